@@ -0,0 +1,217 @@
+"""Async (ASGI) serving mode for the SQL parser service.
+
+Serves the same JSON API as ``main.py`` (health, parse-sql, validate-sql,
+fingerprint) from an event loop. Parsing runs in a process pool with
+coalescing of identical in-flight requests and a queue depth limit (see
+``src.parser.async_service``); a full queue is answered with 503 and
+Retry-After.
+
+Run with any ASGI server, e.g.:
+    uv run --with uvicorn uvicorn asgi:app --host 0.0.0.0 --port 5000
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+import json
+from typing import Any
+
+from main import (
+    ErrorResponse,
+    HealthResponse,
+    SQLFingerprintRequest,
+    SQLFingerprintResponse,
+    SQLParseRequest,
+    SQLParseResponse,
+    SQLValidateRequest,
+    SQLValidateResponse,
+)
+from pydantic import BaseModel, ValidationError
+from src.parser.async_service import AsyncParserService
+from src.parser.config import get_server_config
+from src.parser.exceptions import ServiceOverloadedError
+from src.parser.logging_config import get_logger
+
+Scope = dict[str, Any]
+Receive = Callable[[], Awaitable[dict[str, Any]]]
+Send = Callable[[dict[str, Any]], Awaitable[None]]
+Result = tuple[int, BaseModel, list[tuple[bytes, bytes]]]
+
+
+class AsyncServiceStatsResponse(BaseModel):
+    """Response model for async service statistics."""
+
+    workers: int
+    pending: int
+    max_pending: int
+    submitted: int
+    coalesced: int
+    rejected: int
+
+
+class ParserASGIApp:
+    """ASGI application serving the parser API from an AsyncParserService."""
+
+    def __init__(self, service: AsyncParserService) -> None:
+        """Initialize the application.
+
+        Args:
+            service: Service that runs parser operations
+        """
+        self.service = service
+        self.logger = get_logger(__name__)
+        self.routes: dict[tuple[str, str], Callable[..., Awaitable[Result]]] = {
+            ("GET", "/health"): self.health,
+            ("GET", "/stats"): self.stats,
+            ("POST", "/parse-sql"): self.parse_sql,
+            ("POST", "/validate-sql"): self.validate_sql,
+            ("POST", "/fingerprint"): self.fingerprint_sql,
+        }
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle one ASGI connection."""
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+
+        status, response, headers = await self._dispatch(scope, receive)
+        body = json.dumps(response.model_dump()).encode("utf-8")
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    *headers,
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+    async def _lifespan(self, receive: Receive, send: Send) -> None:
+        """Start the worker pool on startup and stop it on shutdown."""
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                self.service.start()
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                self.service.shutdown()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _dispatch(self, scope: Scope, receive: Receive) -> Result:
+        """Route a request and map errors to responses."""
+        method, path = scope["method"], scope["path"]
+        handler = self.routes.get((method, path))
+        if handler is None:
+            return self._unrouted(path)
+        if method == "GET":
+            return await handler()
+
+        try:
+            return await handler(await self._read_json(scope, receive))
+        except ValueError as e:
+            return self._bad_request(path, e)
+        except ServiceOverloadedError as e:
+            self.logger.warning(f"Rejected {path}: {e.message}")
+            retry_after = str(e.retry_after).encode()
+            return 503, ErrorResponse(error=e.message), [(b"retry-after", retry_after)]
+        except Exception:
+            self.logger.exception(f"Unexpected error in {path}")
+            return 500, ErrorResponse(error="Internal server error"), []
+
+    def _unrouted(self, path: str) -> Result:
+        """Response for a path/method pair without a handler."""
+        if any(route_path == path for _, route_path in self.routes):
+            return 405, ErrorResponse(error="Method not allowed"), []
+        self.logger.warning(f"404 error: {path}")
+        return 404, ErrorResponse(error="Endpoint not found"), []
+
+    def _bad_request(self, path: str, error: ValueError) -> Result:
+        """Response for an invalid request body or SQL."""
+        if isinstance(error, ValidationError):
+            self.logger.exception(f"Validation error in {path}: {error}")
+            return 400, ErrorResponse(error=f"Validation error: {error!s}"), []
+        self.logger.warning(f"Value error in {path}: {error}")
+        return 400, ErrorResponse(error=str(error)), []
+
+    async def _read_json(self, scope: Scope, receive: Receive) -> Any:
+        """Read and decode a JSON request body.
+
+        Raises:
+            ValueError: If the content type is not JSON or the body is not
+                a JSON value
+        """
+        headers = dict(scope.get("headers") or [])
+        content_type = headers.get(b"content-type", b"").decode("latin-1")
+        if not content_type.startswith("application/json"):
+            raise ValueError("Content-Type must be application/json")
+        try:
+            data = json.loads(await self._read_body(receive) or b"null")
+        except json.JSONDecodeError:
+            data = None
+        if data is None:
+            raise ValueError("Invalid JSON payload")
+        return data
+
+    async def _read_body(self, receive: Receive) -> bytes:
+        """Read the full request body."""
+        chunks = []
+        while True:
+            message = await receive()
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body"):
+                return b"".join(chunks)
+
+    async def health(self) -> Result:
+        """Health check endpoint."""
+        return 200, HealthResponse(status="healthy", service="sql-parser"), []
+
+    async def stats(self) -> Result:
+        """Queue depth and coalescing counters."""
+        return 200, AsyncServiceStatsResponse(**self.service.stats()), []
+
+    async def parse_sql(self, data: Any) -> Result:
+        """Parse SQL endpoint (see ``main.create_app``)."""
+        request_data = SQLParseRequest.model_validate(data)
+        if not request_data.sql.strip():
+            return 400, ErrorResponse(error="SQL must be a non-empty string"), []
+
+        result = await self.service.submit("parse", request_data.sql.strip())
+        response = SQLParseResponse(**result)
+        return (200 if response.parsed else 400), response, []
+
+    async def validate_sql(self, data: Any) -> Result:
+        """Validate SQL endpoint (see ``main.create_app``)."""
+        request_data = SQLValidateRequest.model_validate(data)
+        options = {"tier": request_data.tier, "schema": request_data.table_schema}
+        result = await self.service.submit(
+            "validate", request_data.sql.strip(), options
+        )
+        return 200, SQLValidateResponse(**result), []
+
+    async def fingerprint_sql(self, data: Any) -> Result:
+        """Fingerprint SQL endpoint (see ``main.create_app``)."""
+        request_data = SQLFingerprintRequest.model_validate(data)
+        result = await self.service.submit("fingerprint", request_data.sql)
+        response = SQLFingerprintResponse(**result)
+        return (200 if response.error is None else 400), response, []
+
+
+def create_asgi_app(service: AsyncParserService | None = None) -> ParserASGIApp:
+    """Create the ASGI application, configured from the environment."""
+    if service is None:
+        config = get_server_config()
+        service = AsyncParserService(
+            workers=config.workers,
+            max_pending=config.max_pending,
+            retry_after=config.retry_after_seconds,
+        )
+    return ParserASGIApp(service)
+
+
+app = create_asgi_app()
@@ -0,0 +1 @@
+"""Benchmarks for the SQL parser service."""
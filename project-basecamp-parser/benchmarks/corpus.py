@@ -0,0 +1,153 @@
+"""Reproducible synthetic Trino query corpus for benchmarks.
+
+Every generator is deterministic for a given size and ``random.Random``
+seed, so a corpus built with the same seed is byte-for-byte identical
+across runs and machines and can be compared against a stored baseline.
+
+Categories (sizes in ``DEFAULT_SIZES``):
+
+- ``simple``: short filtered SELECT with ORDER BY and LIMIT
+- ``join``: star-schema SELECT joining N dimension tables to a fact table
+- ``cte``: pipeline of N CTEs, each selecting from the previous one
+- ``in_list``: SELECT filtered by an IN list of N literals
+- ``insert_select``: INSERT ... SELECT with N target columns and GROUP BY
+- ``wide``: SELECT of N qualified columns
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import random
+from typing import Final
+
+DEFAULT_SEED: Final[int] = 42
+
+# Sizes per category; all queries stay below the default max_query_length
+DEFAULT_SIZES: Final[dict[str, tuple[int, ...]]] = {
+    "simple": (1,),
+    "join": (10, 50),
+    "cte": (20, 200),
+    "in_list": (1000, 10000),
+    "insert_select": (20, 200),
+    "wide": (500, 2000),
+}
+
+
+@dataclass(frozen=True)
+class BenchCase:
+    """One corpus query.
+
+    Attributes:
+        name: Unique case name, e.g. ``join_50``
+        category: Corpus category
+        size: Category-specific size (tables, CTEs, values or columns)
+        sql: Query text
+    """
+
+    name: str
+    category: str
+    size: int
+    sql: str
+
+
+def wide_select(columns: int) -> str:
+    """SELECT with ``columns`` qualified columns and a filter on each tenth."""
+    select_list = ",\n  ".join(f"t.col_{i}" for i in range(columns))
+    filters = " AND ".join(f"t.col_{i} IS NOT NULL" for i in range(0, columns, 10))
+    return f"SELECT\n  {select_list}\nFROM lake.analytics.wide_table t\nWHERE {filters}"
+
+
+def cte_chain(depth: int, columns: int = 20) -> str:
+    """WITH chain of ``depth`` CTEs, each selecting from the previous one."""
+    column_list = ", ".join(f"c{i}" for i in range(columns))
+    ctes = [f"step_0 AS (SELECT {column_list} FROM lake.raw.events)"]  # noqa: S608
+    for level in range(1, depth):
+        ctes.append(
+            f"step_{level} AS (SELECT {column_list} FROM step_{level - 1} "  # noqa: S608
+            f"WHERE c{level % columns} > {level})"
+        )
+    return f"WITH {', '.join(ctes)}\nSELECT {column_list} FROM step_{depth - 1}"
+
+
+def simple_select(rng: random.Random) -> str:
+    """Short filtered SELECT."""
+    return (
+        "SELECT order_id, customer_id, amount, created_at\n"
+        "FROM lake.sales.orders\n"
+        f"WHERE status = 'shipped' AND amount > {rng.randint(10, 1000)}\n"
+        f"ORDER BY created_at DESC\nLIMIT {rng.choice([10, 100, 1000])}"
+    )
+
+
+def join_star(tables: int, rng: random.Random) -> str:
+    """Fact table joined to ``tables`` dimension tables."""
+    select_list = ["f.event_id", "f.event_date"]
+    joins = []
+    for i in range(1, tables + 1):
+        kind = rng.choice(["JOIN", "LEFT JOIN"])
+        select_list.append(f"d{i}.name AS dim_{i}_name")
+        joins.append(f"{kind} lake.mart.dim_{i} d{i} ON d{i}.id = f.dim_{i}_id")
+    return (
+        f"SELECT {', '.join(select_list)}\n"
+        "FROM lake.mart.fact_events f\n"
+        + "\n".join(joins)
+        + f"\nWHERE f.event_date >= DATE '2024-{rng.randint(1, 12):02d}-01'"
+    )
+
+
+def in_list(values: int, rng: random.Random) -> str:
+    """SELECT filtered by an IN list of ``values`` integer literals."""
+    ids = ", ".join(str(rng.randint(1, 10_000_000)) for _ in range(values))
+    return (
+        "SELECT order_id, customer_id, amount\n"
+        "FROM lake.sales.orders\n"
+        f"WHERE customer_id IN ({ids})"
+    )
+
+
+def insert_select(columns: int, rng: random.Random) -> str:
+    """INSERT ... SELECT aggregating ``columns`` columns into a summary table."""
+    dims = [f"dim_{i}" for i in range(columns // 2)]
+    measures = [f"metric_{i}" for i in range(columns - len(dims))]
+    aggregates = [
+        f"{rng.choice(['SUM', 'MAX', 'MIN', 'AVG'])}(e.{m}) AS {m}" for m in measures
+    ]
+    return (
+        f"INSERT INTO lake.mart.daily_summary ({', '.join(dims + measures)})\n"
+        f"SELECT {', '.join(f'e.{d}' for d in dims)}, {', '.join(aggregates)}\n"
+        "FROM lake.raw.events e\n"
+        "JOIN lake.raw.users u ON u.user_id = e.user_id\n"
+        f"WHERE e.dt = '2024-01-{rng.randint(1, 28):02d}' AND u.country = 'KR'\n"
+        f"GROUP BY {', '.join(f'e.{d}' for d in dims)}"
+    )
+
+
+def build_corpus(
+    seed: int = DEFAULT_SEED,
+    sizes: dict[str, tuple[int, ...]] | None = None,
+) -> list[BenchCase]:
+    """Build the benchmark corpus.
+
+    Args:
+        seed: Seed for literal values and join/aggregate choices
+        sizes: Sizes per category (defaults to ``DEFAULT_SIZES``); categories
+            left out are skipped
+
+    Returns:
+        Cases in category order, smallest first
+    """
+    rng = random.Random(seed)  # noqa: S311
+    generators = {
+        "simple": lambda _size: simple_select(rng),
+        "join": lambda size: join_star(size, rng),
+        "cte": cte_chain,
+        "in_list": lambda size: in_list(size, rng),
+        "insert_select": lambda size: insert_select(size, rng),
+        "wide": wide_select,
+    }
+    cases = []
+    for category, category_sizes in (sizes or DEFAULT_SIZES).items():
+        for size in category_sizes:
+            name = category if category == "simple" else f"{category}_{size}"
+            cases.append(BenchCase(name, category, size, generators[category](size)))
+    return cases
@@ -0,0 +1,109 @@
+"""CPU-time benchmark for TrinoSQLParser.parse_sql on large generated queries.
+
+Generates wide SELECTs (thousands of columns) and deep CTE chains, then
+reports the median CPU time per ``parse_sql`` call together with the time
+spent extracting tables/columns from the AST. The extraction is measured
+twice on the same tree: with the single-pass visitor used by the parser and
+with the previous three ``find_all`` walks, to show what the visitor saves.
+The tokenizer-only ``fingerprint_sql`` path is timed for comparison.
+
+Usage:
+    uv run python -m benchmarks.parse_sql_benchmark
+    uv run python -m benchmarks.parse_sql_benchmark --repeat 10 --columns 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable
+import logging
+import statistics
+import time
+from typing import Any
+
+import sqlglot
+from sqlglot import exp
+from src.parser.sql_parser import TrinoSQLParser
+
+from benchmarks.corpus import cte_chain, wide_select
+
+
+def cpu_ms(fn: Callable[[], Any], repeat: int) -> float:
+    """Median CPU milliseconds of ``fn`` over ``repeat`` runs."""
+    samples = []
+    for _ in range(repeat):
+        start = time.process_time()
+        fn()
+        samples.append((time.process_time() - start) * 1000)
+    return statistics.median(samples)
+
+
+def multi_pass_extract(parsed: exp.Expression) -> tuple[set[str], set[str], set[str]]:
+    """The previous extraction: three separate walks over the AST."""
+    tables = {t.name for t in parsed.find_all(exp.Table) if t.name}
+    columns = {c.name for c in parsed.find_all(exp.Column) if c.name and c.name != "*"}
+    qualified = set()
+    for table in parsed.find_all(exp.Table):
+        if table.catalog and table.db and table.name:
+            qualified.add(f"{table.catalog}.{table.db}.{table.name}")
+        elif table.db and table.name:
+            qualified.add(f"{table.db}.{table.name}")
+    return tables, columns, qualified
+
+
+def run(columns: list[int], depths: list[int], repeat: int) -> None:
+    """Run the benchmark and print one line per generated query."""
+    logging.disable(logging.CRITICAL)
+    parser = TrinoSQLParser()
+    # Repeated runs of one query would otherwise be served from the parse cache
+    parser.cache.max_size = 0
+    cases = [(f"wide select, {n} columns", wide_select(n)) for n in columns]
+    cases += [(f"cte chain, depth {d}", cte_chain(d)) for d in depths]
+
+    print(  # noqa: T201
+        f"{'query':<28} {'chars':>8} {'parse_sql ms':>13} "
+        f"{'extract 1-pass':>15} {'extract 3-pass':>15} {'fingerprint':>12}"
+    )
+    for label, sql in cases:
+        parser.config = parser.config.model_copy(
+            update={"max_query_length": max(parser.config.max_query_length, len(sql))}
+        )
+        result = parser.parse_sql(sql)
+        if not result["parsed"]:
+            raise SystemExit(f"{label}: {result['error']}")
+
+        tree = sqlglot.parse_one(sql, dialect=parser.dialect)
+        total = cpu_ms(lambda sql=sql: parser.parse_sql(sql), repeat)
+        single = cpu_ms(lambda tree=tree: parser._analyze(tree), repeat)
+        multi = cpu_ms(lambda tree=tree: multi_pass_extract(tree), repeat)
+        fingerprint = cpu_ms(lambda sql=sql: parser.fingerprint_sql(sql), repeat)
+        print(  # noqa: T201
+            f"{label:<28} {len(sql):>8} {total:>13.1f} {single:>15.1f} {multi:>15.1f} "
+            f"{fingerprint:>12.1f}"
+        )
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--columns",
+        type=int,
+        nargs="+",
+        default=[500, 2000, 5000],
+        help="Column counts for the wide SELECT queries",
+    )
+    parser.add_argument(
+        "--depths",
+        type=int,
+        nargs="+",
+        default=[50, 200, 500],
+        help="Chain depths for the CTE queries",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement")
+    args = parser.parse_args()
+    run(args.columns, args.depths, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,340 @@
+"""Latency and memory regression harness for the parser service.
+
+Runs every query of the synthetic corpus (``benchmarks.corpus``) through
+``parse_sql`` and ``validate_sql``, both in-process and through the Flask
+test client (``POST /parse-sql`` and ``POST /validate-sql``), and reports
+p50/p95/p99 latency and the peak traced memory of one call.
+
+The parse cache is disabled so every call measures a cold parse. Results can
+be stored as a baseline and later runs compared against it: a measurement
+regresses when a compared metric grows by more than ``--threshold``
+(relative) and by more than ``--min-delta-ms`` or ``--min-delta-kib``
+(absolute), so noise on tiny cases is ignored.
+
+Usage:
+    uv run python -m benchmarks.regression                     # compare
+    uv run python -m benchmarks.regression --update-baseline   # store
+    uv run python -m benchmarks.regression --threshold 0.5 --categories join cte
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+import gc
+import json
+import logging
+from pathlib import Path
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Final
+
+from main import create_app
+import sqlglot
+
+from benchmarks.corpus import DEFAULT_SEED, DEFAULT_SIZES, BenchCase, build_corpus
+
+DEFAULT_BASELINE: Final[Path] = Path(__file__).with_name("baseline.json")
+DEFAULT_ITERATIONS: Final[int] = 10
+DEFAULT_THRESHOLD: Final[float] = 0.25
+DEFAULT_MIN_DELTA_MS: Final[float] = 1.0
+DEFAULT_MIN_DELTA_KIB: Final[float] = 64.0
+DEFAULT_METRICS: Final[tuple[str, ...]] = ("p50_ms", "peak_kib")
+
+MODES: Final[tuple[str, ...]] = ("inproc", "http")
+OPERATIONS: Final[tuple[str, ...]] = ("parse", "validate")
+
+
+@dataclass(frozen=True)
+class Measurement:
+    """Latency percentiles and peak memory of one case/operation/mode."""
+
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    mean_ms: float
+    peak_kib: float
+    samples: int
+
+
+@dataclass(frozen=True)
+class Regression:
+    """A metric that grew beyond the threshold."""
+
+    key: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        """Relative change (0.3 means 30% slower or larger)."""
+        return self.current / self.baseline - 1 if self.baseline else float("inf")
+
+
+def summarize(samples_ms: list[float], peak_kib: float) -> Measurement:
+    """Reduce latency samples to percentiles."""
+    if len(samples_ms) > 1:
+        cuts = statistics.quantiles(samples_ms, n=100, method="inclusive")
+        p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+    else:
+        p50 = p95 = p99 = samples_ms[0]
+    return Measurement(
+        p50_ms=round(p50, 3),
+        p95_ms=round(p95, 3),
+        p99_ms=round(p99, 3),
+        mean_ms=round(statistics.fmean(samples_ms), 3),
+        peak_kib=round(peak_kib, 1),
+        samples=len(samples_ms),
+    )
+
+
+def measure(call: Callable[[], Any], iterations: int) -> Measurement:
+    """Time ``call`` after one warm-up run, then trace one run's memory."""
+    call()
+    samples = []
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(iterations):
+            start = time.perf_counter()
+            call()
+            samples.append((time.perf_counter() - start) * 1000)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    tracemalloc.start()
+    try:
+        call()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return summarize(samples, peak / 1024)
+
+
+def _calls(case: BenchCase, mode: str, operation: str, app: Any) -> Callable[[], Any]:
+    """Return a function performing one operation on the case."""
+    parser = app.extensions["sql_parser"]
+    if mode == "inproc":
+        if operation == "parse":
+            return lambda: parser.parse_sql(case.sql)
+        return lambda: parser.validate_sql(case.sql)
+
+    client = app.test_client()
+    path = "/parse-sql" if operation == "parse" else "/validate-sql"
+
+    def request() -> Any:
+        response = client.post(path, json={"sql": case.sql})
+        if response.status_code != 200:  # noqa: PLR2004
+            raise RuntimeError(f"{case.name}: {path} returned {response.status_code}")
+        return response
+
+    return request
+
+
+def run_benchmarks(
+    cases: list[BenchCase],
+    *,
+    modes: tuple[str, ...] = MODES,
+    operations: tuple[str, ...] = OPERATIONS,
+    iterations: int = DEFAULT_ITERATIONS,
+    progress: Callable[[str, Measurement], Any] | None = None,
+) -> dict[str, Measurement]:
+    """Measure every case for every mode and operation.
+
+    Returns:
+        Measurements keyed by ``mode/operation/case``
+    """
+    app = create_app()
+    # Measure cold parses, not cache hits
+    app.extensions["sql_parser"].cache.max_size = 0
+
+    results = {}
+    for mode in modes:
+        for operation in operations:
+            for case in cases:
+                key = f"{mode}/{operation}/{case.name}"
+                results[key] = measure(_calls(case, mode, operation, app), iterations)
+                if progress is not None:
+                    progress(key, results[key])
+    return results
+
+
+def environment() -> dict[str, str]:
+    """Describe the environment results were measured in."""
+    return {
+        "python": platform.python_version(),
+        "sqlglot": sqlglot.__version__,
+        "system": platform.system(),
+        "machine": platform.machine(),
+    }
+
+
+def compare(
+    baseline: dict[str, dict[str, float]],
+    current: dict[str, Measurement],
+    *,
+    threshold: float = DEFAULT_THRESHOLD,
+    min_delta_ms: float = DEFAULT_MIN_DELTA_MS,
+    min_delta_kib: float = DEFAULT_MIN_DELTA_KIB,
+    metrics: tuple[str, ...] = DEFAULT_METRICS,
+) -> list[Regression]:
+    """Return the metrics that regressed against the baseline.
+
+    A metric regresses when it exceeds the baseline by more than
+    ``threshold`` (relative) and by more than ``min_delta_ms`` (latency) or
+    ``min_delta_kib`` (memory). Measurements missing from either side are
+    skipped.
+    """
+    regressions = []
+    for key, measurement in current.items():
+        previous = baseline.get(key)
+        if previous is None:
+            continue
+        for metric in metrics:
+            old, new = previous.get(metric), getattr(measurement, metric)
+            if old is None:
+                continue
+            min_delta = min_delta_ms if metric.endswith("_ms") else min_delta_kib
+            if new > old * (1 + threshold) and new - old > min_delta:
+                regressions.append(Regression(key, metric, old, new))
+    return regressions
+
+
+def load_baseline(path: Path) -> dict[str, Any]:
+    """Load a stored baseline (empty if the file does not exist)."""
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def save_baseline(
+    path: Path, results: dict[str, Measurement], *, seed: int, iterations: int
+) -> None:
+    """Store results with the environment they were measured in."""
+    document = {
+        "created_at": datetime.now(UTC).isoformat(timespec="seconds"),
+        "environment": environment(),
+        "seed": seed,
+        "iterations": iterations,
+        "results": {key: asdict(m) for key, m in sorted(results.items())},
+    }
+    path.write_text(json.dumps(document, indent=2) + "\n")
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the harness; return 1 if any metric regressed."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Store results as the new baseline",
+    )
+    parser.add_argument("--output", type=Path, help="Also write results to this file")
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed relative growth per metric (0.25 = 25%%)",
+    )
+    parser.add_argument(
+        "--min-delta-ms",
+        type=float,
+        default=DEFAULT_MIN_DELTA_MS,
+        help="Latency growth below this many ms is never a regression",
+    )
+    parser.add_argument(
+        "--min-delta-kib",
+        type=float,
+        default=DEFAULT_MIN_DELTA_KIB,
+        help="Memory growth below this many KiB is never a regression",
+    )
+    parser.add_argument(
+        "--metrics",
+        nargs="+",
+        default=list(DEFAULT_METRICS),
+        choices=["p50_ms", "p95_ms", "p99_ms", "mean_ms", "peak_kib"],
+    )
+    parser.add_argument("--modes", nargs="+", default=list(MODES), choices=MODES)
+    parser.add_argument(
+        "--operations", nargs="+", default=list(OPERATIONS), choices=OPERATIONS
+    )
+    parser.add_argument(
+        "--categories",
+        nargs="+",
+        choices=sorted(DEFAULT_SIZES),
+        help="Only run these corpus categories",
+    )
+    args = parser.parse_args(argv)
+    logging.disable(logging.CRITICAL)
+
+    sizes = DEFAULT_SIZES
+    if args.categories:
+        sizes = {c: s for c, s in DEFAULT_SIZES.items() if c in args.categories}
+    cases = build_corpus(seed=args.seed, sizes=sizes)
+
+    def progress(key: str, m: Measurement) -> None:
+        print(  # noqa: T201
+            f"{key:<40} p50 {m.p50_ms:>9.2f}  p95 {m.p95_ms:>9.2f}  "
+            f"p99 {m.p99_ms:>9.2f} ms  peak {m.peak_kib:>9.1f} KiB"
+        )
+
+    results = run_benchmarks(
+        cases,
+        modes=tuple(args.modes),
+        operations=tuple(args.operations),
+        iterations=args.iterations,
+        progress=progress,
+    )
+    if args.output:
+        save_baseline(args.output, results, seed=args.seed, iterations=args.iterations)
+    if args.update_baseline:
+        save_baseline(
+            args.baseline, results, seed=args.seed, iterations=args.iterations
+        )
+        print(f"Baseline written to {args.baseline}")  # noqa: T201
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    if not baseline:
+        print(f"No baseline at {args.baseline}; run with --update-baseline")  # noqa: T201
+        return 0
+    if (
+        baseline.get("environment") != environment()
+        or baseline.get("seed") != args.seed
+    ):
+        print(  # noqa: T201
+            "Warning: baseline was measured in a different environment or with a "
+            f"different seed: {baseline.get('environment')}, seed {baseline.get('seed')}"
+        )
+
+    regressions = compare(
+        baseline.get("results", {}),
+        results,
+        threshold=args.threshold,
+        min_delta_ms=args.min_delta_ms,
+        min_delta_kib=args.min_delta_kib,
+        metrics=tuple(args.metrics),
+    )
+    for r in regressions:
+        print(  # noqa: T201
+            f"REGRESSION {r.key} {r.metric}: {r.baseline} -> {r.current} ({r.change:+.0%})"
+        )
+    print(  # noqa: T201
+        f"{len(regressions)} regressions in {len(results)} measurements "
+        f"(threshold {args.threshold:.0%})"
+    )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
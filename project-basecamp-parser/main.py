@@ -7,11 +7,12 @@ from typing import Any
 
 from dotenv import load_dotenv
 from flask import Flask, Response, jsonify, request
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, Field, ValidationError
 
 from src.parser.config import get_server_config
 from src.parser.logging_config import get_logger, setup_logging
 from src.parser.sql_parser import TrinoSQLParser
+from src.parser.validation import build_schema
 
 # Load environment variables
 load_dotenv()
@@ -30,6 +31,22 @@ class SQLValidateRequest(BaseModel):
     """Request model for SQL validation."""
 
     sql: str
+    tier: int = Field(default=1, ge=0, le=2)
+    table_schema: dict[str, list[str] | dict[str, str]] | None = Field(
+        default=None, alias="schema"
+    )
+
+
+class SQLFingerprintRequest(BaseModel):
+    """Request model for SQL fingerprinting."""
+
+    sql: str
+
+
+class SQLFingerprintBatchRequest(BaseModel):
+    """Request model for batch SQL fingerprinting."""
+
+    queries: list[str]
 
 
 class HealthResponse(BaseModel):
@@ -39,6 +56,19 @@ class HealthResponse(BaseModel):
     service: str
 
 
+class SQLStatementResult(BaseModel):
+    """Parse result of one statement in a script."""
+
+    statement_type: str | None
+    tables: list[str]
+    columns: list[str]
+    schema_qualified_tables: list[str]
+    cte_names: list[str]
+    sql: str
+    parsed: bool
+    error: str | None
+
+
 class SQLParseResponse(BaseModel):
     """Response model for SQL parsing."""
 
@@ -46,6 +76,9 @@ class SQLParseResponse(BaseModel):
     tables: list[str]
     columns: list[str]
     schema_qualified_tables: list[str]
+    cte_names: list[str] = []
+    statement_count: int = 0
+    statements: list[SQLStatementResult] = []
     parsed: bool
     error: str | None
 
@@ -54,6 +87,41 @@ class SQLValidateResponse(BaseModel):
     """Response model for SQL validation."""
 
     valid: bool
+    tier: int = 1
+    error: str | None = None
+    elapsed_ms: float = 0.0
+
+
+class TierLatencyStats(BaseModel):
+    """Validation request count and latency for one tier."""
+
+    count: int
+    invalid: int
+    mean_ms: float
+    max_ms: float
+    total_ms: float
+
+
+class StatsResponse(BaseModel):
+    """Response model for service statistics."""
+
+    validation: dict[str, TierLatencyStats]
+    parse_cache: dict[str, int]
+
+
+class SQLFingerprintResponse(BaseModel):
+    """Response model for SQL fingerprinting."""
+
+    fingerprint: str | None
+    normalized: str | None
+    statement_count: int
+    error: str | None
+
+
+class SQLFingerprintBatchResponse(BaseModel):
+    """Response model for batch SQL fingerprinting."""
+
+    results: list[SQLFingerprintResponse]
 
 
 class ErrorResponse(BaseModel):
@@ -73,6 +141,7 @@ def create_app() -> Flask:
     # Initialize parser
     try:
         parser = TrinoSQLParser()
+        app.extensions["sql_parser"] = parser
         logger.info("SQL Parser initialized successfully")
     except Exception as e:
         logger.error(f"Failed to initialize SQL Parser: {e}")
@@ -85,6 +154,24 @@ def create_app() -> Flask:
         response = HealthResponse(status="healthy", service="sql-parser")
         return jsonify(response.model_dump()), 200
 
+    @app.route("/stats", methods=["GET"])
+    def stats() -> tuple[Response, int]:
+        """
+        Service statistics endpoint.
+
+        Returns validation request counts and latency per tier, and the
+        parse cache counters:
+        {
+            "validation": {"0": {"count": 120, "invalid": 3, "mean_ms": 0.2, ...}},
+            "parse_cache": {"hits": 40, "misses": 12, "size": 12, "max_size": 1024}
+        }
+        """
+        response = StatsResponse(
+            validation=parser.validation_stats.snapshot(),
+            parse_cache=parser.cache.info(),
+        )
+        return jsonify(response.model_dump()), 200
+
     @app.route("/parse-sql", methods=["POST"])
     def parse_sql() -> tuple[Response, int]:
         """
@@ -101,9 +188,16 @@ def create_app() -> Flask:
             "tables": ["table1"],
             "columns": ["col1", "col2", "col3"],
             "schema_qualified_tables": ["schema.table1"],
+            "cte_names": [],
+            "statement_count": 1,
+            "statements": [{"statement_type": "SELECT", ..., "sql": "SELECT ..."}],
             "parsed": true,
             "error": null
         }
+
+        A script with several ``;``-separated statements returns
+        statement_type "SCRIPT", the union of tables and columns, and one
+        entry per statement in "statements".
         """
         logger.debug("Parse SQL request received")
         
@@ -164,16 +258,26 @@ def create_app() -> Flask:
 
         Expected JSON payload:
         {
-            "sql": "SELECT * FROM table1"
+            "sql": "SELECT * FROM table1",
+            "tier": 1,
+            "schema": {"db.table1": ["col1", "col2"]}
         }
 
+        "tier" picks the checks (default 1): 0 tokenizes only (statement
+        keyword and balanced parentheses), 1 also parses, and 2 also
+        resolves tables and columns against "schema" (required for tier 2;
+        values are column lists or column-to-type mappings).
+
         Returns:
         {
-            "valid": true
+            "valid": true,
+            "tier": 1,
+            "error": null,
+            "elapsed_ms": 0.42
         }
         """
         logger.debug("Validate SQL request received")
-        
+
         if not request.is_json:
             logger.warning("Validate SQL request with invalid content type")
             error_response = ErrorResponse(
@@ -191,12 +295,19 @@ def create_app() -> Flask:
             # Validate request using Pydantic
             request_data = SQLValidateRequest(**data)
 
+            schema = None
+            if request_data.table_schema is not None:
+                schema = build_schema(request_data.table_schema, parser.dialect)
+
             # Validate the SQL
-            logger.info(f"Validating SQL query of length {len(request_data.sql)}")
-            is_valid = parser.validate_sql(request_data.sql.strip())
-            response = SQLValidateResponse(valid=is_valid)
-            
-            logger.info(f"SQL validation result: {is_valid}")
+            logger.info(
+                f"Validating SQL query of length {len(request_data.sql)} "
+                f"at tier {request_data.tier}"
+            )
+            result = parser.validate(request_data.sql.strip(), request_data.tier, schema)
+            response = SQLValidateResponse(**result)
+
+            logger.info(f"SQL validation result: {response.valid} ({response.elapsed_ms} ms)")
             return jsonify(response.model_dump()), 200
 
         except ValidationError as e:
@@ -212,6 +323,135 @@ def create_app() -> Flask:
             error_response = ErrorResponse(error="Internal server error")
             return jsonify(error_response.model_dump()), 500
 
+    @app.route("/fingerprint", methods=["POST"])
+    def fingerprint_sql() -> tuple[Response, int]:
+        """
+        Fingerprint SQL statement endpoint.
+
+        Only the tokenizer runs. Queries that differ only in literals,
+        identifier case, whitespace, comments or IN-list lengths share a
+        fingerprint.
+
+        Expected JSON payload:
+        {
+            "sql": "SELECT * FROM Orders WHERE id IN (1, 2, 3)"
+        }
+
+        Returns:
+        {
+            "fingerprint": "9923995ad6449106",
+            "normalized": "SELECT * FROM orders WHERE id IN (?)",
+            "statement_count": 1,
+            "error": null
+        }
+        """
+        logger.debug("Fingerprint SQL request received")
+
+        if not request.is_json:
+            logger.warning("Fingerprint SQL request with invalid content type")
+            error_response = ErrorResponse(
+                error="Content-Type must be application/json"
+            )
+            return jsonify(error_response.model_dump()), 400
+
+        try:
+            data = request.get_json()
+            if data is None:
+                logger.warning("Fingerprint SQL request with invalid JSON")
+                error_response = ErrorResponse(error="Invalid JSON payload")
+                return jsonify(error_response.model_dump()), 400
+
+            # Validate request using Pydantic
+            request_data = SQLFingerprintRequest(**data)
+
+            logger.info(f"Fingerprinting SQL query of length {len(request_data.sql)}")
+            response = SQLFingerprintResponse(**parser.fingerprint_sql(request_data.sql))
+            status_code = 200 if response.error is None else 400
+            return jsonify(response.model_dump()), status_code
+
+        except ValidationError as e:
+            logger.exception("Validation error in fingerprint SQL")
+            error_response = ErrorResponse(error=f"Validation error: {e!s}")
+            return jsonify(error_response.model_dump()), 400
+        except ValueError as e:
+            logger.warning(f"Value error in fingerprint SQL: {e}")
+            error_response = ErrorResponse(error=str(e))
+            return jsonify(error_response.model_dump()), 400
+        except Exception as e:
+            logger.error(f"Unexpected error in fingerprint SQL: {e}", exc_info=True)
+            error_response = ErrorResponse(error="Internal server error")
+            return jsonify(error_response.model_dump()), 500
+
+    @app.route("/fingerprint/batch", methods=["POST"])
+    def fingerprint_sql_batch() -> tuple[Response, int]:
+        """
+        Fingerprint many SQL statements in one request.
+
+        Expected JSON payload:
+        {
+            "queries": ["SELECT 1", "SELECT * FROM t WHERE id = 42"]
+        }
+
+        Returns one result per query, in order. A query that cannot be
+        fingerprinted gets an error in its own result instead of failing
+        the whole batch:
+        {
+            "results": [
+                {"fingerprint": "...", "normalized": "SELECT ?", ...},
+                ...
+            ]
+        }
+        """
+        logger.debug("Fingerprint SQL batch request received")
+
+        if not request.is_json:
+            logger.warning("Fingerprint SQL batch request with invalid content type")
+            error_response = ErrorResponse(
+                error="Content-Type must be application/json"
+            )
+            return jsonify(error_response.model_dump()), 400
+
+        try:
+            data = request.get_json()
+            if data is None:
+                logger.warning("Fingerprint SQL batch request with invalid JSON")
+                error_response = ErrorResponse(error="Invalid JSON payload")
+                return jsonify(error_response.model_dump()), 400
+
+            # Validate request using Pydantic
+            request_data = SQLFingerprintBatchRequest(**data)
+
+            max_batch_size = parser.config.max_batch_size
+            if len(request_data.queries) > max_batch_size:
+                logger.warning(f"Fingerprint SQL batch of {len(request_data.queries)} queries")
+                error_response = ErrorResponse(
+                    error=f"Batch exceeds maximum size of {max_batch_size} queries"
+                )
+                return jsonify(error_response.model_dump()), 400
+
+            logger.info(f"Fingerprinting {len(request_data.queries)} SQL queries")
+            results = []
+            for sql in request_data.queries:
+                try:
+                    result = SQLFingerprintResponse(**parser.fingerprint_sql(sql))
+                except ValueError as e:
+                    result = SQLFingerprintResponse(
+                        fingerprint=None, normalized=None, statement_count=0, error=str(e)
+                    )
+                results.append(result)
+
+            response = SQLFingerprintBatchResponse(results=results)
+            return jsonify(response.model_dump()), 200
+
+        except ValidationError as e:
+            logger.exception("Validation error in fingerprint SQL batch")
+            error_response = ErrorResponse(error=f"Validation error: {e!s}")
+            return jsonify(error_response.model_dump()), 400
+        except Exception as e:
+            logger.error(f"Unexpected error in fingerprint SQL batch: {e}", exc_info=True)
+            error_response = ErrorResponse(error="Internal server error")
+            return jsonify(error_response.model_dump()), 500
+
     @app.errorhandler(404)
     def not_found(error: Any) -> tuple[Response, int]:
         logger.warning(f"404 error: {request.url}")
@@ -0,0 +1,187 @@
+"""Process-pool parsing behind an event loop.
+
+The async serving mode (``asgi.py``) hands every parse, validation and
+fingerprint request to an AsyncParserService:
+
+- Work runs in a pool of parser processes, so CPU-bound sqlglot parsing
+  neither blocks the event loop nor contends for one GIL.
+- Identical requests already in flight are coalesced: the SQL is parsed
+  once and the result is fanned out to every waiter. Requests are identical
+  when operation, options and SQL text (ignoring surrounding whitespace)
+  hash the same; queries that differ only in literals still share each
+  worker's fingerprint-keyed parse cache.
+- At most ``max_pending`` distinct requests are queued or running. Beyond
+  that ``submit`` raises ServiceOverloadedError, which the server answers
+  with 503 and Retry-After instead of queueing without bound. Coalesced
+  waiters add no work and are never rejected.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor
+import hashlib
+import json
+import multiprocessing
+import os
+from typing import Any, Final
+
+from .exceptions import ServiceOverloadedError
+from .logging_config import get_logger
+from .sql_parser import TrinoSQLParser
+from .validation import build_schema
+
+OPERATIONS: Final[frozenset[str]] = frozenset({"parse", "validate", "fingerprint"})
+
+# Parser of the current worker process
+_worker_parser: TrinoSQLParser | None = None
+
+
+def _init_worker() -> None:
+    """Create the worker process's parser."""
+    global _worker_parser  # noqa: PLW0603
+    _worker_parser = TrinoSQLParser()
+
+
+def _ping() -> None:
+    """No-op task used to start worker processes ahead of requests."""
+
+
+def _run(operation: str, sql: str, options: dict[str, Any]) -> dict[str, Any]:
+    """Run one operation with the worker's parser.
+
+    Raises:
+        ValueError: If the SQL or options are invalid
+    """
+    if _worker_parser is None:
+        _init_worker()
+    parser = _worker_parser
+    assert parser is not None
+
+    if operation == "parse":
+        return parser.parse_sql(sql)
+    if operation == "validate":
+        tables = options.get("schema")
+        schema = build_schema(tables, parser.dialect) if tables is not None else None
+        return parser.validate(sql, options.get("tier", 1), schema)
+    if operation == "fingerprint":
+        return parser.fingerprint_sql(sql)
+    raise ValueError(f"Unknown operation: {operation}")
+
+
+def request_key(operation: str, sql: str, options: dict[str, Any]) -> str:
+    """Return the coalescing key of a request."""
+    payload = json.dumps(
+        [operation, sql.strip(), options], sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class AsyncParserService:
+    """Runs parser operations in a process pool with coalescing and backpressure."""
+
+    def __init__(
+        self,
+        *,
+        workers: int = 0,
+        max_pending: int = 64,
+        retry_after: int = 1,
+        executor: Executor | None = None,
+    ) -> None:
+        """Initialize the service.
+
+        Args:
+            workers: Parser processes (0 = one per CPU)
+            max_pending: Distinct requests queued or running before
+                ``submit`` rejects new work
+            retry_after: Seconds suggested to rejected clients
+            executor: Executor to use instead of an owned process pool
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending
+        self.retry_after = retry_after
+        self.logger = get_logger(__name__)
+        self.submitted = 0
+        self.coalesced = 0
+        self.rejected = 0
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._inflight: dict[str, asyncio.Future[dict[str, Any]]] = {}
+
+    @property
+    def pending(self) -> int:
+        """Distinct requests queued or running."""
+        return len(self._inflight)
+
+    def start(self) -> Executor:
+        """Start the worker pool (idempotent) and return the executor."""
+        if self._executor is None:
+            # Spawned workers do not inherit the event loop or its threads
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            )
+            for _ in range(self.workers):
+                self._executor.submit(_ping)
+            self.logger.info(f"Started {self.workers} parser worker processes")
+        return self._executor
+
+    def shutdown(self) -> None:
+        """Stop an owned worker pool, cancelling queued work."""
+        if self._executor is not None and self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            self.logger.info("Stopped parser worker processes")
+
+    async def submit(
+        self, operation: str, sql: str, options: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Run an operation, sharing the result with identical in-flight requests.
+
+        Args:
+            operation: "parse", "validate" or "fingerprint"
+            sql: SQL statement or script
+            options: Operation options ("tier" and "schema" for validate)
+
+        Returns:
+            The parser's result dictionary
+
+        Raises:
+            ServiceOverloadedError: If max_pending distinct requests are pending
+            ValueError: If the operation, SQL or options are invalid
+        """
+        if operation not in OPERATIONS:
+            raise ValueError(f"Unknown operation: {operation}")
+        options = options or {}
+        key = request_key(operation, sql, options)
+
+        future = self._inflight.get(key)
+        if future is not None:
+            self.coalesced += 1
+            return await asyncio.shield(future)
+
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise ServiceOverloadedError(
+                f"Too many pending requests ({self.max_pending})", self.retry_after
+            )
+
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self.start(), _run, operation, sql, options)
+        self._inflight[key] = future
+        future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        self.submitted += 1
+        # A cancelled waiter must not cancel the work other waiters share
+        return await asyncio.shield(future)
+
+    def stats(self) -> dict[str, int]:
+        """Return request counters and the current queue depth."""
+        return {
+            "workers": self.workers,
+            "pending": self.pending,
+            "max_pending": self.max_pending,
+            "submitted": self.submitted,
+            "coalesced": self.coalesced,
+            "rejected": self.rejected,
+        }
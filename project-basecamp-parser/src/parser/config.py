@@ -15,6 +15,15 @@ class ServerConfig(BaseModel):
     port: int = Field(default=5000, description="Port to bind to")
     debug: bool = Field(default=False, description="Enable debug mode")
     log_level: str = Field(default="INFO", description="Logging level")
+    workers: int = Field(
+        default=0, description="Parser processes in async mode (0 = one per CPU)"
+    )
+    max_pending: int = Field(
+        default=64, description="Distinct requests queued or running in async mode"
+    )
+    retry_after_seconds: int = Field(
+        default=1, description="Retry-After sent with 503 when async mode is busy"
+    )
 
     @classmethod
     def from_env(cls) -> ServerConfig:
@@ -24,6 +33,9 @@ class ServerConfig(BaseModel):
             port=int(os.getenv("PARSER_PORT", "5000")),
             debug=os.getenv("PARSER_DEBUG", "false").lower() == "true",
             log_level=os.getenv("PARSER_LOG_LEVEL", "INFO").upper(),
+            workers=int(os.getenv("PARSER_WORKERS", "0")),
+            max_pending=int(os.getenv("PARSER_MAX_PENDING", "64")),
+            retry_after_seconds=int(os.getenv("PARSER_RETRY_AFTER", "1")),
         )
 
 
@@ -33,6 +45,10 @@ class SQLParserConfig(BaseModel):
     dialect: str = Field(default="presto", description="SQL dialect for parsing")
     max_query_length: int = Field(default=100000, description="Maximum query length")
     timeout_seconds: int = Field(default=30, description="Query parsing timeout")
+    parse_cache_size: int = Field(
+        default=1024, description="Parse results cached per literal-normalized statement (0 disables)"
+    )
+    max_batch_size: int = Field(default=1000, description="Maximum queries per batch request")
 
 
 # Global configuration instances
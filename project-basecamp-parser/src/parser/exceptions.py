@@ -42,4 +42,18 @@ class SQLValidationError(Exception):
 class ConfigurationError(Exception):
     """Raised when there's a configuration issue."""
 
-    pass
\ No newline at end of file
+    pass
+
+class ServiceOverloadedError(Exception):
+    """Raised when the async service has too many pending requests."""
+
+    def __init__(self, message: str, retry_after: int) -> None:
+        """Initialize the exception.
+
+        Args:
+            message: The error message
+            retry_after: Seconds the client should wait before retrying
+        """
+        super().__init__(message)
+        self.message = message
+        self.retry_after = retry_after
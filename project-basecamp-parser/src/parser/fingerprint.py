@@ -0,0 +1,227 @@
+"""Query fingerprinting on the token stream.
+
+Queries that differ only in literal values, identifier case, whitespace,
+comments or the length of an IN list share one fingerprint:
+
+- String, number and other literals (and ``?`` placeholders) become ``?``;
+  a sign in front of a number is dropped.
+- ``IN (...)`` lists of only literals (or tuples of literals) collapse to
+  ``IN (?)``.
+- Unquoted and quoted identifiers are lowercased (Trino folds both);
+  quoting is kept only where the name needs it.
+- Keywords are uppercased, comments dropped and tokens joined with
+  canonical spacing.
+
+Only the tokenizer runs, so fingerprinting is much cheaper than a parse.
+The parse cache keys on the same normalization with ``fold_case=False``:
+parse results echo identifier case, so only literals may differ between
+queries sharing an entry.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import hashlib
+import re
+import threading
+from typing import TYPE_CHECKING, Final
+
+from sqlglot.tokens import TokenType
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Sequence
+
+    from sqlglot.tokens import Token
+
+# Hex characters of the SHA-256 digest kept in a fingerprint (64 bits)
+FINGERPRINT_LENGTH: Final[int] = 16
+
+# Token types missing from older sqlglot releases (the floor is 28.5.0)
+_OPTIONAL_LITERAL_TOKENS = ("NATIONAL_RAW_STRING",)
+
+LITERAL_TOKENS: Final[frozenset[TokenType]] = frozenset(
+    {
+        TokenType.STRING,
+        TokenType.NUMBER,
+        TokenType.BIT_STRING,
+        TokenType.HEX_STRING,
+        TokenType.BYTE_STRING,
+        TokenType.NATIONAL_STRING,
+        TokenType.RAW_STRING,
+        TokenType.HEREDOC_STRING,
+        TokenType.UNICODE_STRING,
+        TokenType.PLACEHOLDER,
+        *(
+            getattr(TokenType, name)
+            for name in _OPTIONAL_LITERAL_TOKENS
+            if hasattr(TokenType, name)
+        ),
+    }
+)
+
+# Tokens that can end an operand, making a following "-" a binary minus
+_OPERAND_END: Final[frozenset[TokenType]] = LITERAL_TOKENS | {
+    TokenType.VAR,
+    TokenType.IDENTIFIER,
+    TokenType.R_PAREN,
+    TokenType.R_BRACKET,
+    TokenType.NULL,
+    TokenType.TRUE,
+    TokenType.FALSE,
+}
+
+# Enum attribute lookups are slow in the per-token loop
+_DASH = TokenType.DASH
+_NUMBER = TokenType.NUMBER
+_VAR = TokenType.VAR
+_IDENTIFIER = TokenType.IDENTIFIER
+_L_PAREN = TokenType.L_PAREN
+_R_PAREN = TokenType.R_PAREN
+
+_SIMPLE_IDENTIFIER = re.compile(r"[a-z_][a-z0-9_]*")
+_NO_SPACE_BEFORE: Final[frozenset[str]] = frozenset({",", ")", "]", ".", "["})
+_NO_SPACE_AFTER: Final[frozenset[str]] = frozenset({"(", "[", "."})
+_IN_LIST_ITEMS: Final[frozenset[str]] = frozenset({"?", ",", "(", ")"})
+
+
+def normalize_tokens(
+    tokens: Sequence[Token], keywords: Collection[str], *, fold_case: bool = True
+) -> str:
+    """Return the normalized text of one statement's tokens.
+
+    Args:
+        tokens: Tokens of a single statement (no semicolons)
+        keywords: Upper-case dialect keywords, used to decide whether a
+            lowercased quoted identifier still needs its quotes
+        fold_case: Lowercase identifiers and uppercase keywords; when
+            False, all non-literal tokens keep their text and quoted
+            identifiers keep their quotes
+
+    Returns:
+        Normalized statement text
+    """
+    # (text, is_name) pairs; names are identifiers and unreserved words
+    parts: list[tuple[str, bool]] = []
+    open_parens: list[int] = []
+    previous: TokenType | None = None
+
+    for i, token in enumerate(tokens):
+        token_type = token.token_type
+        if (
+            token_type is _DASH
+            and previous not in _OPERAND_END
+            and i + 1 < len(tokens)
+            and tokens[i + 1].token_type is _NUMBER
+        ):
+            previous = token_type
+            continue
+        previous = token_type
+
+        if token_type in LITERAL_TOKENS:
+            parts.append(("?", False))
+        elif token_type is _VAR:
+            parts.append((token.text.lower() if fold_case else token.text, True))
+        elif token_type is _IDENTIFIER and not fold_case:
+            parts.append(('"' + token.text.replace('"', '""') + '"', True))
+        elif token_type is _IDENTIFIER:
+            name = token.text.lower()
+            if not _SIMPLE_IDENTIFIER.fullmatch(name) or name.upper() in keywords:
+                name = '"' + name.replace('"', '""') + '"'
+            parts.append((name, True))
+        elif token_type is _L_PAREN:
+            open_parens.append(len(parts))
+            parts.append(("(", False))
+        elif token_type is _R_PAREN:
+            start = open_parens.pop() if open_parens else None
+            if (
+                start is not None
+                and start > 0
+                and parts[start - 1][0] == "IN"
+                and len(parts) > start + 1
+                and all(text in _IN_LIST_ITEMS for text, _ in parts[start + 1 :])
+            ):
+                del parts[start + 1 :]
+                parts.append(("?", False))
+            parts.append((")", False))
+        else:
+            parts.append((token.text.upper() if fold_case else token.text, False))
+
+    pieces: list[str] = []
+    previous_text: str | None = None
+    previous_is_name = False
+    for text, is_name in parts:
+        if previous_text is not None and not (
+            text in _NO_SPACE_BEFORE
+            or previous_text in _NO_SPACE_AFTER
+            or (text == "(" and previous_is_name)
+        ):
+            pieces.append(" ")
+        pieces.append(text)
+        previous_text, previous_is_name = text, is_name
+    return "".join(pieces)
+
+
+def fingerprint_hash(normalized: str) -> str:
+    """Return the stable fingerprint of normalized SQL text."""
+    digest = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+    return digest[:FINGERPRINT_LENGTH]
+
+
+class ParseCache[V]:
+    """Thread-safe LRU cache of parse results keyed by fingerprint.
+
+    Queries that differ only in literals share an entry, so parameterized
+    variants of one query are parsed once.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries (0 disables caching)
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, V] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> V | None:
+        """Return the cached value for key, or None."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: str, value: V) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> dict[str, int]:
+        """Return hit/miss counters and the current size."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+        }
@@ -2,15 +2,42 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 import time
 from typing import Any, Final
 
 import sqlglot
 from sqlglot import exp
+from sqlglot.dialects.dialect import Dialect
+from sqlglot.schema import MappingSchema
+from sqlglot.tokens import Token, TokenType
 
 from .config import get_parser_config
 from .exceptions import SQLParseError, SQLValidationError
+from .fingerprint import ParseCache, fingerprint_hash, normalize_tokens
 from .logging_config import get_logger
+from .validation import TierStats, ValidationTier, check_tokens, resolve_references
+
+
+@dataclass
+class StatementInfo:
+    """Everything extracted from one statement in a single AST pass."""
+
+    statement_type: str
+    tables: set[str] = field(default_factory=set)
+    schema_qualified_tables: set[str] = field(default_factory=set)
+    columns: set[str] = field(default_factory=set)
+    cte_names: set[str] = field(default_factory=set)
+
+    def to_result(self) -> dict[str, Any]:
+        """Return the JSON-serializable result fields."""
+        return {
+            "statement_type": self.statement_type,
+            "tables": sorted(self.tables),
+            "columns": sorted(self.columns),
+            "schema_qualified_tables": sorted(self.schema_qualified_tables),
+            "cte_names": sorted(self.cte_names),
+        }
 
 
 class TrinoSQLParser:
@@ -20,71 +47,55 @@ class TrinoSQLParser:
         self.config = get_parser_config()
         self.logger = get_logger(__name__)
         self.dialect: Final[str] = self.config.dialect
+        self._dialect = Dialect.get_or_raise(self.dialect)
+        self._keywords = frozenset(self._dialect.tokenizer_class.KEYWORDS)
+        self.cache: ParseCache[StatementInfo] = ParseCache(self.config.parse_cache_size)
+        self.validation_stats = TierStats()
         self.logger.info(f"Initialized TrinoSQLParser with dialect: {self.dialect}")
 
     def parse_sql(self, sql: str) -> dict[str, Any]:
         """
-        Parse SQL statement and extract information about statement type, tables, and columns.
+        Parse SQL and extract information about statement type, tables, and columns.
+
+        Scripts with several ``;``-separated statements are split on the token
+        stream and each statement is parsed on its own, so a syntax error in
+        one statement does not hide the results of the others.
 
         Args:
-            sql: SQL statement string
+            sql: SQL statement or script string
 
         Returns:
             Dictionary containing parsed information:
-            - statement_type: Type of SQL statement (SELECT, DML, DDL, etc.)
+            - statement_type: Type of SQL statement (SELECT, DML, DDL, etc.),
+              or SCRIPT when there are several statements
             - tables: List of tables used in the query
             - columns: List of columns used in the query
             - schema_qualified_tables: List of schema.table references
+            - cte_names: Names defined in WITH clauses
+            - statement_count: Number of statements found
+            - statements: Per-statement results (the fields above plus sql,
+              parsed and error)
             - parsed: Whether parsing was successful
             - error: Error message if parsing failed
 
         Raises:
-            SQLParseError: If SQL parsing fails due to syntax errors
             ValueError: If input parameters are invalid
         """
-        if not sql or not sql.strip():
-            raise ValueError("SQL cannot be empty or whitespace only")
-        
-        if len(sql) > self.config.max_query_length:
-            raise ValueError(f"SQL exceeds maximum length of {self.config.max_query_length} characters")
-        
+        self._check_sql(sql)
+
         start_time = time.time()
-        
+
         try:
             self.logger.debug(f"Parsing SQL query of length {len(sql)}")
-            
-            # Parse the SQL statement
-            parsed = sqlglot.parse_one(sql, dialect=self.dialect)
 
-            if not parsed:
+            chunks = self._split_statements(sql)
+            if not chunks:
                 error_msg = "Failed to parse SQL statement - no valid statements found"
                 self.logger.warning(error_msg)
                 return self._error_result(error_msg)
 
-            # Get statement type
-            statement_type = self._get_statement_type(parsed)
-
-            # Extract tables and columns
-            tables = self._extract_tables(parsed)
-            columns = self._extract_columns(parsed)
-            schema_qualified_tables = self._extract_schema_qualified_tables(parsed)
-
-            parse_time = time.time() - start_time
-            self.logger.info(
-                f"Successfully parsed {statement_type} statement in {parse_time:.3f}s - "
-                f"Found {len(tables)} tables, {len(columns)} columns"
-            )
-
-            return {
-                "statement_type": statement_type,
-                "tables": sorted(list(tables)),
-                "columns": sorted(list(columns)),
-                "schema_qualified_tables": sorted(list(schema_qualified_tables)),
-                "parsed": True,
-                "error": None,
-            }
-
-        except sqlglot.ParseError as e:
+            statements = [self._parse_statement(sql, chunk) for chunk in chunks]
+        except sqlglot.errors.TokenError as e:
             error_msg = f"SQL syntax error: {e!s}"
             self.logger.error(error_msg)
             return self._error_result(error_msg)
@@ -93,48 +104,192 @@ class TrinoSQLParser:
             self.logger.error(error_msg)
             return self._error_result(error_msg)
 
-    def _get_statement_type(self, parsed: exp.Expression) -> str:
-        """Determine the type of SQL statement."""
-        statement_type_mapping: dict[type[exp.Expression], str] = {
-            exp.Select: "SELECT",
-            exp.Insert: "INSERT",
-            exp.Update: "UPDATE",
-            exp.Delete: "DELETE",
-            exp.Create: "CREATE",
-            exp.Drop: "DROP",
-            exp.Alter: "ALTER",
-            exp.Merge: "MERGE",
+        if len(statements) == 1:
+            result = statements[0]
+            if not result["parsed"]:
+                self.logger.error(result["error"])
+                return self._error_result(result["error"])
+            result = {**result, "statement_count": 1, "statements": [result]}
+            result.pop("sql")
+        else:
+            result = self._script_result(statements)
+
+        parse_time = time.time() - start_time
+        if result["parsed"]:
+            self.logger.info(
+                f"Successfully parsed {result['statement_type']} statement in {parse_time:.3f}s - "
+                f"Found {len(result['tables'])} tables, {len(result['columns'])} columns"
+            )
+        else:
+            self.logger.error(result["error"])
+        return result
+
+    def fingerprint_sql(self, sql: str) -> dict[str, Any]:
+        """
+        Fingerprint SQL without building an AST.
+
+        Literals, identifier case, whitespace, comments and IN-list lengths
+        do not change the fingerprint (see ``src.parser.fingerprint``), so
+        queries that differ only in parameter values share one fingerprint.
+
+        Args:
+            sql: SQL statement or script string
+
+        Returns:
+            Dictionary containing:
+            - fingerprint: Stable hash of the normalized text
+            - normalized: Normalized text, statements joined with "; "
+            - statement_count: Number of statements found
+            - error: Error message if the SQL could not be tokenized
+
+        Raises:
+            ValueError: If input parameters are invalid
+        """
+        self._check_sql(sql)
+
+        try:
+            chunks = self._split_statements(sql)
+        except sqlglot.errors.TokenError as e:
+            return self._fingerprint_error(f"SQL syntax error: {e!s}")
+        if not chunks:
+            return self._fingerprint_error("No valid statements found")
+
+        normalized = "; ".join(self._normalize(chunk) for chunk in chunks)
+        return {
+            "fingerprint": fingerprint_hash(normalized),
+            "normalized": normalized,
+            "statement_count": len(chunks),
+            "error": None,
         }
 
-        for expr_type, statement_type in statement_type_mapping.items():
-            if isinstance(parsed, expr_type):
-                return statement_type
+    def _fingerprint_error(self, error_message: str) -> dict[str, Any]:
+        """Return the fingerprint error result."""
+        return {
+            "fingerprint": None,
+            "normalized": None,
+            "statement_count": 0,
+            "error": error_message,
+        }
 
-        # Check for general categories
-        if isinstance(parsed, (exp.Insert, exp.Update, exp.Delete, exp.Merge)):
-            return "DML"
-        if isinstance(parsed, (exp.Create, exp.Drop, exp.Alter)):
-            return "DDL"
-        return "UNKNOWN"
+    def _normalize(self, tokens: list[Token]) -> str:
+        """Return the normalized text of one statement's tokens."""
+        return normalize_tokens(tokens, self._keywords)
 
-    def _extract_tables(self, parsed: exp.Expression) -> set[str]:
-        """Extract table names from the parsed SQL."""
-        tables = set()
+    def _cache_key(self, tokens: list[Token]) -> str:
+        """Return the parse cache key of one statement's tokens.
 
-        for table in parsed.find_all(exp.Table):
-            if table.name:
-                tables.add(table.name)
+        Unlike the fingerprint, the key keeps identifier case and quoting,
+        which parse results echo.
+        """
+        return fingerprint_hash(normalize_tokens(tokens, self._keywords, fold_case=False))
 
-        return tables
+    def _check_sql(self, sql: str) -> None:
+        """Reject empty or oversized SQL."""
+        if not sql or not sql.strip():
+            raise ValueError("SQL cannot be empty or whitespace only")
 
-    def _extract_columns(self, parsed: exp.Expression) -> set[str]:
-        """Extract column names from the parsed SQL."""
-        columns = set()
+        if len(sql) > self.config.max_query_length:
+            raise ValueError(f"SQL exceeds maximum length of {self.config.max_query_length} characters")
 
-        # Extract columns from general SQL parts
-        for column in parsed.find_all(exp.Column):
-            if column.name and column.name != "*":
-                columns.add(column.name)
+    def _split_statements(self, sql: str) -> list[list[Token]]:
+        """Tokenize SQL once and split the tokens into statements."""
+        chunks: list[list[Token]] = [[]]
+        for token in self._dialect.tokenize(sql):
+            if token.token_type == TokenType.SEMICOLON:
+                chunks.append([])
+            else:
+                chunks[-1].append(token)
+        return [chunk for chunk in chunks if chunk]
+
+    def _parse_statement(self, sql: str, tokens: list[Token]) -> dict[str, Any]:
+        """Parse one statement's tokens and extract its information."""
+        statement_sql = sql[tokens[0].start : tokens[-1].end + 1]
+
+        # Statements differing only in literals share one cached analysis
+        key = self._cache_key(tokens) if self.cache.max_size else None
+        info = self.cache.get(key) if key else None
+        if info is None:
+            try:
+                expressions = self._dialect.parser().parse(tokens, sql)
+            except sqlglot.ParseError as e:
+                return self._statement_error(statement_sql, f"SQL syntax error: {e!s}")
+
+            parsed = expressions[0] if expressions else None
+            if parsed is None:
+                return self._statement_error(
+                    statement_sql, "Failed to parse SQL statement - no valid statements found"
+                )
+            info = self._analyze(parsed)
+            if key:
+                self.cache.put(key, info)
+        return {
+            **info.to_result(),
+            "sql": statement_sql,
+            "parsed": True,
+            "error": None,
+        }
+
+    def _statement_error(self, statement_sql: str, error_message: str) -> dict[str, Any]:
+        """Return the per-statement error result."""
+        return {
+            "statement_type": None,
+            "tables": [],
+            "columns": [],
+            "schema_qualified_tables": [],
+            "cte_names": [],
+            "sql": statement_sql,
+            "parsed": False,
+            "error": error_message,
+        }
+
+    def _script_result(self, statements: list[dict[str, Any]]) -> dict[str, Any]:
+        """Combine per-statement results for a multi-statement script."""
+        parsed = [s for s in statements if s["parsed"]]
+        errors = [
+            f"Statement {i}: {s['error']}"
+            for i, s in enumerate(statements, start=1)
+            if not s["parsed"]
+        ]
+
+        def union(key: str) -> list[str]:
+            return sorted({value for s in parsed for value in s[key]})
+
+        return {
+            "statement_type": "SCRIPT",
+            "tables": union("tables"),
+            "columns": union("columns"),
+            "schema_qualified_tables": union("schema_qualified_tables"),
+            "cte_names": union("cte_names"),
+            "statement_count": len(statements),
+            "statements": statements,
+            "parsed": not errors,
+            "error": "; ".join(errors) or None,
+        }
+
+    def _analyze(self, parsed: exp.Expression) -> StatementInfo:
+        """Collect tables, qualified names, columns and CTE names in one AST walk."""
+        info = StatementInfo(statement_type=self._get_statement_type(parsed))
+
+        for node in parsed.walk():
+            if isinstance(node, exp.Table):
+                name = node.name
+                if not name:
+                    continue
+                info.tables.add(name)
+                db = node.db
+                if db:
+                    catalog = node.catalog
+                    info.schema_qualified_tables.add(
+                        f"{catalog}.{db}.{name}" if catalog else f"{db}.{name}"
+                    )
+            elif isinstance(node, exp.Column):
+                name = node.name
+                if name and name != "*":
+                    info.columns.add(name)
+            elif isinstance(node, exp.CTE):
+                alias = node.alias
+                if alias:
+                    info.cte_names.add(alias)
 
         # For INSERT statements, extract column names from the column list
         if (
@@ -146,33 +301,46 @@ class TrinoSQLParser:
             # Get columns from INSERT INTO table (col1, col2) part
             for expr in parsed.this.expressions:
                 if isinstance(expr, exp.Identifier) and expr.this:
-                    columns.add(expr.this)
+                    info.columns.add(expr.this)
                 elif hasattr(expr, "name") and expr.name:
-                    columns.add(expr.name)
+                    info.columns.add(expr.name)
 
-        return columns
+        return info
 
-    def _extract_schema_qualified_tables(self, parsed: exp.Expression) -> set[str]:
-        """Extract schema-qualified table names (schema.table)."""
-        qualified_tables = set()
+    def _get_statement_type(self, parsed: exp.Expression) -> str:
+        """Determine the type of SQL statement."""
+        statement_type_mapping: dict[type[exp.Expression], str] = {
+            exp.Select: "SELECT",
+            exp.Insert: "INSERT",
+            exp.Update: "UPDATE",
+            exp.Delete: "DELETE",
+            exp.Create: "CREATE",
+            exp.Drop: "DROP",
+            exp.Alter: "ALTER",
+            exp.Merge: "MERGE",
+        }
 
-        for table in parsed.find_all(exp.Table):
-            if table.catalog and table.db and table.name:
-                qualified_tables.add(f"{table.catalog}.{table.db}.{table.name}")
-            elif table.db and table.name:
-                qualified_tables.add(f"{table.db}.{table.name}")
+        for expr_type, statement_type in statement_type_mapping.items():
+            if isinstance(parsed, expr_type):
+                return statement_type
 
-        return qualified_tables
+        # Check for general categories
+        if isinstance(parsed, (exp.Insert, exp.Update, exp.Delete, exp.Merge)):
+            return "DML"
+        if isinstance(parsed, (exp.Create, exp.Drop, exp.Alter)):
+            return "DDL"
+        return "UNKNOWN"
 
-    def _error_result(
-        self, error_message: str
-    ) -> dict[str, None | bool | str | list[str]]:
+    def _error_result(self, error_message: str) -> dict[str, Any]:
         """Return error result structure."""
         return {
             "statement_type": None,
             "tables": [],
             "columns": [],
             "schema_qualified_tables": [],
+            "cte_names": [],
+            "statement_count": 0,
+            "statements": [],
             "parsed": False,
             "error": error_message,
         }
@@ -186,56 +354,108 @@ class TrinoSQLParser:
 
         Returns:
             True if valid, False otherwise
-            
+
         Raises:
             ValueError: If input parameters are invalid
         """
-        if not sql or not sql.strip():
-            raise ValueError("SQL cannot be empty or whitespace only")
-        
-        if len(sql) > self.config.max_query_length:
-            raise ValueError(f"SQL exceeds maximum length of {self.config.max_query_length} characters")
-        
+        return self.validate(sql)["valid"]
+
+    def validate(
+        self,
+        sql: str,
+        tier: int = ValidationTier.PARSE,
+        schema: MappingSchema | None = None,
+    ) -> dict[str, Any]:
+        """
+        Validate SQL at the requested tier (see ``src.parser.validation``).
+
+        Tier 0 only tokenizes, tier 1 also parses every statement (a
+        statement already in the parse cache has already parsed), and tier 2 also resolves tables and columns against schema.
+
+        Args:
+            sql: SQL statement or script string
+            tier: Validation tier (0, 1 or 2)
+            schema: Known tables and columns, required for tier 2
+
+        Returns:
+            Dictionary containing:
+            - valid: Whether the SQL passed every check of the tier
+            - tier: The tier used
+            - error: First failed check, if any
+            - elapsed_ms: Time spent validating
+
+        Raises:
+            ValueError: If input parameters are invalid
+        """
+        self._check_sql(sql)
+        tier = ValidationTier(tier)
+        if tier is ValidationTier.RESOLVE and schema is None:
+            raise ValueError("Tier 2 validation requires a schema")
+
+        start_time = time.perf_counter()
         try:
-            self.logger.debug(f"Validating SQL query of length {len(sql)}")
-            
-            parsed = sqlglot.parse_one(sql, dialect=self.dialect, read=self.dialect)
-            if parsed is None:
-                self.logger.debug("SQL validation failed - no valid statements found")
-                return False
-
-            # Additional validation: check if the SQL contains valid keywords
-            sql_upper = sql.strip().upper()
-            valid_keywords = [
-                "SELECT",
-                "INSERT",
-                "UPDATE", 
-                "DELETE",
-                "CREATE",
-                "DROP",
-                "ALTER",
-                "MERGE",
-                "WITH",
-                "EXPLAIN",
-                "DESCRIBE",
-                "SHOW",
-                "TRUNCATE",
-                "ANALYZE",
-            ]
-
-            # Check if SQL starts with a valid keyword
-            is_valid = any(sql_upper.startswith(keyword) for keyword in valid_keywords)
-            
-            if is_valid:
-                self.logger.debug("SQL validation successful")
-            else:
-                self.logger.debug("SQL validation failed - invalid statement type")
-                
-            return is_valid
-            
-        except sqlglot.ParseError as e:
-            self.logger.debug(f"SQL validation failed with parse error: {e}")
-            return False
+            self.logger.debug(f"Validating SQL query of length {len(sql)} at tier {tier:d}")
+            error = self._validation_error(sql, tier, schema)
         except Exception as e:
             self.logger.warning(f"Unexpected error during SQL validation: {e}")
-            return False
+            error = f"Unexpected validation error: {e!s}"
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+
+        self.validation_stats.record(tier, elapsed_ms, valid=error is None)
+        if error is None:
+            self.logger.debug("SQL validation successful")
+        else:
+            self.logger.debug(f"SQL validation failed: {error}")
+        return {
+            "valid": error is None,
+            "tier": int(tier),
+            "error": error,
+            "elapsed_ms": round(elapsed_ms, 3),
+        }
+
+    def _validation_error(
+        self, sql: str, tier: ValidationTier, schema: MappingSchema | None
+    ) -> str | None:
+        """Return the first failed validation check, or None."""
+        try:
+            chunks = self._split_statements(sql)
+        except sqlglot.errors.TokenError as e:
+            return f"SQL syntax error: {e!s}"
+        if not chunks:
+            return "No valid statements found"
+
+        for i, tokens in enumerate(chunks, start=1):
+            error = self._validate_statement(sql, tokens, tier, schema)
+            if error is not None:
+                return f"Statement {i}: {error}" if len(chunks) > 1 else error
+        return None
+
+    def _validate_statement(
+        self,
+        sql: str,
+        tokens: list[Token],
+        tier: ValidationTier,
+        schema: MappingSchema | None,
+    ) -> str | None:
+        """Validate one statement's tokens at the given tier."""
+        error = check_tokens(tokens)
+        if error is not None or tier is ValidationTier.TOKENS:
+            return error
+
+        if (
+            tier is ValidationTier.PARSE
+            and self.cache.max_size
+            and self.cache.get(self._cache_key(tokens)) is not None
+        ):
+            return None
+
+        try:
+            expressions = self._dialect.parser().parse(tokens, sql)
+        except sqlglot.ParseError as e:
+            return f"SQL syntax error: {e!s}"
+        parsed = expressions[0] if expressions else None
+        if parsed is None:
+            return "No valid statements found"
+        if tier is ValidationTier.PARSE or schema is None:
+            return None
+        return resolve_references(parsed, schema, self.dialect)
@@ -0,0 +1,205 @@
+"""Tiered SQL validation.
+
+Callers pick how much work a validation request may cost:
+
+- Tier 0 (TOKENS): tokenizer only. Each statement must start with a known
+  statement keyword and have balanced parentheses and brackets.
+- Tier 1 (PARSE): tier 0 plus a full parse of every statement.
+- Tier 2 (RESOLVE): tier 1 plus resolution of every table and column
+  against a caller-supplied schema.
+
+Each tier includes the checks of the tiers below it.
+"""
+
+from __future__ import annotations
+
+from enum import IntEnum
+import threading
+from typing import TYPE_CHECKING, Final
+
+from sqlglot import exp
+from sqlglot.errors import OptimizeError, SchemaError
+from sqlglot.optimizer.normalize_identifiers import normalize_identifiers
+from sqlglot.optimizer.qualify import qualify
+from sqlglot.schema import MappingSchema
+from sqlglot.tokens import TokenType
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from sqlglot.tokens import Token
+
+
+class ValidationTier(IntEnum):
+    """How thoroughly SQL is validated."""
+
+    TOKENS = 0
+    PARSE = 1
+    RESOLVE = 2
+
+
+VALID_STATEMENT_KEYWORDS: Final[frozenset[str]] = frozenset(
+    {
+        "SELECT",
+        "INSERT",
+        "UPDATE",
+        "DELETE",
+        "CREATE",
+        "DROP",
+        "ALTER",
+        "MERGE",
+        "WITH",
+        "EXPLAIN",
+        "DESCRIBE",
+        "SHOW",
+        "TRUNCATE",
+        "ANALYZE",
+    }
+)
+
+_CLOSING: Final[dict[TokenType, TokenType]] = {
+    TokenType.R_PAREN: TokenType.L_PAREN,
+    TokenType.R_BRACKET: TokenType.L_BRACKET,
+}
+_OPENING: Final[frozenset[TokenType]] = frozenset(_CLOSING.values())
+
+
+def check_tokens(tokens: Sequence[Token]) -> str | None:
+    """Run the tier 0 checks on one statement's tokens.
+
+    Args:
+        tokens: Tokens of a single statement (no semicolons)
+
+    Returns:
+        Error message, or None if the statement passes
+    """
+    keyword = tokens[0].text.upper()
+    if keyword not in VALID_STATEMENT_KEYWORDS:
+        return f"Unsupported statement type: {keyword}"
+
+    open_tokens: list[Token] = []
+    for token in tokens:
+        if token.token_type in _OPENING:
+            open_tokens.append(token)
+        elif token.token_type in _CLOSING:
+            if (
+                not open_tokens
+                or open_tokens[-1].token_type != _CLOSING[token.token_type]
+            ):
+                return (
+                    f"Unbalanced '{token.text}' at line {token.line}, col {token.col}"
+                )
+            open_tokens.pop()
+    if open_tokens:
+        token = open_tokens[-1]
+        return f"Unclosed '{token.text}' at line {token.line}, col {token.col}"
+    return None
+
+
+def build_schema(
+    tables: Mapping[str, Sequence[str] | Mapping[str, str]], dialect: str
+) -> MappingSchema:
+    """Build a schema for tier 2 validation.
+
+    Args:
+        tables: Dotted table names (``schema.table`` or
+            ``catalog.schema.table``, the same depth for all) mapped to
+            column names or to column types
+        dialect: SQL dialect of the names and types
+
+    Returns:
+        Schema usable by ``resolve_references``
+
+    Raises:
+        ValueError: If the table names are inconsistent
+    """
+    nested: dict[str, dict] = {}
+    for name, columns in tables.items():
+        *path, table = name.split(".")
+        level = nested
+        for part in path:
+            level = level.setdefault(part, {})
+        level[table] = (
+            dict(columns)
+            if isinstance(columns, dict)
+            else dict.fromkeys(columns, "UNKNOWN")
+        )
+    try:
+        return MappingSchema(nested, dialect=dialect)
+    except SchemaError as e:
+        raise ValueError(f"Invalid schema: {e!s}") from e
+
+
+def resolve_references(
+    expression: exp.Expression, schema: MappingSchema, dialect: str
+) -> str | None:
+    """Run the tier 2 checks on one parsed statement.
+
+    Every table must exist in the schema (CTEs and the table created by a
+    CREATE statement excepted), and every column must resolve to exactly
+    one source.
+
+    Args:
+        expression: Parsed statement (modified in place)
+        schema: Known tables and columns
+        dialect: SQL dialect of the statement
+
+    Returns:
+        Error message, or None if all references resolve
+    """
+    expression = normalize_identifiers(expression, dialect=dialect)
+    cte_names = {cte.alias_or_name for cte in expression.find_all(exp.CTE)}
+    created = None
+    if isinstance(expression, exp.Create):
+        created = expression.this
+        if isinstance(created, exp.Schema):
+            created = created.this
+
+    for table in expression.find_all(exp.Table):
+        if table is created or not table.name:
+            continue
+        if not table.db and table.name in cte_names:
+            continue
+        if schema.find(table, raise_on_missing=False) is None:
+            return f"Unknown table: {table.sql(dialect=dialect)}"
+
+    try:
+        qualify(
+            expression, schema=schema, dialect=dialect, validate_qualify_columns=True
+        )
+    except (OptimizeError, SchemaError) as e:
+        return str(e)
+    return None
+
+
+class TierStats:
+    """Thread-safe request counts and latency per validation tier."""
+
+    def __init__(self) -> None:
+        self._stats: dict[ValidationTier, dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, tier: ValidationTier, elapsed_ms: float, *, valid: bool) -> None:
+        """Record one validation request."""
+        with self._lock:
+            stats = self._stats.setdefault(
+                tier, {"count": 0, "invalid": 0, "total_ms": 0.0, "max_ms": 0.0}
+            )
+            stats["count"] += 1
+            stats["invalid"] += not valid
+            stats["total_ms"] += elapsed_ms
+            stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        """Return count, invalid count and mean/max/total latency per tier."""
+        with self._lock:
+            return {
+                str(int(tier)): {
+                    "count": int(stats["count"]),
+                    "invalid": int(stats["invalid"]),
+                    "mean_ms": round(stats["total_ms"] / stats["count"], 3),
+                    "max_ms": round(stats["max_ms"], 3),
+                    "total_ms": round(stats["total_ms"], 3),
+                }
+                for tier, stats in sorted(self._stats.items())
+            }
@@ -185,3 +185,105 @@ class TestAPIEndpoints:
         assert "items" in data["tables"]
         assert "orders.customer_orders" in data["schema_qualified_tables"]
         assert "customers.customer_info" in data["schema_qualified_tables"]
+
+    def test_parse_sql_script(self, client):
+        """Test parse-sql endpoint with a multi-statement script."""
+        payload = {"sql": "CREATE TABLE s.t (a INT); INSERT INTO s.t SELECT a FROM s.src"}
+        response = client.post(
+            "/parse-sql", data=json.dumps(payload), content_type="application/json"
+        )
+
+        assert response.status_code == 200
+        data = json.loads(response.data)
+
+        assert data["statement_type"] == "SCRIPT"
+        assert data["statement_count"] == 2
+        assert [s["statement_type"] for s in data["statements"]] == ["CREATE", "INSERT"]
+        assert data["schema_qualified_tables"] == ["s.src", "s.t"]
+
+
+    def test_fingerprint(self, client):
+        """Test fingerprint endpoint groups literal variants."""
+        fingerprints = []
+        for sql in ["SELECT * FROM t WHERE id = 1", "select * from T where ID = 42"]:
+            response = client.post(
+                "/fingerprint", data=json.dumps({"sql": sql}), content_type="application/json"
+            )
+            assert response.status_code == 200
+            data = json.loads(response.data)
+            assert data["normalized"] == "SELECT * FROM t WHERE id = ?"
+            fingerprints.append(data["fingerprint"])
+
+        assert fingerprints[0] == fingerprints[1]
+
+    def test_fingerprint_invalid_sql(self, client):
+        """Test fingerprint endpoint with SQL that cannot be tokenized."""
+        response = client.post(
+            "/fingerprint", data=json.dumps({"sql": "SELECT 'abc"}), content_type="application/json"
+        )
+
+        assert response.status_code == 400
+        data = json.loads(response.data)
+        assert data["fingerprint"] is None
+        assert data["error"].startswith("SQL syntax error")
+
+    def test_fingerprint_batch(self, client):
+        """Test batch fingerprinting reports errors per query."""
+        payload = {"queries": ["SELECT 1", "SELECT 2", "", "SELECT 'abc"]}
+        response = client.post(
+            "/fingerprint/batch", data=json.dumps(payload), content_type="application/json"
+        )
+
+        assert response.status_code == 200
+        results = json.loads(response.data)["results"]
+        assert len(results) == 4
+        assert results[0]["fingerprint"] == results[1]["fingerprint"]
+        assert "cannot be empty" in results[2]["error"]
+        assert results[3]["error"].startswith("SQL syntax error")
+
+    def test_fingerprint_batch_too_large(self, client):
+        """Test batch fingerprinting rejects oversized batches."""
+        payload = {"queries": ["SELECT 1"] * 1001}
+        response = client.post(
+            "/fingerprint/batch", data=json.dumps(payload), content_type="application/json"
+        )
+
+        assert response.status_code == 400
+        assert "maximum size" in json.loads(response.data)["error"]
+
+    def test_validate_sql_tiers(self, client):
+        """Test validate-sql endpoint tiers and stats."""
+        payloads = [
+            {"sql": "SELECT a FROM t WHERE", "tier": 0},
+            {"sql": "SELECT a FROM t WHERE", "tier": 1},
+            {"sql": "SELECT c FROM s.t", "tier": 2, "schema": {"s.t": ["a", "b"]}},
+        ]
+        results = []
+        for payload in payloads:
+            response = client.post(
+                "/validate-sql", data=json.dumps(payload), content_type="application/json"
+            )
+            assert response.status_code == 200
+            results.append(json.loads(response.data))
+
+        assert [r["valid"] for r in results] == [True, False, False]
+        assert [r["tier"] for r in results] == [0, 1, 2]
+        assert "could not be resolved" in results[2]["error"]
+
+        stats = json.loads(client.get("/stats").data)
+        assert {tier: s["count"] for tier, s in stats["validation"].items()} == {
+            "0": 1,
+            "1": 1,
+            "2": 1,
+        }
+        assert "hits" in stats["parse_cache"]
+
+    def test_validate_sql_tier2_without_schema(self, client):
+        """Test validate-sql endpoint rejects tier 2 without a schema."""
+        payload = {"sql": "SELECT 1", "tier": 2}
+        response = client.post(
+            "/validate-sql", data=json.dumps(payload), content_type="application/json"
+        )
+
+        assert response.status_code == 400
+        assert "requires a schema" in json.loads(response.data)["error"]
@@ -0,0 +1,217 @@
+"""Tests for the async (ASGI) serving mode."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import json
+import threading
+
+from asgi import create_asgi_app
+import pytest
+from src.parser import async_service
+from src.parser.async_service import AsyncParserService
+from src.parser.exceptions import ServiceOverloadedError
+
+
+async def call(app, method, path, body=None, content_type="application/json"):
+    """Send one HTTP request to an ASGI app and decode the JSON response."""
+    messages = []
+    payload = json.dumps(body).encode() if body is not None else b""
+
+    async def receive():
+        return {"type": "http.request", "body": payload, "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "headers": [(b"content-type", content_type.encode())],
+    }
+    await app(scope, receive, send)
+    return (
+        messages[0]["status"],
+        dict(messages[0]["headers"]),
+        json.loads(messages[1]["body"]),
+    )
+
+
+class BlockingRunner:
+    """Replacement for async_service._run that waits until released."""
+
+    def __init__(self):
+        self.calls = []
+        self.release = threading.Event()
+
+    def __call__(self, operation, sql, options):
+        self.calls.append(sql)
+        self.release.wait(5)
+        return {
+            "fingerprint": "f",
+            "normalized": sql,
+            "statement_count": 1,
+            "error": None,
+        }
+
+
+@pytest.fixture
+def executor():
+    pool = ThreadPoolExecutor(max_workers=4)
+    yield pool
+    pool.shutdown(wait=True)
+
+
+@pytest.fixture
+def blocking(monkeypatch):
+    runner = BlockingRunner()
+    monkeypatch.setattr(async_service, "_run", runner)
+    yield runner
+    runner.release.set()
+
+
+class TestAsyncParserService:
+    """Test cases for coalescing and backpressure."""
+
+    def test_coalesces_identical_requests(self, executor, blocking):
+        """Test identical in-flight requests run once and share the result."""
+        service = AsyncParserService(executor=executor)
+
+        async def scenario():
+            tasks = [
+                asyncio.create_task(service.submit("fingerprint", sql))
+                for sql in ["SELECT 1", "  SELECT 1", "SELECT 1 ", "SELECT 2"]
+            ]
+            await asyncio.sleep(0.05)
+            assert service.pending == 2
+            blocking.release.set()
+            return await asyncio.gather(*tasks)
+
+        results = asyncio.run(scenario())
+
+        assert sorted(blocking.calls) == ["SELECT 1", "SELECT 2"]
+        assert results[0] is results[1] is results[2]
+        assert service.stats()["coalesced"] == 2
+        assert service.pending == 0
+
+    def test_rejects_beyond_max_pending(self, executor, blocking):
+        """Test distinct requests beyond the limit are rejected, duplicates are not."""
+        service = AsyncParserService(executor=executor, max_pending=1, retry_after=7)
+
+        async def scenario():
+            first = asyncio.create_task(service.submit("parse", "SELECT 1"))
+            await asyncio.sleep(0.05)
+            duplicate = asyncio.create_task(service.submit("parse", "SELECT 1"))
+            with pytest.raises(ServiceOverloadedError) as excinfo:
+                await service.submit("parse", "SELECT 2")
+            blocking.release.set()
+            await asyncio.gather(first, duplicate)
+            return excinfo.value
+
+        error = asyncio.run(scenario())
+
+        assert error.retry_after == 7
+        assert service.stats()["rejected"] == 1
+        assert service.stats()["submitted"] == 1
+
+    def test_process_pool(self):
+        """Test operations run in spawned parser processes."""
+        service = AsyncParserService(workers=1)
+
+        async def scenario():
+            return await asyncio.gather(
+                service.submit("parse", "SELECT a FROM s.t"),
+                service.submit(
+                    "validate",
+                    "SELECT c FROM s.t",
+                    {"tier": 2, "schema": {"s.t": ["a"]}},
+                ),
+            )
+
+        try:
+            parsed, validated = asyncio.run(scenario())
+        finally:
+            service.shutdown()
+
+        assert parsed["schema_qualified_tables"] == ["s.t"]
+        assert validated["valid"] is False
+
+
+class TestASGIApp:
+    """Test cases for the ASGI endpoints."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.pool = ThreadPoolExecutor(max_workers=2)
+        self.app = create_asgi_app(
+            AsyncParserService(executor=self.pool, max_pending=1)
+        )
+
+    def teardown_method(self):
+        """Stop the executor."""
+        self.pool.shutdown(wait=True)
+
+    def test_endpoints(self):
+        """Test parse, validate and fingerprint match the Flask API."""
+
+        async def scenario():
+            return (
+                await call(
+                    self.app, "POST", "/parse-sql", {"sql": "SELECT a FROM s.t"}
+                ),
+                await call(
+                    self.app, "POST", "/validate-sql", {"sql": "SELEC 1", "tier": 0}
+                ),
+                await call(self.app, "POST", "/fingerprint", {"sql": "SELECT 1"}),
+                await call(self.app, "GET", "/health"),
+            )
+
+        parsed, validated, fingerprinted, health = asyncio.run(scenario())
+
+        assert parsed[0] == 200 and parsed[2]["tables"] == ["t"]
+        assert validated[0] == 200 and validated[2]["valid"] is False
+        assert fingerprinted[2]["normalized"] == "SELECT ?"
+        assert health[2] == {"status": "healthy", "service": "sql-parser"}
+
+    def test_errors(self):
+        """Test request errors map to the same status codes as the Flask API."""
+
+        async def scenario():
+            return (
+                await call(self.app, "POST", "/parse-sql", {"sql": "SELECT FROM"}),
+                await call(self.app, "POST", "/parse-sql", {"sql": " "}),
+                await call(self.app, "POST", "/parse-sql", {}),
+                await call(
+                    self.app, "POST", "/parse-sql", {"sql": "SELECT 1"}, "text/plain"
+                ),
+                await call(
+                    self.app, "POST", "/validate-sql", {"sql": "SELECT 1", "tier": 2}
+                ),
+                await call(self.app, "GET", "/parse-sql"),
+                await call(self.app, "GET", "/missing"),
+            )
+
+        statuses = [status for status, _, _ in asyncio.run(scenario())]
+
+        assert statuses == [400, 400, 400, 400, 400, 405, 404]
+
+    def test_busy_returns_503(self, blocking):
+        """Test a full queue answers 503 with Retry-After."""
+
+        async def scenario():
+            first = asyncio.create_task(
+                call(self.app, "POST", "/fingerprint", {"sql": "SELECT 1"})
+            )
+            await asyncio.sleep(0.05)
+            busy = await call(self.app, "POST", "/fingerprint", {"sql": "SELECT 2"})
+            blocking.release.set()
+            await first
+            stats = await call(self.app, "GET", "/stats")
+            return busy, stats
+
+        (status, headers, body), stats = asyncio.run(scenario())
+
+        assert status == 503
+        assert headers[b"retry-after"] == b"1"
+        assert "Too many pending requests" in body["error"]
+        assert stats[2]["rejected"] == 1
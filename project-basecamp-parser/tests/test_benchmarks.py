@@ -0,0 +1,91 @@
+"""Tests for the benchmark corpus and regression harness."""
+
+from benchmarks.corpus import DEFAULT_SIZES, build_corpus
+from benchmarks.regression import Measurement, compare, run_benchmarks, summarize
+from src.parser.config import get_parser_config
+
+
+def measurement(p50_ms, peak_kib=100.0):
+    return Measurement(
+        p50_ms=p50_ms,
+        p95_ms=p50_ms,
+        p99_ms=p50_ms,
+        mean_ms=p50_ms,
+        peak_kib=peak_kib,
+        samples=5,
+    )
+
+
+class TestCorpus:
+    """Test cases for the synthetic query corpus."""
+
+    def test_reproducible(self):
+        """Test the same seed builds the same corpus."""
+        assert build_corpus(seed=1) == build_corpus(seed=1)
+        assert build_corpus(seed=1) != build_corpus(seed=2)
+
+    def test_sizes_fit_max_query_length(self):
+        """Test every query can be sent to the service unchanged."""
+        cases = build_corpus()
+
+        assert len(cases) == sum(len(sizes) for sizes in DEFAULT_SIZES.values())
+        assert (
+            max(len(case.sql) for case in cases) <= get_parser_config().max_query_length
+        )
+        assert {"join_50", "cte_200", "in_list_10000", "insert_select_200"} <= {
+            case.name for case in cases
+        }
+
+
+class TestRegressionHarness:
+    """Test cases for measuring and comparing against a baseline."""
+
+    def test_summarize_percentiles(self):
+        """Test percentiles over latency samples."""
+        result = summarize([float(ms) for ms in range(1, 101)], peak_kib=12.34)
+
+        assert result.p50_ms == 50.5
+        assert result.p95_ms == 95.05
+        assert result.p99_ms == 99.01
+        assert result.peak_kib == 12.3
+        assert summarize([3.0], peak_kib=0).p99_ms == 3.0
+
+    def test_compare_threshold(self):
+        """Test only growth beyond the relative and absolute limits regresses."""
+        baseline = {
+            "inproc/parse/a": {"p50_ms": 10.0, "peak_kib": 100.0},
+            "inproc/parse/b": {"p50_ms": 0.2, "peak_kib": 100.0},
+            "inproc/parse/c": {"p50_ms": 10.0, "peak_kib": 100.0},
+        }
+        current = {
+            "inproc/parse/a": measurement(13.0),
+            "inproc/parse/b": measurement(0.6),  # +200% but under min_delta_ms
+            "inproc/parse/c": measurement(12.0, peak_kib=200.0),
+            "inproc/parse/new": measurement(50.0),
+        }
+
+        regressions = compare(
+            baseline, current, threshold=0.25, min_delta_ms=1.0, min_delta_kib=64.0
+        )
+
+        assert [(r.key, r.metric) for r in regressions] == [
+            ("inproc/parse/a", "p50_ms"),
+            ("inproc/parse/c", "peak_kib"),
+        ]
+        assert round(regressions[0].change, 2) == 0.3
+        assert compare(baseline, current, threshold=0.5) == [regressions[1]]
+        assert compare(baseline, current, threshold=0.5, min_delta_kib=200.0) == []
+
+    def test_run_in_process_and_http(self):
+        """Test one small case runs through both modes."""
+        cases = [case for case in build_corpus() if case.name == "simple"]
+
+        results = run_benchmarks(cases, iterations=2)
+
+        assert sorted(results) == [
+            "http/parse/simple",
+            "http/validate/simple",
+            "inproc/parse/simple",
+            "inproc/validate/simple",
+        ]
+        assert all(m.samples == 2 and m.p50_ms > 0 for m in results.values())
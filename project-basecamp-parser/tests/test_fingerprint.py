@@ -0,0 +1,145 @@
+"""Tests for query fingerprinting and the parse cache."""
+
+import pytest
+from src.parser.fingerprint import ParseCache, fingerprint_hash
+from src.parser.sql_parser import TrinoSQLParser
+
+
+class TestFingerprint:
+    """Test cases for TrinoSQLParser.fingerprint_sql."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.parser = TrinoSQLParser()
+
+    def normalized(self, sql):
+        return self.parser.fingerprint_sql(sql)["normalized"]
+
+    def test_literals_and_placeholders(self):
+        """Test literals, signs and placeholders normalize to ?."""
+        assert (
+            self.normalized(
+                "SELECT a FROM t WHERE b = 'x' AND c = -1.5e3 AND d = ? AND e = a - 5 LIMIT 10"
+            )
+            == "SELECT a FROM t WHERE b = ? AND c = ? AND d = ? AND e = a - ? LIMIT ?"
+        )
+
+    def test_in_lists_collapse(self):
+        """Test IN lists of any length share one form."""
+        assert self.normalized("SELECT a FROM t WHERE b IN (1, 2, 3)") == (
+            "SELECT a FROM t WHERE b IN (?)"
+        )
+        assert self.normalized(
+            "SELECT a FROM t WHERE (b, c) NOT IN ((1, 2), (3, 4))"
+        ) == ("SELECT a FROM t WHERE (b, c) NOT IN (?)")
+        assert self.normalized("SELECT a FROM t WHERE b IN (SELECT b FROM u)") == (
+            "SELECT a FROM t WHERE b IN (SELECT b FROM u)"
+        )
+
+    def test_identifiers_whitespace_and_comments(self):
+        """Test case, quoting, spacing and comments do not matter."""
+        first = self.parser.fingerprint_sql(
+            'SELECT "Col", COUNT(*)\n  FROM "Cat".s.t -- nightly\nWHERE x=1'
+        )
+        second = self.parser.fingerprint_sql(
+            "select col, count( * ) from cat.S.T where X = 2"
+        )
+
+        assert first["normalized"] == "SELECT col, count(*) FROM cat.s.t WHERE x = ?"
+        assert first["fingerprint"] == second["fingerprint"]
+        assert first["fingerprint"] == fingerprint_hash(first["normalized"])
+        assert self.normalized('SELECT "select", "my col" FROM t') == (
+            'SELECT "select", "my col" FROM t'
+        )
+
+    def test_different_queries_differ(self):
+        """Test structural changes change the fingerprint."""
+        first = self.parser.fingerprint_sql("SELECT a FROM t WHERE b = 1")
+        second = self.parser.fingerprint_sql("SELECT a FROM t WHERE c = 1")
+
+        assert first["fingerprint"] != second["fingerprint"]
+
+    def test_script(self):
+        """Test scripts are normalized statement by statement."""
+        result = self.parser.fingerprint_sql("DELETE FROM t WHERE id = 1; SELECT 1;")
+
+        assert result["statement_count"] == 2
+        assert result["normalized"] == "DELETE FROM t WHERE id = ?; SELECT ?"
+
+    def test_errors(self):
+        """Test tokenizer errors and empty input."""
+        result = self.parser.fingerprint_sql("SELECT 'abc")
+
+        assert result["fingerprint"] is None
+        assert result["error"].startswith("SQL syntax error")
+        assert self.parser.fingerprint_sql(";")["error"] == "No valid statements found"
+        with pytest.raises(ValueError, match="cannot be empty"):
+            self.parser.fingerprint_sql("  ")
+
+
+class TestParseCache:
+    """Test cases for fingerprint-keyed parse result caching."""
+
+    def test_parameterized_variants_share_entry(self):
+        """Test variants that differ only in literals are parsed once."""
+        parser = TrinoSQLParser()
+
+        first = parser.parse_sql("SELECT a FROM s.t WHERE b = 1")
+        second = parser.parse_sql("SELECT a FROM s.t WHERE b IN (2, 3)")
+        parser.parse_sql("SELECT a FROM s.t WHERE b = 1")
+
+        assert parser.cache.info() == {
+            "hits": 1,
+            "misses": 2,
+            "size": 2,
+            "max_size": 1024,
+        }
+        assert second["statements"][0]["sql"] == "SELECT a FROM s.t WHERE b IN (2, 3)"
+        assert first["columns"] == second["columns"] == ["a", "b"]
+
+    def test_identifier_case_not_shared(self):
+        """Test cached results keep the identifier case of each query."""
+        parser = TrinoSQLParser()
+        parser.parse_sql("SELECT UserId FROM Sales.Orders")
+        parser.parse_sql('SELECT "Total Amount" FROM t')
+
+        lower = parser.parse_sql("select userid from sales.orders where x = 2")
+        quoted = parser.parse_sql('SELECT "total amount" FROM t')
+
+        assert lower["columns"] == ["userid", "x"]
+        assert lower["schema_qualified_tables"] == ["sales.orders"]
+        assert quoted["columns"] == ["total amount"]
+        assert parser.cache.hits == 0
+        assert (
+            parser.fingerprint_sql("SELECT UserId FROM Sales.Orders")["fingerprint"]
+            == parser.fingerprint_sql("select userid from sales.orders")["fingerprint"]
+        )
+
+    def test_script_statements_share_entries(self):
+        """Test statements of a script hit entries of single queries."""
+        parser = TrinoSQLParser()
+        parser.parse_sql("SELECT a FROM t WHERE b = 1")
+
+        result = parser.parse_sql("SELECT a FROM t WHERE b = 2; SELECT c FROM u")
+
+        assert result["tables"] == ["t", "u"]
+        assert parser.cache.hits == 1
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted."""
+        cache = ParseCache(max_size=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert len(cache) == 2
+
+    def test_disabled(self):
+        """Test a zero-size cache stores nothing."""
+        cache = ParseCache(max_size=0)
+        cache.put("a", 1)
+
+        assert cache.get("a") is None
@@ -163,3 +163,57 @@ class TestTrinoSQLParser:
         assert result["statement_type"] == "SELECT"
         assert "table1" in result["tables"]
         assert "catalog.schema.table1" in result["schema_qualified_tables"]
+
+    def test_parse_cte_names(self):
+        """Test CTE names are reported alongside tables and columns."""
+        sql = """
+        WITH recent AS (SELECT id, amount FROM sales.orders),
+             totals AS (SELECT id, SUM(amount) AS total FROM recent GROUP BY id)
+        SELECT id, total FROM totals
+        """
+        result = self.parser.parse_sql(sql)
+
+        assert result["parsed"] is True
+        assert result["statement_type"] == "SELECT"
+        assert result["cte_names"] == ["recent", "totals"]
+        assert "orders" in result["tables"]
+        assert result["schema_qualified_tables"] == ["sales.orders"]
+        assert result["columns"] == ["amount", "id", "total"]
+        assert result["statement_count"] == 1
+        assert result["statements"][0]["sql"].startswith("WITH recent")
+
+    def test_parse_multi_statement_script(self):
+        """Test each statement of a script gets its own result."""
+        sql = "SELECT a FROM s.t1; ; DELETE FROM s.t2 WHERE b = 1;"
+        result = self.parser.parse_sql(sql)
+
+        assert result["parsed"] is True
+        assert result["statement_type"] == "SCRIPT"
+        assert result["statement_count"] == 2
+        assert [s["statement_type"] for s in result["statements"]] == [
+            "SELECT",
+            "DELETE",
+        ]
+        assert [s["sql"] for s in result["statements"]] == [
+            "SELECT a FROM s.t1",
+            "DELETE FROM s.t2 WHERE b = 1",
+        ]
+        assert result["tables"] == ["t1", "t2"]
+        assert result["columns"] == ["a", "b"]
+
+    def test_parse_script_with_invalid_statement(self):
+        """Test a syntax error in one statement keeps the others' results."""
+        sql = "SELECT a FROM t1; SELEC b FRO t2; SELECT c FROM t3"
+        result = self.parser.parse_sql(sql)
+
+        assert result["parsed"] is False
+        assert result["error"].startswith("Statement 2: SQL syntax error")
+        assert [s["parsed"] for s in result["statements"]] == [True, False, True]
+        assert result["tables"] == ["t1", "t3"]
+
+    def test_parse_unterminated_string(self):
+        """Test tokenizer errors are reported as syntax errors."""
+        result = self.parser.parse_sql("SELECT 'abc")
+
+        assert result["parsed"] is False
+        assert result["error"].startswith("SQL syntax error")
@@ -0,0 +1,87 @@
+"""Tests for tiered SQL validation."""
+
+import pytest
+from src.parser.sql_parser import TrinoSQLParser
+from src.parser.validation import ValidationTier, build_schema
+
+SCHEMA = {"s.t": ["a", "b"], "s.u": {"id": "int", "a": "int"}}
+
+
+class TestTieredValidation:
+    """Test cases for TrinoSQLParser.validate."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.parser = TrinoSQLParser()
+        self.schema = build_schema(SCHEMA, self.parser.dialect)
+
+    def error(self, sql, tier):
+        return self.parser.validate(sql, tier, self.schema)["error"]
+
+    def test_tier0_tokens(self):
+        """Test tier 0 checks keywords and balanced brackets only."""
+        assert self.error("SELECT a[1] FROM t WHERE (b = 1)", 0) is None
+        assert self.error("SELEC a FROM t", 0) == "Unsupported statement type: SELEC"
+        assert self.error("SELECT a FROM t WHERE (b = 1", 0).startswith("Unclosed '('")
+        assert self.error("SELECT a FROM t WHERE b = 1)", 0).startswith(
+            "Unbalanced ')'"
+        )
+        assert self.error("SELECT 'abc", 0).startswith("SQL syntax error")
+        # Not parsed at tier 0
+        assert self.error("SELECT a FROM t WHERE", 0) is None
+
+    def test_tier1_parse(self):
+        """Test tier 1 adds a full parse."""
+        assert self.error("SELECT a FROM t WHERE", 1).startswith("SQL syntax error")
+        assert self.error("SELECT a FROM missing", 1) is None
+
+    def test_tier1_uses_parse_cache(self):
+        """Test statements already in the parse cache are not parsed again."""
+        self.parser.parse_sql("SELECT a FROM t WHERE b = 1")
+
+        assert self.error("SELECT a FROM t WHERE b = 2", 1) is None
+        assert self.parser.cache.hits == 1
+
+    def test_tier2_resolve(self):
+        """Test tier 2 resolves tables and columns against the schema."""
+        assert self.error("SELECT a, B FROM S.T", 2) is None
+        assert self.error("SELECT a FROM s.missing", 2) == "Unknown table: s.missing"
+        assert "'c' could not be resolved" in self.error("SELECT c FROM s.t", 2)
+        # Ambiguous between both tables
+        assert "'a' could not be resolved" in self.error(
+            "SELECT a FROM s.t JOIN s.u ON t.a = u.id", 2
+        )
+
+    def test_tier2_ctes_and_create(self):
+        """Test CTEs and created tables do not need to be in the schema."""
+        assert self.error("WITH x AS (SELECT a FROM s.t) SELECT a FROM x", 2) is None
+        assert self.error("CREATE TABLE s.new AS SELECT id FROM s.u", 2) is None
+
+    def test_script_reports_statement(self):
+        """Test the failing statement of a script is named."""
+        error = self.error("SELECT a FROM s.t; SELECT z FROM s.u", 2)
+
+        assert error.startswith("Statement 2:")
+
+    def test_invalid_arguments(self):
+        """Test tier 2 requires a schema and unknown tiers are rejected."""
+        with pytest.raises(ValueError, match="requires a schema"):
+            self.parser.validate("SELECT 1", ValidationTier.RESOLVE)
+        with pytest.raises(ValueError, match="not a valid ValidationTier"):
+            self.parser.validate("SELECT 1", 3)
+        with pytest.raises(ValueError, match="Invalid schema"):
+            build_schema({"s.t": ["a"], "u": ["b"]}, self.parser.dialect)
+
+    def test_latency_per_tier(self):
+        """Test latency is reported per request and aggregated per tier."""
+        result = self.parser.validate("SELECT 1", 0)
+        self.parser.validate("SELEC 1", 0)
+        self.parser.validate("SELECT 1")
+
+        assert result["tier"] == 0
+        assert result["elapsed_ms"] >= 0
+        stats = self.parser.validation_stats.snapshot()
+        assert stats["0"]["count"] == 2
+        assert stats["0"]["invalid"] == 1
+        assert stats["1"]["count"] == 1
+        assert "2" not in stats
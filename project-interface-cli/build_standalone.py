@@ -58,6 +58,8 @@ def main():
         "--clean",  # Clean build
         "--noconfirm",  # Overwrite without confirmation
         "--console",  # Console application
+        # Subcommands are imported lazily by module path (dli.commands.lazy)
+        "--collect-submodules=dli.commands",
         str(main_script),
     ]
 
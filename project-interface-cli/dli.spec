@@ -2,6 +2,8 @@
 
 import os
 
+from PyInstaller.utils.hooks import collect_submodules
+
 # Get the directory where the spec file is located
 spec_dir = os.path.dirname(os.path.abspath(SPEC))
 
@@ -10,7 +12,8 @@ a = Analysis(
     pathex=[os.path.join(spec_dir, 'src')],
     binaries=[],
     datas=[],
-    hiddenimports=['typer', 'rich', 'click'],
+    # dli.commands.* are imported lazily by module path, so list them explicitly
+    hiddenimports=['typer', 'rich', 'click'] + collect_submodules('dli.commands'),
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
@@ -53,102 +53,221 @@ Example (Airflow PythonOperator):
     ...     return result.model_dump()
 """
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.2.0"
 
-# Public API classes
-from dli.api import (
-    CatalogAPI,
-    ConfigAPI,
-    DatasetAPI,
-    DebugAPI,
-    LineageAPI,
-    MetricAPI,
-    QualityAPI,
-    QueryAPI,
-    RunAPI,
-    SqlAPI,
-    TranspileAPI,
-    WorkflowAPI,
-)
-
-# Debug models (public API)
-from dli.core.debug.models import CheckCategory, CheckResult, CheckStatus, DebugResult
-
-# Exceptions
-from dli.exceptions import (
-    ConfigEnvNotFoundError,
-    ConfigTemplateError,
-    ConfigurationError,
-    ConfigValidationError,
-    ConfigWriteError,
-    DatasetNotFoundError,
-    DebugCheckError,
-    DebugTimeoutError,
-    DLIError,
-    DLIValidationError,
-    ErrorCode,
-    ExecutionError,
-    FormatConfigError,
-    FormatDialectError,
-    FormatError,
-    FormatLintError,
-    FormatSqlError,
-    FormatYamlError,
-    LineageError,
-    LineageNotFoundError,
-    LineageTimeoutError,
-    MetricNotFoundError,
-    QualityNotFoundError,
-    QualitySpecNotFoundError,
-    QualitySpecParseError,
-    QualityTargetNotFoundError,
-    QueryAccessDeniedError,
-    QueryCancelError,
-    QueryInvalidFilterError,
-    QueryNotFoundError,
-    RunExecutionError,
-    RunFileNotFoundError,
-    RunLocalDeniedError,
-    RunOutputError,
-    RunServerUnavailableError,
-    ServerError,
-    SqlAccessDeniedError,
-    SqlFileNotFoundError,
-    SqlTeamNotFoundError,
-    SqlWorksheetNotFoundError,
-    SqlUpdateFailedError,
-    TableNotFoundError,
-    TranspileError,
-    WorkflowExecutionError,
-    WorkflowNotFoundError,
-    WorkflowPermissionError,
-    WorkflowRegistrationError,
-)
-
-# Context and Configuration
-# Config models
-from dli.models.common import ConfigValue, ExecutionContext, ExecutionMode, TraceMode
-from dli.models.config import (
-    ConfigSource,
-    ConfigValidationResult,
-    ConfigValueInfo,
-    EnvironmentProfile,
-)
-
-# Trace context
-from dli.core.trace import TraceContext, get_current_trace, with_trace
-
-# Format models (public API)
-from dli.models.format import (
-    FileFormatResult,
-    FileFormatStatus,
-    FormatResult,
-    FormatStatus,
-    LintViolation,
-)
-
-# Run models (public API)
-from dli.models.run import ExecutionPlan, OutputFormat, RunResult
+if TYPE_CHECKING:
+    # Public API classes
+    from dli.api import (
+        CatalogAPI,
+        ConfigAPI,
+        DatasetAPI,
+        DebugAPI,
+        LineageAPI,
+        MetricAPI,
+        QualityAPI,
+        QueryAPI,
+        RunAPI,
+        SqlAPI,
+        TranspileAPI,
+        WorkflowAPI,
+    )
+
+    # Debug models (public API)
+    from dli.core.debug.models import (
+        CheckCategory,
+        CheckResult,
+        CheckStatus,
+        DebugResult,
+    )
+
+    # Trace context
+    from dli.core.trace import TraceContext, get_current_trace, with_trace
+
+    # Exceptions
+    from dli.exceptions import (
+        ConfigEnvNotFoundError,
+        ConfigTemplateError,
+        ConfigurationError,
+        ConfigValidationError,
+        ConfigWriteError,
+        DatasetNotFoundError,
+        DebugCheckError,
+        DebugTimeoutError,
+        DLIError,
+        DLIValidationError,
+        ErrorCode,
+        ExecutionError,
+        FormatConfigError,
+        FormatDialectError,
+        FormatError,
+        FormatLintError,
+        FormatSqlError,
+        FormatYamlError,
+        LineageError,
+        LineageNotFoundError,
+        LineageTimeoutError,
+        MetricNotFoundError,
+        QualityNotFoundError,
+        QualitySpecNotFoundError,
+        QualitySpecParseError,
+        QualityTargetNotFoundError,
+        QueryAccessDeniedError,
+        QueryCancelError,
+        QueryInvalidFilterError,
+        QueryNotFoundError,
+        RunExecutionError,
+        RunFileNotFoundError,
+        RunLocalDeniedError,
+        RunOutputError,
+        RunServerUnavailableError,
+        ServerError,
+        SqlAccessDeniedError,
+        SqlFileNotFoundError,
+        SqlTeamNotFoundError,
+        SqlUpdateFailedError,
+        SqlWorksheetNotFoundError,
+        TableNotFoundError,
+        TranspileError,
+        WorkflowExecutionError,
+        WorkflowNotFoundError,
+        WorkflowPermissionError,
+        WorkflowRegistrationError,
+    )
+
+    # Context and Configuration
+    # Config models
+    from dli.models.common import (
+        ConfigValue,
+        ExecutionContext,
+        ExecutionMode,
+        TraceMode,
+    )
+    from dli.models.config import (
+        ConfigSource,
+        ConfigValidationResult,
+        ConfigValueInfo,
+        EnvironmentProfile,
+    )
+
+    # Format models (public API)
+    from dli.models.format import (
+        FileFormatResult,
+        FileFormatStatus,
+        FormatResult,
+        FormatStatus,
+        LintViolation,
+    )
+
+    # Run models (public API)
+    from dli.models.run import ExecutionPlan, OutputFormat, RunResult
+
+# Public names are resolved on first access (PEP 562) so that ``import dli``
+# stays cheap; ``from dli import DatasetAPI`` imports only what DatasetAPI needs.
+_LAZY_IMPORTS: dict[str, str] = {
+    "CatalogAPI": "dli.api",
+    "ConfigAPI": "dli.api",
+    "DatasetAPI": "dli.api",
+    "DebugAPI": "dli.api",
+    "LineageAPI": "dli.api",
+    "MetricAPI": "dli.api",
+    "QualityAPI": "dli.api",
+    "QueryAPI": "dli.api",
+    "RunAPI": "dli.api",
+    "SqlAPI": "dli.api",
+    "TranspileAPI": "dli.api",
+    "WorkflowAPI": "dli.api",
+    "CheckCategory": "dli.core.debug.models",
+    "CheckResult": "dli.core.debug.models",
+    "CheckStatus": "dli.core.debug.models",
+    "DebugResult": "dli.core.debug.models",
+    "ConfigEnvNotFoundError": "dli.exceptions",
+    "ConfigTemplateError": "dli.exceptions",
+    "ConfigurationError": "dli.exceptions",
+    "ConfigValidationError": "dli.exceptions",
+    "ConfigWriteError": "dli.exceptions",
+    "DatasetNotFoundError": "dli.exceptions",
+    "DebugCheckError": "dli.exceptions",
+    "DebugTimeoutError": "dli.exceptions",
+    "DLIError": "dli.exceptions",
+    "DLIValidationError": "dli.exceptions",
+    "ErrorCode": "dli.exceptions",
+    "ExecutionError": "dli.exceptions",
+    "FormatConfigError": "dli.exceptions",
+    "FormatDialectError": "dli.exceptions",
+    "FormatError": "dli.exceptions",
+    "FormatLintError": "dli.exceptions",
+    "FormatSqlError": "dli.exceptions",
+    "FormatYamlError": "dli.exceptions",
+    "LineageError": "dli.exceptions",
+    "LineageNotFoundError": "dli.exceptions",
+    "LineageTimeoutError": "dli.exceptions",
+    "MetricNotFoundError": "dli.exceptions",
+    "QualityNotFoundError": "dli.exceptions",
+    "QualitySpecNotFoundError": "dli.exceptions",
+    "QualitySpecParseError": "dli.exceptions",
+    "QualityTargetNotFoundError": "dli.exceptions",
+    "QueryAccessDeniedError": "dli.exceptions",
+    "QueryCancelError": "dli.exceptions",
+    "QueryInvalidFilterError": "dli.exceptions",
+    "QueryNotFoundError": "dli.exceptions",
+    "RunExecutionError": "dli.exceptions",
+    "RunFileNotFoundError": "dli.exceptions",
+    "RunLocalDeniedError": "dli.exceptions",
+    "RunOutputError": "dli.exceptions",
+    "RunServerUnavailableError": "dli.exceptions",
+    "ServerError": "dli.exceptions",
+    "SqlAccessDeniedError": "dli.exceptions",
+    "SqlFileNotFoundError": "dli.exceptions",
+    "SqlTeamNotFoundError": "dli.exceptions",
+    "SqlWorksheetNotFoundError": "dli.exceptions",
+    "SqlUpdateFailedError": "dli.exceptions",
+    "TableNotFoundError": "dli.exceptions",
+    "TranspileError": "dli.exceptions",
+    "WorkflowExecutionError": "dli.exceptions",
+    "WorkflowNotFoundError": "dli.exceptions",
+    "WorkflowPermissionError": "dli.exceptions",
+    "WorkflowRegistrationError": "dli.exceptions",
+    "ConfigValue": "dli.models.common",
+    "ExecutionContext": "dli.models.common",
+    "ExecutionMode": "dli.models.common",
+    "TraceMode": "dli.models.common",
+    "ConfigSource": "dli.models.config",
+    "ConfigValidationResult": "dli.models.config",
+    "ConfigValueInfo": "dli.models.config",
+    "EnvironmentProfile": "dli.models.config",
+    "TraceContext": "dli.core.trace",
+    "get_current_trace": "dli.core.trace",
+    "with_trace": "dli.core.trace",
+    "FileFormatResult": "dli.models.format",
+    "FileFormatStatus": "dli.models.format",
+    "FormatResult": "dli.models.format",
+    "FormatStatus": "dli.models.format",
+    "LintViolation": "dli.models.format",
+    "ExecutionPlan": "dli.models.run",
+    "OutputFormat": "dli.models.run",
+    "RunResult": "dli.models.run",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public attribute from its defining module on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS})
+
 
 __all__ = [
     # API Classes
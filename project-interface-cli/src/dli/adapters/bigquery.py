@@ -10,8 +10,10 @@ from concurrent.futures import TimeoutError as FuturesTimeoutError
 import time
 from typing import TYPE_CHECKING, Any
 
+from dli.core.cancellation import InterruptReason, request_cancel
 from dli.core.executor import BaseExecutor
 from dli.core.models import ExecutionResult
+from dli.core.spans import traced
 
 # Optional BigQuery dependency
 BIGQUERY_AVAILABLE = False
@@ -41,15 +43,25 @@ class BigQueryExecutor(BaseExecutor):
     Attributes:
         project: GCP project ID
         location: BigQuery location (default: US)
+        maximum_bytes_billed: Default byte cap for executed queries (optional)
         client: BigQuery client instance
     """
 
-    def __init__(self, project: str, location: str = "US"):
+    supports_maximum_bytes_billed = True
+
+    def __init__(
+        self,
+        project: str,
+        location: str = "US",
+        maximum_bytes_billed: int | None = None,
+    ):
         """Initialize the BigQuery executor.
 
         Args:
             project: GCP project ID
             location: BigQuery location
+            maximum_bytes_billed: Default byte cap for executed queries;
+                BigQuery fails queries that would bill more bytes
 
         Raises:
             ImportError: If google-cloud-bigquery is not installed
@@ -63,22 +75,46 @@ class BigQueryExecutor(BaseExecutor):
 
         self.project = project
         self.location = location
+        self.maximum_bytes_billed = maximum_bytes_billed
         self.client = _bigquery_module.Client(project=project, location=location)
 
-    def execute_sql(self, sql: str, timeout: int = 300) -> ExecutionResult:
+    @traced("executor.bigquery")
+    def execute_sql(
+        self,
+        sql: str,
+        timeout: int = 300,
+        *,
+        maximum_bytes_billed: int | None = None,
+    ) -> ExecutionResult:
         """Execute a SQL query on BigQuery.
 
         Args:
             sql: SQL query to execute
             timeout: Execution timeout in seconds
+            maximum_bytes_billed: Byte cap for this query (overrides the
+                executor default)
 
         Returns:
-            ExecutionResult with query results
+            ExecutionResult with query results. When the timeout passes or
+            the user presses Ctrl-C, the job is cancelled and the result
+            records the cancellation latency.
         """
         start = time.time()
+        job = None
+        bytes_cap = (
+            maximum_bytes_billed
+            if maximum_bytes_billed is not None
+            else self.maximum_bytes_billed
+        )
 
         try:
-            job = self.client.query(sql)
+            if bytes_cap is not None:
+                job_config = _bigquery_module.QueryJobConfig(
+                    maximum_bytes_billed=bytes_cap
+                )
+                job = self.client.query(sql, job_config=job_config)
+            else:
+                job = self.client.query(sql)
             results = job.result(timeout=timeout)
 
             # Convert results to list of dictionaries
@@ -100,14 +136,25 @@ class BigQueryExecutor(BaseExecutor):
                 execution_time_ms=int((time.time() - start) * 1000),
             )
 
-        except FuturesTimeoutError:
+        except (FuturesTimeoutError, KeyboardInterrupt) as e:
+            timed_out = isinstance(e, FuturesTimeoutError)
+            latency = request_cancel(job.cancel, job.done) if job is not None else None
             return ExecutionResult(
                 dataset_name="",
                 phase="main",
                 success=False,
-                error_message=f"Query timed out after {timeout} seconds",
+                error_message=(
+                    f"Query timed out after {timeout} seconds"
+                    if timed_out
+                    else "Query cancelled by user"
+                ),
                 rendered_sql=sql,
                 execution_time_ms=int((time.time() - start) * 1000),
+                cancelled=job is not None,
+                interrupt_reason=(
+                    InterruptReason.TIMEOUT if timed_out else InterruptReason.USER
+                ),
+                cancel_latency_ms=latency,
             )
         except Exception as e:
             # Catch BigQuery API errors and other unexpected errors
@@ -120,6 +167,7 @@ class BigQueryExecutor(BaseExecutor):
                 execution_time_ms=int((time.time() - start) * 1000),
             )
 
+    @traced("executor.bigquery.dry_run")
     def dry_run(self, sql: str) -> dict[str, Any]:
         """Perform a dry run to estimate query cost.
 
@@ -6,11 +6,19 @@ The trino package is an optional dependency.
 
 from __future__ import annotations
 
+import json
+import math
 import time
 from typing import TYPE_CHECKING, Any
 
+from dli.core.cancellation import (
+    InterruptReason,
+    QueryInterruptedError,
+    run_cancellable,
+)
 from dli.core.executor import BaseExecutor
 from dli.core.models import ExecutionResult
+from dli.core.spans import traced
 
 # Optional Trino dependency
 TRINO_AVAILABLE = False
@@ -38,6 +46,15 @@ if TYPE_CHECKING:
     from trino import dbapi as _trino_dbapi
 
 
+def _as_float(value: Any) -> float | None:
+    """Convert a Trino plan estimate to float (None for unknown/NaN)."""
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return None if math.isnan(number) or math.isinf(number) else number
+
+
 class TrinoExecutor(BaseExecutor):
     """Trino query executor.
 
@@ -54,6 +71,7 @@ class TrinoExecutor(BaseExecutor):
         ssl_verify: Whether to verify SSL certificates
         auth_type: Authentication type (none, basic, jwt, oidc)
         auth_token: Token for JWT/OIDC authentication
+        query_max_run_time: Server-side run time limit in seconds (optional)
         connection: Trino connection instance
     """
 
@@ -69,6 +87,7 @@ class TrinoExecutor(BaseExecutor):
         auth_type: str = "none",
         auth_token: str | None = None,
         password: str | None = None,
+        query_max_run_time: int | None = None,
     ):
         """Initialize the Trino executor.
 
@@ -87,6 +106,9 @@ class TrinoExecutor(BaseExecutor):
                 - "oidc": OIDC authentication (requires auth_token)
             auth_token: Token for JWT/OIDC authentication
             password: Password for basic authentication
+            query_max_run_time: Sets the ``query_max_run_time`` session
+                property, so the coordinator kills queries that run longer
+                even if this client goes away
 
         Raises:
             ImportError: If trino package is not installed
@@ -106,12 +128,18 @@ class TrinoExecutor(BaseExecutor):
         self.auth_type = auth_type
         self.auth_token = auth_token
         self.password = password
+        self.query_max_run_time = query_max_run_time
 
         # Build authentication
         auth = self._build_auth()
 
         # Create connection
         http_scheme = "https" if ssl else "http"
+        connect_kwargs: dict[str, Any] = {}
+        if query_max_run_time is not None:
+            connect_kwargs["session_properties"] = {
+                "query_max_run_time": f"{query_max_run_time}s"
+            }
         self.connection = _trino_dbapi.connect(
             host=host,
             port=port,
@@ -121,6 +149,7 @@ class TrinoExecutor(BaseExecutor):
             http_scheme=http_scheme,
             verify=ssl_verify if ssl else False,
             auth=auth,
+            **connect_kwargs,
         )
 
     def _build_auth(self) -> Any:
@@ -156,12 +185,17 @@ class TrinoExecutor(BaseExecutor):
                 msg = f"Unsupported auth_type: {self.auth_type}. Use one of: none, basic, jwt, oidc"
                 raise ValueError(msg)
 
+    @traced("executor.trino")
     def execute_sql(self, sql: str, timeout: int = 300) -> ExecutionResult:
         """Execute a SQL query on Trino.
 
+        The query runs under a client-side deadline: when ``timeout`` passes,
+        or on Ctrl-C, the running query is cancelled on the coordinator and
+        the cancellation latency is recorded in the result.
+
         Args:
             sql: SQL query to execute
-            timeout: Execution timeout in seconds (applied via query timeout)
+            timeout: Execution timeout in seconds
 
         Returns:
             ExecutionResult with query results
@@ -171,11 +205,14 @@ class TrinoExecutor(BaseExecutor):
         try:
             cursor = self.connection.cursor()
 
-            # Execute the query
-            cursor.execute(sql)
+            def run() -> list[Any]:
+                cursor.execute(sql)
+                return cursor.fetchall()
 
-            # Fetch all results
-            rows_raw = cursor.fetchall()
+            # Execute the query and fetch all results
+            rows_raw = run_cancellable(
+                run, cancel=cursor.cancel, timeout=timeout or None
+            )
 
             # Get column names from cursor description
             columns = (
@@ -200,12 +237,32 @@ class TrinoExecutor(BaseExecutor):
                 execution_time_ms=int((time.time() - start) * 1000),
             )
 
+        except QueryInterruptedError as e:
+            return ExecutionResult(
+                dataset_name="",
+                phase="main",
+                success=False,
+                error_message=(
+                    f"Query timed out after {timeout} seconds"
+                    if e.reason == InterruptReason.TIMEOUT
+                    else "Query cancelled by user"
+                ),
+                rendered_sql=sql,
+                execution_time_ms=int((time.time() - start) * 1000),
+                cancelled=True,
+                interrupt_reason=e.reason,
+                cancel_latency_ms=e.cancel_latency_ms,
+            )
+
         except Exception as e:
             # Catch Trino errors and other unexpected errors
             error_message = str(e)
 
-            # Check for timeout-like errors
-            if "timeout" in error_message.lower():
+            # Check for timeout-like errors (incl. query_max_run_time)
+            if (
+                "timeout" in error_message.lower()
+                or "EXCEEDED_TIME_LIMIT" in error_message
+            ):
                 error_message = f"Query timed out after {timeout} seconds"
 
             return ExecutionResult(
@@ -217,6 +274,7 @@ class TrinoExecutor(BaseExecutor):
                 execution_time_ms=int((time.time() - start) * 1000),
             )
 
+    @traced("executor.trino.dry_run")
     def dry_run(self, sql: str) -> dict[str, Any]:
         """Perform a dry run using EXPLAIN to validate query syntax.
 
@@ -253,6 +311,44 @@ class TrinoExecutor(BaseExecutor):
                 "message": "Query is valid",
             }
 
+    @traced("executor.trino.estimate_cost")
+    def estimate_cost(self, sql: str) -> dict[str, Any]:
+        """Estimate the bytes a query reads using ``EXPLAIN (TYPE IO)``.
+
+        Sums the estimated output size of every input table scan. Trino
+        has no billing model, so only ``bytes_processed`` is reported;
+        connectors without statistics report no size. Falls back to
+        ``dry_run`` if the IO plan cannot be produced.
+
+        Args:
+            sql: SQL query to estimate
+
+        Returns:
+            Dictionary with validation status and ``bytes_processed``
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute(f"EXPLAIN (TYPE IO, FORMAT JSON) {sql}")
+            rows = cursor.fetchall()
+            cursor.close()
+            plan = json.loads(rows[0][0]) if rows else {}
+        except Exception:
+            return self.dry_run(sql)
+
+        total = 0.0
+        known = False
+        for table in plan.get("inputTableColumnInfos", []):
+            size = _as_float(table.get("estimate", {}).get("outputSizeInBytes"))
+            if size is not None:
+                total += size
+                known = True
+        return {
+            "valid": True,
+            "bytes_processed": int(total) if known else None,
+            "bytes_processed_gb": total / (1024**3) if known else None,
+            "message": "Query is valid",
+        }
+
     def test_connection(self) -> bool:
         """Test connection to Trino.
 
@@ -28,18 +28,57 @@ Example:
     >>> print(result.transpiled_sql)
 """
 
-from dli.api.catalog import CatalogAPI
-from dli.api.config import ConfigAPI
-from dli.api.dataset import DatasetAPI
-from dli.api.debug import DebugAPI
-from dli.api.lineage import LineageAPI
-from dli.api.metric import MetricAPI
-from dli.api.quality import QualityAPI
-from dli.api.query import QueryAPI
-from dli.api.run import RunAPI
-from dli.api.sql import SqlAPI
-from dli.api.transpile import TranspileAPI
-from dli.api.workflow import WorkflowAPI
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from dli.api.catalog import CatalogAPI
+    from dli.api.config import ConfigAPI
+    from dli.api.dataset import DatasetAPI
+    from dli.api.debug import DebugAPI
+    from dli.api.lineage import LineageAPI
+    from dli.api.metric import MetricAPI
+    from dli.api.quality import QualityAPI
+    from dli.api.query import QueryAPI
+    from dli.api.run import RunAPI
+    from dli.api.sql import SqlAPI
+    from dli.api.transpile import TranspileAPI
+    from dli.api.workflow import WorkflowAPI
+
+# API classes are imported on first access (PEP 562); each API module pulls
+# in its own models and services, so unused APIs cost nothing.
+_LAZY_IMPORTS: dict[str, str] = {
+    "CatalogAPI": "dli.api.catalog",
+    "ConfigAPI": "dli.api.config",
+    "DatasetAPI": "dli.api.dataset",
+    "DebugAPI": "dli.api.debug",
+    "LineageAPI": "dli.api.lineage",
+    "MetricAPI": "dli.api.metric",
+    "QualityAPI": "dli.api.quality",
+    "QueryAPI": "dli.api.query",
+    "RunAPI": "dli.api.run",
+    "SqlAPI": "dli.api.sql",
+    "TranspileAPI": "dli.api.transpile",
+    "WorkflowAPI": "dli.api.workflow",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import an API class from its defining module on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS})
+
 
 __all__ = [
     "CatalogAPI",
@@ -9,14 +9,28 @@ Example:
     >>> api = CatalogAPI(context=ctx)
     >>> tables = api.list_tables("my-project.analytics")
     >>> detail = api.get("my-project.analytics.users")
+
+Offline index:
+    After ``api.sync_index()`` has built a local snapshot, ``list_tables``
+    and ``search`` answer from the SQLite index under
+    ``<project>/.dli/cache/catalog`` and refresh it in the background when
+    it is older than an hour.
 """
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import Any
 
-from dli.core.catalog import TableDetail, TableInfo
-from dli.core.client import BasecampClient, ServerConfig
+from dli.core.catalog import (
+    CatalogIndex,
+    CatalogSyncStats,
+    TableDetail,
+    TableInfo,
+    catalog_index_path,
+    refresh_in_background,
+)
+from dli.core.client import BasecampClient, create_client
 from dli.models.common import (
     CatalogListResult,
     CatalogSearchResult,
@@ -35,7 +49,8 @@ class CatalogAPI:
     - Get table details (columns, ownership, quality, freshness)
     - Search tables by keyword
 
-    All data comes from Basecamp Server API.
+    All data comes from Basecamp Server API. Once a local index exists
+    (see ``sync_index``), listing and searching use it instead.
 
     Thread Safety:
         This class is NOT thread-safe. Create separate instances for
@@ -50,15 +65,24 @@ class CatalogAPI:
         ...     print(f"{t.name}: {t.row_count} rows")
     """
 
-    def __init__(self, context: ExecutionContext | None = None) -> None:
+    def __init__(
+        self,
+        context: ExecutionContext | None = None,
+        *,
+        use_index: bool = True,
+    ) -> None:
         """Initialize CatalogAPI.
 
         Args:
             context: Execution context with settings. If None, creates
                      default context from environment variables.
+            use_index: Answer list/search from the local catalog index
+                       when one exists.
         """
         self.context = context or ExecutionContext()
+        self.use_index = use_index
         self._client: BasecampClient | None = None
+        self._index: CatalogIndex | None = None
 
     def __repr__(self) -> str:
         """Return concise representation."""
@@ -76,16 +100,52 @@ class CatalogAPI:
             BasecampClient instance.
         """
         if self._client is None:
-            config = ServerConfig(
-                url=self.context.server_url or "http://localhost:8081",
-            )
-            self._client = BasecampClient(
-                config=config,
+            self._client = create_client(
+                url=self.context.server_url,
+                api_key=self.context.api_token,
                 mock_mode=self._is_mock_mode,
             )
 
         return self._client
 
+    def _index_path(self) -> Path:
+        """Return the index file for the configured server."""
+        from dli.core.config import get_dli_home
+
+        root = self.context.project_path or get_dli_home()
+        return catalog_index_path(root, self._get_client().config.url)
+
+    def _get_index(self) -> CatalogIndex | None:
+        """Open the local catalog index if it exists and is enabled.
+
+        Starts a background refresh when the index is stale.
+
+        Returns:
+            CatalogIndex instance, or None to query the server.
+        """
+        if not self.use_index:
+            return None
+        if self._index is None:
+            path = self._index_path()
+            if not path.exists():
+                return None
+            self._index = CatalogIndex(path)
+        refresh_in_background(self._index, self._get_client())
+        return self._index
+
+    def sync_index(self, *, full: bool = False) -> CatalogSyncStats:
+        """Create or update the local catalog index.
+
+        Args:
+            full: Rebuild the snapshot instead of applying changes.
+
+        Returns:
+            CatalogSyncStats with the number of tables synced.
+        """
+        if self._index is None:
+            self._index = CatalogIndex(self._index_path())
+        return self._index.sync(self._get_client(), full=full)
+
     def list_tables(
         self,
         identifier: str | None = None,
@@ -144,6 +204,19 @@ class CatalogAPI:
                     error_message=detail_result.error_message,
                 )
 
+        index = self._get_index()
+        if index is not None:
+            tables = [
+                self._dict_to_table_info(item)
+                for item in index.list(project=project, dataset=dataset, limit=limit)
+            ]
+            return CatalogListResult(
+                status=ResultStatus.SUCCESS,
+                tables=tables,
+                total_count=len(tables),
+                has_more=len(tables) >= limit,
+            )
+
         response = client.catalog_list(
             project=project,
             dataset=dataset,
@@ -215,6 +288,8 @@ class CatalogAPI:
         """Search tables by pattern.
 
         Searches in table names, column names, descriptions, and tags.
+        With a local index, words are prefix-matched and results are ranked
+        by relevance.
 
         Args:
             pattern: Search pattern (substring match).
@@ -223,6 +298,19 @@ class CatalogAPI:
         Returns:
             CatalogSearchResult with matching tables and search metadata.
         """
+        index = self._get_index()
+        if index is not None:
+            tables = [
+                self._dict_to_table_info(item)
+                for item in index.search(pattern, limit=limit)
+            ]
+            return CatalogSearchResult(
+                status=ResultStatus.SUCCESS,
+                tables=tables,
+                total_matches=len(tables),
+                keyword=pattern,
+            )
+
         client = self._get_client()
 
         response = client.catalog_search(pattern, limit=limit)
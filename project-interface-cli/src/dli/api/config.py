@@ -28,7 +28,7 @@ import os
 from pathlib import Path
 from typing import Any
 
-from dli.core.client import BasecampClient, ServerConfig
+from dli.core.client import BasecampClient, create_client
 from dli.models.common import (
     ConfigValue,
     EnvironmentInfo,
@@ -121,11 +121,9 @@ class ConfigAPI:
     def _get_client(self) -> BasecampClient:
         """Get or create BasecampClient instance."""
         if self._client is None:
-            config = ServerConfig(
-                url=self.context.server_url or "http://localhost:8081",
-            )
-            self._client = BasecampClient(
-                config=config,
+            self._client = create_client(
+                url=self.context.server_url,
+                api_key=self.context.api_token,
                 mock_mode=self._is_mock_mode,
             )
         return self._client
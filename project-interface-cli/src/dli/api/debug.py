@@ -22,6 +22,7 @@ Example:
 
 from __future__ import annotations
 
+import time
 from typing import TYPE_CHECKING
 
 from dli import __version__
@@ -37,10 +38,11 @@ from dli.core.debug.checks import (
     HttpsConnectivityCheck,
 )
 from dli.core.debug.models import CheckCategory, CheckResult, CheckStatus, DebugResult
+from dli.core.debug.runner import CheckRunner
 from dli.models.common import ExecutionContext, ExecutionMode
 
 if TYPE_CHECKING:
-    pass
+    from collections.abc import Sequence
 
 
 class DebugAPI:
@@ -92,26 +94,30 @@ class DebugAPI:
         """Check if running in mock mode."""
         return self.context.execution_mode == ExecutionMode.MOCK
 
-    def _run_checks(self, check_classes: list[type[BaseCheck]]) -> list[CheckResult]:
-        """Run a list of check classes.
+    def _run_checks(
+        self,
+        checks: Sequence[type[BaseCheck] | BaseCheck],
+        deadline: float | None = None,
+    ) -> list[CheckResult]:
+        """Run checks concurrently with CheckRunner.
 
         Args:
-            check_classes: List of check classes to instantiate and run.
+            checks: Check classes to instantiate, or check instances.
+            deadline: Global deadline in seconds (default: context.timeout).
 
         Returns:
-            List of check results.
+            List of check results, in the order of ``checks``.
         """
-        results: list[CheckResult] = []
-        for check_class in check_classes:
+        instances: list[BaseCheck] = []
+        results: list[CheckResult | None] = []
+        for check in checks:
             try:
-                check = check_class()
-                result = check.execute(self.context)
-                results.append(result)
+                instance = check() if isinstance(check, type) else check
             except Exception as e:
-                # If check fails to run, record it as an error
+                # If check fails to initialize, record it as an error
                 results.append(
                     CheckResult(
-                        name=check_class.__name__,
+                        name=getattr(check, "__name__", type(check).__name__),
                         category=CheckCategory.SYSTEM,
                         status=CheckStatus.FAIL,
                         message="Check failed to execute",
@@ -119,7 +125,13 @@ class DebugAPI:
                         remediation="Check the error message and fix the underlying issue",
                     )
                 )
-        return results
+                continue
+            instances.append(instance)
+            results.append(None)
+
+        runner = CheckRunner(self.context, deadline=deadline)
+        executed = iter(runner.run(instances))
+        return [r if r is not None else next(executed) for r in results]
 
     def _create_mock_result(self, categories: list[CheckCategory]) -> DebugResult:
         """Create a mock result with all checks passing.
@@ -159,11 +171,14 @@ class DebugAPI:
             checks=mock_checks,
         )
 
-    def _build_result(self, checks: list[CheckResult]) -> DebugResult:
+    def _build_result(
+        self, checks: list[CheckResult], duration_ms: int = 0
+    ) -> DebugResult:
         """Build DebugResult from check results.
 
         Args:
             checks: List of check results.
+            duration_ms: Wall-clock duration of the run in milliseconds.
 
         Returns:
             DebugResult with aggregated status.
@@ -175,13 +190,28 @@ class DebugAPI:
             version=__version__,
             success=success,
             checks=checks,
+            duration_ms=duration_ms,
         )
 
+    def _run(
+        self,
+        checks: Sequence[type[BaseCheck] | BaseCheck],
+        deadline: float | None = None,
+    ) -> DebugResult:
+        """Run checks and build a timed DebugResult."""
+        start = time.perf_counter()
+        results = self._run_checks(checks, deadline=deadline)
+        return self._build_result(results, int((time.perf_counter() - start) * 1000))
+
     def run_all(self, timeout: int = 30) -> DebugResult:
         """Run all diagnostic checks.
 
+        Independent checks run concurrently; checks that depend on another
+        check (e.g. HTTPS after DNS) run once it has finished.
+
         Args:
-            timeout: Overall timeout in seconds (not currently enforced per-check).
+            timeout: Global deadline in seconds. Checks still running when it
+                expires are reported as failed.
 
         Returns:
             DebugResult with all check results.
@@ -201,8 +231,7 @@ class DebugAPI:
                 ]
             )
 
-        checks = self._run_checks(ALL_CHECKS)
-        return self._build_result(checks)
+        return self._run(ALL_CHECKS, deadline=timeout)
 
     def check_system(self) -> DebugResult:
         """Run system environment checks only.
@@ -218,8 +247,7 @@ class DebugAPI:
         if self._is_mock_mode:
             return self._create_mock_result([CheckCategory.SYSTEM])
 
-        checks = self._run_checks(SYSTEM_CHECKS)
-        return self._build_result(checks)
+        return self._run(SYSTEM_CHECKS)
 
     def check_project(self) -> DebugResult:
         """Run project configuration checks only.
@@ -235,8 +263,7 @@ class DebugAPI:
         if self._is_mock_mode:
             return self._create_mock_result([CheckCategory.CONFIG])
 
-        checks = self._run_checks(CONFIG_CHECKS)
-        return self._build_result(checks)
+        return self._run(CONFIG_CHECKS)
 
     def check_server(self) -> DebugResult:
         """Run Basecamp Server checks only.
@@ -253,8 +280,7 @@ class DebugAPI:
         if self._is_mock_mode:
             return self._create_mock_result([CheckCategory.SERVER])
 
-        checks = self._run_checks(SERVER_CHECKS)
-        return self._build_result(checks)
+        return self._run(SERVER_CHECKS)
 
     def check_auth(self) -> DebugResult:
         """Run authentication checks only.
@@ -270,8 +296,7 @@ class DebugAPI:
         if self._is_mock_mode:
             return self._create_mock_result([CheckCategory.AUTH])
 
-        checks = self._run_checks(AUTH_CHECKS)
-        return self._build_result(checks)
+        return self._run(AUTH_CHECKS)
 
     def check_connection(self, dialect: str | None = None) -> DebugResult:
         """Run database connection checks only.
@@ -294,9 +319,6 @@ class DebugAPI:
 
         # For now, we run network checks that verify endpoint connectivity
         # Full database connection checks would require dialect-specific implementations
-        checks: list[CheckResult] = []
-
-        # Check DNS for relevant endpoints based on dialect
         endpoints = {
             "bigquery": [
                 ("bigquery.googleapis.com", "https://bigquery.googleapis.com"),
@@ -304,18 +326,17 @@ class DebugAPI:
             "trino": [],  # Would need server-specific URL
         }
 
+        targets: list[type[BaseCheck] | BaseCheck] = []
         if dialect and dialect in endpoints:
             for hostname, url in endpoints[dialect]:
-                dns_check = DnsResolutionCheck(hostname)
-                checks.append(dns_check.execute(self.context))
-                https_check = HttpsConnectivityCheck(url)
-                checks.append(https_check.execute(self.context))
+                targets.append(DnsResolutionCheck(hostname))
+                targets.append(HttpsConnectivityCheck(url))
         else:
             # Default: check Google APIs
-            dns_check = DnsResolutionCheck("bigquery.googleapis.com")
-            checks.append(dns_check.execute(self.context))
-            https_check = HttpsConnectivityCheck("https://www.googleapis.com")
-            checks.append(https_check.execute(self.context))
+            targets.append(DnsResolutionCheck("bigquery.googleapis.com"))
+            targets.append(HttpsConnectivityCheck("https://www.googleapis.com"))
+
+        result = self._run(targets)
 
         # Update category to DATABASE for these checks
         connection_checks = [
@@ -329,10 +350,10 @@ class DebugAPI:
                 remediation=c.remediation,
                 duration_ms=c.duration_ms,
             )
-            for c in checks
+            for c in result.checks
         ]
 
-        return self._build_result(connection_checks)
+        return self._build_result(connection_checks, result.duration_ms)
 
     def check_network(self, endpoints: list[str] | None = None) -> DebugResult:
         """Run network diagnostics only.
@@ -354,14 +375,9 @@ class DebugAPI:
 
         if endpoints:
             # Run custom endpoint checks
-            checks: list[CheckResult] = []
-            for url in endpoints:
-                https_check = HttpsConnectivityCheck(url)
-                checks.append(https_check.execute(self.context))
-            return self._build_result(checks)
+            return self._run([HttpsConnectivityCheck(url) for url in endpoints])
         # Run default network checks
-        checks = self._run_checks(NETWORK_CHECKS)
-        return self._build_result(checks)
+        return self._run(NETWORK_CHECKS)
 
 
 __all__ = [
@@ -22,9 +22,10 @@ Example:
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import TYPE_CHECKING
 
-from dli.core.client import BasecampClient, ServerConfig
+from dli.core.client import BasecampClient, create_client
 from dli.core.lineage import (
     LineageDirection,
     LineageDirectionType,
@@ -42,7 +43,7 @@ from dli.exceptions import (
 from dli.models.common import ExecutionContext, ExecutionMode
 
 if TYPE_CHECKING:
-    pass
+    from dli.core.lineage.local import LineageBuildStats, LocalLineageIndex
 
 __all__ = ["LineageAPI"]
 
@@ -90,6 +91,7 @@ class LineageAPI:
         """
         self.context = context or ExecutionContext()
         self._client = client
+        self._local_index: LocalLineageIndex | None = None
 
     def __repr__(self) -> str:
         """Return concise representation."""
@@ -113,8 +115,7 @@ class LineageAPI:
             return self._client
 
         if self._is_mock_mode:
-            config = ServerConfig(url="http://mock-server")
-            self._client = BasecampClient(config, mock_mode=True)
+            self._client = create_client(url="http://mock-server", mock_mode=True)
             return self._client
 
         if not self.context.server_url:
@@ -123,11 +124,11 @@ class LineageAPI:
                 code=ErrorCode.CONFIG_INVALID,
             )
 
-        config = ServerConfig(
+        self._client = create_client(
             url=self.context.server_url,
             api_key=self.context.api_token,
+            mock_mode=False,
         )
-        self._client = BasecampClient(config, mock_mode=False)
         return self._client
 
     # =========================================================================
@@ -271,6 +272,87 @@ class LineageAPI:
             depth=depth,
         )
 
+    # =========================================================================
+    # Local Lineage (spec SQL, no server)
+    # =========================================================================
+
+    def get_local_lineage(
+        self,
+        resource_name: str,
+        direction: LineageDirectionType = "both",
+        depth: int = -1,
+        *,
+        column: bool = False,
+    ) -> LineageResult:
+        """Get lineage derived from the project's spec SQL.
+
+        Works before anything is registered on the server. The local index
+        (.dli/cache/lineage.db) is brought up to date first; only specs
+        changed since the last call are re-parsed.
+
+        Args:
+            resource_name: Fully qualified table name, or
+                catalog.schema.table.column when ``column`` is True
+            direction: 'upstream', 'downstream' or 'both'
+            depth: Maximum traversal depth (-1 for unlimited)
+            column: Query column-level lineage instead of table-level
+
+        Returns:
+            LineageResult; upstream nodes have negative depth.
+
+        Raises:
+            ConfigurationError: If project_path is not set.
+            LineageNotFoundError: If the resource is not in the project lineage.
+
+        Example:
+            >>> result = api.get_local_lineage("iceberg.analytics.daily_clicks")
+            >>> cols = api.get_local_lineage(
+            ...     "iceberg.analytics.daily_clicks.user_id", "upstream", column=True
+            ... )
+        """
+        index = self._get_local_index()
+        index.build()
+        if not index.contains(resource_name, column=column):
+            level = "column" if column else "table"
+            raise LineageNotFoundError(
+                message=f"No local {level} lineage for resource: {resource_name}",
+                resource_name=resource_name,
+            )
+        if column:
+            return index.get_column_lineage(resource_name, direction, depth)
+        return index.get_lineage(resource_name, direction, depth)
+
+    def build_local_index(self) -> LineageBuildStats:
+        """Build or refresh the local lineage index from spec SQL.
+
+        Returns:
+            LineageBuildStats with parsed/reused spec counts and edge counts.
+
+        Raises:
+            ConfigurationError: If project_path is not set.
+        """
+        return self._get_local_index().build()
+
+    def _get_local_index(self) -> LocalLineageIndex:
+        """Get or create the local lineage index for the project."""
+        if self._local_index is not None:
+            return self._local_index
+
+        if self.context.project_path is None:
+            raise ConfigurationError(
+                message="project_path required for local lineage",
+                code=ErrorCode.CONFIG_INVALID,
+            )
+
+        from dli.core.lineage.local import LocalLineageIndex
+
+        self._local_index = LocalLineageIndex(
+            Path(self.context.project_path),
+            dialect=self.context.dialect,
+            variables=self.context.parameters,
+        )
+        return self._local_index
+
     # =========================================================================
     # Private Helpers
     # =========================================================================
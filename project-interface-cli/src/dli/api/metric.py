@@ -14,6 +14,11 @@ Example:
     >>> from dli.core.executor import MockExecutor
     >>> mock_executor = MockExecutor(mock_data=[{"id": 1}])
     >>> api = MetricAPI(context=ctx, executor=mock_executor)
+
+    >>> # Reuse results for 10 minutes (opt-in local result cache)
+    >>> ctx = ExecutionContext(project_path="/path/to/project", result_cache_ttl=600)
+    >>> result = MetricAPI(context=ctx).run("catalog.schema.metric")
+    >>> print(result.cache_hit, result.data_age_seconds)
 """
 
 from __future__ import annotations
@@ -46,9 +51,13 @@ from dli.models.format import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from dli.core.client import BasecampClient
     from dli.core.executor import QueryExecutor
     from dli.core.metric_service import MetricService
     from dli.core.models.metric import MetricSpec
+    from dli.core.result_cache import ResultCache
 
 
 class MetricAPI:
@@ -83,6 +92,8 @@ class MetricAPI:
         self,
         context: ExecutionContext | None = None,
         executor: QueryExecutor | None = None,
+        *,
+        result_cache: ResultCache | None = None,
     ) -> None:
         """Initialize MetricAPI.
 
@@ -92,6 +103,9 @@ class MetricAPI:
             executor: Optional query executor for DI (dependency injection).
                      If provided, this executor will be used instead of
                      creating one based on execution_mode.
+            result_cache: Optional result cache for run(). If None, a cache
+                     under ~/.dli/cache/results is used when
+                     context.result_cache_ttl is set.
 
         Example:
             >>> # Normal usage
@@ -108,6 +122,7 @@ class MetricAPI:
         # use the injected executor instead of creating one via ExecutorFactory.
         self._executor = executor
         self._service: MetricService | None = None
+        self._result_cache = result_cache
 
     def __repr__(self) -> str:
         """Return concise representation."""
@@ -139,6 +154,47 @@ class MetricAPI:
 
         return self._service
 
+    def _get_result_cache(self) -> ResultCache | None:
+        """Get the result cache if result caching is enabled.
+
+        Returns:
+            ResultCache instance, or None if caching is disabled.
+        """
+        if self._result_cache is None and self.context.result_cache_ttl is not None:
+            from dli.core.result_cache import ResultCache, default_result_cache_dir
+
+            self._result_cache = ResultCache(
+                default_result_cache_dir(),
+                ttl_seconds=self.context.result_cache_ttl,
+            )
+        return self._result_cache
+
+    @staticmethod
+    def _table_versions(
+        client: BasecampClient, tables: Iterable[str]
+    ) -> dict[str, str | None]:
+        """Look up the catalog last_updated timestamp of each table.
+
+        Args:
+            client: Client used for catalog lookups.
+            tables: Table references.
+
+        Returns:
+            Mapping of table to last_updated (None if unknown).
+        """
+        versions: dict[str, str | None] = {}
+        for table in tables:
+            response = client.catalog_get(table)
+            data = (
+                response.data
+                if response.success and isinstance(response.data, dict)
+                else {}
+            )
+            versions[table] = data.get("last_updated") or (
+                data.get("freshness") or {}
+            ).get("last_updated")
+        return versions
+
     # === CRUD Operations ===
 
     def list_metrics(
@@ -216,6 +272,11 @@ class MetricAPI:
         Both LOCAL and SERVER modes use the Execution API for consistency.
         The Execution API handles query execution via the server.
 
+        When the result cache is enabled (context.result_cache_ttl), a result
+        for the same rendered SQL, dialect, target and limit is reused until
+        it expires or, with context.result_cache_check_freshness, until an
+        upstream table is updated in the catalog.
+
         Args:
             name: Fully qualified metric name.
             parameters: Runtime parameters (merged with context.parameters).
@@ -291,6 +352,38 @@ class MetricAPI:
                 mock_mode=use_mock,
             )
 
+            cache = self._get_result_cache()
+            cache_key: str | None = None
+            table_versions: dict[str, str | None] | None = None
+            if cache is not None:
+                from dli.core.result_cache import compute_result_key
+
+                cache_key = compute_result_key(
+                    rendered_sql,
+                    dialect=self.context.dialect,
+                    target=self.context.server_url,
+                    limit=limit,
+                )
+                if self.context.result_cache_check_freshness:
+                    table_versions = self._table_versions(
+                        client, service.validator.extract_tables(rendered_sql)
+                    )
+                cached = cache.get(cache_key, table_versions=table_versions)
+                if cached is not None:
+                    ended_at = datetime.now(tz=UTC)
+                    return MetricResult(
+                        name=name,
+                        status=ResultStatus.SUCCESS,
+                        started_at=started_at,
+                        ended_at=ended_at,
+                        duration_ms=int((ended_at - started_at).total_seconds() * 1000),
+                        sql=rendered_sql if show_sql else None,
+                        data=cached.rows,
+                        row_count=cached.row_count,
+                        cache_hit=True,
+                        data_age_seconds=cached.age_seconds,
+                    )
+
             response = client.execute_rendered_metric(
                 rendered_sql=rendered_sql,
                 resource_name=name,
@@ -312,6 +405,14 @@ class MetricAPI:
                     row_count = response.data.get("row_count", 0)
                     rows = response.data.get("rows")
 
+                if cache is not None and cache_key is not None and rows is not None:
+                    cache.put(
+                        cache_key,
+                        rows,
+                        row_count=row_count,
+                        table_versions=table_versions,
+                    )
+
                 return MetricResult(
                     name=name,
                     status=ResultStatus.SUCCESS,
@@ -321,6 +422,7 @@ class MetricAPI:
                     sql=rendered_sql if show_sql else None,
                     data=rows,
                     row_count=row_count,
+                    data_age_seconds=0.0,
                 )
             else:
                 return MetricResult(
@@ -343,6 +445,130 @@ class MetricAPI:
                 cause=e,
             ) from e
 
+    def query(
+        self,
+        metrics: list[str],
+        *,
+        dimensions: list[str] | None = None,
+        parameters: dict[str, Any] | None = None,
+        time_grain: str | None = None,
+        use_rollups: bool = True,
+        dry_run: bool = False,
+        show_sql: bool = False,
+    ) -> MetricResult:
+        """Query several metrics at once through the semantic query planner.
+
+        Metrics sharing a source relation are computed by one statement,
+        and groups covered by a declared rollup read the rollup table (see
+        MetricService.plan_query). Rows of all statements are merged on the
+        dimension values.
+
+        Args:
+            metrics: Metric references (``<spec name>.<metric name>`` or a
+                unique metric name).
+            dimensions: Dimension names to group by.
+            parameters: Runtime parameters (merged with context.parameters).
+            time_grain: Grain to truncate time dimensions to (e.g., "day").
+            use_rollups: Whether to read from rollups when possible.
+            dry_run: If True, plan and compile SQL without execution.
+            show_sql: If True, include the compiled SQL in result.
+
+        Returns:
+            MetricResult with the merged rows; ``rollups`` lists the rollup
+            tables that were read.
+
+        Raises:
+            MetricNotFoundError: If a metric is not found.
+            ExecutionError: If planning or execution fails.
+        """
+        started_at = datetime.now(tz=UTC)
+        name = ", ".join(metrics)
+        merged_params = {**self.context.parameters, **(parameters or {})}
+
+        if self._is_mock_mode:
+            return MetricResult(
+                name=name,
+                status=ResultStatus.SUCCESS,
+                started_at=started_at,
+                ended_at=datetime.now(tz=UTC),
+                duration_ms=0,
+                sql="-- Mock SQL" if show_sql else None,
+                data=[],
+                row_count=0,
+            )
+
+        from dli.core.metric_service import UnknownMetricError
+
+        service = self._get_service()
+        try:
+            plan = service.plan_query(
+                metrics,
+                dimensions,
+                merged_params,
+                dialect=self.context.dialect,
+                time_grain=time_grain,
+                use_rollups=use_rollups,
+            )
+        except UnknownMetricError as e:
+            raise MetricNotFoundError(message=str(e), name=name) from e
+        except ValueError as e:
+            raise ExecutionError(
+                message=f"Metric query planning failed: {e}", cause=e
+            ) from e
+
+        def result(**kwargs: Any) -> MetricResult:
+            ended_at = datetime.now(tz=UTC)
+            return MetricResult(
+                name=name,
+                started_at=started_at,
+                ended_at=ended_at,
+                duration_ms=int((ended_at - started_at).total_seconds() * 1000),
+                sql=plan.sql if show_sql else None,
+                columns=plan.columns,
+                rollups=plan.rollups,
+                **kwargs,
+            )
+
+        if dry_run or self.context.dry_run:
+            return result(status=ResultStatus.SUCCESS)
+
+        try:
+            from dli.core.client import create_client
+
+            client = create_client(
+                url=self.context.server_url,
+                timeout=self.context.timeout,
+                api_key=self.context.api_token,
+                mock_mode=self.context.server_url is None,
+            )
+            frames: list[list[dict[str, Any]]] = []
+            for planned in plan.queries:
+                response = client.execute_rendered_metric(
+                    rendered_sql=planned.sql,
+                    resource_name=planned.rollup or planned.spec_names[0],
+                    parameters=merged_params,
+                    execution_timeout=self.context.timeout,
+                    transpile_source_dialect=plan.dialect,
+                    transpile_target_dialect=None,
+                )
+                if not response.success:
+                    return result(
+                        status=ResultStatus.FAILURE,
+                        error_message=response.error or "Execution failed",
+                    )
+                data = response.data if isinstance(response.data, dict) else {}
+                frames.append(data.get("rows") or [])
+        except Exception as e:
+            raise ExecutionError(message=f"Metric query failed: {e}", cause=e) from e
+
+        rows = plan.merge(frames)
+        return result(
+            status=ResultStatus.SUCCESS,
+            data=rows,
+            row_count=len(rows),
+            data_age_seconds=0.0,
+        )
+
     # === Validation ===
 
     def validate(
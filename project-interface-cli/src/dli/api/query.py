@@ -19,16 +19,18 @@ Example:
 
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import datetime
-from typing import Literal
+from typing import TYPE_CHECKING, Any, Literal
 
-from dli.core.client import BasecampClient, ServerConfig
+from dli.core.client import BasecampClient, create_client
 from dli.core.query.models import (
     QueryDetail,
     QueryInfo,
     QueryScope,
     QueryState,
 )
+from dli.core.query.watch import PollBackoff, QueryWatcher, QueryWatchUpdate
 from dli.exceptions import (
     ConfigurationError,
     ErrorCode,
@@ -44,6 +46,10 @@ from dli.models.query import (
     QueryListResult,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    import threading
+
 __all__ = ["QueryAPI"]
 
 
@@ -112,11 +118,9 @@ class QueryAPI:
             BasecampClient instance.
         """
         if self._client is None:
-            config = ServerConfig(
-                url=self.context.server_url or "http://localhost:8081",
-            )
-            self._client = BasecampClient(
-                config=config,
+            self._client = create_client(
+                url=self.context.server_url,
+                api_key=self.context.api_token,
                 mock_mode=self._is_mock_mode,
             )
         return self._client
@@ -226,6 +230,78 @@ class QueryAPI:
             status=ResultStatus.SUCCESS,
         )
 
+    def watch_queries(
+        self,
+        *,
+        scope: QueryScope = QueryScope.MY,
+        account_keyword: str | None = None,
+        sql_pattern: str | None = None,
+        status: QueryState | None = None,
+        tags: list[str] | None = None,
+        engine: Literal["bigquery", "trino"] | None = None,
+        since: datetime | str | None = None,
+        until: datetime | str | None = None,
+        limit: int = 10,
+        min_interval: float = 2.0,
+        max_interval: float = 30.0,
+        use_events: bool = False,
+        stop: threading.Event | None = None,
+    ) -> Iterator[QueryWatchUpdate]:
+        """Watch a query list, yielding the full list and then each change.
+
+        Reuses one client for every poll and asks the server only for rows
+        changed since the previous poll (ETag / ``updated_since``). The poll
+        interval doubles from ``min_interval`` up to ``max_interval`` while
+        nothing changes.
+
+        Args:
+            scope: Query scope - MY, SYSTEM, USER, or ALL.
+            account_keyword: Filter by account name.
+            sql_pattern: Filter by SQL query text content.
+            status: Filter by query state.
+            tags: Filter by tags (AND logic).
+            engine: Filter by query engine.
+            since: Start time filter (datetime or relative string).
+            until: End time filter.
+            limit: Maximum number of rows to keep.
+            min_interval: Poll interval after a change, in seconds.
+            max_interval: Maximum poll interval, in seconds.
+            use_events: Use server-sent events when the server supports them.
+            stop: Event that ends the watch when set.
+
+        Yields:
+            QueryWatchUpdate with QueryInfo rows and the changed IDs.
+
+        Raises:
+            ServerError: If the first request fails.
+
+        Example:
+            >>> for update in api.watch_queries(status=QueryState.RUNNING):
+            ...     print([q.query_id for q in update.queries])
+        """
+        filters: dict[str, Any] = {
+            "scope": scope.value,
+            "account_keyword": account_keyword,
+            "sql_pattern": sql_pattern,
+            "state": status.value if status else None,
+            "tags": tags,
+            "engine": engine,
+            "since": since.isoformat() if isinstance(since, datetime) else since,
+            "until": until.isoformat() if isinstance(until, datetime) else until,
+        }
+        watcher = QueryWatcher(
+            self._get_client(),
+            filters=filters,
+            limit=limit,
+            backoff=PollBackoff(min_interval=min_interval, max_interval=max_interval),
+            use_events=use_events,
+        )
+        for update in watcher.updates(stop=stop):
+            yield replace(
+                update,
+                queries=[QueryInfo.model_validate(q) for q in update.queries],
+            )
+
     # =========================================================================
     # Query Detail
     # =========================================================================
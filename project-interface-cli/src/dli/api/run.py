@@ -27,21 +27,29 @@ import json
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
 
-from dli.core.client import BasecampClient, ServerConfig
+from dli.core.cancellation import InterruptReason
+from dli.core.client import RESULT_PAGE_SIZE, BasecampClient, create_client
+from dli.core.spans import traced
 from dli.exceptions import (
     ConfigurationError,
     ErrorCode,
+    RunCostExceededError,
     RunExecutionError,
     RunFileNotFoundError,
     RunLocalDeniedError,
     RunOutputError,
     RunServerUnavailableError,
+    RunTimeoutError,
+    ServerError,
 )
 from dli.models.common import ExecutionContext, ExecutionMode, ResultStatus
 from dli.models.run import ExecutionPlan, OutputFormat, RunResult
 
 if TYPE_CHECKING:
-    from dli.core.executor import QueryExecutor
+    from collections.abc import Callable, Iterable
+
+    from dli.core.admission import AdmissionDecision, AdmissionExecutor
+    from dli.core.executor import BaseExecutor, QueryExecutor
 
 __all__ = ["RunAPI"]
 
@@ -52,6 +60,11 @@ class RunAPI:
     Executes SQL files against query engines and saves results to local files.
     Supports both local and server execution modes with server policy enforcement.
 
+    Local executions pass through cost admission when dli.yaml or the server
+    policy defines an ``admission`` budget: each query is dry-run first and
+    rejected (or confirmed via ``confirm_cost``) if its estimate exceeds the
+    budget. See ``dli.core.admission``.
+
     Thread Safety:
         This class is NOT thread-safe. Create separate instances for
         concurrent operations.
@@ -82,6 +95,7 @@ class RunAPI:
         *,
         client: BasecampClient | None = None,  # DI for testing
         executor: QueryExecutor | None = None,  # DI for testing
+        confirm_cost: Callable[[AdmissionDecision], bool] | None = None,
     ) -> None:
         """Initialize RunAPI.
 
@@ -89,10 +103,14 @@ class RunAPI:
             context: Execution context. Defaults to ExecutionContext().
             client: Optional BasecampClient for dependency injection.
             executor: Optional QueryExecutor for dependency injection (local execution).
+            confirm_cost: Called for queries above the cost budget when the
+                budget allows confirmation; returns whether to run anyway.
         """
         self.context = context or ExecutionContext()
         self._client = client
         self._executor = executor
+        self._confirm_cost = confirm_cost
+        self._policy_data: dict[str, Any] = {}
 
     def __repr__(self) -> str:
         """Return concise representation."""
@@ -112,11 +130,9 @@ class RunAPI:
         if self._client is not None:
             return self._client
 
-        config = ServerConfig(
-            url=self.context.server_url or "http://localhost:8081",
-        )
-        self._client = BasecampClient(
-            config=config,
+        self._client = create_client(
+            url=self.context.server_url,
+            api_key=self.context.api_token,
             mock_mode=self._is_mock_mode,
         )
         return self._client
@@ -138,9 +154,13 @@ class RunAPI:
         prefer_local: bool = False,
         prefer_server: bool = False,
         prefer_remote: bool = False,
+        stream: bool = False,
     ) -> RunResult:
         """Execute SQL file and save results to output file.
 
+        Server results are retrieved page by page and written to the output
+        file as they arrive, so memory use stays bounded by the page size.
+
         Args:
             sql_path: Path to SQL file.
             output_path: Path for output file.
@@ -152,6 +172,8 @@ class RunAPI:
             prefer_local: Request local execution (server policy may override).
             prefer_server: Request server execution (server policy may override).
             prefer_remote: Request async remote execution via server queue.
+            stream: Download server results as one NDJSON stream instead of
+                page by page.
 
         Returns:
             RunResult with execution details and output file path.
@@ -161,6 +183,8 @@ class RunAPI:
             RunLocalDeniedError: If server denies local execution request.
             RunServerUnavailableError: If server execution unavailable.
             RunExecutionError: If query execution fails.
+            RunCostExceededError: If a local query exceeds the cost budget.
+            RunTimeoutError: If a local query was cancelled at its timeout.
             RunOutputError: If output file cannot be written.
             ConfigurationError: If multiple execution modes are specified.
 
@@ -223,6 +247,7 @@ class RunAPI:
                 dialect=dialect,
                 limit=limit,
                 timeout=timeout,
+                stream=stream,
             )
         return self._execute_server(
             sql_path=sql_path,
@@ -232,6 +257,7 @@ class RunAPI:
             dialect=dialect,
             limit=limit,
             timeout=timeout,
+            stream=stream,
         )
 
     def _render_sql(self, sql: str, parameters: dict[str, str]) -> str:
@@ -268,6 +294,7 @@ class RunAPI:
         policy_data: dict[str, Any] = (
             policy.data if isinstance(policy.data, dict) else {}
         )
+        self._policy_data = policy_data
 
         if prefer_local:
             if not policy_data.get("allow_local", False):
@@ -379,12 +406,31 @@ class RunAPI:
             # Execute based on executor type
             # BaseExecutor subclasses use execute_sql(), others use execute()
             if isinstance(executor, BaseExecutor):
-                result = executor.execute_sql(rendered_sql, timeout)
+                admission = self._admission(executor)
+                if admission is not None:
+                    result = admission.execute_sql(rendered_sql, timeout)
+                    decision = admission.decisions[-1]
+                    if not decision.admitted:
+                        raise RunCostExceededError(
+                            message=result.error_message or "Query rejected",
+                            code=ErrorCode.RUN_COST_EXCEEDED,
+                            exceeded=decision.exceeded,
+                            bytes_processed=decision.bytes_processed,
+                            estimated_cost_usd=decision.estimated_cost_usd,
+                        )
+                else:
+                    result = executor.execute_sql(rendered_sql, timeout)
             else:
                 # ServerExecutor and other executors with execute() method
                 result = executor.execute(rendered_sql)
 
         if not result.success:
+            if result.interrupt_reason == InterruptReason.TIMEOUT:
+                raise RunTimeoutError(
+                    message=result.error_message or "",
+                    code=ErrorCode.RUN_TIMEOUT,
+                    timeout_seconds=timeout,
+                )
             raise RunExecutionError(
                 message=result.error_message or "Query execution failed",
                 code=ErrorCode.RUN_EXECUTION_FAILED,
@@ -411,6 +457,50 @@ class RunAPI:
             rendered_sql=rendered_sql,
         )
 
+    def _admission(self, executor: BaseExecutor) -> AdmissionExecutor | None:
+        """Wrap a local executor in cost admission if a budget is configured.
+
+        The budget is the stricter combination of the ``admission`` section
+        of dli.yaml (when ``project_path`` is set) and of the server policy.
+
+        Returns:
+            AdmissionExecutor, or None if no budget applies.
+        """
+        from dli.core.admission import (
+            DEFAULT_DRY_RUN_CACHE_DIR,
+            AdmissionExecutor,
+            DryRunCache,
+            budget_from_config,
+        )
+
+        project_path = self.context.project_path
+        project_admission: dict[str, Any] = {}
+        if project_path is not None and (project_path / "dli.yaml").exists():
+            from dli.core.config import load_project
+
+            project_admission = load_project(project_path).admission
+
+        try:
+            budget = budget_from_config(project_admission, self._policy_data)
+        except ValueError as e:
+            raise ConfigurationError(
+                message=str(e),
+                code=ErrorCode.CONFIG_INVALID,
+            ) from e
+        if budget.is_unlimited:
+            return None
+
+        cache = DryRunCache(
+            project_path / DEFAULT_DRY_RUN_CACHE_DIR if project_path else None
+        )
+        return AdmissionExecutor(
+            executor,
+            budget,
+            cache=cache,
+            confirm=self._confirm_cost,
+            engine=self.context.dialect,
+        )
+
     def _execute_server(
         self,
         sql_path: Path,
@@ -420,10 +510,13 @@ class RunAPI:
         dialect: str,
         limit: int | None,
         timeout: int,
+        stream: bool = False,
     ) -> RunResult:
         """Execute query via Basecamp Server Execution API.
 
-        Uses the new /api/v1/execution/sql/run endpoint.
+        Uses the new /api/v1/execution/sql/run endpoint. The response holds
+        the first page of rows; the remaining pages (or the NDJSON stream)
+        are written to the output file as they are downloaded.
         """
         client = self._get_client()
 
@@ -434,6 +527,7 @@ class RunAPI:
             execution_timeout=timeout,
             execution_limit=limit,
             target_dialect=dialect,
+            page_size=RESULT_PAGE_SIZE,
         )
 
         if not response.success:
@@ -446,68 +540,101 @@ class RunAPI:
         # Handle response data - could be list or dict
         raw_data = response.data
         if isinstance(raw_data, list):
-            result_rows: list[dict[str, Any]] = raw_data
-            row_count = len(raw_data)
+            result_rows: Iterable[dict[str, Any]] = raw_data
+            row_count: int | None = len(raw_data)
             duration_seconds = 0.0
             execution_id: str | None = None
         else:
             data: dict[str, Any] = raw_data if isinstance(raw_data, dict) else {}
-            result_rows = data.get("rows", [])
-            row_count = data.get("row_count", len(result_rows))
+            if data.get("next_page_token"):
+                # Remaining rows are downloaded while writing the output
+                result_rows = client.iter_result_rows(
+                    data, page_size=RESULT_PAGE_SIZE, stream=stream
+                )
+            else:
+                result_rows = data.get("rows", [])
+            row_count = data.get("row_count")
             duration_seconds = data.get("duration_seconds", 0.0)
             execution_id = data.get("execution_id")
 
-        self._write_output(output_path, output_format, result_rows)
+        try:
+            written = self._write_output(output_path, output_format, result_rows)
+        except ServerError as e:
+            raise RunExecutionError(
+                message=f"Failed to download results: {e.message}",
+                code=ErrorCode.RUN_EXECUTION_FAILED,
+                cause=str(e),
+            ) from e
 
         return RunResult(
             status=ResultStatus.SUCCESS,
             sql_path=sql_path,
             output_path=output_path,
             output_format=output_format,
-            row_count=row_count,
+            row_count=row_count if row_count is not None else written,
             duration_seconds=duration_seconds,
             execution_mode=ExecutionMode.SERVER,
             rendered_sql=rendered_sql,
             execution_id=execution_id,
         )
 
+    @traced("run.write_output")
     def _write_output(
         self,
         output_path: Path,
         output_format: OutputFormat,
-        rows: list[dict[str, Any]],
-    ) -> None:
-        """Write result rows to output file."""
+        rows: Iterable[dict[str, Any]],
+    ) -> int:
+        """Write result rows to output file.
+
+        Rows are consumed one at a time, so ``rows`` may be a lazy iterator
+        over a paged or streamed result. The file is written next to the
+        target and moved into place only when every row has been written.
+
+        Returns:
+            Number of rows written.
+        """
+        part_path = output_path.with_name(output_path.name + ".part")
+        written = 0
         try:
             output_path.parent.mkdir(parents=True, exist_ok=True)
+            row_iter = iter(rows)
 
             if output_format == OutputFormat.JSON:
-                with output_path.open("w", encoding="utf-8") as f:
-                    for row in rows:
+                with part_path.open("w", encoding="utf-8") as f:
+                    for row in row_iter:
                         f.write(json.dumps(row, ensure_ascii=False, default=str) + "\n")
+                        written += 1
 
-            elif output_format == OutputFormat.TSV:
-                with output_path.open("w", encoding="utf-8", newline="") as f:
-                    if rows:
+            else:  # CSV / TSV
+                delimiter = "\t" if output_format == OutputFormat.TSV else ","
+                with part_path.open("w", encoding="utf-8", newline="") as f:
+                    first = next(row_iter, None)
+                    if first is not None:
                         writer = csv.DictWriter(
-                            f, fieldnames=list(rows[0].keys()), delimiter="\t"
+                            f, fieldnames=list(first.keys()), delimiter=delimiter
                         )
                         writer.writeheader()
-                        writer.writerows(rows)
+                        writer.writerow(first)
+                        written = 1
+                        for row in row_iter:
+                            writer.writerow(row)
+                            written += 1
 
-            else:  # CSV
-                with output_path.open("w", encoding="utf-8", newline="") as f:
-                    if rows:
-                        writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
-                        writer.writeheader()
-                        writer.writerows(rows)
+            part_path.replace(output_path)
 
         except OSError as e:
+            part_path.unlink(missing_ok=True)
             raise RunOutputError(
                 message=f"Cannot write output file: {output_path}",
                 code=ErrorCode.RUN_OUTPUT_FAILED,
                 path=str(output_path),
             ) from e
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
+
+        return written
 
     # =========================================================================
     # Dry Run / Validation
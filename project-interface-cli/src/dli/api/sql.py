@@ -17,7 +17,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from dli.core.client import BasecampClient, ServerConfig
+from dli.core.client import BasecampClient, create_client
 from dli.exceptions import (
     SqlAccessDeniedError,
     SqlTeamNotFoundError,
@@ -97,11 +97,9 @@ class SqlAPI:
             BasecampClient instance.
         """
         if self._client is None:
-            config = ServerConfig(
-                url=self.context.server_url or "http://localhost:8081",
-            )
-            self._client = BasecampClient(
-                config=config,
+            self._client = create_client(
+                url=self.context.server_url,
+                api_key=self.context.api_token,
                 mock_mode=self._is_mock_mode,
             )
         return self._client
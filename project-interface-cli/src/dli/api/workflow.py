@@ -26,7 +26,13 @@ from __future__ import annotations
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
-from dli.core.client import BasecampClient, ServerConfig
+from dli.core.client import BasecampClient, create_client
+from dli.core.workflow.bulk import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_MAX_WORKERS,
+    BulkFetchResult,
+    fetch_in_chunks,
+)
 from dli.core.workflow.models import (
     RunStatus,
     SourceType,
@@ -44,6 +50,7 @@ from dli.exceptions import (
 )
 from dli.models.common import ExecutionContext, ExecutionMode, ResultStatus
 from dli.models.workflow import (
+    WorkflowBulkStatusResult,
     WorkflowHistoryResult,
     WorkflowListResult,
     WorkflowRegisterResult,
@@ -52,7 +59,9 @@ from dli.models.workflow import (
 )
 
 if TYPE_CHECKING:
-    pass
+    from collections.abc import Sequence
+
+    from dli.core.client import ServerResponse
 
 __all__ = ["WorkflowAPI"]
 
@@ -123,8 +132,7 @@ class WorkflowAPI:
             return self._client
 
         if self._is_mock_mode:
-            config = ServerConfig(url="http://mock-server")
-            self._client = BasecampClient(config, mock_mode=True)
+            self._client = create_client(url="http://mock-server", mock_mode=True)
             return self._client
 
         if not self.context.server_url:
@@ -133,11 +141,11 @@ class WorkflowAPI:
                 code=ErrorCode.CONFIG_INVALID,
             )
 
-        config = ServerConfig(
+        self._client = create_client(
             url=self.context.server_url,
             api_key=self.context.api_token,
+            mock_mode=False,
         )
-        self._client = BasecampClient(config, mock_mode=False)
         return self._client
 
     # =========================================================================
@@ -590,8 +598,137 @@ class WorkflowAPI:
             )
 
         run_data = response.data if isinstance(response.data, dict) else {}
+        return self._to_status_result(run_data, run_id=run_id)
+
+    def get_statuses(
+        self,
+        run_ids: Sequence[str],
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> WorkflowBulkStatusResult:
+        """Get the status of many workflow runs with batch requests.
+
+        Run IDs are sent in batches of ``batch_size``; several batches are
+        sent concurrently. Unknown run IDs are reported in ``missing``
+        instead of raising.
+
+        Args:
+            run_ids: Run IDs to query (duplicates are ignored).
+            batch_size: Maximum run IDs per request.
+            max_workers: Maximum concurrent requests.
+
+        Returns:
+            WorkflowBulkStatusResult with one status per known run.
+
+        Raises:
+            WorkflowExecutionError: If every batch request failed.
+
+        Example:
+            >>> result = api.get_statuses(run_ids)
+            >>> failed = [r.run_id for r in result.runs if r.run_status == RunStatus.FAILED]
+        """
+        client = self._get_client()
+        fetched = fetch_in_chunks(
+            run_ids,
+            client.workflow_status_batch,
+            batch_size=batch_size,
+            max_workers=max_workers,
+        )
+        return self._bulk_status_result(fetched)
+
+    def get_latest_statuses(
+        self,
+        dataset_names: Sequence[str] | None = None,
+        *,
+        since: datetime | str | None = None,
+        limit_per_dataset: int = 1,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> WorkflowBulkStatusResult:
+        """Get the most recent runs of many workflows with batch requests.
+
+        With ``limit_per_dataset`` greater than one this returns the recent
+        history of every dataset, replacing one ``history()`` call per
+        dataset.
+
+        Args:
+            dataset_names: Datasets to query. None returns every workflow
+                with runs in the window in a single request.
+            since: Only runs started at or after this time (datetime, ISO8601
+                or relative string like "24h").
+            limit_per_dataset: Runs per dataset, newest first.
+            batch_size: Maximum dataset names per request.
+            max_workers: Maximum concurrent requests.
+
+        Returns:
+            WorkflowBulkStatusResult; datasets without runs in the window are
+            listed in ``missing``.
+
+        Raises:
+            WorkflowExecutionError: If every batch request failed.
+
+        Example:
+            >>> result = api.get_latest_statuses(since="24h")
+            >>> for name, runs in result.by_dataset().items():
+            ...     print(name, runs[0].run_status)
+        """
+        client = self._get_client()
+        since_value = since.isoformat() if isinstance(since, datetime) else since
+
+        def fetch(names: list[str] | None) -> ServerResponse:
+            return client.workflow_latest_runs(
+                names, since=since_value, limit_per_dataset=limit_per_dataset
+            )
+
+        if dataset_names is None:
+            response = fetch(None)
+            if not response.success:
+                raise WorkflowExecutionError(
+                    dataset_name="unknown",
+                    message=response.error or "Status query failed",
+                )
+            data = response.data if isinstance(response.data, dict) else {}
+            fetched = BulkFetchResult(
+                runs=list(data.get("runs") or []),
+                missing=list(data.get("missing") or []),
+                requests=1,
+            )
+        else:
+            fetched = fetch_in_chunks(
+                dataset_names,
+                fetch,
+                batch_size=batch_size,
+                max_workers=max_workers,
+            )
+        return self._bulk_status_result(fetched)
+
+    def _bulk_status_result(self, fetched: BulkFetchResult) -> WorkflowBulkStatusResult:
+        """Convert a chunked lookup into a WorkflowBulkStatusResult.
+
+        Raises:
+            WorkflowExecutionError: If keys were requested and all batches failed.
+        """
+        if fetched.failed and not fetched.runs and not fetched.missing:
+            raise WorkflowExecutionError(
+                dataset_name="unknown",
+                message=next(iter(fetched.failed.values())),
+            )
+        return WorkflowBulkStatusResult(
+            runs=[self._to_status_result(run) for run in fetched.runs],
+            missing=fetched.missing,
+            failed=fetched.failed,
+            request_count=fetched.requests,
+            status=ResultStatus.FAILURE if fetched.failed else ResultStatus.SUCCESS,
+        )
+
+    @staticmethod
+    def _to_status_result(
+        run_data: dict[str, Any], run_id: str | None = None
+    ) -> WorkflowStatusResult:
+        """Convert a server run dict into a WorkflowStatusResult."""
         return WorkflowStatusResult(
-            run_id=run_id,
+            run_id=run_id or run_data.get("run_id", "unknown"),
             dataset_name=run_data.get("dataset_name", "unknown"),
             source_type=SourceType(run_data.get("source", "manual")),
             run_status=RunStatus(run_data.get("status", "PENDING")),
@@ -8,9 +8,10 @@ Commands:
 - info: Display CLI and environment information
 - metric: Metric management and execution subcommand (list, get, run, validate, register, transpile)
 - dataset: Dataset management and execution subcommand (list, get, run, validate, register, transpile)
+- format: Project-wide SQL and YAML formatting with unchanged-file skipping
 - config: Configuration management subcommand (show, status)
 - debug: Environment diagnostics and connection testing
-- lineage: Data lineage commands (table-level, server-based)
+- lineage: Data lineage commands (server-based, or local from spec SQL)
 - quality: Data quality testing subcommand
 - workflow: Workflow execution and management (server-based via Airflow)
 - catalog: Data catalog browsing and search (server-based)
@@ -19,25 +20,97 @@ Commands:
 - sql: SQL snippet management (list, get, put)
 """
 
-from dli.commands.catalog import catalog_app
-from dli.commands.config import config_app
-from dli.commands.dataset import dataset_app
-from dli.commands.debug import debug_app
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from dli.commands.info import info
-from dli.commands.lineage import lineage_app
-from dli.commands.metric import metric_app
-from dli.commands.quality import quality_app
-from dli.commands.query import query_app
-from dli.commands.run import run_app
-from dli.commands.sql import sql_app
+from dli.commands.lazy import LazySubcommand
 from dli.commands.version import version
-from dli.commands.workflow import workflow_app
+
+if TYPE_CHECKING:
+    from dli.commands.catalog import catalog_app
+    from dli.commands.config import config_app
+    from dli.commands.dataset import dataset_app
+    from dli.commands.debug import debug_app
+    from dli.commands.format import format_app
+    from dli.commands.lineage import lineage_app
+    from dli.commands.metric import metric_app
+    from dli.commands.quality import quality_app
+    from dli.commands.query import query_app
+    from dli.commands.run import run_app
+    from dli.commands.sql import sql_app
+    from dli.commands.workflow import workflow_app
+
+# Subcommand groups are imported on first dispatch (see dli.commands.lazy).
+# Help text must match the ``help=`` of each module's ``typer.Typer``.
+LAZY_SUBCOMMANDS: dict[str, LazySubcommand] = {
+    "catalog": LazySubcommand(
+        "dli.commands.catalog:catalog_app", "Browse and search the data catalog."
+    ),
+    "config": LazySubcommand(
+        "dli.commands.config:config_app", "Configuration management commands."
+    ),
+    "dataset": LazySubcommand(
+        "dli.commands.dataset:dataset_app",
+        "Dataset management and execution commands.",
+    ),
+    "debug": LazySubcommand(
+        "dli.commands.debug:debug_app",
+        "Environment diagnostics and connection testing.",
+    ),
+    "format": LazySubcommand(
+        "dli.commands.format:format_app",
+        "Format all SQL and YAML files in the project.",
+    ),
+    "lineage": LazySubcommand(
+        "dli.commands.lineage:lineage_app",
+        "Data lineage commands (server-based, or local from spec SQL).",
+    ),
+    "metric": LazySubcommand(
+        "dli.commands.metric:metric_app", "Metric management and execution commands."
+    ),
+    "quality": LazySubcommand(
+        "dli.commands.quality:quality_app", "Data quality testing commands."
+    ),
+    "query": LazySubcommand(
+        "dli.commands.query:query_app", "Browse and manage query execution metadata."
+    ),
+    "run": LazySubcommand(
+        "dli.commands.run:run_app", "Execute ad-hoc SQL files and download results."
+    ),
+    "sql": LazySubcommand(
+        "dli.commands.sql:sql_app", "Manage saved SQL worksheets on Basecamp Server."
+    ),
+    "workflow": LazySubcommand(
+        "dli.commands.workflow:workflow_app",
+        "Workflow management and execution commands (server-based via Airflow).",
+    ),
+}
+
+_LAZY_APPS = {f"{name}_app": name for name in LAZY_SUBCOMMANDS}
+
+
+def __getattr__(name: str) -> Any:
+    """Import ``<name>_app`` sub-apps on first attribute access."""
+    if name in _LAZY_APPS:
+        value = LAZY_SUBCOMMANDS[_LAZY_APPS[name]].load()
+        globals()[name] = value
+        return value
+    if name in LAZY_SUBCOMMANDS:
+        return importlib.import_module(f"{__name__}.{name}")
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
 
 __all__ = [
+    "LAZY_SUBCOMMANDS",
     "catalog_app",
     "config_app",
     "dataset_app",
     "debug_app",
+    "format_app",
     "info",
     "lineage_app",
     "metric_app",
@@ -14,6 +14,8 @@ from __future__ import annotations
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal
 
+from dli.commands.utils import console, print_error, print_success, print_warning
+
 # Re-export trace utilities for command modules
 from dli.core.trace import get_current_trace, with_trace
 
@@ -53,6 +55,7 @@ __all__ = [
     "spec_to_dict",
     "spec_to_list_dict",
     "spec_to_register_dict",
+    "validate_project_specs",
     # Trace utilities
     "with_trace",
 ]
@@ -164,6 +167,68 @@ def load_dataset_service(project_path: Path):
     return DatasetService(project_path=project_path)
 
 
+def validate_project_specs(
+    project_path: Path,
+    spec_type: Literal["metric", "dataset"],
+    variables: dict[str, str] | None = None,
+    *,
+    use_cache: bool = True,
+    jobs: int | None = None,
+) -> bool:
+    """Validate every spec of one type in the project and print the outcome.
+
+    Specs unchanged since the last run are reused from the validation cache
+    (.dli/cache/validation.json); the rest are validated in worker processes.
+
+    Args:
+        project_path: Path to the project directory.
+        spec_type: Type of specs to validate.
+        variables: Optional variable substitutions for SQL rendering.
+        use_cache: Reuse results for unchanged specs and store new ones.
+        jobs: Worker processes for cache misses (None uses the CPU count).
+
+    Returns:
+        True if every spec passed validation.
+    """
+    # Deferred so commands that never validate do not load the validators
+    from dli.core.config import load_project  # noqa: PLC0415
+    from dli.core.validation import SpecValidator  # noqa: PLC0415
+
+    try:
+        validator = SpecValidator(load_project(project_path).default_dialect)
+    except FileNotFoundError:
+        # validate_all reports the missing dli.yaml as a failed result
+        validator = SpecValidator()
+
+    summary = validator.validate_all(
+        project_path,
+        spec_type=spec_type,
+        variables=variables,
+        use_cache=use_cache,
+        jobs=jobs,
+    )
+
+    for result in summary.results:
+        label = result.spec_name or str(result.spec_path)
+        if not result.is_valid:
+            print_error(label)
+            for error in result.errors:
+                console.print(f"  • {error}")
+        elif result.has_warnings:
+            print_warning(label)
+            for warning in result.warnings:
+                console.print(f"  • {warning}")
+
+    counts = (
+        f"{summary.passed} passed, {summary.failed} failed ({summary.cached} cached)"
+    )
+    if summary.all_passed:
+        print_success(f"Validated {summary.total} {spec_type} specs: {counts}")
+    else:
+        print_error(f"Validation failed for {spec_type} specs: {counts}")
+    return summary.all_passed
+
+
 def format_tags_display(tags: list[str], max_display: int = MAX_TAGS_DISPLAY) -> str:
     """Format a list of tags for display, truncating if necessary.
 
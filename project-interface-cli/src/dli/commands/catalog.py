@@ -7,17 +7,23 @@ Uses implicit routing based on identifier part count:
 - 3-part: project.dataset.table -> table detail
 - 4-part: engine.project.dataset.table -> engine-specific table detail
 
-Note: All metadata is fetched from Basecamp Server API.
+Note: All metadata is fetched from Basecamp Server API. After
+`dli catalog sync`, `list` and `search` answer from a local SQLite index
+and refresh it in a background process when it is stale.
 """
 
 from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Annotated, Any, Literal
+import subprocess
+import sys
+from typing import TYPE_CHECKING, Annotated, Any, Literal
 
+import click
 from rich.table import Table
 import typer
+from typer.core import TyperGroup
 
 from dli.commands.base import (
     ListOutputFormat,
@@ -30,8 +36,13 @@ from dli.commands.utils import (
     console,
     format_datetime,
     print_error,
+    print_success,
     print_warning,
 )
+from dli.core.catalog.index import CatalogIndex, catalog_index_path
+
+if TYPE_CHECKING:
+    from dli.core.client import BasecampClient
 
 # Supported query engines for 4-part identifier detection
 SUPPORTED_ENGINES: frozenset[str] = frozenset({"bigquery", "trino", "hive"})
@@ -41,9 +52,26 @@ SectionType = Literal[
     "basic", "columns", "quality", "freshness", "ownership", "impact", "queries"
 ]
 
+
+class CatalogGroup(TyperGroup):
+    """Catalog group whose subcommand names win over the identifier argument.
+
+    The callback takes an optional positional identifier, which would
+    otherwise consume a subcommand name (``dli catalog sync`` would look up
+    a project named "sync").
+    """
+
+    def parse_args(self, ctx: click.Context, args: list[str]) -> list[str]:
+        """Fill the identifier with an empty value before a subcommand name."""
+        if args and args[0] in self.commands:
+            args = ["", *args]
+        return super().parse_args(ctx, args)
+
+
 # Create catalog subcommand app
 catalog_app = typer.Typer(
     name="catalog",
+    cls=CatalogGroup,
     help="Browse and search the data catalog.",
     invoke_without_command=True,
 )
@@ -109,6 +137,45 @@ def _parse_identifier(identifier: str) -> tuple[str | None, str, int]:
     return None, identifier, len(parts)
 
 
+def _open_index(project_path: Path, client: BasecampClient) -> CatalogIndex | None:
+    """Open the local catalog index, refreshing it in the background if stale.
+
+    The refresh runs in a detached ``dli catalog sync`` process so the
+    current command returns immediately from the existing snapshot.
+
+    Returns:
+        CatalogIndex instance, or None if no index has been synced yet.
+    """
+    path = catalog_index_path(project_path, client.config.url)
+    if not path.exists():
+        return None
+
+    index = CatalogIndex(path)
+    if index.is_stale() and index.claim_refresh():
+        _spawn_background_sync(project_path)
+    return index
+
+
+def _spawn_background_sync(project_path: Path) -> None:
+    """Start a detached ``dli catalog sync`` for the project."""
+    if getattr(sys, "frozen", False):
+        # Standalone binary: the executable is dli itself
+        command = [sys.executable]
+    else:
+        command = [sys.executable, "-m", "dli"]
+    command += ["catalog", "sync", "--path", str(project_path)]
+    try:
+        subprocess.Popen(  # noqa: S603
+            command,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError as e:
+        print_warning(f"Could not refresh catalog index in background: {e}")
+
+
 def _display_table_list(
     tables: list[dict[str, Any]],
     title: str,
@@ -489,6 +556,10 @@ def list_tables(
         int,
         typer.Option("--offset", help="Pagination offset."),
     ] = 0,
+    no_index: Annotated[
+        bool,
+        typer.Option("--no-index", help="Query the server instead of the local index."),
+    ] = False,
     path: Annotated[
         Path | None,
         typer.Option("--path", help="Project path."),
@@ -496,6 +567,9 @@ def list_tables(
 ) -> None:
     """List tables with advanced filters.
 
+    Uses the local catalog index when one exists (see `dli catalog sync`);
+    filters then match exactly, ignoring case.
+
     Examples:
         dli catalog list --project my-project
         dli catalog list --owner data-team@example.com
@@ -505,6 +579,24 @@ def list_tables(
     project_path = get_project_path(path)
     client = get_client(project_path)
 
+    index = None if no_index else _open_index(project_path, client)
+    if index is not None:
+        with index:
+            tables = index.list(
+                project=project,
+                dataset=dataset,
+                owner=owner,
+                team=team,
+                tags=tag,
+                limit=limit,
+                offset=offset,
+            )
+        if not tables:
+            print_warning("No tables found matching the filters.")
+            raise typer.Exit(0)
+        _display_table_list(tables, "Catalog Tables", format_output)
+        return
+
     with console.status("[bold green]Fetching tables..."):
         response = client.catalog_list(
             project=project,
@@ -548,6 +640,10 @@ def search_tables(
         int,
         typer.Option("--limit", "-n", help="Maximum number of results."),
     ] = 20,
+    no_index: Annotated[
+        bool,
+        typer.Option("--no-index", help="Query the server instead of the local index."),
+    ] = False,
     path: Annotated[
         Path | None,
         typer.Option("--path", help="Project path."),
@@ -555,7 +651,9 @@ def search_tables(
 ) -> None:
     """Search tables by keyword.
 
-    Searches in table names, column names, descriptions, and tags.
+    Searches in table names, column names, descriptions, and tags. With a
+    local catalog index (see `dli catalog sync`), results are ranked by
+    relevance and every word of the keyword is prefix-matched.
 
     Examples:
         dli catalog search user
@@ -565,6 +663,16 @@ def search_tables(
     project_path = get_project_path(path)
     client = get_client(project_path)
 
+    index = None if no_index else _open_index(project_path, client)
+    if index is not None:
+        with index:
+            tables = index.search(keyword, project=project, limit=limit)
+        if not tables:
+            print_warning(f"No tables found matching '{keyword}'.")
+            raise typer.Exit(0)
+        _display_table_list(tables, f"Search Results for '{keyword}'", format_output)
+        return
+
     with console.status(f"[bold green]Searching for '{keyword}'..."):
         response = client.catalog_search(
             keyword=keyword,
@@ -583,3 +691,45 @@ def search_tables(
         raise typer.Exit(0)
 
     _display_table_list(tables, f"Search Results for '{keyword}'", format_output)
+
+
+@catalog_app.command("sync")
+@with_trace("catalog sync")
+def sync_index(
+    full: Annotated[
+        bool,
+        typer.Option("--full", help="Rebuild the index instead of applying changes."),
+    ] = False,
+    path: Annotated[
+        Path | None,
+        typer.Option("--path", help="Project path."),
+    ] = None,
+) -> None:
+    """Sync the local catalog index used by list and search.
+
+    The first sync downloads the whole catalog; later syncs fetch only
+    tables changed since the previous one.
+
+    Examples:
+        dli catalog sync
+        dli catalog sync --full
+    """
+    project_path = get_project_path(path)
+    client = get_client(project_path)
+
+    with (
+        CatalogIndex(catalog_index_path(project_path, client.config.url)) as index,
+        console.status("[bold green]Syncing catalog index..."),
+    ):
+        stats = index.sync(client, full=full)
+        total = len(index)
+
+    if not stats.success:
+        print_error(stats.error or "Catalog sync failed")
+        raise typer.Exit(1)
+
+    mode = "Full sync" if stats.full else "Incremental sync"
+    print_success(
+        f"{mode}: {stats.upserted} updated, {stats.deleted} removed "
+        f"({total} tables indexed, {stats.duration_ms} ms)"
+    )
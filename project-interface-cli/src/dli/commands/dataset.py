@@ -23,6 +23,7 @@ from dli.commands.base import (
     spec_to_dict,
     spec_to_list_dict,
     spec_to_register_dict,
+    validate_project_specs,
     with_trace,
 )
 from dli.commands.utils import (
@@ -543,7 +544,10 @@ def _run_adhoc_sql(
 @dataset_app.command("validate")
 @with_trace("dataset validate")
 def validate_dataset(
-    name: Annotated[str, typer.Argument(help="Dataset name to validate.")],
+    name: Annotated[
+        str | None,
+        typer.Argument(help="Dataset name to validate (omit with --all)."),
+    ] = None,
     params: Annotated[
         list[str] | None,
         typer.Option("--param", "-p", help="Parameter in key=value format."),
@@ -552,15 +556,38 @@ def validate_dataset(
         bool,
         typer.Option("--show-sql/--no-sql", help="Show rendered SQL."),
     ] = True,
+    all_specs: Annotated[
+        bool,
+        typer.Option("--all", help="Validate every dataset spec in the project."),
+    ] = False,
+    no_cache: Annotated[
+        bool,
+        typer.Option(
+            "--no-cache", help="With --all, validate every spec, ignoring the cache."
+        ),
+    ] = False,
+    jobs: Annotated[
+        int | None,
+        typer.Option(
+            "--jobs",
+            "-j",
+            min=1,
+            help="Worker processes for --all (default: CPU count).",
+        ),
+    ] = None,
     path: Annotated[
         Path | None,
         typer.Option("--path", help="Project path."),
     ] = None,
 ) -> None:
-    """Validate a dataset query.
+    """Validate a dataset query, or every dataset spec with --all.
+
+    With --all, specs unchanged since the last run are skipped (cache in
+    .dli/cache/validation.json) and the rest are validated in parallel.
 
     Examples:
         dli dataset validate iceberg.analytics.daily_clicks -p execution_date=2024-01-01
+        dli dataset validate --all
     """
     project_path = get_project_path(path)
 
@@ -573,6 +600,25 @@ def validate_dataset(
         print_error(str(e))
         raise typer.Exit(1)
 
+    if all_specs:
+        if name:
+            print_error("Pass either a dataset name or --all, not both")
+            raise typer.Exit(1)
+        passed = validate_project_specs(
+            project_path,
+            "dataset",
+            {key: str(value) for key, value in param_dict.items()},
+            use_cache=not no_cache,
+            jobs=jobs,
+        )
+        if not passed:
+            raise typer.Exit(1)
+        return
+
+    if not name:
+        print_error("Missing dataset name (or pass --all)")
+        raise typer.Exit(1)
+
     try:
         service = load_dataset_service(project_path)
     except Exception as e:
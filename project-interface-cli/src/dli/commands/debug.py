@@ -71,7 +71,8 @@ def _print_check_result(check: CheckResult, verbose: bool = False) -> None:
         verbose: Whether to show verbose output.
     """
     symbol, _ = STATUS_SYMBOLS.get(check.status, ("[?]", "white"))
-    console.print(f"  {symbol} {check.name}: {check.message}")
+    latency = f"[dim]({check.duration_ms}ms)[/dim]"
+    console.print(f"  {symbol} {check.name}: {check.message} {latency}")
 
     # Show details in verbose mode
     if verbose and check.details:
@@ -118,6 +119,12 @@ def _print_debug_result(result: DebugResult, verbose: bool = False) -> None:
         console.print()
 
     # Print summary
+    slowest = result.slowest_check
+    if verbose and slowest is not None:
+        console.print(
+            f"[dim]Completed in {result.duration_ms}ms "
+            f"(slowest: {slowest.name}, {slowest.duration_ms}ms)[/dim]"
+        )
     if result.success:
         console.print(
             f"[green]All checks passed ({result.passed_count}/{result.total_count})[/green]"
@@ -158,6 +165,7 @@ def _merge_debug_results(results: list[DebugResult]) -> DebugResult:
         version=__version__,
         success=success,
         checks=all_checks,
+        duration_ms=sum(r.duration_ms for r in results),
     )
 
 
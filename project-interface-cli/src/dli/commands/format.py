@@ -0,0 +1,183 @@
+"""Format subcommand for DLI CLI.
+
+Formats every SQL file and spec YAML file of a project in one run.
+Files already known to be formatted are skipped using a local cache, and
+the remaining files are formatted in parallel worker processes.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Annotated
+
+from rich.table import Table
+import typer
+
+from dli.commands.base import ListOutputFormat, get_project_path, with_trace
+from dli.commands.utils import console, print_error, print_success, print_warning
+from dli.core.format.engine import ProjectFormatSummary, ProjectFormatter
+
+# Create format subcommand app
+format_app = typer.Typer(
+    name="format",
+    help="Format all SQL and YAML files in the project.",
+)
+
+
+@format_app.callback(invoke_without_command=True)
+@with_trace("format")
+def format_project(
+    check: Annotated[
+        bool,
+        typer.Option("--check", help="Check only, don't modify files (CI mode)."),
+    ] = False,
+    dialect: Annotated[
+        str | None,
+        typer.Option(
+            "--dialect", "-d", help="SQL dialect (bigquery, trino, snowflake, etc.)."
+        ),
+    ] = None,
+    lint: Annotated[
+        bool,
+        typer.Option("--lint", help="Report lint violations for SQL files."),
+    ] = False,
+    jobs: Annotated[
+        int | None,
+        typer.Option(
+            "--jobs", "-j", min=1, help="Worker processes (default: CPU count)."
+        ),
+    ] = None,
+    no_cache: Annotated[
+        bool,
+        typer.Option(
+            "--no-cache", help="Format every file, ignoring the format cache."
+        ),
+    ] = False,
+    timings: Annotated[
+        int,
+        typer.Option("--timings", min=0, help="Show the N slowest files."),
+    ] = 0,
+    format_output: Annotated[
+        ListOutputFormat,
+        typer.Option("--format", "-f", help="Output format (table or json)."),
+    ] = "table",
+    path: Annotated[
+        Path | None,
+        typer.Option("--path", "-p", help="Project path."),
+    ] = None,
+) -> None:
+    """Format all SQL and YAML files in the project.
+
+    Files unchanged since they were last formatted with the same settings
+    are skipped (cache in .dli/cache/format.json).
+
+    Examples:
+        dli format
+        dli format --check
+        dli format --dialect trino --jobs 8
+        dli format --check --timings 10
+    """
+    project_path = get_project_path(path)
+
+    try:
+        formatter = ProjectFormatter(
+            project_path,
+            dialect=dialect,
+            lint=lint,
+            jobs=jobs,
+            use_cache=not no_cache,
+        )
+        with console.status("[bold green]Formatting project..."):
+            summary = formatter.format_project(check_only=check)
+    except Exception as e:
+        print_error(f"Format failed: {e}")
+        raise typer.Exit(1)
+
+    if format_output == "json":
+        payload = {
+            "check_mode": summary.check_mode,
+            "duration_ms": round(summary.duration_ms, 1),
+            "changed_count": summary.changed_count,
+            "error_count": summary.error_count,
+            "cached_count": summary.cached_count,
+            "files": [
+                {
+                    "path": str(f.path),
+                    "kind": f.kind,
+                    "status": f.status.value,
+                    "duration_ms": round(f.duration_ms, 1),
+                    "cached": f.cached,
+                    "violations": f.violations,
+                    "error": f.error,
+                }
+                for f in summary.files
+            ],
+        }
+        console.print_json(json.dumps(payload))
+    else:
+        _print_summary(summary, project_path, timings=timings)
+
+    if summary.error_count:
+        raise typer.Exit(2)
+    if check and summary.has_changes:
+        raise typer.Exit(1)
+
+
+def _print_summary(
+    summary: ProjectFormatSummary, project_path: Path, *, timings: int
+) -> None:
+    """Print changed/error files, optional timings and a one-line summary."""
+    if not summary.files:
+        print_warning("No files found to format")
+        return
+
+    def _rel(file_path: Path) -> str:
+        try:
+            return str(file_path.relative_to(project_path))
+        except ValueError:
+            return str(file_path)
+
+    notable = [
+        f for f in summary.files if f.status.value != "unchanged" or f.violations
+    ]
+    if notable:
+        table = Table(show_header=True)
+        table.add_column("File", style="green")
+        table.add_column("Status", style="yellow")
+        table.add_column("Violations", style="red")
+        for f in notable:
+            color = {"changed": "yellow", "error": "red"}.get(f.status.value, "green")
+            table.add_row(
+                _rel(f.path),
+                f"[{color}]{f.status.value.upper()}[/{color}]",
+                str(len(f.violations)) if f.violations else "-",
+            )
+        console.print(table)
+        for f in notable:
+            if f.error:
+                console.print(f"  [red]{_rel(f.path)}[/red]: {f.error}")
+
+    if timings:
+        console.print(f"\n[bold]Slowest {timings} file(s):[/bold]")
+        for f in summary.slowest(timings):
+            tag = " (cached)" if f.cached else ""
+            console.print(f"  {f.duration_ms:8.1f}ms  {_rel(f.path)}{tag}")
+
+    console.print(
+        f"\n[dim]{len(summary.files)} file(s), {summary.cached_count} skipped as "
+        f"unchanged, {summary.duration_ms / 1000:.2f}s[/dim]"
+    )
+    if summary.error_count:
+        print_error(f"Format failed for {summary.error_count} file(s)")
+    elif summary.has_changes:
+        if summary.check_mode:
+            print_warning(f"{summary.changed_count} file(s) would be changed")
+            console.print("Run without --check to apply changes.")
+        else:
+            print_success(f"{summary.changed_count} file(s) formatted")
+    else:
+        print_success("All files already formatted")
+
+
+__all__ = ["format_app"]
@@ -0,0 +1,125 @@
+"""Lazy subcommand registry for the DLI CLI.
+
+Subcommand modules (dataset, metric, workflow, ...) pull in sqlglot, jinja2,
+pydantic models and rich tables at import time. Importing all of them before
+any argument is parsed makes ``dli --help`` and ``dli version`` pay for every
+command group.
+
+This module provides a Typer group that knows each subcommand only by its
+import path and short help text. The module behind a subcommand is imported
+the first time that subcommand is dispatched; listing commands in ``--help``
+uses lightweight placeholders and imports nothing.
+
+Example:
+    >>> class DliGroup(LazyTyperGroup):
+    ...     lazy_subcommands = LAZY_SUBCOMMANDS
+    >>> app = typer.Typer(cls=DliGroup)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from difflib import get_close_matches
+import importlib
+from typing import TYPE_CHECKING, ClassVar
+
+import click
+from typer.core import TyperGroup
+import typer.main
+from typer.models import TyperInfo
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+@dataclass(frozen=True)
+class LazySubcommand:
+    """A subcommand resolved by import path on first dispatch.
+
+    Attributes:
+        import_path: ``module:attribute`` path of the ``typer.Typer`` app
+        help: Short help text shown in ``dli --help`` without importing
+    """
+
+    import_path: str
+    help: str
+
+    def load(self) -> typer.Typer:
+        """Import the module and return the Typer sub-app."""
+        module_name, _, attr = self.import_path.partition(":")
+        module = importlib.import_module(module_name)
+        return getattr(module, attr)
+
+
+class _PlaceholderCommand(click.Command):
+    """Help-only stand-in for a subcommand that has not been imported yet."""
+
+
+class LazyTyperGroup(TyperGroup):
+    """Typer group that imports subcommand modules only when dispatched.
+
+    Subclasses set ``lazy_subcommands``. Eager commands (``version``,
+    ``info``) are registered as usual. Lazy subcommands are listed with
+    placeholder commands carrying their help text, and replaced with the
+    real Typer group in ``resolve_command``.
+    """
+
+    lazy_subcommands: ClassVar[Mapping[str, LazySubcommand]] = {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:  # noqa: ARG002 - click override
+        """Return eager commands first, then lazy ones in registration order."""
+        names = list(self.commands)
+        names.extend(name for name in self.lazy_subcommands if name not in names)
+        return names
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:  # noqa: ARG002 - click override
+        """Return the loaded command, or a placeholder for help listing."""
+        command = self.commands.get(cmd_name)
+        if command is not None:
+            return command
+        lazy = self.lazy_subcommands.get(cmd_name)
+        if lazy is None:
+            return None
+        return _PlaceholderCommand(cmd_name, help=lazy.help)
+
+    def resolve_command(
+        self, ctx: click.Context, args: list[str]
+    ) -> tuple[str | None, click.Command | None, list[str]]:
+        """Resolve the subcommand, importing its module on first dispatch.
+
+        Lookup goes through Click's resolver directly: typer's own
+        ``resolve_command`` only suggests names already present in
+        ``self.commands``, so typo suggestions covering lazy subcommands are
+        added here instead.
+        """
+        try:
+            cmd_name, command, rest = click.Group.resolve_command(self, ctx, args)
+        except click.UsageError as e:
+            if self.suggest_commands and args:
+                matches = get_close_matches(args[0], self.list_commands(ctx))
+                if matches:
+                    suggestions = ", ".join(f"{m!r}" for m in matches)
+                    e.message = f"{e.message.rstrip('.')}. Did you mean {suggestions}?"
+            raise
+        if isinstance(command, _PlaceholderCommand) and cmd_name is not None:
+            command = self.load_command(cmd_name)
+        return cmd_name, command, rest
+
+    def load_command(self, cmd_name: str) -> click.Command:
+        """Import a lazy subcommand and cache the resulting click command."""
+        sub_app = self.lazy_subcommands[cmd_name].load()
+        # Same conversion as ``app.add_typer(sub_app, name=cmd_name)``
+        command = typer.main.get_group_from_info(
+            TyperInfo(sub_app, name=cmd_name),
+            pretty_exceptions_short=True,
+            suggest_commands=self.suggest_commands,
+            rich_markup_mode=self.rich_markup_mode,
+        )
+        self.commands[cmd_name] = command
+        return command
+
+
+__all__ = [
+    "LazySubcommand",
+    "LazyTyperGroup",
+]
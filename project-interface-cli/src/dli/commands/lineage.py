@@ -1,22 +1,23 @@
 """Lineage subcommand for DLI CLI.
 
-Provides commands for querying data lineage information from the server.
-This module supports table-level lineage only (no column-level lineage).
+Provides commands for querying data lineage information.
 
-All lineage operations are SERVER-BASED ONLY, querying registered datasets
-from the Basecamp server. No local SQLGlot processing is performed.
+By default, lineage is queried from the Basecamp server (registered
+datasets, table-level). With ``--local``, lineage is derived from the
+project's spec SQL with SQLGlot, which also provides column-level lineage.
 
 Commands:
     show: Display full lineage (upstream and downstream)
     upstream: Show upstream dependencies
     downstream: Show downstream dependents
+    columns: Show column-level lineage (local only)
 """
 
 from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, cast
 
 from rich.panel import Panel
 from rich.table import Table
@@ -34,16 +35,19 @@ from dli.commands.utils import (
     print_error,
     print_warning,
 )
+from dli.core.config import load_project
 from dli.core.lineage import (
+    LineageDirectionType,
     LineageNode,
     LineageResult,
 )
 from dli.core.lineage.client import LineageClient, LineageClientError
+from dli.core.lineage.local import LocalLineageIndex
 
 # Create lineage subcommand app
 lineage_app = typer.Typer(
     name="lineage",
-    help="Data lineage commands (table-level, server-based).",
+    help="Data lineage commands (server-based, or local from spec SQL).",
     no_args_is_help=True,
 )
 
@@ -61,6 +65,46 @@ def _get_lineage_client(project_path: Path) -> LineageClient:
     return LineageClient(basecamp_client)
 
 
+def _get_local_lineage(
+    project_path: Path,
+    resource: str,
+    direction: LineageDirectionType,
+    depth: int,
+    *,
+    column: bool = False,
+) -> LineageResult:
+    """Query lineage from the local spec-SQL index, refreshing it first.
+
+    Args:
+        project_path: Path to the project directory
+        resource: Table/spec name, or column name when ``column`` is True
+        direction: Direction of the lineage query
+        depth: Maximum traversal depth (-1 for unlimited)
+        column: Query column-level lineage
+
+    Returns:
+        LineageResult from the local index
+
+    Raises:
+        typer.Exit: If the resource is unknown to the project
+    """
+    index = LocalLineageIndex(
+        project_path, dialect=load_project(project_path).default_dialect
+    )
+    stats = index.build()
+    for spec_path, errors in stats.errors.items():
+        for error in errors:
+            print_warning(f"{spec_path}: {error}")
+
+    if not index.contains(resource, column=column):
+        level = "column" if column else "table"
+        print_error(f"No local {level} lineage found for '{resource}'.")
+        raise typer.Exit(1)
+    if column:
+        return index.get_column_lineage(resource, direction, depth)
+    return index.get_lineage(resource, direction, depth)
+
+
 def _format_node_name(node: LineageNode, show_type: bool = True) -> str:
     """Format a node name for display.
 
@@ -76,6 +120,7 @@ def _format_node_name(node: LineageNode, show_type: bool = True) -> str:
             "Dataset": "cyan",
             "Metric": "magenta",
             "External": "yellow",
+            "Column": "green",
         }.get(node.type, "white")
         return f"[{type_color}]{node.name}[/{type_color}] [dim]({node.type})[/dim]"
     return f"[cyan]{node.name}[/cyan]"
@@ -293,6 +338,12 @@ def show_lineage(
         ListOutputFormat,
         typer.Option("--format", "-f", help="Output format (table or json)."),
     ] = "table",
+    local: Annotated[
+        bool,
+        typer.Option(
+            "--local", help="Derive lineage from project spec SQL (no server)."
+        ),
+    ] = False,
     path: Annotated[
         Path | None,
         typer.Option("--path", "-p", help="Project path."),
@@ -307,19 +358,23 @@ def show_lineage(
         dli lineage show iceberg.analytics.daily_clicks
         dli lineage show iceberg.analytics.daily_clicks --depth 3
         dli lineage show iceberg.analytics.daily_clicks --format json
+        dli lineage show iceberg.analytics.daily_clicks --local
     """
     project_path = get_project_path(path)
 
-    try:
-        client = _get_lineage_client(project_path)
-        result = client.get_lineage(
-            resource_name=resource,
-            direction="both",
-            depth=depth,
-        )
-    except LineageClientError as e:
-        print_error(e.message)
-        raise typer.Exit(1)
+    if local:
+        result = _get_local_lineage(project_path, resource, "both", depth)
+    else:
+        try:
+            client = _get_lineage_client(project_path)
+            result = client.get_lineage(
+                resource_name=resource,
+                direction="both",
+                depth=depth,
+            )
+        except LineageClientError as e:
+            print_error(e.message)
+            raise typer.Exit(1)
 
     if format_output == "json":
         console.print_json(json.dumps(_lineage_to_dict(result), default=str))
@@ -352,6 +407,12 @@ def show_upstream(
         ListOutputFormat,
         typer.Option("--format", "-f", help="Output format (table or json)."),
     ] = "table",
+    local: Annotated[
+        bool,
+        typer.Option(
+            "--local", help="Derive lineage from project spec SQL (no server)."
+        ),
+    ] = False,
     path: Annotated[
         Path | None,
         typer.Option("--path", "-p", help="Project path."),
@@ -364,18 +425,22 @@ def show_upstream(
     Examples:
         dli lineage upstream iceberg.analytics.daily_clicks
         dli lineage upstream iceberg.analytics.daily_clicks --depth 3
+        dli lineage upstream iceberg.analytics.daily_clicks --local
     """
     project_path = get_project_path(path)
 
-    try:
-        client = _get_lineage_client(project_path)
-        result = client.get_upstream(
-            resource_name=resource,
-            depth=depth,
-        )
-    except LineageClientError as e:
-        print_error(e.message)
-        raise typer.Exit(1)
+    if local:
+        result = _get_local_lineage(project_path, resource, "upstream", depth)
+    else:
+        try:
+            client = _get_lineage_client(project_path)
+            result = client.get_upstream(
+                resource_name=resource,
+                depth=depth,
+            )
+        except LineageClientError as e:
+            print_error(e.message)
+            raise typer.Exit(1)
 
     if format_output == "json":
         console.print_json(json.dumps(_lineage_to_dict(result), default=str))
@@ -408,6 +473,12 @@ def show_downstream(
         ListOutputFormat,
         typer.Option("--format", "-f", help="Output format (table or json)."),
     ] = "table",
+    local: Annotated[
+        bool,
+        typer.Option(
+            "--local", help="Derive lineage from project spec SQL (no server)."
+        ),
+    ] = False,
     path: Annotated[
         Path | None,
         typer.Option("--path", "-p", help="Project path."),
@@ -420,18 +491,22 @@ def show_downstream(
     Examples:
         dli lineage downstream iceberg.analytics.daily_clicks
         dli lineage downstream iceberg.analytics.daily_clicks --depth 2
+        dli lineage downstream iceberg.raw.user_events --local
     """
     project_path = get_project_path(path)
 
-    try:
-        client = _get_lineage_client(project_path)
-        result = client.get_downstream(
-            resource_name=resource,
-            depth=depth,
-        )
-    except LineageClientError as e:
-        print_error(e.message)
-        raise typer.Exit(1)
+    if local:
+        result = _get_local_lineage(project_path, resource, "downstream", depth)
+    else:
+        try:
+            client = _get_lineage_client(project_path)
+            result = client.get_downstream(
+                resource_name=resource,
+                depth=depth,
+            )
+        except LineageClientError as e:
+            print_error(e.message)
+            raise typer.Exit(1)
 
     if format_output == "json":
         console.print_json(json.dumps(_lineage_to_dict(result), default=str))
@@ -445,3 +520,66 @@ def show_downstream(
 
     console.print()
     console.print(f"[dim]Total downstream dependents: {result.total_downstream}[/dim]")
+
+
+@lineage_app.command("columns")
+@with_trace("lineage columns")
+def show_column_lineage(
+    column: Annotated[
+        str,
+        typer.Argument(
+            help="Column name (e.g., iceberg.analytics.daily_clicks.user_id)."
+        ),
+    ],
+    direction: Annotated[
+        str,
+        typer.Option("--direction", help="Direction: upstream, downstream or both."),
+    ] = "upstream",
+    depth: Annotated[
+        int,
+        typer.Option(
+            "--depth", "-d", help="Maximum traversal depth (-1 for unlimited)."
+        ),
+    ] = -1,
+    format_output: Annotated[
+        ListOutputFormat,
+        typer.Option("--format", "-f", help="Output format (table or json)."),
+    ] = "table",
+    path: Annotated[
+        Path | None,
+        typer.Option("--path", "-p", help="Project path."),
+    ] = None,
+) -> None:
+    """Show column-level lineage derived from project spec SQL.
+
+    Column lineage is computed locally with SQLGlot and cached in
+    .dli/cache/lineage.db; only changed specs are re-parsed.
+
+    Examples:
+        dli lineage columns iceberg.analytics.daily_clicks.user_id
+        dli lineage columns iceberg.raw.user_events.item_id --direction downstream
+    """
+    if direction not in ("upstream", "downstream", "both"):
+        print_error("--direction must be one of: upstream, downstream, both")
+        raise typer.Exit(1)
+
+    project_path = get_project_path(path)
+    result = _get_local_lineage(
+        project_path,
+        column,
+        cast("LineageDirectionType", direction),
+        depth,
+        column=True,
+    )
+
+    if format_output == "json":
+        console.print_json(json.dumps(_lineage_to_dict(result), default=str))
+        return
+
+    _display_lineage_tree(result, direction)
+
+    console.print()
+    console.print(
+        f"[dim]Summary: {result.total_upstream} upstream, "
+        f"{result.total_downstream} downstream column(s)[/dim]"
+    )
@@ -26,6 +26,7 @@ from dli.commands.base import (
     spec_to_dict,
     spec_to_list_dict,
     spec_to_register_dict,
+    validate_project_specs,
     with_trace,
 )
 from dli.commands.utils import (
@@ -369,7 +370,10 @@ def run_metric(
 @metric_app.command("validate")
 @with_trace("metric validate")
 def validate_metric(
-    name: Annotated[str, typer.Argument(help="Metric name to validate.")],
+    name: Annotated[
+        str | None,
+        typer.Argument(help="Metric name to validate (omit with --all)."),
+    ] = None,
     params: Annotated[
         list[str] | None,
         typer.Option("--param", "-p", help="Parameter in key=value format."),
@@ -378,15 +382,38 @@ def validate_metric(
         bool,
         typer.Option("--show-sql/--no-sql", help="Show rendered SQL."),
     ] = True,
+    all_specs: Annotated[
+        bool,
+        typer.Option("--all", help="Validate every metric spec in the project."),
+    ] = False,
+    no_cache: Annotated[
+        bool,
+        typer.Option(
+            "--no-cache", help="With --all, validate every spec, ignoring the cache."
+        ),
+    ] = False,
+    jobs: Annotated[
+        int | None,
+        typer.Option(
+            "--jobs",
+            "-j",
+            min=1,
+            help="Worker processes for --all (default: CPU count).",
+        ),
+    ] = None,
     path: Annotated[
         Path | None,
         typer.Option("--path", help="Project path."),
     ] = None,
 ) -> None:
-    """Validate a metric query.
+    """Validate a metric query, or every metric spec with --all.
+
+    With --all, specs unchanged since the last run are skipped (cache in
+    .dli/cache/validation.json) and the rest are validated in parallel.
 
     Examples:
         dli metric validate iceberg.reporting.user_summary -p date=2024-01-01
+        dli metric validate --all
     """
     project_path = get_project_path(path)
 
@@ -399,6 +426,25 @@ def validate_metric(
         print_error(str(e))
         raise typer.Exit(1)
 
+    if all_specs:
+        if name:
+            print_error("Pass either a metric name or --all, not both")
+            raise typer.Exit(1)
+        passed = validate_project_specs(
+            project_path,
+            "metric",
+            {key: str(value) for key, value in param_dict.items()},
+            use_cache=not no_cache,
+            jobs=jobs,
+        )
+        if not passed:
+            raise typer.Exit(1)
+        return
+
+    if not name:
+        print_error("Missing metric name (or pass --all)")
+        raise typer.Exit(1)
+
     try:
         service = load_metric_service(project_path)
     except Exception as e:
@@ -9,10 +9,12 @@ not query results.
 
 from __future__ import annotations
 
+from datetime import datetime
 import json
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated, Any
 
+from rich.live import Live
 from rich.table import Table
 import typer
 
@@ -33,6 +35,16 @@ from dli.core.query.models import (
     QueryScope,
     QueryState,
 )
+from dli.core.query.watch import (
+    DEFAULT_MAX_INTERVAL,
+    DEFAULT_MIN_INTERVAL,
+    PollBackoff,
+    QueryWatcher,
+)
+from dli.exceptions import ServerError
+
+if TYPE_CHECKING:
+    from dli.core.client import BasecampClient
 
 # Status style constants for Rich output
 _STATUS_STYLES: dict[str, str] = {
@@ -122,6 +134,123 @@ def _format_bytes(bytes_value: int | None) -> str:
     return f"{bytes_value} B"
 
 
+def _build_query_table(
+    queries: list[dict[str, Any]],
+    *,
+    show_account: bool,
+    title: str,
+    changed_ids: set[str] | None = None,
+) -> Table:
+    """Build the query list table.
+
+    Args:
+        queries: Query rows from the server.
+        show_account: Include account and account type columns.
+        title: Table title.
+        changed_ids: Rows to highlight (changed since the last refresh).
+
+    Returns:
+        Rich Table.
+    """
+    table = Table(title=title, show_header=True)
+    table.add_column("QUERY_ID", style="cyan", no_wrap=True, max_width=35)
+
+    if show_account:
+        table.add_column("ACCOUNT", style="white", max_width=25)
+        table.add_column("TYPE", style="dim")
+
+    table.add_column("ENGINE", style="yellow")
+    table.add_column("STATE", style="green")
+    table.add_column("STARTED", style="dim")
+    table.add_column("DURATION", style="magenta", justify="right")
+    table.add_column("TABLES", style="blue", justify="right")
+
+    for q in queries:
+        query_state = q.get("state", "-")
+        account_type = q.get("account_type", "-")
+
+        row = [q.get("query_id", "-")]
+
+        if show_account:
+            row.append(q.get("account", "-"))
+            row.append(f"[{_get_account_type_style(account_type)}]{account_type}[/]")
+
+        row.extend(
+            [
+                q.get("engine", "-"),
+                f"[{_get_status_style(query_state)}]{query_state}[/]",
+                format_datetime(q.get("started_at"), include_seconds=True),
+                _format_duration(q.get("duration_seconds")),
+                str(q.get("tables_used_count", 0)),
+            ]
+        )
+
+        highlight = changed_ids is not None and q.get("query_id") in changed_ids
+        table.add_row(*row, style="bold" if highlight else None)
+
+    return table
+
+
+def _watch_queries(
+    client: BasecampClient,
+    filters: dict[str, Any],
+    *,
+    limit: int,
+    show_account: bool,
+    format_output: str,
+    backoff: PollBackoff,
+    use_events: bool,
+) -> None:
+    """Show a live query list until interrupted.
+
+    The table is updated in place; rows changed by the latest update are
+    highlighted. With JSON output, each change is printed as one JSON
+    object (changed rows and removed IDs).
+    """
+    watcher = QueryWatcher(
+        client,
+        filters=filters,
+        limit=limit,
+        backoff=backoff,
+        use_events=use_events,
+    )
+    updates = watcher.updates()
+
+    try:
+        if format_output == "json":
+            for update in updates:
+                changed = [
+                    q for q in update.queries if q["query_id"] in update.changed_ids
+                ]
+                console.print_json(
+                    json.dumps(
+                        {"queries": changed, "removed": sorted(update.removed_ids)},
+                        default=str,
+                    )
+                )
+            return
+
+        with Live(console=console, auto_refresh=False, transient=False) as live:
+            for update in updates:
+                table = _build_query_table(
+                    update.queries,
+                    show_account=show_account,
+                    title=f"Queries ({len(update.queries)})",
+                    changed_ids=update.changed_ids if update.polls > 1 else None,
+                )
+                via = "events" if update.source == "events" else f"{update.polls} polls"
+                table.caption = (
+                    f"Updated {datetime.now().strftime('%H:%M:%S')} ({via}) "
+                    "- Ctrl+C to stop"
+                )
+                live.update(table, refresh=True)
+    except ServerError as e:
+        print_error(e.message)
+        raise typer.Exit(1)
+    except KeyboardInterrupt:
+        return
+
+
 @query_app.command("list")
 @with_trace("query list")
 def list_queries(
@@ -178,6 +307,26 @@ def list_queries(
         ListOutputFormat,
         typer.Option("--format", "-f", help="Output format (table or json)."),
     ] = "table",
+    watch: Annotated[
+        bool,
+        typer.Option("--watch", "-w", help="Keep the list updated until Ctrl+C."),
+    ] = False,
+    interval: Annotated[
+        float,
+        typer.Option(
+            "--interval", help="Watch poll interval after a change (seconds)."
+        ),
+    ] = DEFAULT_MIN_INTERVAL,
+    max_interval: Annotated[
+        float,
+        typer.Option("--max-interval", help="Longest watch poll interval (seconds)."),
+    ] = DEFAULT_MAX_INTERVAL,
+    events: Annotated[
+        bool,
+        typer.Option(
+            "--events", help="Use server-sent events when the server supports them."
+        ),
+    ] = False,
     path: Annotated[
         Path | None,
         typer.Option("--path", help="Project path."),
@@ -195,6 +344,10 @@ def list_queries(
       user    - Queries from personal (non-system) accounts
       all     - All accessible queries
 
+    With --watch the list stays open and refreshes in place. Only changed
+    rows are fetched, and polling slows down (up to --max-interval) while
+    nothing changes.
+
     Examples:
         dli query list
         dli query list --status failed
@@ -202,10 +355,37 @@ def list_queries(
         dli query list airflow --scope system
         dli query list --scope all --sql "SELECT * FROM users"
         dli query list --tag team::analytics --since 7d
+        dli query list --scope all --status running --watch
     """
     project_path = get_project_path(path)
     client = get_client(project_path)
 
+    if watch:
+        try:
+            backoff = PollBackoff(min_interval=interval, max_interval=max_interval)
+        except ValueError as e:
+            print_error(str(e))
+            raise typer.Exit(1)
+        _watch_queries(
+            client,
+            {
+                "scope": scope.value,
+                "account_keyword": account_keyword,
+                "sql_pattern": sql,
+                "state": status.value if status else None,
+                "tags": tag,
+                "engine": engine,
+                "since": since,
+                "until": until,
+            },
+            limit=limit,
+            show_account=scope != QueryScope.MY,
+            format_output=format_output,
+            backoff=backoff,
+            use_events=events,
+        )
+        return
+
     with console.status("[bold green]Fetching queries..."):
         response = client.query_list(
             scope=scope.value,
@@ -238,45 +418,13 @@ def list_queries(
         return
 
     # Build table based on scope
-    show_account = scope != QueryScope.MY
-    table = Table(title=f"Queries ({len(queries)})", show_header=True)
-    table.add_column("QUERY_ID", style="cyan", no_wrap=True, max_width=35)
-
-    if show_account:
-        table.add_column("ACCOUNT", style="white", max_width=25)
-        table.add_column("TYPE", style="dim")
-
-    table.add_column("ENGINE", style="yellow")
-    table.add_column("STATE", style="green")
-    table.add_column("STARTED", style="dim")
-    table.add_column("DURATION", style="magenta", justify="right")
-    table.add_column("TABLES", style="blue", justify="right")
-
-    for q in queries:
-        query_state = q.get("state", "-")
-        account_type = q.get("account_type", "-")
-
-        row = [q.get("query_id", "-")]
-
-        if show_account:
-            row.append(q.get("account", "-"))
-            row.append(
-                f"[{_get_account_type_style(account_type)}]{account_type}[/]"
-            )
-
-        row.extend(
-            [
-                q.get("engine", "-"),
-                f"[{_get_status_style(query_state)}]{query_state}[/]",
-                format_datetime(q.get("started_at"), include_seconds=True),
-                _format_duration(q.get("duration_seconds")),
-                str(q.get("tables_used_count", 0)),
-            ]
+    console.print(
+        _build_query_table(
+            queries,
+            show_account=scope != QueryScope.MY,
+            title=f"Queries ({len(queries)})",
         )
-
-        table.add_row(*row)
-
-    console.print(table)
+    )
 
     # Show pagination info
     if has_more or total_count > len(queries):
@@ -11,7 +11,7 @@ this command runs arbitrary SQL files without registration.
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 from rich.panel import Panel
 from rich.syntax import Syntax
@@ -27,6 +27,7 @@ from dli.commands.utils import (
 )
 from dli.exceptions import (
     ConfigurationError,
+    RunCostExceededError,
     RunExecutionError,
     RunFileNotFoundError,
     RunLocalDeniedError,
@@ -36,6 +37,13 @@ from dli.exceptions import (
 from dli.models.common import ExecutionContext, ExecutionMode
 from dli.models.run import OutputFormat
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from rich.status import Status
+
+    from dli.core.admission import AdmissionDecision
+
 # Create run subcommand app
 run_app = typer.Typer(
     name="run",
@@ -112,6 +120,36 @@ def _format_duration(seconds: float) -> str:
     return f"{minutes}m {remaining_seconds:.0f}s"
 
 
+def _cost_confirmer(status: Status | None) -> Callable[[AdmissionDecision], bool]:
+    """Build the prompt for queries above a cost budget with on_exceed: confirm.
+
+    Args:
+        status: Progress spinner to pause while the prompt is shown.
+
+    Returns:
+        Callback for RunAPI's ``confirm_cost``.
+    """
+
+    def confirm(decision: AdmissionDecision) -> bool:
+        if status is not None:
+            status.stop()
+        try:
+            console.print(
+                "[yellow]Query exceeds the cost budget:[/yellow] "
+                f"{'; '.join(decision.exceeded)}"
+            )
+            if decision.bytes_processed is not None:
+                console.print(
+                    f"[dim]Estimated bytes:[/dim] {_format_bytes(decision.bytes_processed)}"
+                )
+            return typer.confirm("Run anyway?", default=False)
+        finally:
+            if status is not None:
+                status.start()
+
+    return confirm
+
+
 @run_app.command(name="sql")
 @with_trace("run sql")
 def run_sql(
@@ -287,7 +325,21 @@ def run_sql(
         project_path=project_path,
         execution_mode=ExecutionMode.MOCK,  # Use mock for now
     )
-    api = RunAPI(context=ctx)
+    # Determine mode string for display
+    if local:
+        mode_str = "local"
+    elif server:
+        mode_str = "server"
+    elif remote:
+        mode_str = "remote"
+    else:
+        mode_str = "default"
+    status = (
+        None
+        if quiet
+        else console.status(f"[bold green]Executing {sql.name} ({mode_str} mode)...")
+    )
+    api = RunAPI(context=ctx, confirm_cost=_cost_confirmer(status))
 
     # Handle dry-run
     if dry_run:
@@ -357,20 +409,8 @@ def run_sql(
 
     # Execute query
     try:
-        # Determine mode string for display
-        if local:
-            mode_str = "local"
-        elif server:
-            mode_str = "server"
-        elif remote:
-            mode_str = "remote"
-        else:
-            mode_str = "default"
-
-        if not quiet:
-            with console.status(
-                f"[bold green]Executing {sql.name} ({mode_str} mode)..."
-            ):
+        if status is not None:
+            with status:
                 result = api.run(
                     sql_path=sql,
                     output_path=output,
@@ -407,6 +447,12 @@ def run_sql(
     except RunServerUnavailableError as e:
         print_error(str(e), trace_mode=trace_mode)
         raise typer.Exit(1)
+    except RunCostExceededError as e:
+        print_error(str(e), trace_mode=trace_mode)
+        console.print(
+            "[dim]Narrow the query or adjust the admission budget in dli.yaml.[/dim]"
+        )
+        raise typer.Exit(1)
     except RunExecutionError as e:
         print_error(str(e), trace_mode=trace_mode)
         raise typer.Exit(1)
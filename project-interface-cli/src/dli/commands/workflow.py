@@ -12,11 +12,12 @@ from __future__ import annotations
 from datetime import datetime
 import json
 from pathlib import Path
-from typing import Annotated, Literal
+from typing import TYPE_CHECKING, Annotated, Literal
 
 from rich.table import Table
 import typer
 
+from dli.api.workflow import WorkflowAPI
 from dli.commands.base import (
     ListOutputFormat,
     get_client,
@@ -32,6 +33,13 @@ from dli.commands.utils import (
     print_success,
     print_warning,
 )
+from dli.core.workflow.bulk import resolve_since
+from dli.core.workflow.models import RunStatus
+from dli.exceptions import DLIError
+from dli.models.common import ExecutionContext
+
+if TYPE_CHECKING:
+    from dli.core.client import BasecampClient
 
 # Workflow-specific type definitions for CLI options
 WorkflowSourceType = Literal["code", "manual", "all"]
@@ -311,10 +319,33 @@ def stop_workflow(
 @workflow_app.command("status")
 @with_trace("workflow status")
 def status_workflow(
-    run_id: Annotated[
-        str,
-        typer.Argument(help="Run ID to check status."),
-    ],
+    run_ids: Annotated[
+        list[str] | None,
+        typer.Argument(help="Run ID(s) to check status."),
+    ] = None,
+    all_workflows: Annotated[
+        bool,
+        typer.Option("--all", "-a", help="Show the latest run of every workflow."),
+    ] = False,
+    datasets: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--dataset", "-d", help="Show the latest run of a dataset (repeatable)."
+        ),
+    ] = None,
+    since: Annotated[
+        str | None,
+        typer.Option(
+            "--since",
+            help="With --all/--dataset: only runs started since (ISO8601 or relative: 1h, 7d).",
+        ),
+    ] = None,
+    limit_per_dataset: Annotated[
+        int,
+        typer.Option(
+            "--runs", "-n", min=1, help="With --all/--dataset: runs per dataset."
+        ),
+    ] = 1,
     format_output: Annotated[
         ListOutputFormat,
         typer.Option("--format", "-f", help="Output format (table or json)."),
@@ -326,12 +357,95 @@ def status_workflow(
 ) -> None:
     """Get workflow run status.
 
+    A single run ID shows its details. Several run IDs, --dataset or --all
+    fetch every status with batch requests and show one table.
+
     Examples:
         dli workflow status iceberg.analytics.daily_clicks_20240115_093045
+        dli workflow status RUN_ID_1 RUN_ID_2 RUN_ID_3
+        dli workflow status --all --since 24h
+        dli workflow status -d iceberg.analytics.daily_clicks -n 5
     """
+    if not run_ids and not datasets and not all_workflows:
+        print_error("Provide run ID(s), --dataset or --all")
+        raise typer.Exit(1)
+    if run_ids and (datasets or all_workflows):
+        print_error("Run IDs cannot be combined with --dataset or --all")
+        raise typer.Exit(1)
+
     project_path = get_project_path(path)
     client = get_client(project_path)
 
+    if run_ids and len(run_ids) == 1:
+        _show_run_status(client, run_ids[0], format_output)
+        return
+
+    try:
+        resolve_since(since)
+    except ValueError as e:
+        print_error(str(e))
+        raise typer.Exit(1) from None
+
+    api = WorkflowAPI(
+        context=ExecutionContext(project_path=project_path), client=client
+    )
+    try:
+        with console.status("[bold green]Fetching statuses..."):
+            if run_ids:
+                result = api.get_statuses(run_ids)
+            else:
+                result = api.get_latest_statuses(
+                    None if all_workflows else datasets,
+                    since=since,
+                    limit_per_dataset=limit_per_dataset,
+                )
+    except DLIError as e:
+        print_error(e.message)
+        raise typer.Exit(1) from None
+
+    if format_output == "json":
+        console.print_json(result.model_dump_json())
+        return
+
+    for key, error in result.failed.items():
+        print_warning(f"{key}: {error}")
+    if result.missing:
+        label = "runs" if run_ids else "datasets without runs"
+        print_warning(f"Not found ({label}): {', '.join(result.missing)}")
+    if not result.runs:
+        print_warning("No workflow runs found.")
+        return
+
+    table = Table(title=f"Workflow Status ({len(result.runs)})", show_header=True)
+    table.add_column("DATASET", style="white")
+    table.add_column("RUN ID", style="cyan", no_wrap=True, max_width=40)
+    table.add_column("STATUS", style="green")
+    table.add_column("SOURCE", style="yellow")
+    table.add_column("STARTED", style="dim")
+    table.add_column("ENDED", style="dim")
+
+    for run in result.runs:
+        run_status = run.run_status.value
+        source_type = run.source_type.value
+        table.add_row(
+            run.dataset_name,
+            run.run_id,
+            f"[{_get_status_style(run_status)}]{run_status}[/]",
+            f"[{_get_source_style(source_type)}]{source_type}[/]",
+            format_datetime(run.started_at, include_seconds=True),
+            format_datetime(run.finished_at, include_seconds=True),
+        )
+
+    console.print(table)
+    failed_runs = sum(run.run_status == RunStatus.FAILED for run in result.runs)
+    if failed_runs:
+        console.print(f"[red]{failed_runs} failed run(s)[/red]")
+
+
+def _show_run_status(
+    client: BasecampClient, run_id: str, format_output: ListOutputFormat
+) -> None:
+    """Print the details of a single workflow run."""
     with console.status("[bold green]Fetching status..."):
         response = client.workflow_status(run_id=run_id)
 
@@ -0,0 +1,536 @@
+"""Cost-based admission control for query executors.
+
+This module provides the AdmissionExecutor, a BaseExecutor wrapper that
+dry-runs every statement before executing it and enforces byte and cost
+budgets:
+- Query budgets limit a single statement
+- Command budgets limit the total of all statements run through one
+  AdmissionExecutor (one CLI command or library call)
+
+Statements above a limit are rejected, or executed after confirmation when
+the budget is configured with ``on_exceed: confirm``. Admitted statements
+on engines that support it (BigQuery) run with ``maximum_bytes_billed`` set
+to the remaining byte budget, so a bad estimate cannot overspend.
+
+Budgets come from the ``admission`` section of dli.yaml and from the server
+execution policy; when both set a limit, the stricter one applies::
+
+    admission:
+      on_exceed: confirm        # or reject (default)
+      query:
+        max_bytes: 100000000000
+        max_cost_usd: 5.0
+      command:
+        max_bytes: 500000000000
+        max_cost_usd: 20.0
+
+Dry-run estimates are cached by SQL hash (in memory, and on disk under
+``.dli/cache/dryrun`` when a cache directory is given), so repeated runs of
+the same statement do not pay for the dry run twice.
+
+Example:
+    >>> budget = CostBudget.from_dict(project_config.admission)
+    >>> executor = AdmissionExecutor(
+    ...     BigQueryExecutor(project="my-project"),
+    ...     budget,
+    ...     cache=DryRunCache(project_path / DEFAULT_DRY_RUN_CACHE_DIR),
+    ... )
+    >>> result = executor.execute_sql("SELECT * FROM big_table")
+    >>> result.success, executor.decisions[-1].reason
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from enum import StrEnum
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import tempfile
+import time
+from typing import TYPE_CHECKING, Any
+
+from dli.core.executor import BaseExecutor
+from dli.core.models import ExecutionResult
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+    from dli.core.types import DryRunResult
+
+logger = logging.getLogger(__name__)
+
+# Default dry-run cache location relative to the project directory
+DEFAULT_DRY_RUN_CACHE_DIR = Path(".dli") / "cache" / "dryrun"
+DRY_RUN_CACHE_FILENAME = "estimates.json"
+
+# Default lifetime of a cached estimate; table sizes change over time
+DEFAULT_DRY_RUN_TTL_SECONDS = 3600
+
+# Upper bound for the number of estimates kept on disk
+_MAX_CACHED_ESTIMATES = 1000
+
+# Bump when the stored layout changes
+_CACHE_FORMAT = 1
+
+# Decimal (SI) step between byte units in messages
+_BYTES_PER_UNIT = 1000
+
+
+class OnExceed(StrEnum):
+    """What to do with a statement above a budget."""
+
+    REJECT = "reject"
+    CONFIRM = "confirm"
+
+
+def _stricter(a: float | None, b: float | None) -> float | None:
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return min(a, b)
+
+
+@dataclass(frozen=True)
+class CostBudget:
+    """Byte and cost limits for query admission.
+
+    Attributes:
+        max_bytes_per_query: Maximum estimated bytes for one statement.
+        max_cost_per_query_usd: Maximum estimated cost for one statement.
+        max_bytes_per_command: Maximum total bytes for one command.
+        max_cost_per_command_usd: Maximum total cost for one command.
+        on_exceed: Reject statements above a limit or ask for confirmation.
+    """
+
+    max_bytes_per_query: int | None = None
+    max_cost_per_query_usd: float | None = None
+    max_bytes_per_command: int | None = None
+    max_cost_per_command_usd: float | None = None
+    on_exceed: OnExceed = OnExceed.REJECT
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any] | None) -> CostBudget:
+        """Create a budget from an ``admission`` config section.
+
+        Args:
+            data: Mapping with optional ``query`` and ``command`` sections
+                (each with ``max_bytes`` and ``max_cost_usd``) and
+                ``on_exceed``.
+
+        Returns:
+            CostBudget (unlimited if data is empty).
+
+        Raises:
+            ValueError: If a value has the wrong type.
+        """
+        data = data or {}
+        query = data.get("query") or {}
+        command = data.get("command") or {}
+        try:
+            return cls(
+                max_bytes_per_query=_optional(int, query.get("max_bytes")),
+                max_cost_per_query_usd=_optional(float, query.get("max_cost_usd")),
+                max_bytes_per_command=_optional(int, command.get("max_bytes")),
+                max_cost_per_command_usd=_optional(float, command.get("max_cost_usd")),
+                on_exceed=OnExceed(data.get("on_exceed", OnExceed.REJECT.value)),
+            )
+        except (TypeError, ValueError) as e:
+            msg = f"Invalid admission config: {e}"
+            raise ValueError(msg) from e
+
+    @property
+    def is_unlimited(self) -> bool:
+        """Whether no limit is set."""
+        return (
+            self.max_bytes_per_query is None
+            and self.max_cost_per_query_usd is None
+            and self.max_bytes_per_command is None
+            and self.max_cost_per_command_usd is None
+        )
+
+    def merge(self, other: CostBudget) -> CostBudget:
+        """Combine two budgets, keeping the stricter of each limit.
+
+        Confirmation is only offered if both budgets allow it.
+        """
+        return CostBudget(
+            max_bytes_per_query=_stricter(
+                self.max_bytes_per_query, other.max_bytes_per_query
+            ),
+            max_cost_per_query_usd=_stricter(
+                self.max_cost_per_query_usd, other.max_cost_per_query_usd
+            ),
+            max_bytes_per_command=_stricter(
+                self.max_bytes_per_command, other.max_bytes_per_command
+            ),
+            max_cost_per_command_usd=_stricter(
+                self.max_cost_per_command_usd, other.max_cost_per_command_usd
+            ),
+            on_exceed=(
+                OnExceed.CONFIRM
+                if self.on_exceed == other.on_exceed == OnExceed.CONFIRM
+                else OnExceed.REJECT
+            ),
+        )
+
+
+def _optional(convert: Callable[[Any], Any], value: Any) -> Any:
+    return None if value is None else convert(value)
+
+
+@dataclass
+class AdmissionDecision:
+    """Outcome of admitting one statement.
+
+    Attributes:
+        sql_hash: SHA-256 of the statement.
+        admitted: Whether the statement may run.
+        bytes_processed: Estimated bytes, if the engine reports them.
+        estimated_cost_usd: Estimated cost, if the engine reports it.
+        cached: Whether the estimate came from the dry-run cache.
+        exceeded: Descriptions of the limits the statement exceeds.
+        confirmed: Whether a statement above a limit was confirmed.
+        maximum_bytes_billed: Byte cap applied to the execution, if any.
+        reason: Human-readable summary.
+    """
+
+    sql_hash: str
+    admitted: bool
+    bytes_processed: int | None = None
+    estimated_cost_usd: float | None = None
+    cached: bool = False
+    exceeded: list[str] = field(default_factory=list)
+    confirmed: bool = False
+    maximum_bytes_billed: int | None = None
+    reason: str = ""
+
+
+def sql_hash(sql: str, engine: str = "") -> str:
+    """Hash a statement for the dry-run cache."""
+    digest = hashlib.sha256(engine.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(sql.strip().encode("utf-8"))
+    return digest.hexdigest()
+
+
+class DryRunCache:
+    """Cache of dry-run estimates keyed by SQL hash.
+
+    Estimates are kept in memory and, when ``cache_dir`` is set, in a JSON
+    file so they survive across commands. Only successful dry runs are
+    cached.
+
+    Attributes:
+        cache_dir: Directory of the on-disk cache (None: memory only).
+        ttl_seconds: Lifetime of an estimate.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        *,
+        ttl_seconds: float = DEFAULT_DRY_RUN_TTL_SECONDS,
+    ) -> None:
+        """Initialize the cache and load stored estimates.
+
+        Args:
+            cache_dir: Directory of the on-disk cache (None: memory only).
+            ttl_seconds: Lifetime of an estimate in seconds.
+        """
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._load()
+
+    @property
+    def cache_file(self) -> Path | None:
+        """Path to the JSON cache file, if persistent."""
+        return self.cache_dir / DRY_RUN_CACHE_FILENAME if self.cache_dir else None
+
+    def __len__(self) -> int:
+        """Return the number of cached estimates."""
+        return len(self._entries)
+
+    def get(self, key: str) -> DryRunResult | None:
+        """Return a cached estimate if it has not expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.time() - entry["created_at"] > self.ttl_seconds:
+            del self._entries[key]
+            return None
+        return entry["result"]
+
+    def put(self, key: str, result: DryRunResult) -> None:
+        """Store an estimate."""
+        self._entries[key] = {"created_at": time.time(), "result": dict(result)}
+        if len(self._entries) > _MAX_CACHED_ESTIMATES:
+            oldest = sorted(self._entries, key=lambda k: self._entries[k]["created_at"])
+            for stale in oldest[: len(self._entries) - _MAX_CACHED_ESTIMATES]:
+                del self._entries[stale]
+        self._save()
+
+    def _save(self) -> None:
+        if self.cache_dir is None or self.cache_file is None:
+            return
+        payload = {"format": _CACHE_FORMAT, "entries": self._entries}
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(
+                dir=self.cache_dir, prefix=".dryrun-", suffix=".tmp"
+            )
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f)
+            Path(tmp_name).replace(self.cache_file)
+        except OSError as e:
+            logger.warning("Failed to write dry-run cache %s: %s", self.cache_file, e)
+
+    def _load(self) -> None:
+        if self.cache_file is None:
+            return
+        try:
+            with open(self.cache_file, encoding="utf-8") as f:
+                payload = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(
+                "Ignoring unreadable dry-run cache %s: %s", self.cache_file, e
+            )
+            return
+        if isinstance(payload, dict) and payload.get("format") == _CACHE_FORMAT:
+            entries = payload.get("entries")
+            if isinstance(entries, dict):
+                self._entries = entries
+
+
+class AdmissionExecutor(BaseExecutor):
+    """Executor wrapper that admits statements against cost budgets.
+
+    Attributes:
+        executor: Wrapped executor.
+        budget: Byte and cost limits.
+        engine: Engine name used in the dry-run cache key.
+        decisions: Admission decisions, in execution order.
+        spent_bytes: Estimated bytes of the admitted statements so far.
+        spent_cost_usd: Estimated cost of the admitted statements so far.
+    """
+
+    def __init__(
+        self,
+        executor: BaseExecutor,
+        budget: CostBudget,
+        *,
+        cache: DryRunCache | None = None,
+        confirm: Callable[[AdmissionDecision], bool] | None = None,
+        engine: str | None = None,
+    ) -> None:
+        """Initialize the admission layer.
+
+        Args:
+            executor: Executor to wrap.
+            budget: Byte and cost limits.
+            cache: Dry-run cache (default: in-memory only).
+            confirm: Called for statements above a limit when the budget
+                asks for confirmation; returns whether to run anyway.
+                Without it, such statements are rejected.
+            engine: Engine name for the cache key (default: executor class).
+        """
+        self.executor = executor
+        self.budget = budget
+        self.cache = cache if cache is not None else DryRunCache()
+        self.confirm = confirm
+        self.engine = engine or type(executor).__name__
+        self.decisions: list[AdmissionDecision] = []
+        self.spent_bytes = 0
+        self.spent_cost_usd = 0.0
+
+    def estimate(self, sql: str) -> tuple[DryRunResult, bool]:
+        """Dry-run a statement, using the cache when possible.
+
+        Returns:
+            Tuple of (dry-run result, whether it came from the cache).
+        """
+        key = sql_hash(sql, self.engine)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached, True
+        result = self.executor.estimate_cost(sql)
+        if result.get("valid", result.get("success", False)):
+            self.cache.put(key, result)
+        return result, False
+
+    def admit(self, sql: str) -> AdmissionDecision:
+        """Decide whether a statement may run within the budget.
+
+        Statements whose dry run fails are admitted without an estimate;
+        the execution reports the actual error.
+
+        Args:
+            sql: Statement to admit.
+
+        Returns:
+            AdmissionDecision (also appended to ``decisions``).
+        """
+        estimate, cached = self.estimate(sql)
+        decision = AdmissionDecision(
+            sql_hash=sql_hash(sql, self.engine),
+            admitted=True,
+            bytes_processed=estimate.get("bytes_processed"),
+            estimated_cost_usd=estimate.get("estimated_cost_usd"),
+            cached=cached,
+        )
+        if not estimate.get("valid", estimate.get("success", False)):
+            decision.reason = (
+                f"No estimate: {estimate.get('error') or estimate.get('error_message')}"
+            )
+            self.decisions.append(decision)
+            return decision
+
+        decision.exceeded = self._exceeded(decision)
+        if decision.exceeded:
+            if self.budget.on_exceed == OnExceed.CONFIRM and self.confirm is not None:
+                decision.confirmed = bool(self.confirm(decision))
+            decision.admitted = decision.confirmed
+            status = "confirmed" if decision.confirmed else "rejected"
+            decision.reason = f"{status}: {'; '.join(decision.exceeded)}"
+        else:
+            decision.reason = "within budget"
+            decision.maximum_bytes_billed = self._byte_cap()
+
+        self.decisions.append(decision)
+        return decision
+
+    def execute_sql(self, sql: str, timeout: int = 300) -> ExecutionResult:
+        """Admit and execute a statement.
+
+        Args:
+            sql: Statement to execute.
+            timeout: Execution timeout in seconds.
+
+        Returns:
+            ExecutionResult of the wrapped executor, or a failed result
+            when the statement is rejected.
+        """
+        decision = self.admit(sql)
+        if not decision.admitted:
+            return ExecutionResult(
+                dataset_name="",
+                phase="main",
+                success=False,
+                error_message="Rejected by cost admission: "
+                + "; ".join(decision.exceeded),
+                rendered_sql=sql,
+            )
+
+        cap = decision.maximum_bytes_billed
+        if cap is not None and self.executor.supports_maximum_bytes_billed:
+            result = self.executor.execute_sql(  # type: ignore[call-arg]
+                sql, timeout, maximum_bytes_billed=cap
+            )
+        else:
+            result = self.executor.execute_sql(sql, timeout)
+
+        if result.success:
+            self.spent_bytes += decision.bytes_processed or 0
+            self.spent_cost_usd += decision.estimated_cost_usd or 0.0
+        return result
+
+    def dry_run(self, sql: str) -> DryRunResult:
+        """Dry-run through the cache."""
+        return self.estimate(sql)[0]
+
+    def estimate_cost(self, sql: str) -> DryRunResult:
+        """Estimate through the cache."""
+        return self.estimate(sql)[0]
+
+    def test_connection(self) -> bool:
+        """Test the wrapped executor's connection."""
+        return self.executor.test_connection()
+
+    def _exceeded(self, decision: AdmissionDecision) -> list[str]:
+        budget = self.budget
+        size = decision.bytes_processed
+        cost = decision.estimated_cost_usd
+        checks: list[tuple[float | None, float | None, str, Callable[[float], str]]] = [
+            (size, budget.max_bytes_per_query, "query", _format_bytes),
+            (
+                None if size is None else self.spent_bytes + size,
+                budget.max_bytes_per_command,
+                "command",
+                _format_bytes,
+            ),
+            (cost, budget.max_cost_per_query_usd, "query", _format_usd),
+            (
+                None if cost is None else self.spent_cost_usd + cost,
+                budget.max_cost_per_command_usd,
+                "command",
+                _format_usd,
+            ),
+        ]
+        return [
+            f"{fmt(value)} exceeds the {scope} limit of {fmt(limit)}"
+            for value, limit, scope, fmt in checks
+            if value is not None and limit is not None and value > limit
+        ]
+
+    def _byte_cap(self) -> int | None:
+        remaining = (
+            None
+            if self.budget.max_bytes_per_command is None
+            else max(self.budget.max_bytes_per_command - self.spent_bytes, 0)
+        )
+        cap = _stricter(self.budget.max_bytes_per_query, remaining)
+        return None if cap is None else int(cap)
+
+
+def _format_usd(cost: float) -> str:
+    return f"${cost:.2f}"
+
+
+def _format_bytes(size: float) -> str:
+    for unit in ("B", "KB", "MB", "GB", "TB"):
+        if size < _BYTES_PER_UNIT or unit == "TB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= _BYTES_PER_UNIT
+    return f"{size:.1f} PB"  # pragma: no cover
+
+
+def budget_from_config(
+    project_admission: Mapping[str, Any] | None,
+    policy: Mapping[str, Any] | None = None,
+) -> CostBudget:
+    """Build the effective budget from dli.yaml and the server policy.
+
+    Args:
+        project_admission: ``admission`` section of dli.yaml.
+        policy: Server execution policy (``run_get_policy`` data); its
+            ``admission`` section uses the same layout.
+
+    Returns:
+        The stricter combination of both budgets.
+    """
+    budget = CostBudget.from_dict(project_admission)
+    server_section = (policy or {}).get("admission")
+    if server_section:
+        server = CostBudget.from_dict(server_section)
+        budget = server if budget.is_unlimited else budget.merge(server)
+    return budget
+
+
+__all__ = [
+    "DEFAULT_DRY_RUN_CACHE_DIR",
+    "DEFAULT_DRY_RUN_TTL_SECONDS",
+    "DRY_RUN_CACHE_FILENAME",
+    "AdmissionDecision",
+    "AdmissionExecutor",
+    "CostBudget",
+    "DryRunCache",
+    "OnExceed",
+    "budget_from_config",
+    "sql_hash",
+]
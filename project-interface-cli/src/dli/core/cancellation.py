@@ -0,0 +1,166 @@
+"""Deadline enforcement and cancellation for blocking engine calls.
+
+Engine clients block the calling thread while a query runs. This module
+runs such a call under a deadline and cancels the query on the engine when:
+- The deadline passes
+- The user presses Ctrl-C (KeyboardInterrupt in the main thread)
+
+After requesting cancellation it waits (bounded by a grace period) for the
+call to stop, and reports how long that took, so executors can record the
+cancellation latency in their ExecutionResult.
+
+Example:
+    >>> cursor = connection.cursor()
+    >>> try:
+    ...     rows = run_cancellable(
+    ...         lambda: cursor.execute(sql) and cursor.fetchall(),
+    ...         cancel=cursor.cancel,
+    ...         timeout=300,
+    ...     )
+    ... except QueryInterruptedError as e:
+    ...     print(e.reason, e.cancel_latency_ms)
+"""
+
+from __future__ import annotations
+
+from enum import StrEnum
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+# Maximum time to wait for an engine to acknowledge a cancellation
+CANCEL_GRACE_SECONDS = 10.0
+
+# Poll interval while waiting for an engine to acknowledge a cancellation
+_CANCEL_POLL_SECONDS = 0.1
+
+
+class InterruptReason(StrEnum):
+    """Why a query was cancelled."""
+
+    TIMEOUT = "timeout"
+    USER = "user"
+
+
+class QueryInterruptedError(Exception):
+    """A query was cancelled before it finished.
+
+    Attributes:
+        reason: Deadline passed or user interrupt.
+        cancel_latency_ms: Time from the cancel request until the call
+            stopped, or None if it did not stop within the grace period.
+    """
+
+    def __init__(self, reason: InterruptReason, cancel_latency_ms: int | None) -> None:
+        """Initialize with the reason and measured latency."""
+        super().__init__(reason.value)
+        self.reason = reason
+        self.cancel_latency_ms = cancel_latency_ms
+
+
+def request_cancel(
+    cancel: Callable[[], Any],
+    is_done: Callable[[], bool],
+    *,
+    grace: float = CANCEL_GRACE_SECONDS,
+) -> int | None:
+    """Request cancellation and wait until the engine acknowledges it.
+
+    Failures of the cancel call are logged and ignored; the query may
+    already have finished.
+
+    Args:
+        cancel: Function that requests cancellation on the engine.
+        is_done: Function that returns whether the query has stopped.
+        grace: Maximum seconds to wait for the acknowledgement.
+
+    Returns:
+        Cancellation latency in milliseconds, or None if the query did not
+        stop within the grace period.
+    """
+    start = time.monotonic()
+    try:
+        cancel()
+    except Exception as e:
+        logger.warning("Failed to cancel query: %s", e)
+
+    deadline = start + grace
+    while True:
+        try:
+            if is_done():
+                return int((time.monotonic() - start) * 1000)
+        except Exception as e:
+            logger.debug("Cancellation status check failed: %s", e)
+            return int((time.monotonic() - start) * 1000)
+        if time.monotonic() >= deadline:
+            return None
+        time.sleep(_CANCEL_POLL_SECONDS)
+
+
+def run_cancellable[T](
+    call: Callable[[], T],
+    *,
+    cancel: Callable[[], Any],
+    timeout: float | None,
+    grace: float = CANCEL_GRACE_SECONDS,
+) -> T:
+    """Run a blocking call under a deadline, cancelling it when interrupted.
+
+    The call runs in a daemon worker thread so the calling thread can
+    enforce the deadline and receive Ctrl-C while the engine client blocks.
+
+    Args:
+        call: Blocking call that runs the query and returns its result.
+        cancel: Function that cancels the running query on the engine.
+        timeout: Deadline in seconds (None for no deadline).
+        grace: Maximum seconds to wait for the call to stop after cancel.
+
+    Returns:
+        The call's return value.
+
+    Raises:
+        QueryInterruptedError: If the deadline passed or the user interrupted.
+        Exception: Any exception raised by the call itself.
+    """
+    finished = threading.Event()
+    outcome: dict[str, Any] = {}
+
+    def worker() -> None:
+        try:
+            outcome["value"] = call()
+        except BaseException as e:
+            outcome["error"] = e
+        finally:
+            finished.set()
+
+    thread = threading.Thread(target=worker, name="dli-query", daemon=True)
+    thread.start()
+
+    try:
+        completed = finished.wait(timeout)
+    except KeyboardInterrupt:
+        latency = request_cancel(cancel, finished.is_set, grace=grace)
+        raise QueryInterruptedError(InterruptReason.USER, latency) from None
+
+    if not completed:
+        latency = request_cancel(cancel, finished.is_set, grace=grace)
+        raise QueryInterruptedError(InterruptReason.TIMEOUT, latency)
+
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["value"]
+
+
+__all__ = [
+    "CANCEL_GRACE_SECONDS",
+    "InterruptReason",
+    "QueryInterruptedError",
+    "request_cancel",
+    "run_cancellable",
+]
@@ -8,14 +8,21 @@ Key Features:
 - Table listing with filtering by project, dataset, owner, team, tags
 - Table detail view with all metadata sections
 - Keyword search across tables, columns, descriptions, and tags
+- Offline SQLite snapshot with full-text search (CatalogIndex)
 
 Note:
-    This implementation is SERVER-BASED ONLY. All data comes from
-    the Basecamp server API, not from direct query engine connections.
+    All metadata comes from the Basecamp server API, not from direct query
+    engine connections. The offline index is a local copy of that data.
 """
 
 from __future__ import annotations
 
+from dli.core.catalog.index import (
+    CatalogIndex,
+    CatalogSyncStats,
+    catalog_index_path,
+    refresh_in_background,
+)
 from dli.core.catalog.models import (
     ColumnInfo,
     FreshnessInfo,
@@ -29,6 +36,8 @@ from dli.core.catalog.models import (
 )
 
 __all__ = [
+    "CatalogIndex",
+    "CatalogSyncStats",
     "ColumnInfo",
     "FreshnessInfo",
     "ImpactSummary",
@@ -38,4 +47,6 @@ __all__ = [
     "SampleQuery",
     "TableDetail",
     "TableInfo",
+    "catalog_index_path",
+    "refresh_in_background",
 ]
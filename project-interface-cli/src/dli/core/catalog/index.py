@@ -0,0 +1,590 @@
+"""Offline catalog index backed by SQLite.
+
+The Basecamp catalog can hold tens of thousands of tables, so listing and
+searching it over the network is slow. This module keeps a local snapshot
+of the catalog in a SQLite database:
+
+- ``tables``: one row per table with the full server payload
+- ``table_tags``: one row per (table, tag) for tag filters
+- B-tree indexes on owner, team, project/dataset and tag (case-insensitive)
+- ``tables_fts``: FTS5 index over table names, tags, descriptions, column
+  names and column descriptions, ranked with bm25
+
+The snapshot is refreshed incrementally: the server returns the tables
+changed since the last sync token, plus the names of deleted tables.
+Searches and listings run entirely against the local file, so they work
+offline and answer in milliseconds.
+
+If the SQLite build lacks FTS5, search falls back to substring matching
+over a denormalized search column.
+
+Example:
+    >>> from dli.core.catalog.index import CatalogIndex, catalog_index_path
+    >>> index = CatalogIndex(catalog_index_path(project_path, client.config.url))
+    >>> stats = index.sync(client)
+    >>> index.search("user", limit=10)
+    [{'name': 'my-project.analytics.users', ...}]
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+import hashlib
+import json
+import logging
+from pathlib import Path
+import re
+import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from dli.core.client import BasecampClient
+
+logger = logging.getLogger(__name__)
+
+# Location of index files relative to the project (or DLI home) directory
+DEFAULT_CATALOG_INDEX_DIR = Path(".dli") / "cache" / "catalog"
+
+# Index older than this is refreshed in the background
+DEFAULT_MAX_AGE_SECONDS = 3600
+
+# A background refresh claimed longer ago than this is considered dead
+REFRESH_LEASE_SECONDS = 300
+
+# Number of changed tables requested per sync page
+SYNC_PAGE_SIZE = 1000
+
+_SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS tables (
+    name TEXT PRIMARY KEY,
+    project TEXT COLLATE NOCASE,
+    dataset TEXT COLLATE NOCASE,
+    engine TEXT,
+    owner TEXT COLLATE NOCASE,
+    team TEXT COLLATE NOCASE,
+    row_count INTEGER,
+    last_updated TEXT,
+    search_text TEXT NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tables_owner ON tables (owner);
+CREATE INDEX IF NOT EXISTS idx_tables_team ON tables (team);
+CREATE INDEX IF NOT EXISTS idx_tables_project_dataset ON tables (project, dataset);
+CREATE TABLE IF NOT EXISTS table_tags (
+    name TEXT NOT NULL,
+    tag TEXT NOT NULL COLLATE NOCASE,
+    PRIMARY KEY (name, tag)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_table_tags_tag ON table_tags (tag, name);
+"""
+
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS tables_fts USING fts5(
+    name, tags, description, column_names, column_descriptions
+);
+"""
+
+# bm25 column weights: name, tags, description, column_names, column_descriptions
+_BM25_WEIGHTS = (10.0, 5.0, 2.0, 4.0, 1.0)
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+@dataclass
+class CatalogSyncStats:
+    """Outcome of a catalog index sync.
+
+    Attributes:
+        full: Whether the snapshot was rebuilt from scratch.
+        upserted: Number of tables inserted or updated.
+        deleted: Number of tables removed.
+        pages: Number of change pages fetched.
+        duration_ms: Wall-clock sync time.
+        error: Error message if the sync failed (the index is unchanged).
+    """
+
+    full: bool
+    upserted: int = 0
+    deleted: int = 0
+    pages: int = 0
+    duration_ms: int = 0
+    error: str | None = None
+
+    @property
+    def success(self) -> bool:
+        """Whether the sync completed."""
+        return self.error is None
+
+
+def catalog_index_path(root: Path, server_url: str) -> Path:
+    """Return the index file for a server under a project or DLI home.
+
+    Args:
+        root: Project directory or DLI home.
+        server_url: Basecamp server URL the snapshot is taken from.
+
+    Returns:
+        Path of the SQLite file (may not exist yet).
+    """
+    digest = hashlib.sha256(server_url.encode("utf-8")).hexdigest()[:12]
+    return root / DEFAULT_CATALOG_INDEX_DIR / f"catalog-{digest}.sqlite3"
+
+
+def _split_name(name: str) -> tuple[str | None, str | None]:
+    """Return (project, dataset) of a project.dataset.table name."""
+    parts = name.split(".")
+    project = parts[0] if len(parts) > 1 else None
+    dataset = parts[1] if len(parts) > 2 else None  # noqa: PLR2004
+    return project, dataset
+
+
+def _fts_query(keyword: str) -> str | None:
+    """Build an FTS5 query that prefix-matches every keyword token."""
+    tokens = _TOKEN_PATTERN.findall(keyword.lower())
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+def _summary(payload: dict[str, Any]) -> dict[str, Any]:
+    """Return the lightweight TableInfo dict of a table payload."""
+    return {
+        "name": payload["name"],
+        "engine": payload.get("engine"),
+        "owner": payload.get("owner"),
+        "team": payload.get("team"),
+        "tags": payload.get("tags", []),
+        "row_count": payload.get("row_count"),
+        "last_updated": payload.get("last_updated"),
+    }
+
+
+class CatalogIndex:
+    """Local SQLite snapshot of the catalog with full-text search.
+
+    A connection must only be used from the thread that created it; open a
+    separate CatalogIndex per thread (the file is shared safely through
+    SQLite's WAL mode).
+
+    Example:
+        >>> index = CatalogIndex(tmp_path / "catalog.sqlite3")
+        >>> index.upsert([{"name": "p.d.users", "engine": "bigquery"}])
+        >>> [t["name"] for t in index.search("users")]
+        ['p.d.users']
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Open (and create if needed) the index database.
+
+        Args:
+            path: SQLite file path.
+        """
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), timeout=30, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        try:
+            self._conn.executescript(_FTS_SCHEMA)
+            self.fts_enabled = True
+        except sqlite3.OperationalError as e:
+            logger.debug("FTS5 unavailable, using substring search: %s", e)
+            self.fts_enabled = False
+        if self.get_meta("schema_version") is None:
+            self.set_meta("schema_version", str(_SCHEMA_VERSION))
+
+    def __enter__(self) -> CatalogIndex:
+        """Return the index for use as a context manager."""
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Close the connection."""
+        self.close()
+
+    def __len__(self) -> int:
+        """Return the number of indexed tables."""
+        return self._conn.execute("SELECT COUNT(*) FROM tables").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run statements in one write transaction."""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self._conn
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    # ------------------------------------------------------------------
+    # Metadata
+    # ------------------------------------------------------------------
+
+    def get_meta(self, key: str) -> str | None:
+        """Return a metadata value."""
+        row = self._conn.execute(
+            "SELECT value FROM meta WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str | None) -> None:
+        """Store a metadata value."""
+        self._conn.execute(
+            "INSERT INTO meta (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, value),
+        )
+
+    @property
+    def synced_at(self) -> float | None:
+        """Epoch seconds of the last successful sync."""
+        value = self.get_meta("synced_at")
+        return float(value) if value else None
+
+    def is_stale(self, max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS) -> bool:
+        """Return whether the snapshot is missing or older than max_age."""
+        synced_at = self.synced_at
+        return synced_at is None or time.time() - synced_at > max_age_seconds
+
+    def claim_refresh(self, lease_seconds: float = REFRESH_LEASE_SECONDS) -> bool:
+        """Claim the right to run a background refresh.
+
+        Prevents several CLI invocations from syncing the same index at
+        once. A claim expires after ``lease_seconds`` in case the refreshing
+        process died.
+
+        Returns:
+            True if the caller should refresh.
+        """
+        now = time.time()
+        with self._transaction():
+            started = self.get_meta("refresh_started_at")
+            if started and now - float(started) < lease_seconds:
+                return False
+            self.set_meta("refresh_started_at", str(now))
+        return True
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def upsert(self, tables: list[dict[str, Any]]) -> int:
+        """Insert or replace tables.
+
+        Args:
+            tables: Full table payloads (as returned by catalog_get).
+
+        Returns:
+            Number of tables written.
+        """
+        with self._transaction():
+            return self._upsert(tables)
+
+    def delete(self, names: list[str]) -> int:
+        """Remove tables by name.
+
+        Returns:
+            Number of tables removed.
+        """
+        with self._transaction():
+            return self._delete(names)
+
+    def _upsert(self, tables: list[dict[str, Any]]) -> int:
+        self._delete([t["name"] for t in tables])
+        for table in tables:
+            name = table["name"]
+            tags = [str(tag) for tag in table.get("tags") or []]
+            columns = table.get("columns") or []
+            column_names = " ".join(c.get("name") or "" for c in columns)
+            column_descriptions = " ".join(c.get("description") or "" for c in columns)
+            description = table.get("description") or ""
+            project, dataset = _split_name(name)
+            search_text = " ".join(
+                [name, " ".join(tags), description, column_names, column_descriptions]
+            ).lower()
+            cursor = self._conn.execute(
+                "INSERT INTO tables (name, project, dataset, engine, owner, team, "
+                "row_count, last_updated, search_text, payload) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    name,
+                    project,
+                    dataset,
+                    table.get("engine"),
+                    table.get("owner"),
+                    table.get("team"),
+                    table.get("row_count"),
+                    table.get("last_updated"),
+                    search_text,
+                    json.dumps(table, default=str),
+                ),
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO table_tags (name, tag) VALUES (?, ?)",
+                [(name, tag) for tag in tags],
+            )
+            if self.fts_enabled:
+                self._conn.execute(
+                    "INSERT INTO tables_fts (rowid, name, tags, description, "
+                    "column_names, column_descriptions) VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        cursor.lastrowid,
+                        name,
+                        " ".join(tags),
+                        description,
+                        column_names,
+                        column_descriptions,
+                    ),
+                )
+        return len(tables)
+
+    def _delete(self, names: list[str]) -> int:
+        removed = 0
+        for name in names:
+            row = self._conn.execute(
+                "SELECT rowid FROM tables WHERE name = ?", (name,)
+            ).fetchone()
+            if row is None:
+                continue
+            if self.fts_enabled:
+                self._conn.execute("DELETE FROM tables_fts WHERE rowid = ?", (row[0],))
+            self._conn.execute("DELETE FROM table_tags WHERE name = ?", (name,))
+            self._conn.execute("DELETE FROM tables WHERE rowid = ?", (row[0],))
+            removed += 1
+        return removed
+
+    def _clear(self) -> None:
+        self._conn.execute("DELETE FROM tables")
+        self._conn.execute("DELETE FROM table_tags")
+        if self.fts_enabled:
+            self._conn.execute("DELETE FROM tables_fts")
+
+    def sync(
+        self,
+        client: BasecampClient,
+        *,
+        full: bool = False,
+        page_size: int = SYNC_PAGE_SIZE,
+    ) -> CatalogSyncStats:
+        """Pull catalog changes from the server into the index.
+
+        An incremental sync requests only the tables changed since the
+        stored sync token. A full sync (or the first sync) rebuilds the
+        snapshot. All pages are applied in one transaction, so readers never
+        see a partially synced index and a failed sync changes nothing.
+
+        Args:
+            client: Basecamp client to pull changes from.
+            full: Rebuild the snapshot instead of applying changes.
+            page_size: Number of tables requested per page.
+
+        Returns:
+            CatalogSyncStats describing the sync.
+        """
+        start = time.monotonic()
+        since = None if full else self.get_meta("sync_token")
+        stats = CatalogSyncStats(full=since is None)
+        cursor: str | None = None
+        sync_token = since
+
+        try:
+            with self._transaction():
+                if stats.full:
+                    self._clear()
+                while True:
+                    response = client.catalog_changes(
+                        since=since, cursor=cursor, limit=page_size
+                    )
+                    if not response.success or not isinstance(response.data, dict):
+                        raise _SyncAbortedError(
+                            response.error or "Failed to fetch catalog changes"
+                        )
+                    page = response.data
+                    stats.pages += 1
+                    stats.deleted += self._delete(page.get("deleted") or [])
+                    stats.upserted += self._upsert(page.get("tables") or [])
+                    sync_token = page.get("sync_token") or sync_token
+                    cursor = page.get("next_cursor")
+                    if not cursor:
+                        break
+                self.set_meta("sync_token", sync_token)
+                self.set_meta("synced_at", str(time.time()))
+                self.set_meta("server_url", client.config.url)
+                self.set_meta("refresh_started_at", None)
+        except _SyncAbortedError as e:
+            stats.error = str(e)
+            logger.warning("Catalog index sync failed: %s", e)
+
+        stats.duration_ms = int((time.monotonic() - start) * 1000)
+        return stats
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def get(self, name: str) -> dict[str, Any] | None:
+        """Return the full payload of a table, or None if not indexed."""
+        row = self._conn.execute(
+            "SELECT payload FROM tables WHERE name = ? COLLATE NOCASE", (name,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def list(
+        self,
+        *,
+        project: str | None = None,
+        dataset: str | None = None,
+        owner: str | None = None,
+        team: str | None = None,
+        tags: list[str] | None = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> list[dict[str, Any]]:
+        """List tables matching exact, case-insensitive filters.
+
+        Args:
+            project: Project name.
+            dataset: Dataset name.
+            owner: Owner.
+            team: Team.
+            tags: Tags (a table must have all of them).
+            limit: Maximum number of results.
+            offset: Pagination offset.
+
+        Returns:
+            TableInfo dicts ordered by name.
+        """
+        clauses: list[str] = []
+        params: list[Any] = []
+        for column, value in (
+            ("project", project),
+            ("dataset", dataset),
+            ("owner", owner),
+            ("team", team),
+        ):
+            if value:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        for tag in tags or []:
+            clauses.append("name IN (SELECT name FROM table_tags WHERE tag = ?)")
+            params.append(tag)
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._conn.execute(
+            f"SELECT payload FROM tables {where} ORDER BY name LIMIT ? OFFSET ?",  # noqa: S608
+            [*params, limit, offset],
+        ).fetchall()
+        return [_summary(json.loads(row[0])) for row in rows]
+
+    def search(
+        self,
+        keyword: str,
+        *,
+        project: str | None = None,
+        limit: int = 20,
+    ) -> list[dict[str, Any]]:
+        """Search tables by keyword, best matches first.
+
+        With FTS5, every word of the keyword must prefix-match a word in the
+        table name, tags, description, column names or column descriptions;
+        results are ranked by bm25 with table names weighted highest.
+
+        Args:
+            keyword: Search keyword.
+            project: Optional project filter.
+            limit: Maximum number of results.
+
+        Returns:
+            TableInfo dicts ordered by relevance.
+        """
+        query = _fts_query(keyword) if self.fts_enabled else None
+        project_clause = "AND t.project = ?" if project else ""
+        project_params = [project] if project else []
+
+        if query is not None:
+            weights = ", ".join(str(w) for w in _BM25_WEIGHTS)
+            sql = (
+                "SELECT t.payload FROM tables_fts f "  # noqa: S608
+                "JOIN tables t ON t.rowid = f.rowid "
+                f"WHERE tables_fts MATCH ? {project_clause} "
+                f"ORDER BY bm25(tables_fts, {weights}), t.name LIMIT ?"
+            )
+            params: list[Any] = [query, *project_params, limit]
+        else:
+            sql = (
+                "SELECT t.payload FROM tables t "  # noqa: S608
+                f"WHERE instr(t.search_text, ?) > 0 {project_clause} "
+                "ORDER BY instr(t.name, ?) = 0, t.name LIMIT ?"
+            )
+            needle = keyword.lower()
+            params = [needle, *project_params, needle, limit]
+
+        rows = self._conn.execute(sql, params).fetchall()
+        return [_summary(json.loads(row[0])) for row in rows]
+
+
+def refresh_in_background(
+    index: CatalogIndex,
+    client: BasecampClient,
+    *,
+    max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS,
+) -> threading.Thread | None:
+    """Sync a stale index in a daemon thread.
+
+    Does nothing if the index is fresh or another process is already
+    refreshing it. The thread opens its own connection to the index file.
+
+    Args:
+        index: Index to refresh.
+        client: Basecamp client to pull changes from.
+        max_age_seconds: Age after which the index is stale.
+
+    Returns:
+        The started thread, or None if no refresh was needed.
+    """
+    if not index.is_stale(max_age_seconds) or not index.claim_refresh():
+        return None
+
+    path = index.path
+
+    def refresh() -> None:
+        try:
+            with CatalogIndex(path) as background_index:
+                background_index.sync(client)
+        except sqlite3.Error as e:
+            logger.warning("Background catalog refresh failed: %s", e)
+
+    thread = threading.Thread(target=refresh, name="dli-catalog-refresh", daemon=True)
+    thread.start()
+    return thread
+
+
+class _SyncAbortedError(Exception):
+    """Internal signal that rolls back a failed sync."""
+
+
+__all__ = [
+    "DEFAULT_CATALOG_INDEX_DIR",
+    "DEFAULT_MAX_AGE_SECONDS",
+    "CatalogIndex",
+    "CatalogSyncStats",
+    "catalog_index_path",
+    "refresh_in_background",
+]
@@ -9,17 +9,27 @@ Public API:
     - ServerResponse: Response wrapper for API calls
     - WorkflowSource: Enum for workflow source types
     - RunStatus: Enum for workflow run status
+    - RESULT_PAGE_SIZE: Default rows per page for execution results
+    - create_client: Create a client (shared per server in real mode)
+    - close_shared_clients: Close the process-wide shared clients
 """
 
-from dli.core.client.baseclient import BasecampClient, create_client
+from dli.core.client.baseclient import (
+    RESULT_PAGE_SIZE,
+    BasecampClient,
+    create_client,
+)
 from dli.core.client.config import ServerConfig, ServerResponse
 from dli.core.client.enums import RunStatus, WorkflowSource
+from dli.core.client.registry import close_shared_clients
 
 __all__ = [
+    "RESULT_PAGE_SIZE",
     "BasecampClient",
     "ServerConfig",
     "ServerResponse",
     "WorkflowSource",
     "RunStatus",
+    "close_shared_clients",
     "create_client",
 ]
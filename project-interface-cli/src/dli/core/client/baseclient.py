@@ -12,6 +12,8 @@ The client supports:
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any
@@ -20,14 +22,26 @@ from typing import TYPE_CHECKING, Any
 from dli.core.client.config import ServerConfig, ServerResponse
 from dli.core.client.enums import RunStatus, WorkflowSource
 from dli.core.client.mock_data import MockDataFactory
+from dli.core.workflow.bulk import resolve_since
+from dli.exceptions import ErrorCode, ServerError
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from dli.core.http import TracedHttpClient
 
 logger = logging.getLogger(__name__)
 
+# Default number of rows per page when retrieving execution results
+RESULT_PAGE_SIZE = 10_000
+
+# Status codes of successful server responses
+_HTTP_OK = 200
+_HTTP_NOT_MODIFIED = 304
+
 # Re-export for backward compatibility
 __all__ = [
+    "RESULT_PAGE_SIZE",
     "BasecampClient",
     "ServerConfig",
     "ServerResponse",
@@ -47,29 +61,53 @@ class BasecampClient:
     for all HTTP requests, automatically adding trace headers (X-Trace-Id,
     User-Agent) from the current trace context.
 
+    Mock fixtures are built on first use, so real-mode clients never pay
+    for them. Use ``create_client`` to get the process-wide shared client
+    for a server instead of constructing one per call.
+
     Attributes:
         config: Server connection configuration
         mock_mode: Whether to use mock responses
     """
 
-    def __init__(self, config: ServerConfig, mock_mode: bool = False):
+    def __init__(
+        self,
+        config: ServerConfig,
+        mock_mode: bool = False,
+        *,
+        pooled: bool = False,
+    ):
         """Initialize the client.
 
         Args:
             config: Server connection configuration
             mock_mode: If True, use mock responses instead of real API calls.
                       If False, creates TracedHttpClient for real API calls.
+            pooled: If True, reuse HTTP connections across requests until
+                ``close()`` is called.
         """
         self.config = config
         self.mock_mode = mock_mode
-        self._mock_data = self._init_mock_data()
+        self._mock_data_cache: dict[str, list[dict[str, Any]]] | None = None
+        self._mock_results: dict[str, list[dict[str, Any]]] = {}
         self._http: TracedHttpClient | None = None
 
         # Create HTTP client for real API calls (lazy import to avoid circular deps)
         if not mock_mode:
             from dli.core.http import TracedHttpClient
 
-            self._http = TracedHttpClient(config.url, config.timeout)
+            self._http = TracedHttpClient(config.url, config.timeout, pooled=pooled)
+
+    @property
+    def _mock_data(self) -> dict[str, list[dict[str, Any]]]:
+        """Mock data for testing, built on first access."""
+        if self._mock_data_cache is None:
+            self._mock_data_cache = self._init_mock_data()
+        return self._mock_data_cache
+
+    @_mock_data.setter
+    def _mock_data(self, value: dict[str, list[dict[str, Any]]]) -> None:
+        self._mock_data_cache = value
 
     def _init_mock_data(self) -> dict[str, list[dict[str, Any]]]:
         """Initialize mock data for testing.
@@ -78,6 +116,14 @@ class BasecampClient:
         """
         return MockDataFactory.create_all_mock_data()
 
+    def close(self) -> None:
+        """Close pooled HTTP connections.
+
+        The client stays usable; a later request opens new connections.
+        """
+        if self._http is not None:
+            self._http.close()
+
     # NOTE: Old mock data methods (_init_mock_catalog_tables, _init_mock_queries)
     # have been moved to MockDataFactory in dli.core.client.mock_data
 
@@ -1266,6 +1312,131 @@ class BasecampClient:
             status_code=501,
         )
 
+    def workflow_status_batch(self, run_ids: list[str]) -> ServerResponse:
+        """Get the status of many workflow runs in one request.
+
+        Callers with more IDs than the server accepts per request should use
+        ``dli.core.workflow.bulk.fetch_in_chunks``, which splits the IDs and
+        sends the chunks concurrently.
+
+        Args:
+            run_ids: IDs of the runs to check
+
+        Returns:
+            ServerResponse with data containing:
+            - runs: Run dicts (same shape as ``workflow_status``) in request order
+            - missing: Requested run IDs that do not exist
+        """
+        if self.mock_mode:
+            runs_by_id = {r["run_id"]: r for r in self._mock_data["workflow_runs"]}
+            return ServerResponse(
+                success=True,
+                data={
+                    "runs": [runs_by_id[i] for i in run_ids if i in runs_by_id],
+                    "missing": [i for i in run_ids if i not in runs_by_id],
+                },
+            )
+
+        return self._post_workflow_batch(
+            "/api/v1/workflows/runs/status:batch", {"run_ids": run_ids}
+        )
+
+    def workflow_latest_runs(
+        self,
+        dataset_names: list[str] | None = None,
+        *,
+        since: str | None = None,
+        limit_per_dataset: int = 1,
+    ) -> ServerResponse:
+        """Get the most recent runs of many workflows in one request.
+
+        Args:
+            dataset_names: Datasets to check (None for every workflow with
+                runs in the window)
+            since: Only runs started at or after this time (ISO8601 or
+                relative: 30m, 24h, 7d)
+            limit_per_dataset: Runs to return per dataset, newest first
+
+        Returns:
+            ServerResponse with data containing:
+            - runs: Run dicts grouped by dataset, newest first per dataset
+            - missing: Requested datasets without runs in the window
+        """
+        if self.mock_mode:
+            try:
+                cutoff = resolve_since(since)
+            except ValueError as e:
+                return ServerResponse(success=False, error=str(e), status_code=400)
+            if cutoff is not None and cutoff.tzinfo is not None:
+                cutoff = cutoff.astimezone().replace(tzinfo=None)
+
+            by_dataset: dict[str, list[dict[str, Any]]] = {}
+            for run in sorted(
+                self._mock_data["workflow_runs"],
+                key=lambda r: r.get("started_at") or "",
+                reverse=True,
+            ):
+                started_at = run.get("started_at")
+                if cutoff is not None and (
+                    not started_at or datetime.fromisoformat(started_at) < cutoff
+                ):
+                    continue
+                by_dataset.setdefault(run["dataset_name"], []).append(run)
+
+            names = dataset_names if dataset_names is not None else sorted(by_dataset)
+            return ServerResponse(
+                success=True,
+                data={
+                    "runs": [
+                        run
+                        for name in names
+                        for run in by_dataset.get(name, [])[:limit_per_dataset]
+                    ],
+                    "missing": [name for name in names if name not in by_dataset],
+                },
+            )
+
+        body: dict[str, Any] = {"limit_per_dataset": limit_per_dataset}
+        if dataset_names is not None:
+            body["dataset_names"] = dataset_names
+        if since:
+            body["since"] = since
+        return self._post_workflow_batch("/api/v1/workflows/runs/latest:batch", body)
+
+    def _post_workflow_batch(self, path: str, body: dict[str, Any]) -> ServerResponse:
+        """POST a workflow batch request and wrap the response.
+
+        A 413 response is returned as-is so that chunking callers can split
+        the batch and retry.
+        """
+        if self._http is None:
+            return ServerResponse(
+                success=False,
+                error="HTTP client not initialized",
+                status_code=500,
+            )
+
+        try:
+            response = self._http.post(path, json=body)
+            if response.status_code == _HTTP_OK:
+                return ServerResponse(
+                    success=True,
+                    data=response.json(),
+                    status_code=response.status_code,
+                )
+            return ServerResponse(
+                success=False,
+                error=f"Workflow batch request failed: {response.text}",
+                status_code=response.status_code,
+            )
+        except Exception as e:
+            logger.warning("Workflow batch request failed: %s", e)
+            return ServerResponse(
+                success=False,
+                error=str(e),
+                status_code=503,
+            )
+
     def workflow_pause(self, dataset_name: str) -> ServerResponse:
         """Pause a workflow (disable scheduled runs).
 
@@ -1669,6 +1840,87 @@ class BasecampClient:
             status_code=501,
         )
 
+    def catalog_changes(
+        self,
+        *,
+        since: str | None = None,
+        cursor: str | None = None,
+        limit: int = 1000,
+    ) -> ServerResponse:
+        """Fetch catalog tables changed since a sync token.
+
+        Used to keep the local catalog index up to date. Without ``since``
+        every table is returned (a full snapshot). Results are paged; pass
+        ``next_cursor`` back as ``cursor`` until it is None.
+
+        Args:
+            since: Sync token from a previous call (None for a full snapshot)
+            cursor: Page cursor from the previous page
+            limit: Maximum number of tables per page
+
+        Returns:
+            ServerResponse with dict containing:
+            - tables: Full table dicts changed since the token
+            - deleted: Names of tables removed since the token
+            - next_cursor: Cursor for the next page, or None
+            - sync_token: Token to pass as ``since`` on the next sync
+        """
+        if self.mock_mode:
+            tables = sorted(
+                self._mock_data["catalog_tables"],
+                key=lambda t: (t.get("last_updated") or "", t["name"]),
+            )
+            latest = max((t.get("last_updated") or "" for t in tables), default="")
+            sync_token = latest or since
+            if since:
+                tables = [t for t in tables if (t.get("last_updated") or "") > since]
+
+            offset = int(cursor) if cursor else 0
+            end = offset + limit
+            return ServerResponse(
+                success=True,
+                data={
+                    "tables": tables[offset:end],
+                    "deleted": [],
+                    "next_cursor": str(end) if end < len(tables) else None,
+                    "sync_token": sync_token,
+                },
+            )
+
+        if self._http is None:
+            return ServerResponse(
+                success=False,
+                error="HTTP client not initialized",
+                status_code=500,
+            )
+
+        params: dict[str, Any] = {"limit": limit}
+        if since:
+            params["since"] = since
+        if cursor:
+            params["cursor"] = cursor
+
+        try:
+            response = self._http.get("/api/v1/catalog/changes", params=params)
+            if response.status_code == _HTTP_OK:
+                return ServerResponse(
+                    success=True,
+                    data=response.json(),
+                    status_code=response.status_code,
+                )
+            return ServerResponse(
+                success=False,
+                error=f"Failed to fetch catalog changes: {response.text}",
+                status_code=response.status_code,
+            )
+        except Exception as e:
+            logger.warning("Fetching catalog changes failed: %s", e)
+            return ServerResponse(
+                success=False,
+                error=str(e),
+                status_code=503,
+            )
+
     def catalog_get(
         self,
         table_ref: str,
@@ -1951,11 +2203,255 @@ class BasecampClient:
             )
 
         # GET /api/v1/catalog/queries?scope={scope}&account={keyword}&sql={pattern}&...
-        params: dict[str, Any] = {
-            "scope": scope,
-            "limit": limit,
-            "offset": offset,
-        }
+        params = self._query_list_params(
+            scope=scope,
+            account_keyword=account_keyword,
+            sql_pattern=sql_pattern,
+            state=state,
+            tags=tags,
+            engine=engine,
+            since=since,
+            until=until,
+        )
+        params["limit"] = limit
+        params["offset"] = offset
+
+        # TODO: Implement actual HTTP call: self._get("/api/v1/catalog/queries", params=params)
+        return ServerResponse(
+            success=False,
+            error="Real API not implemented yet",
+            status_code=501,
+        )
+
+    def query_list_changes(
+        self,
+        *,
+        scope: str = "my",
+        account_keyword: str | None = None,
+        sql_pattern: str | None = None,
+        state: str | None = None,
+        tags: list[str] | None = None,
+        engine: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        limit: int = 10,
+        updated_since: str | None = None,
+        etag: str | None = None,
+    ) -> ServerResponse:
+        """List only the queries that changed since a previous poll.
+
+        Conditional variant of ``query_list`` for watch mode. The server
+        returns 304 Not Modified when the list is unchanged (``etag`` still
+        matches), otherwise only the rows updated after ``updated_since``.
+
+        Args:
+            scope: Query scope - "my", "system", "user", or "all".
+            account_keyword: Filter by account name.
+            sql_pattern: Filter by SQL query text content.
+            state: Filter by query state.
+            tags: Filter by tags (AND logic).
+            engine: Filter by query engine.
+            since: Start time (ISO8601 or relative).
+            until: End time.
+            limit: Max results.
+            updated_since: Change watermark from the previous response
+                (None returns every matching row).
+            etag: ETag from the previous response.
+
+        Returns:
+            ServerResponse with status 304 and no data when unchanged,
+            otherwise a dict containing:
+            - queries: Rows updated since the watermark
+            - removed: IDs of rows that no longer match the filters
+            - updated_since: Watermark to pass on the next poll
+            - etag: ETag to pass on the next poll
+        """
+        if self.mock_mode:
+            return self._mock_query_list_changes(
+                updated_since=updated_since,
+                etag=etag,
+                scope=scope,
+                account_keyword=account_keyword,
+                sql_pattern=sql_pattern,
+                state=state,
+                tags=tags,
+                engine=engine,
+                since=since,
+                until=until,
+                limit=limit,
+            )
+
+        if self._http is None:
+            return ServerResponse(
+                success=False,
+                error="HTTP client not initialized",
+                status_code=500,
+            )
+
+        params = self._query_list_params(
+            scope=scope,
+            account_keyword=account_keyword,
+            sql_pattern=sql_pattern,
+            state=state,
+            tags=tags,
+            engine=engine,
+            since=since,
+            until=until,
+        )
+        params["limit"] = limit
+        if updated_since:
+            params["updated_since"] = updated_since
+        headers = {"If-None-Match": etag} if etag else {}
+
+        try:
+            response = self._http.get(
+                "/api/v1/catalog/queries/changes", params=params, headers=headers
+            )
+            if response.status_code == _HTTP_NOT_MODIFIED:
+                return ServerResponse(success=True, status_code=_HTTP_NOT_MODIFIED)
+            if response.status_code == _HTTP_OK:
+                data = response.json()
+                data.setdefault("etag", response.headers.get("ETag"))
+                return ServerResponse(
+                    success=True,
+                    data=data,
+                    status_code=response.status_code,
+                )
+            return ServerResponse(
+                success=False,
+                error=f"Failed to fetch query changes: {response.text}",
+                status_code=response.status_code,
+            )
+        except Exception as e:
+            logger.warning("Fetching query changes failed: %s", e)
+            return ServerResponse(
+                success=False,
+                error=str(e),
+                status_code=503,
+            )
+
+    def _mock_query_list_changes(
+        self,
+        *,
+        updated_since: str | None,
+        etag: str | None,
+        **filters: Any,
+    ) -> ServerResponse:
+        """Mock ``query_list_changes`` on top of the mock ``query_list``."""
+        response = self.query_list(**filters)
+        queries = response.data["queries"] if response.data else []
+        payload = json.dumps(queries, sort_keys=True, default=str)
+        current_etag = f'"{hashlib.sha256(payload.encode()).hexdigest()[:16]}"'
+        if etag == current_etag:
+            return ServerResponse(success=True, status_code=_HTTP_NOT_MODIFIED)
+
+        def version(q: dict[str, Any]) -> str:
+            return str(q.get("finished_at") or q.get("started_at") or "")
+
+        if updated_since:
+            queries = [q for q in queries if version(q) > updated_since]
+        latest = max((version(q) for q in queries), default="")
+        return ServerResponse(
+            success=True,
+            data={
+                "queries": queries,
+                "removed": [],
+                "updated_since": max(latest, updated_since or ""),
+                "etag": current_etag,
+            },
+        )
+
+    def stream_query_events(
+        self,
+        *,
+        scope: str = "my",
+        account_keyword: str | None = None,
+        sql_pattern: str | None = None,
+        state: str | None = None,
+        tags: list[str] | None = None,
+        engine: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream query changes as server-sent events.
+
+        Each event carries the same ``queries`` / ``removed`` payload as
+        ``query_list_changes``. The stream stays open until the server or
+        the caller closes it.
+
+        Args:
+            scope: Query scope - "my", "system", "user", or "all".
+            account_keyword: Filter by account name.
+            sql_pattern: Filter by SQL query text content.
+            state: Filter by query state.
+            tags: Filter by tags (AND logic).
+            engine: Filter by query engine.
+            since: Start time (ISO8601 or relative).
+            until: End time.
+
+        Yields:
+            Decoded event payloads.
+
+        Raises:
+            ServerError: If the server does not support query events
+                (also in mock mode) or rejects the request.
+        """
+        path = "/api/v1/catalog/queries/events"
+        if self.mock_mode or self._http is None:
+            raise ServerError(
+                message="Query events are not available",
+                code=ErrorCode.SERVER_ERROR,
+                status_code=501,
+                url=path,
+            )
+
+        params = self._query_list_params(
+            scope=scope,
+            account_keyword=account_keyword,
+            sql_pattern=sql_pattern,
+            state=state,
+            tags=tags,
+            engine=engine,
+            since=since,
+            until=until,
+        )
+        with self._http.stream(
+            "GET",
+            path,
+            params=params,
+            headers={"Accept": "text/event-stream"},
+            timeout=None,
+        ) as response:
+            if response.status_code != _HTTP_OK:
+                response.read()
+                raise ServerError(
+                    message=f"Failed to stream query events: {response.text}",
+                    code=ErrorCode.SERVER_ERROR,
+                    status_code=response.status_code,
+                    url=path,
+                )
+            data_lines: list[str] = []
+            for line in response.iter_lines():
+                if line.startswith("data:"):
+                    data_lines.append(line[5:].strip())
+                elif not line.strip() and data_lines:
+                    yield json.loads("\n".join(data_lines))
+                    data_lines = []
+
+    @staticmethod
+    def _query_list_params(
+        *,
+        scope: str,
+        account_keyword: str | None,
+        sql_pattern: str | None,
+        state: str | None,
+        tags: list[str] | None,
+        engine: str | None,
+        since: str | None,
+        until: str | None,
+    ) -> dict[str, Any]:
+        """Build query-list filter parameters for the catalog queries API."""
+        params: dict[str, Any] = {"scope": scope}
         if account_keyword:
             params["account"] = account_keyword
         if sql_pattern:
@@ -1970,13 +2466,7 @@ class BasecampClient:
             params["since"] = since
         if until:
             params["until"] = until
-
-        # TODO: Implement actual HTTP call: self._get("/api/v1/catalog/queries", params=params)
-        return ServerResponse(
-            success=False,
-            error="Real API not implemented yet",
-            status_code=501,
-        )
+        return params
 
     def query_get(
         self,
@@ -2237,6 +2727,8 @@ class BasecampClient:
         transpile_target_dialect: str | None = None,
         transpile_used_server_policy: bool = False,
         original_spec: dict[str, Any] | None = None,
+        *,
+        page_size: int | None = None,
     ) -> ServerResponse:
         """Execute rendered dataset SQL via server.
 
@@ -2250,6 +2742,8 @@ class BasecampClient:
             transpile_target_dialect: Target SQL dialect for transpilation.
             transpile_used_server_policy: Whether to use server-side transpilation policy.
             original_spec: Original dataset specification (for metadata).
+            page_size: If set, return only the first page of rows plus a
+                ``next_page_token``; fetch the rest with iter_result_rows().
 
         Returns:
             ServerResponse with execution result:
@@ -2260,22 +2754,22 @@ class BasecampClient:
                 "row_count": int,
                 "duration_seconds": float,
                 "rendered_sql": str,
+                "next_page_token": str | None,  # only with page_size
             }
         """
         if self.mock_mode:
             return ServerResponse(
                 success=True,
-                data={
-                    "execution_id": "exec-mock-dataset-001",
-                    "status": "COMPLETED",
-                    "rows": [
+                data=self._mock_execution_data(
+                    execution_id="exec-mock-dataset-001",
+                    rows=[
                         {"id": 1, "name": "mock_dataset_1", "value": 100},
                         {"id": 2, "name": "mock_dataset_2", "value": 200},
                     ],
-                    "row_count": 2,
-                    "duration_seconds": 0.523,
-                    "rendered_sql": rendered_sql,
-                },
+                    duration_seconds=0.523,
+                    rendered_sql=rendered_sql,
+                    page_size=page_size,
+                ),
             )
 
         # TODO: Implement actual HTTP call: POST /api/v1/execution/datasets/run
@@ -2307,6 +2801,8 @@ class BasecampClient:
         transpile_target_dialect: str | None = None,
         transpile_used_server_policy: bool = False,
         original_spec: dict[str, Any] | None = None,
+        *,
+        page_size: int | None = None,
     ) -> ServerResponse:
         """Execute rendered metric SQL via server.
 
@@ -2320,6 +2816,8 @@ class BasecampClient:
             transpile_target_dialect: Target SQL dialect for transpilation.
             transpile_used_server_policy: Whether to use server-side transpilation policy.
             original_spec: Original metric specification (for metadata).
+            page_size: If set, return only the first page of rows plus a
+                ``next_page_token``; fetch the rest with iter_result_rows().
 
         Returns:
             ServerResponse with execution result:
@@ -2330,22 +2828,22 @@ class BasecampClient:
                 "row_count": int,
                 "duration_seconds": float,
                 "rendered_sql": str,
+                "next_page_token": str | None,  # only with page_size
             }
         """
         if self.mock_mode:
             return ServerResponse(
                 success=True,
-                data={
-                    "execution_id": "exec-mock-metric-001",
-                    "status": "COMPLETED",
-                    "rows": [
+                data=self._mock_execution_data(
+                    execution_id="exec-mock-metric-001",
+                    rows=[
                         {"metric_name": "daily_active_users", "value": 15000, "date": "2025-01-01"},
                         {"metric_name": "daily_active_users", "value": 16500, "date": "2025-01-02"},
                     ],
-                    "row_count": 2,
-                    "duration_seconds": 0.412,
-                    "rendered_sql": rendered_sql,
-                },
+                    duration_seconds=0.412,
+                    rendered_sql=rendered_sql,
+                    page_size=page_size,
+                ),
             )
 
         # TODO: Implement actual HTTP call: POST /api/v1/execution/metrics/run
@@ -2645,6 +3143,8 @@ class BasecampClient:
         execution_timeout: int = 300,
         execution_limit: int | None = None,
         target_dialect: str | None = None,
+        *,
+        page_size: int | None = None,
     ) -> ServerResponse:
         """Execute ad-hoc SQL query via server.
 
@@ -2654,6 +3154,8 @@ class BasecampClient:
             execution_timeout: Timeout in seconds (default: 300).
             execution_limit: Maximum number of rows to return.
             target_dialect: Target SQL dialect for transpilation.
+            page_size: If set, return only the first page of rows plus a
+                ``next_page_token``; fetch the rest with iter_result_rows().
 
         Returns:
             ServerResponse with execution result:
@@ -2664,22 +3166,22 @@ class BasecampClient:
                 "row_count": int,
                 "duration_seconds": float,
                 "rendered_sql": str,
+                "next_page_token": str | None,  # only with page_size
             }
         """
         if self.mock_mode:
             return ServerResponse(
                 success=True,
-                data={
-                    "execution_id": "exec-mock-sql-001",
-                    "status": "COMPLETED",
-                    "rows": [
+                data=self._mock_execution_data(
+                    execution_id="exec-mock-sql-001",
+                    rows=[
                         {"id": 1, "name": "mock_row_1", "created_at": "2025-01-01T00:00:00Z"},
                         {"id": 2, "name": "mock_row_2", "created_at": "2025-01-02T00:00:00Z"},
                     ],
-                    "row_count": 2,
-                    "duration_seconds": 0.389,
-                    "rendered_sql": sql,
-                },
+                    duration_seconds=0.389,
+                    rendered_sql=sql,
+                    page_size=page_size,
+                ),
             )
 
         # TODO: Implement actual HTTP call: POST /api/v1/execution/sql/run
@@ -2696,6 +3198,209 @@ class BasecampClient:
             status_code=501,
         )
 
+    # =========================================================================
+    # Execution Result Retrieval (paged and streamed)
+    # =========================================================================
+
+    def fetch_result_page(
+        self,
+        execution_id: str,
+        page_token: str,
+        page_size: int = RESULT_PAGE_SIZE,
+    ) -> ServerResponse:
+        """Fetch one page of an execution result.
+
+        Args:
+            execution_id: Execution ID returned by an execute_rendered_* call.
+            page_token: Token of the page to fetch (``next_page_token``).
+            page_size: Maximum number of rows in the page.
+
+        Returns:
+            ServerResponse with page data:
+            {
+                "rows": list[dict],
+                "next_page_token": str | None,
+            }
+        """
+        if self.mock_mode:
+            rows = self._mock_results.get(execution_id)
+            if rows is None:
+                return ServerResponse(
+                    success=False,
+                    error=f"Execution result not found: {execution_id}",
+                    status_code=404,
+                )
+            offset = int(page_token)
+            end = offset + page_size
+            return ServerResponse(
+                success=True,
+                data={
+                    "rows": rows[offset:end],
+                    "next_page_token": str(end) if end < len(rows) else None,
+                },
+            )
+
+        if self._http is None:
+            return ServerResponse(
+                success=False,
+                error="HTTP client not initialized",
+                status_code=500,
+            )
+
+        try:
+            response = self._http.get(
+                f"/api/v1/execution/results/{execution_id}",
+                params={"page_token": page_token, "page_size": page_size},
+            )
+            if response.status_code == _HTTP_OK:
+                return ServerResponse(
+                    success=True,
+                    data=response.json(),
+                    status_code=response.status_code,
+                )
+            return ServerResponse(
+                success=False,
+                error=f"Failed to fetch result page: {response.text}",
+                status_code=response.status_code,
+            )
+        except Exception as e:
+            logger.warning("Fetching result page failed: %s", e)
+            return ServerResponse(
+                success=False,
+                error=str(e),
+                status_code=503,
+            )
+
+    def stream_result_rows(
+        self,
+        execution_id: str,
+        page_token: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream an execution result as newline-delimited JSON.
+
+        Rows are decoded one line at a time as the body arrives, so memory
+        use does not grow with the result size.
+
+        Args:
+            execution_id: Execution ID returned by an execute_rendered_* call.
+            page_token: Resume after the rows already received
+                (``next_page_token``); None streams the whole result.
+
+        Yields:
+            Result rows in server order.
+
+        Raises:
+            ServerError: If the server rejects the request.
+        """
+        if self.mock_mode:
+            rows = self._mock_results.get(execution_id)
+            if rows is None:
+                raise ServerError(
+                    message=f"Execution result not found: {execution_id}",
+                    code=ErrorCode.SERVER_EXECUTION,
+                    status_code=404,
+                )
+            yield from rows[int(page_token or 0) :]
+            return
+
+        if self._http is None:
+            raise ServerError(
+                message="HTTP client not initialized",
+                code=ErrorCode.SERVER_ERROR,
+            )
+
+        path = f"/api/v1/execution/results/{execution_id}/stream"
+        params = {"page_token": page_token} if page_token else {}
+        with self._http.stream(
+            "GET",
+            path,
+            params=params,
+            headers={"Accept": "application/x-ndjson"},
+        ) as response:
+            if response.status_code != _HTTP_OK:
+                response.read()
+                raise ServerError(
+                    message=f"Failed to stream result: {response.text}",
+                    code=ErrorCode.SERVER_EXECUTION,
+                    status_code=response.status_code,
+                    url=path,
+                )
+            for line in response.iter_lines():
+                if line.strip():
+                    yield json.loads(line)
+
+    def iter_result_rows(
+        self,
+        data: dict[str, Any],
+        *,
+        page_size: int = RESULT_PAGE_SIZE,
+        stream: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over every row of an execution result.
+
+        Yields the rows returned inline by an execute_rendered_* call, then
+        follows ``next_page_token`` page by page (or as one NDJSON stream
+        when ``stream`` is True). Only one page is held in memory at a time.
+
+        Args:
+            data: ``data`` of a successful execute_rendered_* response.
+            page_size: Rows per page when following page tokens.
+            stream: Download the remaining rows as an NDJSON stream
+                instead of page by page.
+
+        Yields:
+            Result rows in server order.
+
+        Raises:
+            ServerError: If a page cannot be retrieved.
+        """
+        yield from data.get("rows") or []
+
+        page_token = data.get("next_page_token")
+        if not page_token:
+            return
+
+        execution_id = data["execution_id"]
+        if stream:
+            yield from self.stream_result_rows(execution_id, page_token)
+            return
+
+        while page_token:
+            response = self.fetch_result_page(execution_id, page_token, page_size)
+            if not response.success:
+                raise ServerError(
+                    message=response.error or "Failed to fetch result page",
+                    code=ErrorCode.SERVER_EXECUTION,
+                    status_code=response.status_code,
+                )
+            page = response.data if isinstance(response.data, dict) else {}
+            yield from page.get("rows") or []
+            page_token = page.get("next_page_token")
+
+    def _mock_execution_data(
+        self,
+        *,
+        execution_id: str,
+        rows: list[dict[str, Any]],
+        duration_seconds: float,
+        rendered_sql: str,
+        page_size: int | None,
+    ) -> dict[str, Any]:
+        """Build a mock execution response, paged when page_size is set."""
+        data: dict[str, Any] = {
+            "execution_id": execution_id,
+            "status": "COMPLETED",
+            "rows": rows,
+            "row_count": len(rows),
+            "duration_seconds": duration_seconds,
+            "rendered_sql": rendered_sql,
+        }
+        if page_size is not None:
+            self._mock_results[execution_id] = rows
+            data["rows"] = rows[:page_size]
+            data["next_page_token"] = str(page_size) if page_size < len(rows) else None
+        return data
+
 
 def create_client(
     url: str | None = None,
@@ -2705,6 +3410,11 @@ def create_client(
 ) -> BasecampClient:
     """Create a Basecamp client.
 
+    In real mode the client comes from the process-wide registry, so every
+    caller with the same (url, api_key, timeout) shares one client and its
+    connection pool. Mock-mode clients are not shared; each caller gets its
+    own mock state.
+
     Args:
         url: Server URL (required unless mock_mode is True)
         timeout: Request timeout in seconds
@@ -2719,4 +3429,9 @@ def create_client(
         timeout=timeout,
         api_key=api_key,
     )
-    return BasecampClient(config, mock_mode=mock_mode)
+    if mock_mode:
+        return BasecampClient(config, mock_mode=True)
+
+    from dli.core.client.registry import get_shared_client  # noqa: PLC0415
+
+    return get_shared_client(config)
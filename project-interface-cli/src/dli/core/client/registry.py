@@ -0,0 +1,131 @@
+"""Process-wide registry of shared BasecampClient instances.
+
+Library API classes (DatasetAPI, MetricAPI, WorkflowAPI, ...) obtain their
+server client through ``create_client``, which hands out one pooled client
+per (server URL, API key, timeout) from this registry. Processes that build
+many API objects, such as Airflow workers, then reuse one set of keep-alive
+connections instead of constructing a client and opening connections for
+every call.
+
+Only real-mode clients are shared. Mock-mode clients keep per-instance mock
+state and are created fresh for every caller.
+
+Shared clients are closed when the interpreter exits. After ``os.fork()``
+the child process starts with an empty registry, and clients created before
+the fork (still held by API objects) open new connections on their next
+request, so the child never reuses sockets owned by the parent.
+
+Example:
+    >>> from dli.core.client import ServerConfig
+    >>> from dli.core.client.registry import get_shared_client
+    >>> config = ServerConfig(url="https://basecamp.example.com")
+    >>> get_shared_client(config) is get_shared_client(config)
+    True
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import threading
+
+from dli.core.client.baseclient import BasecampClient
+from dli.core.client.config import ServerConfig
+
+logger = logging.getLogger(__name__)
+
+# (server URL, API key, timeout)
+ClientKey = tuple[str, str | None, int]
+
+
+class ClientRegistry:
+    """Thread-safe cache of real-mode BasecampClient instances.
+
+    Example:
+        >>> registry = ClientRegistry()
+        >>> client = registry.get(ServerConfig(url="https://basecamp.example.com"))
+        >>> registry.close_all()
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._clients: dict[ClientKey, BasecampClient] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of shared clients."""
+        return len(self._clients)
+
+    @staticmethod
+    def key(config: ServerConfig) -> ClientKey:
+        """Return the registry key for a server configuration."""
+        return (config.url, config.api_key, config.timeout)
+
+    def get(self, config: ServerConfig) -> BasecampClient:
+        """Return the shared client for a server, creating it on first use.
+
+        Args:
+            config: Server connection configuration.
+
+        Returns:
+            Pooled real-mode BasecampClient.
+        """
+        key = self.key(config)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = BasecampClient(config, mock_mode=False, pooled=True)
+                self._clients[key] = client
+            return client
+
+    def close_all(self) -> None:
+        """Close and forget all shared clients."""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            try:
+                client.close()
+            except Exception as e:
+                logger.debug("Failed to close client for %s: %s", client.config.url, e)
+
+    def _reset_after_fork(self) -> None:
+        """Forget the parent's clients without closing their sockets."""
+        self._lock = threading.Lock()
+        self._clients = {}
+
+
+_registry = ClientRegistry()
+
+atexit.register(_registry.close_all)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_registry._reset_after_fork)
+
+
+def get_shared_client(config: ServerConfig) -> BasecampClient:
+    """Return the process-wide client for a server configuration.
+
+    Args:
+        config: Server connection configuration.
+
+    Returns:
+        Shared, pooled BasecampClient.
+    """
+    return _registry.get(config)
+
+
+def close_shared_clients() -> None:
+    """Close all process-wide clients.
+
+    Called automatically at interpreter exit; call it explicitly to release
+    connections earlier (e.g., at the end of an Airflow task).
+    """
+    _registry.close_all()
+
+
+__all__ = [
+    "ClientRegistry",
+    "close_shared_clients",
+    "get_shared_client",
+]
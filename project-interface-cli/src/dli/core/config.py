@@ -14,6 +14,7 @@ from typing import Any
 
 import yaml
 
+from dli.core.spans import traced
 from dli.core.types import EnvironmentConfig, ProjectDefaults
 
 
@@ -166,6 +167,17 @@ class ProjectConfig:
         """
         return self._data.get("server", {}).get("api_key")
 
+    @property
+    def admission(self) -> dict[str, Any]:
+        """Get the cost admission budget section.
+
+        See ``dli.core.admission.CostBudget.from_dict`` for the layout.
+
+        Returns:
+            Admission settings (empty if not configured)
+        """
+        return self._data.get("admission") or {}
+
 
 def get_dli_home() -> Path:
     """Get the DLI_HOME directory.
@@ -179,6 +191,7 @@ def get_dli_home() -> Path:
     return Path.cwd()
 
 
+@traced("config.load_project")
 def load_project(path: Path | None = None) -> ProjectConfig:
     """Load project configuration.
 
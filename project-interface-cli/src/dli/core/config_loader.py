@@ -9,6 +9,12 @@ configuration from multiple sources:
 
 Supports ${VAR} and ${VAR:-default} template syntax.
 
+Loaded configuration is memoized process-wide. The parsed and merged
+layers are keyed by each layer file's (path, mtime, size), and the resolved
+result by the values of the environment variables referenced in templates,
+so repeated loads within one process (ConfigAPI, ExecutionContext) parse
+the YAML once and pick up file or environment changes automatically.
+
 Example:
     >>> from dli.core.config_loader import ConfigLoader
     >>> loader = ConfigLoader(project_path=Path.cwd())
@@ -18,15 +24,58 @@ Example:
 
 from __future__ import annotations
 
+import copy
+from dataclasses import dataclass, field
 import os
-import re
 from pathlib import Path
+import re
+import threading
+import time
 from typing import Any
 
 import yaml
 
+from dli.core.spans import span
 from dli.models.config import ConfigSource
 
+# Files modified this recently may change again without a visible mtime/size
+# change (coarse filesystem timestamps), so snapshots of them are not reused.
+_RACY_WINDOW_NS = 2_000_000_000
+
+# Distinct environment-variable combinations kept per snapshot
+_MAX_RESOLVED_PER_SNAPSHOT = 16
+
+# (path, mtime_ns, size) of a layer file; mtime and size are None if missing
+_FileStamp = tuple[str, int | None, int | None]
+
+
+@dataclass
+class _ConfigSnapshot:
+    """Parsed and merged configuration layers for one set of file stamps.
+
+    Attributes:
+        stamps: Stamps of the layer files the snapshot was built from.
+        config: Merged configuration with templates still unresolved.
+        sources: Source map for the merged configuration.
+        variables: Environment variables referenced by templates.
+        reusable: False if a layer file was modified too recently to trust
+            its stamp.
+        resolved: Resolved (config, sources) keyed by variable values.
+    """
+
+    stamps: tuple[_FileStamp, ...]
+    config: dict[str, Any]
+    sources: dict[str, ConfigSource]
+    variables: tuple[str, ...]
+    reusable: bool
+    resolved: dict[
+        tuple[str | None, ...], tuple[dict[str, Any], dict[str, ConfigSource]]
+    ] = field(default_factory=dict)
+
+
+_snapshots: dict[tuple[Any, ...], _ConfigSnapshot] = {}
+_snapshots_lock = threading.Lock()
+
 
 class ConfigLoader:
     """Hierarchical configuration loader with template resolution.
@@ -74,14 +123,90 @@ class ConfigLoader:
     def load(self) -> tuple[dict[str, Any], dict[str, ConfigSource]]:
         """Load and merge all configuration layers.
 
+        Reuses the process-wide snapshot when no layer file changed and the
+        referenced environment variables have the same values. Each call
+        returns fresh copies, so callers may modify the result.
+
         Returns:
             Tuple of (merged_config, source_map).
 
         Raises:
             ConfigurationError: If required template variable is missing.
         """
-        import warnings
+        # A span, not @traced: the gitignore warning's stacklevel assumes
+        # no wrapper frame between load() and its caller
+        with span("config.load"):
+            layers = self._layer_paths()
+            stamps = tuple(self._stamp(path) for path in layers)
+            scope = (
+                str(self.project_path.resolve()),
+                self._load_global,
+                self._load_local,
+            )
 
+            with _snapshots_lock:
+                snapshot = _snapshots.get(scope)
+            if snapshot is None or not snapshot.reusable or snapshot.stamps != stamps:
+                snapshot = self._build_snapshot(stamps)
+                with _snapshots_lock:
+                    _snapshots[scope] = snapshot
+
+            env_key = tuple(os.environ.get(name) for name in snapshot.variables)
+            resolved = snapshot.resolved.get(env_key)
+            if resolved is None:
+                sources = dict(snapshot.sources)
+                config = self._resolve_templates(
+                    copy.deepcopy(snapshot.config), sources
+                )
+                resolved = (config, sources)
+                if len(snapshot.resolved) >= _MAX_RESOLVED_PER_SNAPSHOT:
+                    snapshot.resolved.clear()
+                snapshot.resolved[env_key] = resolved
+
+            if self._load_local:
+                # Check if .dli.local.yaml is in .gitignore
+                self._check_local_in_gitignore()
+
+            config, sources = resolved
+            return copy.deepcopy(config), dict(sources)
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all memoized configuration snapshots."""
+        with _snapshots_lock:
+            _snapshots.clear()
+
+    def _layer_paths(self) -> list[Path]:
+        """Return the layer files consulted by load(), lowest priority first."""
+        paths: list[Path] = []
+        if self._load_global:
+            paths.append(Path.home() / ".dli" / "config.yaml")
+        paths.append(self.project_path / "dli.yaml")
+        if self._load_local:
+            paths.append(self.project_path / ".dli.local.yaml")
+        return paths
+
+    @staticmethod
+    def _stamp(path: Path) -> _FileStamp:
+        """Return the cache stamp of a layer file."""
+        try:
+            stat = path.stat()
+        except OSError:
+            return (str(path), None, None)
+        return (str(path), stat.st_mtime_ns, stat.st_size)
+
+    def _build_snapshot(self, stamps: tuple[_FileStamp, ...]) -> _ConfigSnapshot:
+        """Parse and merge the layer files into a snapshot.
+
+        Args:
+            stamps: Stamps of the layer files taken before parsing.
+
+        Returns:
+            Snapshot with unresolved templates.
+
+        Raises:
+            ConfigurationError: If YAML parsing fails.
+        """
         config: dict[str, Any] = {}
         sources: dict[str, ConfigSource] = {}
 
@@ -102,13 +227,30 @@ class ConfigLoader:
             config = self._deep_merge(config, local_config)
             sources.update(local_sources)
 
-            # Check if .dli.local.yaml is in .gitignore
-            self._check_local_in_gitignore()
-
         # Layer 4: Environment variables (applied during template resolution)
-        config = self._resolve_templates(config, sources)
-
-        return config, sources
+        recent = time.time_ns() - _RACY_WINDOW_NS
+        return _ConfigSnapshot(
+            stamps=stamps,
+            config=config,
+            sources=sources,
+            variables=tuple(sorted(self._template_variables(config))),
+            reusable=all(mtime is None or mtime < recent for _, mtime, _ in stamps),
+        )
+
+    def _template_variables(self, value: Any) -> set[str]:
+        """Collect the environment variable names referenced in templates."""
+        if isinstance(value, str):
+            return {m.group(1) for m in self.TEMPLATE_PATTERN.finditer(value)}
+        if isinstance(value, dict):
+            values = value.values()
+        elif isinstance(value, list):
+            values = value
+        else:
+            return set()
+        names: set[str] = set()
+        for item in values:
+            names |= self._template_variables(item)
+        return names
 
     def _check_local_in_gitignore(self) -> None:
         """Warn if .dli.local.yaml exists but is not in .gitignore."""
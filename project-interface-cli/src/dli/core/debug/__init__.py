@@ -4,6 +4,7 @@ This module provides:
 - CheckResult, DebugResult: Data models for diagnostic results
 - CheckStatus, CheckCategory: Enums for check state
 - BaseCheck: Abstract base class for implementing checks
+- CheckRunner: Concurrent check execution with dependencies and timeouts
 - Concrete check implementations for system, config, server, etc.
 
 Example:
@@ -21,10 +22,12 @@ from dli.core.debug.models import (
     CheckStatus,
     DebugResult,
 )
+from dli.core.debug.runner import CheckRunner
 
 __all__ = [
     "CheckCategory",
     "CheckResult",
+    "CheckRunner",
     "CheckStatus",
     "DebugResult",
 ]
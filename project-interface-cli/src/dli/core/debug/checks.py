@@ -20,7 +20,8 @@ from pathlib import Path
 import platform
 import sys
 import time
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
+from urllib.parse import urlsplit
 
 from dli.core.debug.models import CheckCategory, CheckResult, CheckStatus
 
@@ -42,6 +43,12 @@ class BaseCheck(ABC):
     - _warn(): Create a warning result
     - _skip(): Create a skipped result
 
+    Scheduling hints used by CheckRunner:
+    - depends_on: Check classes that must finish first; the check is
+      skipped if any of them failed. Override waits_for() to narrow the
+      match to specific instances
+    - timeout: Per-check timeout in seconds (None uses the runner default)
+
     Example:
         >>> class MyCheck(BaseCheck):
         ...     @property
@@ -58,6 +65,9 @@ class BaseCheck(ABC):
         ...         return self._fail("Check failed", "Error details", "Fix it")
     """
 
+    depends_on: ClassVar[tuple[type[BaseCheck], ...]] = ()
+    timeout: ClassVar[float | None] = None
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -82,6 +92,17 @@ class BaseCheck(ABC):
         """
         pass
 
+    def waits_for(self, other: BaseCheck) -> bool:
+        """Return whether this check depends on another scheduled check.
+
+        Args:
+            other: A check placed before this one in the run.
+
+        Returns:
+            True if ``other`` is an instance of a class in ``depends_on``.
+        """
+        return isinstance(other, self.depends_on)
+
     def _pass(
         self,
         message: str,
@@ -386,9 +407,42 @@ class ProjectPathCheck(BaseCheck):
 # =============================================================================
 
 
+class ServerUrlCheck(BaseCheck):
+    """Check server URL is configured."""
+
+    @property
+    def name(self) -> str:
+        return "Server URL"
+
+    @property
+    def category(self) -> CheckCategory:
+        return CheckCategory.SERVER
+
+    def execute(self, context: ExecutionContext) -> CheckResult:
+        """Check if server URL is configured."""
+        start = time.perf_counter()
+
+        server_url = context.server_url
+        duration_ms = int((time.perf_counter() - start) * 1000)
+
+        if server_url:
+            return self._pass(
+                server_url,
+                duration_ms=duration_ms,
+                server_url=server_url,
+            )
+        return self._warn(
+            "Not configured",
+            duration_ms=duration_ms,
+        )
+
+
 class ServerHealthCheck(BaseCheck):
     """Check Basecamp Server connectivity."""
 
+    depends_on = (ServerUrlCheck,)
+    timeout = 15.0
+
     @property
     def name(self) -> str:
         return "Server connection"
@@ -454,36 +508,6 @@ class ServerHealthCheck(BaseCheck):
             )
 
 
-class ServerUrlCheck(BaseCheck):
-    """Check server URL is configured."""
-
-    @property
-    def name(self) -> str:
-        return "Server URL"
-
-    @property
-    def category(self) -> CheckCategory:
-        return CheckCategory.SERVER
-
-    def execute(self, context: ExecutionContext) -> CheckResult:
-        """Check if server URL is configured."""
-        start = time.perf_counter()
-
-        server_url = context.server_url
-        duration_ms = int((time.perf_counter() - start) * 1000)
-
-        if server_url:
-            return self._pass(
-                server_url,
-                duration_ms=duration_ms,
-                server_url=server_url,
-            )
-        return self._warn(
-            "Not configured",
-            duration_ms=duration_ms,
-        )
-
-
 # =============================================================================
 # Authentication Checks
 # =============================================================================
@@ -579,6 +603,8 @@ class GoogleCredentialsCheck(BaseCheck):
 class DnsResolutionCheck(BaseCheck):
     """Check DNS resolution for endpoints."""
 
+    timeout = 10.0
+
     def __init__(self, hostname: str = ""):
         """Initialize with optional hostname.
 
@@ -587,6 +613,11 @@ class DnsResolutionCheck(BaseCheck):
         """
         self._hostname = hostname or "bigquery.googleapis.com"
 
+    @property
+    def hostname(self) -> str:
+        """Return the hostname this check resolves."""
+        return self._hostname
+
     @property
     def name(self) -> str:
         return f"DNS resolution ({self._hostname})"
@@ -628,6 +659,9 @@ class DnsResolutionCheck(BaseCheck):
 class HttpsConnectivityCheck(BaseCheck):
     """Check HTTPS connectivity to an endpoint."""
 
+    depends_on = (DnsResolutionCheck,)
+    timeout = 15.0
+
     def __init__(self, url: str = ""):
         """Initialize with optional URL.
 
@@ -640,6 +674,13 @@ class HttpsConnectivityCheck(BaseCheck):
     def name(self) -> str:
         return f"HTTPS connectivity ({self._url})"
 
+    def waits_for(self, other: BaseCheck) -> bool:
+        """Depend only on the DNS check for this URL's host."""
+        return (
+            isinstance(other, DnsResolutionCheck)
+            and other.hostname == urlsplit(self._url).hostname
+        )
+
     @property
     def category(self) -> CheckCategory:
         return CheckCategory.NETWORK
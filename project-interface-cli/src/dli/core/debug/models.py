@@ -109,6 +109,7 @@ class DebugResult(BaseModel):
         timestamp: When diagnostics were run.
         success: Whether all checks passed.
         checks: List of individual check results.
+        duration_ms: Wall-clock duration of the whole run in milliseconds.
 
     Properties:
         passed_count: Number of checks that passed.
@@ -132,6 +133,9 @@ class DebugResult(BaseModel):
     )
     success: bool = Field(..., description="All checks passed")
     checks: list[CheckResult] = Field(default_factory=list, description="Check results")
+    duration_ms: int = Field(
+        default=0, description="Total run duration in milliseconds"
+    )
 
     @property
     def passed_count(self) -> int:
@@ -158,6 +162,11 @@ class DebugResult(BaseModel):
         """Total number of checks."""
         return len(self.checks)
 
+    @property
+    def slowest_check(self) -> CheckResult | None:
+        """Check with the highest latency, or None if there are no checks."""
+        return max(self.checks, key=lambda c: c.duration_ms, default=None)
+
     @cached_property
     def by_category(self) -> dict[CheckCategory, list[CheckResult]]:
         """Group checks by category.
@@ -0,0 +1,230 @@
+"""Concurrent runner for diagnostic checks.
+
+This module provides the CheckRunner class, which executes BaseCheck
+instances concurrently:
+- Independent checks run in parallel worker threads
+- Checks run after the checks they declare in ``depends_on``; a dependent
+  is skipped when one of its dependencies failed
+- Each check has a timeout (``BaseCheck.timeout`` or the runner default)
+  and the whole run has a global deadline
+- Results keep the order of the input checks, regardless of completion order
+
+Checks that exceed their timeout are reported as failed and abandoned; their
+worker threads are daemon threads, so a hung socket cannot keep the process
+alive after the command finishes.
+
+Example:
+    >>> from dli.core.debug.checks import ALL_CHECKS
+    >>> from dli.core.debug.runner import CheckRunner
+    >>>
+    >>> runner = CheckRunner(ExecutionContext(), deadline=30)
+    >>> results = runner.run([check_class() for check_class in ALL_CHECKS])
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import queue
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from dli.core.debug.models import CheckResult, CheckStatus
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from dli.core.debug.checks import BaseCheck
+    from dli.models.common import ExecutionContext
+
+# Default number of checks executing at the same time
+DEFAULT_MAX_WORKERS = 8
+
+
+@dataclass
+class _Running:
+    """Bookkeeping for a check that has been started."""
+
+    started: float
+    expires: float
+
+
+class CheckRunner:
+    """Run diagnostic checks concurrently with dependencies and timeouts.
+
+    Attributes:
+        context: Execution context passed to every check.
+        deadline: Global deadline for the whole run in seconds.
+        check_timeout: Default per-check timeout in seconds, used for
+            checks that do not set ``timeout`` themselves.
+        max_workers: Maximum number of checks executing at once.
+    """
+
+    def __init__(
+        self,
+        context: ExecutionContext,
+        *,
+        deadline: float | None = None,
+        check_timeout: float | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> None:
+        """Initialize the runner.
+
+        Args:
+            context: Execution context passed to every check.
+            deadline: Global deadline in seconds (default: context.timeout).
+            check_timeout: Default per-check timeout in seconds
+                (default: the global deadline).
+            max_workers: Maximum number of checks executing at once.
+        """
+        self.context = context
+        self.deadline = float(deadline if deadline is not None else context.timeout)
+        self.check_timeout = check_timeout
+        self.max_workers = max(1, max_workers)
+
+    def run(self, checks: Sequence[BaseCheck]) -> list[CheckResult]:
+        """Run checks and return their results in input order.
+
+        Each check's ``duration_ms`` is the wall-clock time it took in the
+        runner (0 for checks skipped because of a failed dependency).
+
+        Args:
+            checks: Check instances to run.
+
+        Returns:
+            One CheckResult per check, in the same order as ``checks``.
+        """
+        start = time.perf_counter()
+        run_deadline = start + self.deadline
+        deps = self._resolve_dependencies(checks)
+
+        results: dict[int, CheckResult] = {}
+        running: dict[int, _Running] = {}
+        pending = list(range(len(checks)))
+        done: queue.Queue[tuple[int, CheckResult | BaseException]] = queue.Queue()
+
+        while pending or running:
+            # Start (or skip) every check whose dependencies are finished
+            for idx in list(pending):
+                if len(running) >= self.max_workers:
+                    break
+                if any(dep not in results for dep in deps[idx]):
+                    continue
+                pending.remove(idx)
+                failed = [
+                    checks[dep].name
+                    for dep in deps[idx]
+                    if results[dep].status == CheckStatus.FAIL
+                ]
+                if failed:
+                    results[idx] = checks[idx]._skip(
+                        f"Skipped: {', '.join(failed)} failed"
+                    )
+                    continue
+                now = time.perf_counter()
+                running[idx] = _Running(
+                    started=now,
+                    expires=min(now + self._timeout_for(checks[idx]), run_deadline),
+                )
+                threading.Thread(
+                    target=self._execute,
+                    args=(idx, checks[idx], done),
+                    name=f"dli-debug-{idx}",
+                    daemon=True,
+                ).start()
+
+            if not running:
+                if pending and all(
+                    any(dep not in results for dep in deps[idx]) for idx in pending
+                ):
+                    # Unsatisfiable dependencies (cannot happen for a DAG)
+                    for idx in pending:
+                        results[idx] = checks[idx]._skip(
+                            "Skipped: dependency did not run"
+                        )
+                    pending.clear()
+                continue
+
+            wait = (
+                min(entry.expires for entry in running.values()) - time.perf_counter()
+            )
+            try:
+                idx, outcome = done.get(timeout=max(wait, 0))
+            except queue.Empty:
+                now = time.perf_counter()
+                for idx in [i for i, entry in running.items() if entry.expires <= now]:
+                    entry = running.pop(idx)
+                    results[idx] = self._timed_out(
+                        checks[idx],
+                        entry,
+                        global_deadline=entry.expires >= run_deadline,
+                    )
+                continue
+
+            entry = running.pop(idx, None)
+            if entry is None:
+                # Finished after it was reported as timed out
+                continue
+            duration_ms = int((time.perf_counter() - entry.started) * 1000)
+            if isinstance(outcome, BaseException):
+                results[idx] = checks[idx]._fail(
+                    "Check failed to execute",
+                    error=str(outcome),
+                    remediation="Check the error message and fix the underlying issue",
+                    duration_ms=duration_ms,
+                )
+            else:
+                results[idx] = outcome.model_copy(update={"duration_ms": duration_ms})
+
+        return [results[idx] for idx in range(len(checks))]
+
+    def _timeout_for(self, check: BaseCheck) -> float:
+        if check.timeout is not None:
+            return check.timeout
+        if self.check_timeout is not None:
+            return self.check_timeout
+        return self.deadline
+
+    @staticmethod
+    def _resolve_dependencies(checks: Sequence[BaseCheck]) -> list[list[int]]:
+        """Map each check to the earlier checks it depends on.
+
+        Only checks placed before the dependent are considered (see
+        ``BaseCheck.waits_for``), so declared order breaks cycles.
+        """
+        return [
+            [other for other in range(idx) if check.waits_for(checks[other])]
+            for idx, check in enumerate(checks)
+        ]
+
+    def _execute(
+        self,
+        idx: int,
+        check: BaseCheck,
+        done: queue.Queue[tuple[int, CheckResult | BaseException]],
+    ) -> None:
+        try:
+            done.put((idx, check.execute(self.context)))
+        except Exception as e:
+            done.put((idx, e))
+
+    @staticmethod
+    def _timed_out(
+        check: BaseCheck, entry: _Running, *, global_deadline: bool
+    ) -> CheckResult:
+        seconds = entry.expires - entry.started
+        reason = "global deadline reached" if global_deadline else "check timeout"
+        return check._fail(
+            f"Timed out after {seconds:.1f}s",
+            error=f"Check did not finish in time ({reason})",
+            remediation=(
+                "1. Verify network connectivity\n2. Increase the timeout with --timeout"
+            ),
+            duration_ms=int(seconds * 1000),
+        )
+
+
+__all__ = [
+    "DEFAULT_MAX_WORKERS",
+    "CheckRunner",
+]
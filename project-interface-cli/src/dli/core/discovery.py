@@ -35,6 +35,7 @@ from dli.core.models import (
     SpecBase,
     SpecType,
 )
+from dli.core.spans import span
 
 # Re-export for backward compatibility
 __all__ = [
@@ -140,6 +141,68 @@ class SpecDiscovery:
         ):
             yield cast(DatasetSpec, spec)
 
+    def discover_spec_paths(self, spec_type: SpecType) -> Iterator[Path]:
+        """Discover spec file paths without loading them.
+
+        Uses the same directories and patterns as ``discover_metrics`` and
+        ``discover_datasets``, but does not parse YAML. A file whose ``type``
+        field disagrees with its filename is still yielded; callers that load
+        the file decide its actual type.
+
+        Args:
+            spec_type: Spec type whose patterns to search
+
+        Yields:
+            Unique spec file paths
+        """
+        if spec_type == SpecType.METRIC:
+            search = [
+                (self.config.metrics_dir, self.config.metric_patterns),
+                (self.config.datasets_dir, self.config.metric_patterns),
+            ]
+        else:
+            search = [(self.config.datasets_dir, self.config.dataset_patterns)]
+
+        seen_paths: set[Path] = set()
+        for directory, patterns in search:
+            if not directory.exists():
+                continue
+            for pattern in patterns:
+                for spec_path in sorted(directory.rglob(pattern)):
+                    if spec_path not in seen_paths:
+                        seen_paths.add(spec_path)
+                        yield spec_path
+
+    def load_spec_file(self, spec_path: Path) -> MetricSpec | DatasetSpec:
+        """Load a single spec file found by ``discover_spec_paths``.
+
+        The spec type is taken from the ``type`` field, falling back to the
+        filename prefix.
+
+        Args:
+            spec_path: Path to the spec file
+
+        Returns:
+            MetricSpec or DatasetSpec object
+
+        Raises:
+            OSError: If the file cannot be read
+            yaml.YAMLError: If the file is not valid YAML
+            ValidationError: If the spec does not match its model
+        """
+        with span("discovery.load_spec", path=str(spec_path)):
+            data = self._load_yaml_file(spec_path)
+            filename = spec_path.name.lower()
+            fallback = (
+                SpecType.METRIC
+                if filename.startswith(self._METRIC_PREFIX)
+                else SpecType.DATASET
+            )
+            spec_type = self._detect_spec_type(
+                str(data.get("type", "")).lower(), filename, fallback
+            )
+            return self._spec_from_data(data, spec_path, spec_type)
+
     def _discover_specs_in_dir(
         self,
         directory: Path,
@@ -197,15 +260,34 @@ class SpecDiscovery:
         Returns:
             MetricSpec or DatasetSpec object, or None if type doesn't match
         """
-        data = self._load_yaml_file(spec_path)
-        spec_type_str = data.get("type", "").lower()
-        filename = spec_path.name.lower()
+        with span("discovery.load_spec", path=str(spec_path)):
+            data = self._load_yaml_file(spec_path)
+            spec_type_str = data.get("type", "").lower()
+            filename = spec_path.name.lower()
+
+            # Determine the actual type from data or filename
+            actual_type = self._detect_spec_type(spec_type_str, filename, expected_type)
+            if actual_type != expected_type:
+                return None
+
+            return self._spec_from_data(data, spec_path, actual_type)
 
-        # Determine the actual type from data or filename
-        actual_type = self._detect_spec_type(spec_type_str, filename, expected_type)
-        if actual_type != expected_type:
-            return None
+    def _spec_from_data(
+        self,
+        data: dict,
+        spec_path: Path,
+        actual_type: SpecType,
+    ) -> MetricSpec | DatasetSpec:
+        """Build a spec model from parsed YAML data.
 
+        Args:
+            data: Parsed YAML data (modified in place with defaults)
+            spec_path: Path to the spec file
+            actual_type: Spec type to build
+
+        Returns:
+            MetricSpec or DatasetSpec object
+        """
         # Set type and query_type if not already present
         self._set_type_defaults(data, actual_type)
         self._merge_execution_defaults(data)
@@ -25,13 +25,14 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 import time
-from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Any, ClassVar, Protocol, runtime_checkable
 
 from dli.core.models import (
     DatasetExecutionResult,
     DatasetSpec,
     ExecutionResult,
 )
+from dli.core.spans import traced
 from dli.core.types import DryRunResult
 
 if TYPE_CHECKING:
@@ -101,8 +102,15 @@ class BaseExecutor(ABC):
 
     All concrete executors (Trino, BigQuery, etc.) must inherit
     from this class and implement the required methods.
+
+    Attributes:
+        supports_maximum_bytes_billed: Whether ``execute_sql`` accepts a
+            ``maximum_bytes_billed`` keyword that makes the engine fail the
+            query instead of scanning more bytes.
     """
 
+    supports_maximum_bytes_billed: ClassVar[bool] = False
+
     @abstractmethod
     def execute_sql(self, sql: str, timeout: int = 300) -> ExecutionResult:
         """Execute a SQL query and return results.
@@ -130,6 +138,21 @@ class BaseExecutor(ABC):
             (e.g., bytes_processed, estimated_cost)
         """
 
+    def estimate_cost(self, sql: str) -> DryRunResult:
+        """Estimate the bytes and cost of a query for admission control.
+
+        Defaults to ``dry_run``; executors whose dry run does not report
+        sizes can override this with a cheaper or richer estimate.
+
+        Args:
+            sql: SQL query to estimate
+
+        Returns:
+            DryRunResult with ``bytes_processed`` and/or
+            ``estimated_cost_usd`` when the engine reports them
+        """
+        return self.dry_run(sql)
+
     @abstractmethod
     def test_connection(self) -> bool:
         """Test the connection to the database.
@@ -311,6 +334,7 @@ class DatasetExecutor:
         """
         self.executor = executor
 
+    @traced("executor.dataset")
     def execute(
         self,
         spec: DatasetSpec,
@@ -420,6 +444,7 @@ class DatasetExecutor:
             error_message=error_message,
         )
 
+    @traced("executor.dataset_phase")
     def execute_phase(
         self,
         spec: DatasetSpec,
@@ -517,6 +542,7 @@ class ServerExecutor:
             )
         return self._client
 
+    @traced("executor.server")
     def execute(
         self, sql: str, params: dict[str, Any] | None = None
     ) -> ExecutionResult:
@@ -703,6 +729,9 @@ class ExecutorFactory:
                         auth_type=context.parameters.get("auth_type", "none"),
                         auth_token=context.parameters.get("auth_token"),
                         password=context.parameters.get("password"),
+                        query_max_run_time=context.parameters.get(
+                            "query_max_run_time", context.timeout
+                        ),
                     )
                 # Add more engines here (snowflake, etc.)
                 raise ValueError(f"Unsupported engine for LOCAL mode: {engine}")
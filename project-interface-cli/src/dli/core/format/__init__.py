@@ -3,6 +3,7 @@
 This module provides formatting capabilities for DLI specs:
 - SQL formatting using sqlfluff with Jinja template preservation
 - YAML formatting with DLI standard key ordering and comment preservation
+- Project-wide formatting with unchanged-file skipping and parallel workers
 
 Example:
     >>> from dli.core.format import SqlFormatter, YamlFormatter
@@ -22,6 +23,13 @@ from dli.core.format.config import (
     get_dialect_from_config,
     load_format_config,
 )
+from dli.core.format.engine import (
+    FileFormatOutcome,
+    FormatCache,
+    ProjectFormatSummary,
+    ProjectFormatter,
+    compute_config_hash,
+)
 from dli.core.format.sql_formatter import SqlFormatResult, SqlFormatter
 from dli.core.format.yaml_formatter import (
     YamlFormatResult,
@@ -47,4 +55,10 @@ __all__ = [  # noqa: RUF022 - Grouped by category
     "YamlFormatResult",
     "YamlFormatter",
     "get_key_order_position",
+    # Project format engine
+    "FileFormatOutcome",
+    "FormatCache",
+    "ProjectFormatSummary",
+    "ProjectFormatter",
+    "compute_config_hash",
 ]
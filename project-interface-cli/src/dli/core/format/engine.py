@@ -0,0 +1,571 @@
+"""Project-wide format engine with unchanged-file skipping.
+
+This module formats every SQL and spec YAML file in a project:
+- Files whose content is known to be formatted under the same configuration
+  are skipped using a cache keyed by (file hash, format config hash, tool
+  version)
+- Remaining files are formatted in a process pool; each worker keeps one warm
+  sqlfluff Linter and ruamel.yaml instance for all files it handles
+- Every file reports how long it took, so slow files are easy to find
+
+Example:
+    >>> from dli.core.format.engine import ProjectFormatter
+    >>> formatter = ProjectFormatter(project_path, dialect="trino")
+    >>> summary = formatter.format_project(check_only=True)
+    >>> for outcome in summary.slowest(5):
+    ...     print(outcome.path, f"{outcome.duration_ms:.0f}ms")
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import contextlib
+from dataclasses import asdict, dataclass, field
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import tempfile
+import time
+from typing import TYPE_CHECKING, Any, Literal
+
+from dli.models.format import FileFormatStatus
+
+from .config import FormatConfig, get_dialect_from_config, load_format_config
+from .sql_formatter import SqlFormatter
+from .yaml_formatter import YamlFormatter
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+logger = logging.getLogger(__name__)
+
+FileKind = Literal["sql", "yaml"]
+
+# Default cache location relative to the project directory
+DEFAULT_CACHE_DIR = Path(".dli") / "cache"
+CACHE_FILENAME = "format.json"
+
+# Bump when the stored entry layout changes
+_CACHE_FORMAT = 1
+
+# Below this many files, process startup costs more than it saves
+_PARALLEL_MIN_FILES = 4
+
+
+@dataclass
+class FileFormatOutcome:
+    """Result of formatting one file in a project-wide run.
+
+    Attributes:
+        path: Path to the file.
+        kind: File kind ("sql" or "yaml").
+        status: Format status for this file.
+        duration_ms: Time spent on this file, including cache checks.
+        cached: Whether the file was skipped as already formatted.
+        violations: Lint violations (SQL with lint enabled only).
+        error: Error message if formatting failed.
+    """
+
+    path: Path
+    kind: FileKind
+    status: FileFormatStatus
+    duration_ms: float = 0.0
+    cached: bool = False
+    violations: list[dict[str, str]] = field(default_factory=list)
+    error: str | None = None
+
+
+@dataclass
+class ProjectFormatSummary:
+    """Summary of a project-wide format run.
+
+    Attributes:
+        files: Per-file outcomes, in discovery order.
+        duration_ms: Wall-clock time of the whole run.
+        check_mode: Whether files were left unmodified.
+    """
+
+    files: list[FileFormatOutcome] = field(default_factory=list)
+    duration_ms: float = 0.0
+    check_mode: bool = False
+
+    @property
+    def changed_count(self) -> int:
+        """Count of files that were (or would be) changed."""
+        return sum(1 for f in self.files if f.status == FileFormatStatus.CHANGED)
+
+    @property
+    def error_count(self) -> int:
+        """Count of files that failed to format."""
+        return sum(1 for f in self.files if f.status == FileFormatStatus.ERROR)
+
+    @property
+    def cached_count(self) -> int:
+        """Count of files skipped as already formatted."""
+        return sum(1 for f in self.files if f.cached)
+
+    @property
+    def has_changes(self) -> bool:
+        """Check if any files have changes."""
+        return self.changed_count > 0
+
+    def slowest(self, limit: int = 10) -> list[FileFormatOutcome]:
+        """Return the slowest files, slowest first.
+
+        Args:
+            limit: Maximum number of files to return.
+        """
+        return sorted(self.files, key=lambda f: f.duration_ms, reverse=True)[:limit]
+
+
+def _hash_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _tool_version(distribution: str) -> str:
+    from importlib.metadata import PackageNotFoundError, version  # noqa: PLC0415
+
+    try:
+        return version(distribution)
+    except PackageNotFoundError:
+        return "missing"
+
+
+def compute_config_hash(config: FormatConfig, dialect: str, *, lint: bool) -> str:
+    """Hash everything besides file content that affects formatting output.
+
+    Includes the format settings, the raw .sqlfluff / .dli-format.yaml
+    content (sqlfluff reads rules beyond the fields FormatConfig models),
+    the dialect, the lint flag and the sqlfluff / ruamel.yaml versions.
+
+    Args:
+        config: Loaded format configuration.
+        dialect: Effective SQL dialect.
+        lint: Whether lint violations are collected.
+
+    Returns:
+        Hex digest of the configuration.
+    """
+    config_files = {}
+    for path in (config.sqlfluff_path, config.dli_format_path):
+        if path is not None:
+            try:
+                config_files[path.name] = _hash_bytes(path.read_bytes())
+            except OSError:
+                config_files[path.name] = "missing"
+
+    payload = json.dumps(
+        {
+            "yaml": asdict(config.yaml),
+            "sql": asdict(config.sql),
+            "config_files": config_files,
+            "dialect": dialect,
+            "lint": lint,
+            "sqlfluff": _tool_version("sqlfluff"),
+            "ruamel.yaml": _tool_version("ruamel.yaml"),
+        },
+        sort_keys=True,
+    )
+    return _hash_bytes(payload.encode("utf-8"))
+
+
+class FormatCache:
+    """On-disk record of files known to be formatted.
+
+    An entry maps a file path to the content hash it had when it was last
+    found (or made) clean, plus the configuration hash at that time. A file
+    is skipped only when both still match.
+
+    Attributes:
+        cache_dir: Directory holding the cache file.
+    """
+
+    def __init__(self, cache_dir: Path, config_hash: str) -> None:
+        """Initialize the cache and load entries for this configuration.
+
+        Args:
+            cache_dir: Directory holding the cache file.
+            config_hash: Hash from ``compute_config_hash``.
+        """
+        self.cache_dir = cache_dir
+        self.config_hash = config_hash
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._dirty = False
+        self._load()
+
+    @property
+    def cache_file(self) -> Path:
+        """Path to the JSON cache file."""
+        return self.cache_dir / CACHE_FILENAME
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
+
+    def lookup(self, path: Path, content_hash: str) -> list[dict[str, str]] | None:
+        """Return stored lint violations if the file is known to be clean.
+
+        Args:
+            path: File path.
+            content_hash: Current content hash of the file.
+
+        Returns:
+            Stored violations (possibly empty) on a hit, None on a miss.
+        """
+        entry = self._entries.get(str(path.resolve()))
+        if entry is None or entry.get("hash") != content_hash:
+            return None
+        return list(entry.get("violations", []))
+
+    def mark_clean(
+        self,
+        path: Path,
+        content_hash: str,
+        violations: list[dict[str, str]] | None = None,
+    ) -> None:
+        """Record that a file's content is formatted.
+
+        Args:
+            path: File path.
+            content_hash: Content hash of the formatted file.
+            violations: Lint violations for this content, if collected.
+        """
+        self._entries[str(path.resolve())] = {
+            "hash": content_hash,
+            "violations": list(violations or []),
+        }
+        self._dirty = True
+
+    def forget(self, path: Path) -> None:
+        """Drop the entry for a file."""
+        if self._entries.pop(str(path.resolve()), None) is not None:
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache atomically if it has changed.
+
+        Failures are logged and ignored; the cache is an optimization only.
+        """
+        if not self._dirty:
+            return
+        payload = {
+            "format": _CACHE_FORMAT,
+            "config_hash": self.config_hash,
+            "entries": self._entries,
+        }
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(
+                dir=self.cache_dir, prefix=".format-", suffix=".tmp"
+            )
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f)
+            Path(tmp_name).replace(self.cache_file)
+            self._dirty = False
+        except OSError as e:
+            logger.warning("Failed to write format cache %s: %s", self.cache_file, e)
+
+    def _load(self) -> None:
+        try:
+            with open(self.cache_file, encoding="utf-8") as f:
+                payload = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(
+                "Ignoring unreadable format cache %s: %s", self.cache_file, e
+            )
+            return
+        if (
+            not isinstance(payload, dict)
+            or payload.get("format") != _CACHE_FORMAT
+            or payload.get("config_hash") != self.config_hash
+        ):
+            # Configuration or tool version changed: every entry is stale
+            self._dirty = True
+            return
+        entries = payload.get("entries")
+        if isinstance(entries, dict):
+            self._entries = entries
+
+
+class _FormatWorker:
+    """Formats files with long-lived formatter instances.
+
+    One instance lives in each pool process (or in-process for serial runs),
+    so the sqlfluff Linter and ruamel.yaml parser are built once per worker.
+    """
+
+    def __init__(
+        self,
+        dialect: str,
+        config: FormatConfig,
+        project_path: Path | None,
+        *,
+        lint: bool,
+    ) -> None:
+        self.lint = lint
+        self.sql_formatter = SqlFormatter(
+            dialect=dialect, config=config, project_path=project_path
+        )
+        self.yaml_formatter = YamlFormatter(config=config)
+
+    def run(self, path: Path, kind: FileKind, *, check_only: bool) -> FileFormatOutcome:
+        start = time.perf_counter()
+        try:
+            if kind == "sql":
+                sql_result = self.sql_formatter.format_file(
+                    path, check_only=check_only, lint=self.lint
+                )
+                changed, error = sql_result.changed, sql_result.error
+                violations = sql_result.violations
+            else:
+                yaml_result = self.yaml_formatter.format_file(
+                    path, check_only=check_only
+                )
+                changed, error = yaml_result.changed, yaml_result.error
+                violations = []
+        except Exception as e:
+            changed, error, violations = False, str(e), []
+
+        if error is not None:
+            status = FileFormatStatus.ERROR
+        elif changed:
+            status = FileFormatStatus.CHANGED
+        else:
+            status = FileFormatStatus.UNCHANGED
+
+        return FileFormatOutcome(
+            path=path,
+            kind=kind,
+            status=status,
+            duration_ms=(time.perf_counter() - start) * 1000,
+            violations=violations,
+            error=error,
+        )
+
+
+# Per-process worker, created by the pool initializer
+_worker: _FormatWorker | None = None
+
+
+def _init_worker(
+    dialect: str,
+    config: FormatConfig,
+    project_path: Path | None,
+    lint: bool,
+) -> None:
+    global _worker
+    _worker = _FormatWorker(dialect, config, project_path, lint=lint)
+
+
+def _format_in_worker(task: tuple[Path, FileKind, bool]) -> FileFormatOutcome:
+    path, kind, check_only = task
+    assert _worker is not None
+    return _worker.run(path, kind, check_only=check_only)
+
+
+class ProjectFormatter:
+    """Format all SQL and spec YAML files of a project.
+
+    Attributes:
+        project_path: Project root (contains dli.yaml).
+        dialect: Effective SQL dialect.
+        config: Loaded format configuration.
+        lint: Whether to collect lint violations for SQL files.
+        jobs: Worker processes (None: CPU count, 1: serial).
+    """
+
+    def __init__(
+        self,
+        project_path: Path,
+        *,
+        dialect: str | None = None,
+        config: FormatConfig | None = None,
+        lint: bool = False,
+        jobs: int | None = None,
+        use_cache: bool = True,
+        cache_dir: Path | None = None,
+    ) -> None:
+        """Initialize the project formatter.
+
+        Args:
+            project_path: Project root (contains dli.yaml).
+            dialect: SQL dialect; defaults to the project format config.
+            config: Format configuration; loaded from the project if None.
+            lint: Whether to collect lint violations for SQL files.
+            jobs: Worker processes (None: CPU count, 1: serial).
+            use_cache: Skip files already known to be formatted.
+            cache_dir: Cache directory (default: <project>/.dli/cache).
+        """
+        self.project_path = project_path
+        self.config = config or load_format_config(project_path)
+        self.dialect = get_dialect_from_config(dialect, self.config)
+        self.lint = lint
+        self.jobs = jobs
+        self.use_cache = use_cache
+        self.cache_dir = cache_dir or project_path / DEFAULT_CACHE_DIR
+
+        # Fail fast on an unsupported dialect, before any worker starts
+        SqlFormatter(dialect=self.dialect, config=self.config)
+
+    def discover_files(self) -> list[tuple[Path, FileKind]]:
+        """List the project's SQL files and spec YAML files.
+
+        Returns:
+            (path, kind) tuples in a stable order.
+        """
+        from dli.core.config import load_project  # noqa: PLC0415
+        from dli.core.discovery import SpecDiscovery  # noqa: PLC0415
+        from dli.core.models import SpecType  # noqa: PLC0415
+
+        discovery = SpecDiscovery(load_project(self.project_path))
+        files: dict[Path, FileKind] = {}
+
+        for spec_type in (SpecType.METRIC, SpecType.DATASET):
+            for path in discovery.discover_spec_paths(spec_type):
+                files.setdefault(path, "yaml")
+
+        config = discovery.config
+        for base_dir in (config.metrics_dir, config.datasets_dir):
+            for path in sorted(discovery.discover_sql_files(base_dir)):
+                files.setdefault(path, "sql")
+
+        return list(files.items())
+
+    def format_project(self, *, check_only: bool = False) -> ProjectFormatSummary:
+        """Format every SQL and spec YAML file in the project.
+
+        Args:
+            check_only: If True, report changes without modifying files.
+
+        Returns:
+            ProjectFormatSummary with per-file outcomes and timings.
+        """
+        return self.format_files(self.discover_files(), check_only=check_only)
+
+    def format_files(
+        self,
+        files: Iterable[tuple[Path, FileKind]],
+        *,
+        check_only: bool = False,
+    ) -> ProjectFormatSummary:
+        """Format the given files, skipping ones known to be formatted.
+
+        Args:
+            files: (path, kind) tuples.
+            check_only: If True, report changes without modifying files.
+
+        Returns:
+            ProjectFormatSummary with per-file outcomes and timings.
+        """
+        run_start = time.perf_counter()
+        files = list(files)
+
+        cache = None
+        if self.use_cache:
+            cache = FormatCache(
+                self.cache_dir,
+                compute_config_hash(self.config, self.dialect, lint=self.lint),
+            )
+
+        outcomes: dict[Path, FileFormatOutcome] = {}
+        pending: list[tuple[Path, FileKind]] = []
+        for path, kind in files:
+            start = time.perf_counter()
+            if cache is not None:
+                violations = None
+                with contextlib.suppress(OSError):
+                    violations = cache.lookup(path, _hash_bytes(path.read_bytes()))
+                if violations is not None:
+                    outcomes[path] = FileFormatOutcome(
+                        path=path,
+                        kind=kind,
+                        status=FileFormatStatus.UNCHANGED,
+                        duration_ms=(time.perf_counter() - start) * 1000,
+                        cached=True,
+                        violations=violations,
+                    )
+                    continue
+            pending.append((path, kind))
+
+        for outcome in self._run(pending, check_only=check_only):
+            outcomes[outcome.path] = outcome
+            if cache is not None:
+                self._update_cache(cache, outcome, check_only=check_only)
+
+        if cache is not None:
+            cache.save()
+
+        return ProjectFormatSummary(
+            files=[outcomes[path] for path, _ in files],
+            duration_ms=(time.perf_counter() - run_start) * 1000,
+            check_mode=check_only,
+        )
+
+    def _update_cache(
+        self,
+        cache: FormatCache,
+        outcome: FileFormatOutcome,
+        *,
+        check_only: bool,
+    ) -> None:
+        """Record files whose on-disk content is now formatted.
+
+        Lint violations of a rewritten SQL file were collected on the
+        formatted output, so they describe the new on-disk content.
+        """
+        clean = outcome.status == FileFormatStatus.UNCHANGED or (
+            outcome.status == FileFormatStatus.CHANGED and not check_only
+        )
+        if not clean:
+            cache.forget(outcome.path)
+            return
+        try:
+            content_hash = _hash_bytes(outcome.path.read_bytes())
+        except OSError:
+            cache.forget(outcome.path)
+            return
+        cache.mark_clean(outcome.path, content_hash, outcome.violations)
+
+    def _run(
+        self,
+        files: list[tuple[Path, FileKind]],
+        *,
+        check_only: bool,
+    ) -> list[FileFormatOutcome]:
+        """Format files in a process pool when there are enough of them."""
+        if not files:
+            return []
+
+        workers = min(self.jobs or os.cpu_count() or 1, len(files))
+        if workers > 1 and len(files) >= _PARALLEL_MIN_FILES:
+            tasks = [(path, kind, check_only) for path, kind in files]
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_worker,
+                    initargs=(self.dialect, self.config, self.project_path, self.lint),
+                ) as pool:
+                    return list(pool.map(_format_in_worker, tasks))
+            except (OSError, BrokenProcessPool) as e:
+                logger.warning(
+                    "Parallel formatting unavailable, running serially: %s", e
+                )
+
+        worker = _FormatWorker(
+            self.dialect, self.config, self.project_path, lint=self.lint
+        )
+        return [worker.run(path, kind, check_only=check_only) for path, kind in files]
+
+
+__all__ = [
+    "FileFormatOutcome",
+    "FormatCache",
+    "ProjectFormatSummary",
+    "ProjectFormatter",
+    "compute_config_hash",
+]
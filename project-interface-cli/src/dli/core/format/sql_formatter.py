@@ -9,6 +9,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 import difflib
 from pathlib import Path
+from typing import Any
 
 from dli.exceptions import FormatDialectError, FormatSqlError
 
@@ -55,6 +56,16 @@ class SqlFormatResult:
         return list(diff)
 
 
+def _violation_to_dict(violation: Any) -> dict[str, str]:
+    """Convert a sqlfluff violation into the plain dict used by results."""
+    return {
+        "rule": str(violation.rule_code()),
+        "line": str(violation.line_no),
+        "column": str(violation.line_pos),
+        "description": str(violation.desc()),
+    }
+
+
 class SqlFormatter:
     """SQL formatter using sqlfluff.
 
@@ -116,19 +127,20 @@ class SqlFormatter:
             return self._linter
 
         try:
-            from sqlfluff.core import Linter
+            from sqlfluff.core import FluffConfig, Linter
         except ImportError as e:
             raise FormatSqlError(
                 message="sqlfluff is not installed. Install with: uv pip install sqlfluff",
             ) from e
 
-        # Configure linter with dialect and Jinja templater
-        self._linter = Linter(
-            dialect=self.dialect,
-            config_path=str(self.project_path / ".sqlfluff")
-            if self.project_path and (self.project_path / ".sqlfluff").exists()
-            else None,
-        )
+        # Configure linter with dialect, picking up the project .sqlfluff if present
+        if self.project_path and (self.project_path / ".sqlfluff").exists():
+            fluff_config = FluffConfig.from_path(
+                str(self.project_path), overrides={"dialect": self.dialect}
+            )
+            self._linter = Linter(config=fluff_config)
+        else:
+            self._linter = Linter(dialect=self.dialect)
         return self._linter
 
     def format(
@@ -154,9 +166,9 @@ class SqlFormatter:
         try:
             linter = self._get_linter()
 
-            # Format the SQL
-            fix_result = linter.fix_string(sql)
-            formatted_sql = fix_result.output_string if hasattr(fix_result, "output_string") else str(fix_result)
+            # Format the SQL (lint with fixes applied, then render the fixed file)
+            linted = linter.lint_string(sql, fix=True)
+            formatted_sql, _ = linted.fix_string()
 
             # Check if content changed
             changed = formatted_sql != sql
@@ -165,13 +177,9 @@ class SqlFormatter:
             violations: list[dict[str, str]] = []
             if lint:
                 lint_result = linter.lint_string(formatted_sql)
-                for violation in lint_result.violations if hasattr(lint_result, "violations") else []:
-                    violations.append({
-                        "rule": getattr(violation, "rule_code", "unknown"),
-                        "line": str(getattr(violation, "line_no", 0)),
-                        "column": str(getattr(violation, "line_pos", 0)),
-                        "description": getattr(violation, "description", str(violation)),
-                    })
+                violations = [
+                    _violation_to_dict(v) for v in lint_result.get_violations()
+                ]
 
             return SqlFormatResult(
                 original=sql,
@@ -218,17 +226,7 @@ class SqlFormatter:
         try:
             linter = self._get_linter()
             result = linter.lint_string(sql)
-
-            violations: list[dict[str, str]] = []
-            for violation in result.violations if hasattr(result, "violations") else []:
-                violations.append({
-                    "rule": getattr(violation, "rule_code", "unknown"),
-                    "line": str(getattr(violation, "line_no", 0)),
-                    "column": str(getattr(violation, "line_pos", 0)),
-                    "description": getattr(violation, "description", str(violation)),
-                })
-
-            return violations
+            return [_violation_to_dict(v) for v in result.get_violations()]
 
         except Exception:
             return []
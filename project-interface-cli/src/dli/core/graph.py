@@ -0,0 +1,507 @@
+"""Project dependency graph for the DLI Core Engine.
+
+This module provides the ProjectGraph class: the ``depends_on`` graph of all
+specs in a project, shared by dependency validation, lineage and execution
+planning.
+
+The graph keeps forward (spec -> dependencies) and reverse
+(dependency -> dependents) adjacency. ``ProjectGraph.for_project`` returns a
+process-wide instance per project; each call re-stats the spec files and
+reloads only the files whose mtime or size changed, so repeated queries do
+not re-parse every YAML file.
+
+All traversals are iterative and O(V + E):
+- upstream/downstream: breadth-first transitive closure with a depth limit
+- strongly_connected_components/cycles: Tarjan's algorithm
+- topological_layers: Kahn's algorithm over the SCC condensation
+
+This is LOCAL ONLY - no server interaction.
+
+Example:
+    >>> from dli.core.config import load_project
+    >>> from dli.core.graph import ProjectGraph
+    >>>
+    >>> graph = ProjectGraph.for_project(load_project(Path("/my/project")))
+    >>> graph.downstream("iceberg.raw.events", depth=2)
+    {'iceberg.analytics.daily_clicks': 1, 'iceberg.analytics.weekly_clicks': 2}
+    >>> graph.topological_layers()
+    [['iceberg.raw.events'], ['iceberg.analytics.daily_clicks'], ...]
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+import logging
+import os
+from pathlib import Path
+import threading
+from typing import TYPE_CHECKING
+
+from pydantic import ValidationError
+import yaml
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from dli.core.config import ProjectConfig
+    from dli.core.discovery import SpecDiscovery
+    from dli.core.models.spec import SpecBase
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class _SpecFile:
+    """Stat snapshot and graph contribution of one spec file."""
+
+    mtime_ns: int
+    size: int
+    name: str | None
+    depends_on: tuple[str, ...] = ()
+
+
+# Process-wide graphs keyed by project root and discovery settings
+_PROJECT_GRAPHS: dict[tuple, ProjectGraph] = {}
+_PROJECT_GRAPHS_LOCK = threading.Lock()
+
+
+class ProjectGraph:
+    """Dependency graph of the specs in a project.
+
+    Nodes are spec names. An edge ``a -> b`` means spec ``a`` declares
+    ``b`` in ``depends_on``. Dependencies that are not specs of the project
+    (external tables, missing specs) appear as targets of edges but have no
+    dependencies of their own; ``is_spec`` tells them apart.
+
+    Attributes:
+        project_config: Project the graph was built from (None for graphs
+            built from specs or mappings)
+    """
+
+    def __init__(self, project_config: ProjectConfig | None = None) -> None:
+        """Initialize an empty graph.
+
+        Args:
+            project_config: Project to track with ``refresh`` (optional)
+        """
+        self.project_config = project_config
+        self._deps: dict[str, tuple[str, ...]] = {}
+        self._dependents: dict[str, dict[str, None]] = {}
+        self._files: dict[Path, _SpecFile] = {}
+        self._owners: dict[str, Path] = {}
+        self._lock = threading.RLock()
+
+    # =========================================================================
+    # Construction
+    # =========================================================================
+
+    @classmethod
+    def from_mapping(cls, graph: Mapping[str, Iterable[str] | None]) -> ProjectGraph:
+        """Build a graph from a name -> dependencies mapping.
+
+        Args:
+            graph: Mapping of spec names to their dependencies
+
+        Returns:
+            ProjectGraph with one node per mapping key
+        """
+        instance = cls()
+        for name, depends_on in graph.items():
+            instance.set_node(name, depends_on or [])
+        return instance
+
+    @classmethod
+    def from_specs(cls, specs: Iterable[SpecBase]) -> ProjectGraph:
+        """Build a graph from loaded specs.
+
+        Args:
+            specs: Specs whose ``depends_on`` define the edges
+
+        Returns:
+            ProjectGraph with one node per spec
+        """
+        instance = cls()
+        for spec in specs:
+            instance.set_node(spec.name, spec.depends_on or [])
+        return instance
+
+    @classmethod
+    def for_project(cls, project_config: ProjectConfig) -> ProjectGraph:
+        """Return the shared, up-to-date graph for a project.
+
+        The first call loads every spec file; later calls reload only the
+        spec files that were added, removed or modified since.
+
+        Args:
+            project_config: Project configuration
+
+        Returns:
+            Process-wide ProjectGraph for the project
+        """
+        key = (
+            str(Path(project_config.root_dir).resolve()),
+            str(project_config.datasets_dir),
+            str(project_config.metrics_dir),
+            tuple(project_config.metric_patterns),
+            tuple(project_config.dataset_patterns),
+        )
+        with _PROJECT_GRAPHS_LOCK:
+            graph = _PROJECT_GRAPHS.get(key)
+            if graph is None:
+                graph = cls(project_config)
+                _PROJECT_GRAPHS[key] = graph
+        graph.refresh()
+        return graph
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all process-wide project graphs."""
+        with _PROJECT_GRAPHS_LOCK:
+            _PROJECT_GRAPHS.clear()
+
+    # =========================================================================
+    # Incremental updates
+    # =========================================================================
+
+    def set_node(self, name: str, depends_on: Iterable[str]) -> None:
+        """Add a spec node or replace its dependencies.
+
+        Args:
+            name: Spec name
+            depends_on: Names the spec depends on (duplicates are dropped)
+        """
+        new_deps = tuple(dict.fromkeys(depends_on))
+        with self._lock:
+            old_deps = self._deps.get(name, ())
+            for dep in old_deps:
+                if dep not in new_deps:
+                    self._unlink(name, dep)
+            for dep in new_deps:
+                self._dependents.setdefault(dep, {})[name] = None
+            self._deps[name] = new_deps
+
+    def remove_node(self, name: str) -> None:
+        """Remove a spec node and its outgoing edges.
+
+        Edges from other specs to ``name`` are kept; ``name`` then becomes a
+        non-spec dependency of those specs.
+
+        Args:
+            name: Spec name
+        """
+        with self._lock:
+            for dep in self._deps.pop(name, ()):
+                self._unlink(name, dep)
+
+    def _unlink(self, name: str, dep: str) -> None:
+        dependents = self._dependents.get(dep)
+        if dependents is None:
+            return
+        dependents.pop(name, None)
+        if not dependents:
+            del self._dependents[dep]
+
+    def refresh(self) -> bool:
+        """Bring the graph up to date with the spec files on disk.
+
+        Only files whose mtime or size changed are loaded. Files that fail
+        to load are skipped with a warning, like ``SpecDiscovery``.
+
+        Returns:
+            True if any node changed
+
+        Raises:
+            ValueError: If the graph was not created for a project
+        """
+        if self.project_config is None:
+            msg = "ProjectGraph.refresh requires a graph created for a project"
+            raise ValueError(msg)
+
+        from dli.core.discovery import SpecDiscovery  # noqa: PLC0415
+        from dli.core.models.base import SpecType  # noqa: PLC0415
+
+        discovery = SpecDiscovery(self.project_config)
+        paths: dict[Path, None] = {}
+        for spec_type in (SpecType.METRIC, SpecType.DATASET):
+            paths.update(dict.fromkeys(discovery.discover_spec_paths(spec_type)))
+
+        changed = False
+        with self._lock:
+            for spec_path in [p for p in self._files if p not in paths]:
+                self._forget_file(spec_path)
+                changed = True
+
+            for spec_path in paths:
+                try:
+                    stat = spec_path.stat()
+                except OSError:
+                    if spec_path in self._files:
+                        self._forget_file(spec_path)
+                        changed = True
+                    continue
+                previous = self._files.get(spec_path)
+                if (
+                    previous is not None
+                    and previous.mtime_ns == stat.st_mtime_ns
+                    and previous.size == stat.st_size
+                ):
+                    continue
+                self._load_file(discovery, spec_path, stat)
+                changed = True
+        return changed
+
+    def _load_file(
+        self, discovery: SpecDiscovery, spec_path: Path, stat: os.stat_result
+    ) -> None:
+        try:
+            spec = discovery.load_spec_file(spec_path)
+        except (OSError, ValueError, yaml.YAMLError, ValidationError) as e:
+            logger.warning("Failed to load spec %s: %s", spec_path, e)
+            self._forget_file(spec_path)
+            self._files[spec_path] = _SpecFile(stat.st_mtime_ns, stat.st_size, None)
+            return
+
+        previous = self._files.get(spec_path)
+        if previous is not None and previous.name not in (None, spec.name):
+            self._forget_file(spec_path)
+
+        owner = self._owners.get(spec.name)
+        if owner is not None and owner != spec_path:
+            logger.warning(
+                "Duplicate spec name %s in %s (already defined in %s)",
+                spec.name,
+                spec_path,
+                owner,
+            )
+        else:
+            self._owners[spec.name] = spec_path
+            self.set_node(spec.name, spec.depends_on or [])
+        self._files[spec_path] = _SpecFile(
+            stat.st_mtime_ns, stat.st_size, spec.name, tuple(spec.depends_on or [])
+        )
+
+    def _forget_file(self, spec_path: Path) -> None:
+        entry = self._files.pop(spec_path, None)
+        if (
+            entry is None
+            or entry.name is None
+            or self._owners.get(entry.name) != spec_path
+        ):
+            return
+        del self._owners[entry.name]
+        self.remove_node(entry.name)
+        # A duplicate definition of the same name takes over
+        for other_path, other in self._files.items():
+            if other.name == entry.name:
+                self._owners[entry.name] = other_path
+                self.set_node(entry.name, other.depends_on)
+                break
+
+    # =========================================================================
+    # Adjacency
+    # =========================================================================
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._deps or name in self._dependents
+
+    def __len__(self) -> int:
+        return len(self._deps)
+
+    @property
+    def nodes(self) -> list[str]:
+        """Spec names in insertion order."""
+        return list(self._deps)
+
+    def is_spec(self, name: str) -> bool:
+        """Check whether ``name`` is a spec of the project."""
+        return name in self._deps
+
+    def dependencies(self, name: str) -> list[str]:
+        """Direct dependencies of a spec, in declaration order."""
+        return list(self._deps.get(name, ()))
+
+    def dependents(self, name: str) -> list[str]:
+        """Specs that directly depend on ``name``."""
+        return list(self._dependents.get(name, ()))
+
+    def to_dict(self) -> dict[str, list[str]]:
+        """Return the forward adjacency as a plain mapping."""
+        return {name: list(deps) for name, deps in self._deps.items()}
+
+    # =========================================================================
+    # Traversals
+    # =========================================================================
+
+    def upstream(self, name: str, depth: int | None = None) -> dict[str, int]:
+        """Transitive dependencies of ``name``.
+
+        Args:
+            name: Start node
+            depth: Maximum number of hops (None for unlimited)
+
+        Returns:
+            Mapping of reachable names to their hop distance (start excluded)
+        """
+        return self._closure(name, self._deps, depth)
+
+    def downstream(self, name: str, depth: int | None = None) -> dict[str, int]:
+        """Transitive dependents of ``name``.
+
+        Args:
+            name: Start node
+            depth: Maximum number of hops (None for unlimited)
+
+        Returns:
+            Mapping of reachable names to their hop distance (start excluded)
+        """
+        return self._closure(name, self._dependents, depth)
+
+    @staticmethod
+    def _closure(
+        name: str,
+        adjacency: Mapping[str, Iterable[str]],
+        depth: int | None,
+    ) -> dict[str, int]:
+        distances: dict[str, int] = {name: 0}
+        queue = deque([name])
+        while queue:
+            node = queue.popleft()
+            distance = distances[node]
+            if depth is not None and distance >= depth:
+                continue
+            for neighbor in adjacency.get(node, ()):
+                if neighbor not in distances:
+                    distances[neighbor] = distance + 1
+                    queue.append(neighbor)
+        del distances[name]
+        return distances
+
+    def strongly_connected_components(self) -> list[list[str]]:
+        """Return the strongly connected components of the spec graph.
+
+        Uses an iterative Tarjan's algorithm, so arbitrarily deep chains do
+        not hit the recursion limit. Components are returned in reverse
+        topological order (dependencies before dependents); nodes in each
+        component are sorted. Dependencies that are not specs are skipped.
+
+        Returns:
+            List of components
+        """
+        index_of: dict[str, int] = {}
+        lowlink: dict[str, int] = {}
+        on_stack: set[str] = set()
+        stack: list[str] = []
+        components: list[list[str]] = []
+        counter = 0
+
+        for root in self._deps:
+            if root in index_of:
+                continue
+            work: list[tuple[str, int]] = [(root, 0)]
+            index_of[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+
+            while work:
+                node, position = work[-1]
+                deps = self._deps.get(node, ())
+                if position < len(deps):
+                    work[-1] = (node, position + 1)
+                    neighbor = deps[position]
+                    if neighbor not in self._deps:
+                        continue
+                    if neighbor not in index_of:
+                        index_of[neighbor] = lowlink[neighbor] = counter
+                        counter += 1
+                        stack.append(neighbor)
+                        on_stack.add(neighbor)
+                        work.append((neighbor, 0))
+                    elif neighbor in on_stack:
+                        lowlink[node] = min(lowlink[node], index_of[neighbor])
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index_of[node]:
+                    component: list[str] = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(sorted(component))
+
+        return components
+
+    def cycles(self) -> list[list[str]]:
+        """Return one dependency cycle per cyclic component.
+
+        Each cycle is a closed path that starts and ends with the same spec,
+        for example ``["a", "b", "a"]``; a self-dependency is ``["a", "a"]``.
+
+        Returns:
+            List of cycles, ordered like ``strongly_connected_components``
+        """
+        cycles: list[list[str]] = []
+        for component in self.strongly_connected_components():
+            start = component[0]
+            if len(component) == 1 and start not in self._deps.get(start, ()):
+                continue
+            members = set(component)
+            path: list[str] = []
+            position: dict[str, int] = {}
+            node = start
+            # Follow edges inside the component until a node repeats
+            while node not in position:
+                position[node] = len(path)
+                path.append(node)
+                node = min(dep for dep in self._deps[node] if dep in members)
+            cycles.append([*path[position[node] :], node])
+        return cycles
+
+    def topological_layers(self) -> list[list[str]]:
+        """Group specs into layers that can be processed in order.
+
+        Every spec appears in a later layer than all specs it depends on.
+        Specs in the same cycle share a layer, so the result is defined for
+        any graph; use ``cycles`` to reject cyclic projects. Dependencies
+        that are not specs of the project are ignored.
+
+        Returns:
+            Layers of sorted spec names, dependencies first
+        """
+        components = self.strongly_connected_components()
+        component_of = {
+            name: idx for idx, component in enumerate(components) for name in component
+        }
+        indegree = [0] * len(components)
+        successors: list[set[int]] = [set() for _ in components]
+        for name, deps in self._deps.items():
+            target = component_of[name]
+            for dep in deps:
+                source = component_of.get(dep)
+                if source is None or source == target or target in successors[source]:
+                    continue
+                successors[source].add(target)
+                indegree[target] += 1
+
+        layers: list[list[str]] = []
+        current = [idx for idx, degree in enumerate(indegree) if degree == 0]
+        while current:
+            layers.append(sorted(name for idx in current for name in components[idx]))
+            following: list[int] = []
+            for idx in current:
+                for successor in successors[idx]:
+                    indegree[successor] -= 1
+                    if indegree[successor] == 0:
+                        following.append(successor)
+            current = following
+        return layers
+
+
+__all__ = ["ProjectGraph"]
@@ -14,12 +14,19 @@ Example:
 
 from __future__ import annotations
 
-from typing import Any
+from contextlib import contextmanager
+import os
+import threading
+from typing import TYPE_CHECKING, Any
 
 import httpx
 
+from dli.core.spans import span
 from dli.core.trace import TraceContext
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 __all__ = ["TracedHttpClient"]
 
 
@@ -27,37 +34,85 @@ class TracedHttpClient:
     """HTTP client that automatically adds trace headers.
 
     Responsibilities:
-    - Low-level HTTP transport (GET, POST, PUT, DELETE)
+    - Low-level HTTP transport (GET, POST, PUT, DELETE, streamed responses)
     - Automatic X-Trace-Id header injection from current trace context
     - User-Agent header with CLI metadata
+    - An "http.request" span per request when profiling is enabled
 
     Note:
         BasecampClient uses this for actual API calls when not in mock mode.
-        Each request creates a new httpx.Client to ensure proper connection handling.
+        By default each request creates a new httpx.Client. With
+        ``pooled=True`` one httpx.Client (and its keep-alive connection pool)
+        is reused across requests until ``close()`` is called; shared
+        clients from the client registry use this mode. A pooled client
+        used in a forked child opens its own connections instead of
+        sharing the parent's sockets.
 
     Attributes:
         base_url: Base URL for all requests.
         timeout: Request timeout in seconds.
+        pooled: Whether connections are reused across requests.
 
     Example:
         >>> client = TracedHttpClient("https://basecamp.example.com", timeout=30)
         >>> response = client.get("/api/v1/health")
     """
 
-    def __init__(self, base_url: str, timeout: int = 30) -> None:
+    def __init__(
+        self, base_url: str, timeout: int = 30, *, pooled: bool = False
+    ) -> None:
         """Initialize the traced HTTP client.
 
         Args:
             base_url: Base URL for all requests (e.g., "https://api.example.com").
             timeout: Request timeout in seconds. Defaults to 30.
+            pooled: Reuse one httpx.Client across requests. Defaults to False.
         """
         self.base_url = base_url
         self.timeout = timeout
+        self.pooled = pooled
+        self._client: httpx.Client | None = None
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
 
     def __repr__(self) -> str:
         """Return representation for debugging."""
         return f"TracedHttpClient(base_url={self.base_url!r})"
 
+    @contextmanager
+    def _http_client(self) -> Iterator[httpx.Client]:
+        """Yield the httpx.Client for one request.
+
+        Pooled clients share one long-lived httpx.Client; otherwise a new
+        client is created and closed around the request.
+        """
+        if not self.pooled:
+            with httpx.Client(base_url=self.base_url, timeout=self.timeout) as client:
+                yield client
+            return
+
+        if self._pid != os.getpid():
+            # Forked child: abandon the parent's connections without
+            # closing them (that would shut down the parent's TLS sessions)
+            self._lock = threading.Lock()
+            self._client = None
+            self._pid = os.getpid()
+
+        with self._lock:
+            if self._client is None or self._client.is_closed:
+                self._client = httpx.Client(
+                    base_url=self.base_url, timeout=self.timeout
+                )
+            client = self._client
+        yield client
+
+    def close(self) -> None:
+        """Close pooled connections (no-op for unpooled clients)."""
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
     def _get_headers(self) -> dict[str, str]:
         """Get headers including trace ID if available.
 
@@ -82,8 +137,11 @@ class TracedHttpClient:
             httpx.Response object.
         """
         headers = {**self._get_headers(), **kwargs.pop("headers", {})}
-        with httpx.Client(base_url=self.base_url, timeout=self.timeout) as client:
-            return client.get(path, headers=headers, **kwargs)
+        with span("http.request", method="GET", path=path) as current:
+            with self._http_client() as client:
+                response = client.get(path, headers=headers, **kwargs)
+            current.set_attribute("status_code", response.status_code)
+            return response
 
     def post(self, path: str, **kwargs: Any) -> httpx.Response:
         """Make POST request with trace headers.
@@ -96,8 +154,11 @@ class TracedHttpClient:
             httpx.Response object.
         """
         headers = {**self._get_headers(), **kwargs.pop("headers", {})}
-        with httpx.Client(base_url=self.base_url, timeout=self.timeout) as client:
-            return client.post(path, headers=headers, **kwargs)
+        with span("http.request", method="POST", path=path) as current:
+            with self._http_client() as client:
+                response = client.post(path, headers=headers, **kwargs)
+            current.set_attribute("status_code", response.status_code)
+            return response
 
     def put(self, path: str, **kwargs: Any) -> httpx.Response:
         """Make PUT request with trace headers.
@@ -110,8 +171,11 @@ class TracedHttpClient:
             httpx.Response object.
         """
         headers = {**self._get_headers(), **kwargs.pop("headers", {})}
-        with httpx.Client(base_url=self.base_url, timeout=self.timeout) as client:
-            return client.put(path, headers=headers, **kwargs)
+        with span("http.request", method="PUT", path=path) as current:
+            with self._http_client() as client:
+                response = client.put(path, headers=headers, **kwargs)
+            current.set_attribute("status_code", response.status_code)
+            return response
 
     def delete(self, path: str, **kwargs: Any) -> httpx.Response:
         """Make DELETE request with trace headers.
@@ -124,5 +188,33 @@ class TracedHttpClient:
             httpx.Response object.
         """
         headers = {**self._get_headers(), **kwargs.pop("headers", {})}
-        with httpx.Client(base_url=self.base_url, timeout=self.timeout) as client:
-            return client.delete(path, headers=headers, **kwargs)
+        with span("http.request", method="DELETE", path=path) as current:
+            with self._http_client() as client:
+                response = client.delete(path, headers=headers, **kwargs)
+            current.set_attribute("status_code", response.status_code)
+            return response
+
+    @contextmanager
+    def stream(self, method: str, path: str, **kwargs: Any) -> Iterator[httpx.Response]:
+        """Make a request whose response body is read incrementally.
+
+        The body is not loaded into memory; iterate it with
+        ``response.iter_lines()`` or ``response.iter_bytes()`` inside the
+        ``with`` block. The connection is closed when the block exits.
+
+        Args:
+            method: HTTP method (e.g., "GET").
+            path: URL path relative to base_url.
+            **kwargs: Additional arguments passed to httpx.Client.stream().
+
+        Yields:
+            httpx.Response object with an unread body.
+        """
+        headers = {**self._get_headers(), **kwargs.pop("headers", {})}
+        with (
+            span("http.request", method=method, path=path, stream=True) as current,
+            self._http_client() as client,
+            client.stream(method, path, headers=headers, **kwargs) as response,
+        ):
+            current.set_attribute("status_code", response.status_code)
+            yield response
@@ -5,13 +5,15 @@ table-level dependencies between datasets.
 
 Key Features:
 - Server-based lineage lookup (registered datasets only)
+- Local table- and column-level lineage from spec SQL (see
+  ``dli.core.lineage.local``), usable before anything is registered
 - Upstream analysis (what this resource depends on)
 - Downstream analysis (what depends on this resource)
 - Configurable traversal depth
 
 Note:
-    This implementation is SERVER-BASED ONLY. It queries registered
-    datasets from the server and does not perform local SQLGlot processing.
+    ``LineageClient`` queries registered datasets from the server.
+    ``LocalLineageIndex`` parses project specs with SQLGlot instead.
 """
 
 from __future__ import annotations
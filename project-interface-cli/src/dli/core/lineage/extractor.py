@@ -0,0 +1,328 @@
+"""SQL lineage extraction for the local lineage index.
+
+This module parses rendered spec SQL once with SQLGlot and extracts:
+- Table-level edges: every physical table read by the statement(s)
+- Column-level edges: for each output column of the target, the physical
+  source columns it is computed from (resolved through CTEs, derived
+  tables and set operations)
+
+The target of a statement is the INSERT/CREATE/MERGE table when present;
+plain SELECT statements (metrics, datasets without DML) use the spec name.
+
+Example:
+    >>> lineage = extract_sql_lineage(
+    ...     "INSERT INTO a.b.t SELECT id, amount * 2 AS doubled FROM a.b.s",
+    ...     dialect="trino",
+    ...     default_target="a.b.t",
+    ... )
+    >>> lineage.tables
+    ['a.b.s']
+    >>> lineage.columns
+    [ColumnEdge(source='a.b.s.amount', target='a.b.t.doubled'), ...]
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+import sqlglot
+from sqlglot import exp
+from sqlglot.errors import ParseError
+from sqlglot.optimizer.scope import Scope, build_scope, traverse_scope
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# Marker column for "all columns" of a source (SELECT * over a physical table)
+STAR = "*"
+
+
+@dataclass(frozen=True)
+class ColumnEdge:
+    """A column-level dependency.
+
+    Attributes:
+        source: Fully qualified source column (catalog.schema.table.column)
+        target: Fully qualified target column (catalog.schema.table.column)
+    """
+
+    source: str
+    target: str
+
+
+@dataclass
+class SqlLineage:
+    """Lineage extracted from the SQL of one spec.
+
+    Attributes:
+        target: Fully qualified name of the table written (or the spec name)
+        tables: Physical tables read, in first-seen order
+        columns: Column-level edges into ``target``
+        errors: Parse or resolution problems (lineage may be partial)
+    """
+
+    target: str
+    tables: list[str] = field(default_factory=list)
+    columns: list[ColumnEdge] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+
+
+def table_name(table: exp.Table) -> str:
+    """Return the dotted catalog.schema.name of a table expression."""
+    return ".".join(part for part in (table.catalog, table.db, table.name) if part)
+
+
+class _ScopeResolver:
+    """Resolve output columns of SQLGlot scopes to physical source columns.
+
+    Each scope is resolved at most once, so CTEs referenced many times do
+    not multiply the work.
+    """
+
+    def __init__(self) -> None:
+        self._outputs: dict[int, list[tuple[str, set[tuple[str, str]]]]] = {}
+
+    def outputs(self, scope: Scope) -> list[tuple[str, set[tuple[str, str]]]]:
+        """Return (output name, source columns) for each projection of a scope."""
+        key = id(scope)
+        cached = self._outputs.get(key)
+        if cached is not None:
+            return cached
+
+        # Guard against recursive CTEs referencing themselves
+        self._outputs[key] = []
+        if isinstance(scope.expression, exp.SetOperation):
+            result = self._set_operation_outputs(scope)
+        elif isinstance(scope.expression, exp.Select):
+            result = self._select_outputs(scope)
+        else:
+            result = []
+        self._outputs[key] = result
+        return result
+
+    def _set_operation_outputs(
+        self, scope: Scope
+    ) -> list[tuple[str, set[tuple[str, str]]]]:
+        # UNION/INTERSECT/EXCEPT: names from the first branch, sources by position.
+        # sqlglot renamed union_scopes to set_operation_scopes after 28.5
+        branch_scopes = getattr(scope, "set_operation_scopes", None)
+        if branch_scopes is None:
+            branch_scopes = scope.union_scopes
+        branches = [self.outputs(branch) for branch in branch_scopes]
+        if not branches or not branches[0]:
+            return []
+        merged = [(name, set(refs)) for name, refs in branches[0]]
+        for branch in branches[1:]:
+            for position, (_, refs) in enumerate(branch[: len(merged)]):
+                merged[position][1].update(refs)
+        return merged
+
+    def _select_outputs(self, scope: Scope) -> list[tuple[str, set[tuple[str, str]]]]:
+        select = scope.expression
+        result: list[tuple[str, set[tuple[str, str]]]] = []
+        for projection in select.expressions:
+            if isinstance(projection, exp.Star):
+                result.extend(self._expand_star(scope, None))
+                continue
+            if isinstance(projection, exp.Column) and isinstance(
+                projection.this, exp.Star
+            ):
+                result.extend(self._expand_star(scope, projection.table))
+                continue
+
+            refs: set[tuple[str, str]] = set()
+            for column in projection.find_all(exp.Column):
+                # Columns of nested subqueries belong to their own scope
+                if column.find_ancestor(exp.Select) is not select:
+                    continue
+                refs.update(self._resolve_column(scope, column))
+            # Scalar subqueries in the projection contribute their outputs
+            if scope.subquery_scopes:
+                nodes = {id(node) for node in projection.walk()}
+                for subquery_scope in scope.subquery_scopes:
+                    if id(subquery_scope.expression) in nodes:
+                        for _, sub_refs in self.outputs(subquery_scope):
+                            refs.update(sub_refs)
+            result.append((projection.alias_or_name, refs))
+        return result
+
+    def _expand_star(
+        self, scope: Scope, alias: str | None
+    ) -> list[tuple[str, set[tuple[str, str]]]]:
+        sources = (
+            {alias: scope.sources[alias]}
+            if alias and alias in scope.sources
+            else scope.sources
+        )
+        result: list[tuple[str, set[tuple[str, str]]]] = []
+        for source in sources.values():
+            if isinstance(source, exp.Table):
+                result.append((STAR, {(table_name(source), STAR)}))
+            elif isinstance(source, Scope):
+                result.extend(self.outputs(source))
+        return result
+
+    def _resolve_column(self, scope: Scope, column: exp.Column) -> set[tuple[str, str]]:
+        name = column.name
+        if column.table:
+            source = scope.sources.get(column.table)
+            return self._from_source(source, name) if source is not None else set()
+
+        if len(scope.sources) == 1:
+            (source,) = scope.sources.values()
+            return self._from_source(source, name)
+
+        # Unqualified column with several sources: prefer derived tables that
+        # expose it; without a schema, physical tables are all candidates
+        refs: set[tuple[str, str]] = set()
+        for source in scope.sources.values():
+            if isinstance(source, Scope):
+                refs.update(self._from_source(source, name))
+        if refs:
+            return refs
+        return {
+            (table_name(source), name)
+            for source in scope.sources.values()
+            if isinstance(source, exp.Table)
+        }
+
+    def _from_source(
+        self, source: exp.Table | Scope, name: str
+    ) -> set[tuple[str, str]]:
+        if isinstance(source, exp.Table):
+            return {(table_name(source), name)}
+        if not isinstance(source, Scope):
+            return set()
+        refs: set[tuple[str, str]] = set()
+        for output_name, output_refs in self.outputs(source):
+            if output_name == name:
+                refs.update(output_refs)
+            elif output_name == STAR:
+                refs.update(
+                    (table, name if column == STAR else column)
+                    for table, column in output_refs
+                )
+        return refs
+
+
+def _statement_target(statement: exp.Expression) -> tuple[exp.Table | None, list[str]]:
+    """Return the written table and explicit column list of a statement."""
+    target = None
+    if isinstance(statement, (exp.Insert, exp.Create, exp.Merge)):
+        target = statement.this
+    if isinstance(target, exp.Schema):
+        columns = [
+            c.name
+            for c in target.expressions
+            if isinstance(c, (exp.Identifier, exp.ColumnDef, exp.Column))
+        ]
+        return (target.this if isinstance(target.this, exp.Table) else None), columns
+    if isinstance(target, exp.Table):
+        return target, []
+    return None, []
+
+
+def _statement_query(statement: exp.Expression) -> exp.Query | None:
+    if isinstance(statement, exp.Query):
+        return statement
+    if isinstance(statement, (exp.Insert, exp.Create)):
+        query = statement.expression
+        if isinstance(query, exp.Query):
+            return query
+    return None
+
+
+def _physical_tables(
+    statement: exp.Expression, query: exp.Query | None
+) -> Iterable[exp.Table]:
+    if query is not None:
+        for scope in traverse_scope(query):
+            for source in scope.sources.values():
+                if isinstance(source, exp.Table):
+                    yield source
+        return
+    # MERGE / UPDATE / DELETE: no scope tree, take every table except CTEs
+    cte_names = {cte.alias_or_name for cte in statement.find_all(exp.CTE)}
+    for table in statement.find_all(exp.Table):
+        if table.name not in cte_names or table.db:
+            yield table
+
+
+def extract_sql_lineage(
+    sql: str,
+    *,
+    dialect: str,
+    default_target: str,
+) -> SqlLineage:
+    """Extract table- and column-level lineage from rendered SQL.
+
+    Args:
+        sql: Rendered SQL (one or more statements)
+        dialect: SQLGlot dialect name
+        default_target: Target name for statements that write no table
+
+    Returns:
+        SqlLineage with tables read and column edges into the target
+    """
+    lineage = SqlLineage(target=default_target)
+    try:
+        statements = sqlglot.parse(sql, read=dialect)
+    except ParseError as e:
+        lineage.errors.append(f"SQL parse error: {e}")
+        return lineage
+
+    seen_tables: dict[str, None] = {}
+    seen_columns: dict[ColumnEdge, None] = {}
+    resolver = _ScopeResolver()
+
+    for statement in statements:
+        if statement is None:
+            continue
+        target_table, target_columns = _statement_target(statement)
+        target = (
+            table_name(target_table) if target_table is not None else default_target
+        )
+        if target_table is not None:
+            lineage.target = target
+        query = _statement_query(statement)
+
+        for table in _physical_tables(statement, query):
+            name = table_name(table)
+            if name and name != target:
+                seen_tables.setdefault(name, None)
+
+        if query is None:
+            continue
+        try:
+            root = build_scope(query)
+        except Exception as e:  # SQLGlot raises bare exceptions on odd scopes
+            lineage.errors.append(f"Column lineage unavailable: {e}")
+            continue
+        if root is None:
+            continue
+
+        for position, (output, refs) in enumerate(resolver.outputs(root)):
+            name = (
+                target_columns[position]
+                if target_columns and position < len(target_columns)
+                else output
+            )
+            if not name:
+                continue
+            for table, column in sorted(refs):
+                edge = ColumnEdge(source=f"{table}.{column}", target=f"{target}.{name}")
+                seen_columns.setdefault(edge, None)
+
+    lineage.tables = list(seen_tables)
+    lineage.columns = list(seen_columns)
+    return lineage
+
+
+__all__ = [
+    "STAR",
+    "ColumnEdge",
+    "SqlLineage",
+    "extract_sql_lineage",
+    "table_name",
+]
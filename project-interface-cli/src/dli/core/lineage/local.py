@@ -0,0 +1,714 @@
+"""Local lineage index built from project spec SQL.
+
+Unlike ``LineageClient``, which asks the Basecamp server about registered
+datasets, this module derives lineage from the specs in a project, so it
+works in CI before anything is registered.
+
+Building:
+- Each spec's SQL is rendered and parsed once with SQLGlot
+  (see ``dli.core.lineage.extractor``) for table- and column-level edges
+- Per-spec results are stored in SQLite (``.dli/cache/lineage.db``) with
+  the spec and SQL file hashes, so rebuilds only re-parse changed specs
+
+Querying:
+- Edges are packed into CSR adjacency arrays (offsets + targets, forward
+  and reverse) and stored as BLOBs in the same database
+- Upstream/downstream traversals at any depth are breadth-first walks over
+  those arrays and return the regular ``LineageResult`` types
+
+Example:
+    >>> index = LocalLineageIndex(project_path, dialect="trino")
+    >>> index.build()
+    >>> result = index.get_lineage("iceberg.analytics.daily_clicks", "upstream")
+    >>> columns = index.get_column_lineage("iceberg.analytics.daily_clicks.user_id")
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+import hashlib
+import json
+import logging
+from pathlib import Path
+import sqlite3
+import time
+from typing import TYPE_CHECKING, Any
+
+from dli.core.lineage import (
+    LineageDirection,
+    LineageDirectionType,
+    LineageEdge,
+    LineageNode,
+    LineageResult,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping
+
+    from dli.core.discovery import SpecDiscovery
+    from dli.core.models import SpecBase
+
+logger = logging.getLogger(__name__)
+
+# Default index location relative to the project directory
+DEFAULT_CACHE_DIR = Path(".dli") / "cache"
+INDEX_FILENAME = "lineage.db"
+
+# Bump when the stored layout or extraction logic changes
+_INDEX_FORMAT = 1
+
+# Graph levels stored in the index
+TABLE_LEVEL = 0
+COLUMN_LEVEL = 1
+_LEVELS = (TABLE_LEVEL, COLUMN_LEVEL)
+
+# CSR array element type (32-bit signed)
+_ARRAY_TYPECODE = "i"
+
+# Placeholder for template variables without a value; lineage does not
+# depend on literal values, only on the SQL structure
+_PLACEHOLDER_VALUE = "0"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS specs (
+    path TEXT PRIMARY KEY,
+    content_hash TEXT NOT NULL,
+    deps TEXT NOT NULL,
+    name TEXT NOT NULL,
+    type TEXT NOT NULL,
+    owner TEXT,
+    team TEXT,
+    description TEXT,
+    tags TEXT NOT NULL,
+    tables TEXT NOT NULL,
+    columns TEXT NOT NULL,
+    errors TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS graph (
+    level INTEGER PRIMARY KEY,
+    names TEXT NOT NULL,
+    offsets BLOB NOT NULL,
+    targets BLOB NOT NULL,
+    rev_offsets BLOB NOT NULL,
+    rev_targets BLOB NOT NULL
+);
+"""
+
+
+@dataclass
+class LineageBuildStats:
+    """Statistics of a local lineage index build.
+
+    Attributes:
+        specs: Number of specs in the project
+        parsed: Specs whose SQL was (re-)parsed
+        reused: Specs reused from the index unchanged
+        removed: Specs dropped because their files no longer exist
+        table_edges: Table-level edges in the index
+        column_edges: Column-level edges in the index
+        duration_ms: Build time in milliseconds
+        errors: Spec path -> problems found while extracting lineage
+    """
+
+    specs: int = 0
+    parsed: int = 0
+    reused: int = 0
+    removed: int = 0
+    table_edges: int = 0
+    column_edges: int = 0
+    duration_ms: float = 0.0
+    errors: dict[str, list[str]] = field(default_factory=dict)
+
+
+class AdjacencyGraph:
+    """Directed graph in compressed sparse row (CSR) form.
+
+    Node ``i`` has forward neighbours ``targets[offsets[i]:offsets[i + 1]]``
+    and reverse neighbours ``rev_targets[rev_offsets[i]:rev_offsets[i + 1]]``.
+
+    Attributes:
+        names: Node names indexed by node id
+    """
+
+    def __init__(
+        self,
+        names: list[str],
+        offsets: array,
+        targets: array,
+        rev_offsets: array,
+        rev_targets: array,
+    ) -> None:
+        """Initialize from prebuilt CSR arrays.
+
+        Args:
+            names: Node names indexed by node id
+            offsets: Forward row offsets (len(names) + 1 entries)
+            targets: Forward neighbour ids
+            rev_offsets: Reverse row offsets (len(names) + 1 entries)
+            rev_targets: Reverse neighbour ids
+        """
+        self.names = names
+        self._ids = {name: i for i, name in enumerate(names)}
+        self._offsets = offsets
+        self._targets = targets
+        self._rev_offsets = rev_offsets
+        self._rev_targets = rev_targets
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[tuple[str, str]]) -> AdjacencyGraph:
+        """Build CSR arrays from (source, target) name pairs.
+
+        Args:
+            edges: Directed edges; duplicates are dropped
+
+        Returns:
+            AdjacencyGraph over every node that appears in an edge
+        """
+        ids: dict[str, int] = {}
+        pairs: set[tuple[int, int]] = set()
+        for source, target in edges:
+            s = ids.setdefault(source, len(ids))
+            t = ids.setdefault(target, len(ids))
+            if s != t:
+                pairs.add((s, t))
+
+        names = list(ids)
+        offsets, targets = _csr(len(names), sorted(pairs))
+        rev_offsets, rev_targets = _csr(len(names), sorted((t, s) for s, t in pairs))
+        return cls(names, offsets, targets, rev_offsets, rev_targets)
+
+    @property
+    def edge_count(self) -> int:
+        """Number of edges in the graph."""
+        return len(self._targets)
+
+    def __contains__(self, name: object) -> bool:
+        """Check whether a node name is in the graph."""
+        return name in self._ids
+
+    def traverse(
+        self, name: str, *, reverse: bool, depth: int = -1
+    ) -> tuple[dict[int, int], list[tuple[int, int]]]:
+        """Breadth-first walk from a node.
+
+        Args:
+            name: Start node name
+            reverse: Follow reverse edges (upstream) instead of forward edges
+            depth: Maximum distance (-1 for unlimited)
+
+        Returns:
+            (node id -> distance for reached nodes excluding the start,
+            traversed edges as (source id, target id) in forward orientation)
+        """
+        start = self._ids.get(name)
+        if start is None:
+            return {}, []
+
+        offsets, targets = (
+            (self._rev_offsets, self._rev_targets)
+            if reverse
+            else (self._offsets, self._targets)
+        )
+        distances = {start: 0}
+        edges: list[tuple[int, int]] = []
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            distance = distances[node]
+            if 0 <= depth <= distance:
+                continue
+            for i in range(offsets[node], offsets[node + 1]):
+                neighbour = targets[i]
+                edges.append((neighbour, node) if reverse else (node, neighbour))
+                if neighbour not in distances:
+                    distances[neighbour] = distance + 1
+                    queue.append(neighbour)
+        del distances[start]
+        return distances, edges
+
+    def to_row(self) -> tuple[str, bytes, bytes, bytes, bytes]:
+        """Serialize to (names JSON, offsets, targets, rev_offsets, rev_targets)."""
+        return (
+            json.dumps(self.names),
+            self._offsets.tobytes(),
+            self._targets.tobytes(),
+            self._rev_offsets.tobytes(),
+            self._rev_targets.tobytes(),
+        )
+
+    @classmethod
+    def from_row(cls, row: tuple[str, bytes, bytes, bytes, bytes]) -> AdjacencyGraph:
+        """Deserialize from the tuple produced by ``to_row``."""
+        names_json, *blobs = row
+        arrays = []
+        for blob in blobs:
+            values = array(_ARRAY_TYPECODE)
+            values.frombytes(blob)
+            arrays.append(values)
+        return cls(json.loads(names_json), *arrays)
+
+
+def _csr(node_count: int, sorted_pairs: list[tuple[int, int]]) -> tuple[array, array]:
+    offsets = array(_ARRAY_TYPECODE, [0]) * (node_count + 1)
+    targets = array(_ARRAY_TYPECODE, (t for _, t in sorted_pairs))
+    for s, _ in sorted_pairs:
+        offsets[s + 1] += 1
+    for i in range(node_count):
+        offsets[i + 1] += offsets[i]
+    return offsets, targets
+
+
+def _hash_file(path: Path) -> str:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return "missing"
+
+
+def render_spec_sql(
+    sql: str, spec: SpecBase, variables: Mapping[str, Any] | None
+) -> str:
+    """Render spec SQL for lineage extraction.
+
+    Parameters use explicit variables, then spec parameter defaults. Any
+    other undefined template variable is replaced with a placeholder, since
+    only the SQL structure matters for lineage.
+
+    Args:
+        sql: SQL template
+        spec: Spec the SQL belongs to
+        variables: Explicit variable values
+
+    Returns:
+        Rendered SQL
+    """
+    from jinja2 import meta  # noqa: PLC0415
+
+    from dli.core.templates import (  # noqa: PLC0415
+        SafeJinjaEnvironment,
+        SafeTemplateRenderer,
+        TemplateContext,
+    )
+
+    params: dict[str, Any] = {
+        p.name: p.default for p in spec.parameters if p.default is not None
+    }
+    params.update(variables or {})
+
+    env = SafeJinjaEnvironment.create_environment()
+    builtins = TemplateContext().to_dict().keys()
+    for name in meta.find_undeclared_variables(env.parse(sql)):
+        if name not in builtins and name not in params:
+            params[name] = _PLACEHOLDER_VALUE
+
+    return SafeTemplateRenderer().render(sql, extra_params=params)
+
+
+class LocalLineageIndex:
+    """Project lineage index derived from spec SQL.
+
+    Attributes:
+        project_path: Project root (contains dli.yaml)
+        dialect: SQLGlot dialect used to parse spec SQL
+        variables: Template variables used when rendering spec SQL
+        cache_dir: Directory holding the index database
+    """
+
+    def __init__(
+        self,
+        project_path: Path,
+        *,
+        dialect: str = "trino",
+        variables: Mapping[str, Any] | None = None,
+        cache_dir: Path | None = None,
+    ) -> None:
+        """Initialize the index (nothing is read until first use).
+
+        Args:
+            project_path: Project root (contains dli.yaml)
+            dialect: SQLGlot dialect used to parse spec SQL
+            variables: Template variables used when rendering spec SQL
+            cache_dir: Index directory (default: <project>/.dli/cache)
+        """
+        self.project_path = project_path
+        self.dialect = dialect
+        self.variables = dict(variables or {})
+        self.cache_dir = cache_dir or project_path / DEFAULT_CACHE_DIR
+        self._graphs: dict[int, AdjacencyGraph] = {}
+        self._nodes: dict[str, LineageNode] | None = None
+
+    @property
+    def index_file(self) -> Path:
+        """Path to the SQLite index file."""
+        return self.cache_dir / INDEX_FILENAME
+
+    # =========================================================================
+    # Build
+    # =========================================================================
+
+    def build(self) -> LineageBuildStats:
+        """Bring the index up to date with the project's specs.
+
+        Only specs whose YAML or SQL file changed since the last build are
+        re-parsed. Changing the dialect or variables re-parses everything.
+
+        Returns:
+            LineageBuildStats describing the work done
+        """
+        from dli.core.config import load_project  # noqa: PLC0415
+        from dli.core.discovery import SpecDiscovery  # noqa: PLC0415
+        from dli.core.models import SpecType  # noqa: PLC0415
+
+        start = time.perf_counter()
+        stats = LineageBuildStats()
+        discovery = SpecDiscovery(load_project(self.project_path))
+
+        paths: dict[str, Path] = {}
+        for spec_type in (SpecType.METRIC, SpecType.DATASET):
+            for spec_path in discovery.discover_spec_paths(spec_type):
+                paths.setdefault(str(spec_path.resolve()), spec_path)
+        stats.specs = len(paths)
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            self._reset_if_settings_changed(conn)
+            stored = {
+                row[0]: (row[1], json.loads(row[2]))
+                for row in conn.execute("SELECT path, content_hash, deps FROM specs")
+            }
+
+            removed = [p for p in stored if p not in paths]
+            conn.executemany(
+                "DELETE FROM specs WHERE path = ?", [(p,) for p in removed]
+            )
+            stats.removed = len(removed)
+
+            for key, spec_path in paths.items():
+                content_hash = _hash_file(spec_path)
+                previous = stored.get(key)
+                if (
+                    previous is not None
+                    and previous[0] == content_hash
+                    and all(_hash_file(Path(d)) == h for d, h in previous[1].items())
+                ):
+                    stats.reused += 1
+                    continue
+                row = self._extract_spec(discovery, spec_path, content_hash)
+                conn.execute(
+                    "INSERT OR REPLACE INTO specs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (key, *row),
+                )
+                stats.parsed += 1
+
+            if stats.parsed or stats.removed or not self._has_graphs(conn):
+                self._rebuild_graphs(conn)
+
+            for path, errors in conn.execute(
+                "SELECT path, errors FROM specs WHERE errors != '[]'"
+            ):
+                stats.errors[path] = json.loads(errors)
+
+        self._graphs.clear()
+        self._nodes = None
+        table_graph = self._graph(TABLE_LEVEL)
+        column_graph = self._graph(COLUMN_LEVEL)
+        stats.table_edges = table_graph.edge_count
+        stats.column_edges = column_graph.edge_count
+        stats.duration_ms = (time.perf_counter() - start) * 1000
+        return stats
+
+    def _extract_spec(
+        self, discovery: SpecDiscovery, spec_path: Path, content_hash: str
+    ) -> tuple[Any, ...]:
+        """Load, render and parse one spec into a ``specs`` row (without path)."""
+        from dli.core.lineage.extractor import extract_sql_lineage  # noqa: PLC0415
+
+        try:
+            spec = discovery.load_spec_file(spec_path)
+        except Exception as e:
+            # Keep a row so the file is not re-parsed until it changes
+            name = spec_path.stem.split(".", 1)[-1]
+            error = json.dumps([f"Failed to load spec: {e}"])
+            return (
+                content_hash,
+                "{}",
+                name,
+                "",
+                None,
+                None,
+                None,
+                "[]",
+                "[]",
+                "[]",
+                error,
+            )
+
+        deps: dict[str, str] = {}
+        if spec.query_file and spec.base_dir:
+            query_path = (spec.base_dir / spec.query_file).resolve()
+            deps[str(query_path)] = _hash_file(query_path)
+
+        errors: list[str] = []
+        tables: list[str] = []
+        columns: list[list[str]] = []
+        try:
+            sql = spec.get_main_sql()
+        except (OSError, ValueError) as e:
+            sql = ""
+            errors.append(f"No SQL content: {e}")
+
+        if sql.strip():
+            try:
+                sql = render_spec_sql(sql, spec, self.variables)
+            except Exception as e:
+                errors.append(f"SQL rendering failed: {e}")
+            lineage = extract_sql_lineage(
+                sql, dialect=self.dialect, default_target=spec.name
+            )
+            errors.extend(lineage.errors)
+            tables = lineage.tables
+            # Column nodes are keyed by spec name, even if the SQL writes a
+            # differently named table
+            prefix = f"{lineage.target}."
+            for edge in lineage.columns:
+                target = edge.target
+                if target.startswith(prefix):
+                    target = f"{spec.name}.{target[len(prefix) :]}"
+                columns.append([edge.source, target])
+
+        return (
+            content_hash,
+            json.dumps(deps),
+            spec.name,
+            spec.type.value,
+            spec.owner,
+            spec.team,
+            spec.description or None,
+            json.dumps(list(spec.tags)),
+            json.dumps(tables),
+            json.dumps(columns),
+            json.dumps(errors),
+        )
+
+    def _rebuild_graphs(self, conn: sqlite3.Connection) -> None:
+        table_edges: list[tuple[str, str]] = []
+        column_edges: list[tuple[str, str]] = []
+        for name, tables, columns in conn.execute(
+            "SELECT name, tables, columns FROM specs"
+        ):
+            table_edges.extend((source, name) for source in json.loads(tables))
+            column_edges.extend((s, t) for s, t in json.loads(columns))
+
+        conn.execute("DELETE FROM graph")
+        for level, edges in ((TABLE_LEVEL, table_edges), (COLUMN_LEVEL, column_edges)):
+            graph = AdjacencyGraph.from_edges(edges)
+            conn.execute(
+                "INSERT INTO graph VALUES (?, ?, ?, ?, ?, ?)", (level, *graph.to_row())
+            )
+
+    def _settings_key(self) -> str:
+        from dli import __version__  # noqa: PLC0415
+
+        return json.dumps(
+            {
+                "format": _INDEX_FORMAT,
+                "dialect": self.dialect,
+                "variables": self.variables,
+                "version": __version__,
+                "itemsize": array(_ARRAY_TYPECODE).itemsize,
+            },
+            sort_keys=True,
+            default=str,
+        )
+
+    def _reset_if_settings_changed(self, conn: sqlite3.Connection) -> None:
+        row = conn.execute("SELECT value FROM meta WHERE key = 'settings'").fetchone()
+        settings = self._settings_key()
+        if row is not None and row[0] == settings:
+            return
+        conn.execute("DELETE FROM specs")
+        conn.execute("DELETE FROM graph")
+        conn.execute("INSERT OR REPLACE INTO meta VALUES ('settings', ?)", (settings,))
+
+    @staticmethod
+    def _has_graphs(conn: sqlite3.Connection) -> bool:
+        return conn.execute("SELECT COUNT(*) FROM graph").fetchone()[0] == len(_LEVELS)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open the index database; commit on success and always close."""
+        conn = sqlite3.connect(self.index_file)
+        try:
+            conn.executescript(_SCHEMA)
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    # =========================================================================
+    # Query
+    # =========================================================================
+
+    def contains(self, name: str, *, column: bool = False) -> bool:
+        """Check whether a table/spec (or column) is known to the index.
+
+        Args:
+            name: Fully qualified table, spec or column name
+            column: Look up a column instead of a table
+
+        Returns:
+            True if the name appears in the lineage graph or is a spec
+        """
+        if column:
+            return name in self._graph(COLUMN_LEVEL)
+        return name in self._graph(TABLE_LEVEL) or name in self._spec_nodes()
+
+    def get_lineage(
+        self,
+        resource_name: str,
+        direction: LineageDirectionType = "both",
+        depth: int = -1,
+    ) -> LineageResult:
+        """Get table-level lineage for a dataset, metric or table.
+
+        Args:
+            resource_name: Fully qualified name (e.g., 'iceberg.analytics.daily_clicks')
+            direction: 'upstream', 'downstream' or 'both'
+            depth: Maximum traversal depth (-1 for unlimited)
+
+        Returns:
+            LineageResult; upstream nodes have negative depth, downstream
+            nodes positive depth
+        """
+        return self._query(TABLE_LEVEL, resource_name, direction, depth)
+
+    def get_column_lineage(
+        self,
+        column_name: str,
+        direction: LineageDirectionType = "both",
+        depth: int = -1,
+    ) -> LineageResult:
+        """Get column-level lineage for a column.
+
+        Args:
+            column_name: Fully qualified column (e.g., 'iceberg.analytics.daily_clicks.user_id')
+            direction: 'upstream', 'downstream' or 'both'
+            depth: Maximum traversal depth (-1 for unlimited)
+
+        Returns:
+            LineageResult whose nodes have type 'Column'
+        """
+        return self._query(COLUMN_LEVEL, column_name, direction, depth)
+
+    def _query(
+        self,
+        level: int,
+        name: str,
+        direction: LineageDirectionType,
+        depth: int,
+    ) -> LineageResult:
+        graph = self._graph(level)
+        nodes: dict[str, LineageNode] = {}
+        edges: dict[tuple[int, int], None] = {}
+        totals = {"upstream": 0, "downstream": 0}
+
+        for walk in ("upstream", "downstream"):
+            if direction not in (walk, "both"):
+                continue
+            distances, walked = graph.traverse(
+                name, reverse=walk == "upstream", depth=depth
+            )
+            sign = -1 if walk == "upstream" else 1
+            for node_id, distance in distances.items():
+                node_name = graph.names[node_id]
+                nodes.setdefault(
+                    node_name, self._node(level, node_name, sign * distance)
+                )
+            edges.update(dict.fromkeys(walked))
+            totals[walk] = len(distances)
+
+        return LineageResult(
+            root=self._node(level, name, 0),
+            nodes=list(nodes.values()),
+            edges=[
+                LineageEdge(
+                    source=graph.names[s],
+                    target=graph.names[t],
+                    edge_type="direct" if level == TABLE_LEVEL else "column",
+                )
+                for s, t in edges
+            ],
+            direction=LineageDirection(direction),
+            max_depth=depth,
+            total_upstream=totals["upstream"],
+            total_downstream=totals["downstream"],
+        )
+
+    def _node(self, level: int, name: str, depth: int) -> LineageNode:
+        if level == COLUMN_LEVEL:
+            return LineageNode(name=name, type="Column", depth=depth)
+        spec_node = self._spec_nodes().get(name)
+        if spec_node is None:
+            return LineageNode(name=name, type="External", depth=depth)
+        return LineageNode(
+            name=spec_node.name,
+            type=spec_node.type,
+            owner=spec_node.owner,
+            team=spec_node.team,
+            description=spec_node.description,
+            tags=list(spec_node.tags),
+            depth=depth,
+        )
+
+    def _spec_nodes(self) -> dict[str, LineageNode]:
+        if self._nodes is None:
+            self._nodes = {}
+            if self.index_file.exists():
+                with self._connect() as conn:
+                    for name, spec_type, owner, team, description, tags in conn.execute(
+                        "SELECT name, type, owner, team, description, tags FROM specs "
+                        "WHERE type != ''"
+                    ):
+                        self._nodes[name] = LineageNode(
+                            name=name,
+                            type=spec_type,
+                            owner=owner,
+                            team=team,
+                            description=description,
+                            tags=json.loads(tags),
+                        )
+        return self._nodes
+
+    def _graph(self, level: int) -> AdjacencyGraph:
+        graph = self._graphs.get(level)
+        if graph is not None:
+            return graph
+        row = None
+        if self.index_file.exists():
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT names, offsets, targets, rev_offsets, rev_targets "
+                    "FROM graph WHERE level = ?",
+                    (level,),
+                ).fetchone()
+        graph = AdjacencyGraph.from_row(row) if row else AdjacencyGraph.from_edges([])
+        self._graphs[level] = graph
+        return graph
+
+
+__all__ = [
+    "COLUMN_LEVEL",
+    "INDEX_FILENAME",
+    "TABLE_LEVEL",
+    "AdjacencyGraph",
+    "LineageBuildStats",
+    "LocalLineageIndex",
+    "render_spec_sql",
+]
@@ -0,0 +1,530 @@
+"""Semantic query planner for multi-metric requests.
+
+This module compiles a request for several metrics sliced by the same
+dimensions into as few SQL statements as possible:
+- Metrics are grouped by source relation (the rendered spec SQL), source
+  dialect and dimension expressions; each group becomes one query
+- Filters shared by every metric of a group go into the WHERE clause
+- Remaining per-metric filters become conditional aggregates, e.g.
+  ``SUM(CASE WHEN <filter> THEN <expr> END)``
+- Generated SQL is transpiled with SQLGlot into the requested dialect
+- A group is rewritten onto the smallest declared rollup of its spec that
+  covers the requested metrics, dimensions and time grain; otherwise the
+  source relation is scanned
+
+Rollups store each metric with its filters applied. Additive metrics
+(count, sum, min, max) are re-aggregated from any covering rollup; averages
+are stored as ``<metric>__sum`` and ``<metric>__count`` columns; distinct
+counts can only be served by a rollup with exactly the requested grouping.
+
+The results of all group queries are merged on the dimension values into a
+single frame (list of row dicts) with ``MetricQueryPlan.merge``.
+
+Example:
+    >>> plan = service.plan_query(
+    ...     ["active_users", "total_sessions", "avg_session_duration"],
+    ...     ["user_country"],
+    ...     {"start_date": "2025-01-01", "end_date": "2025-01-31"},
+    ... )
+    >>> len(plan.queries)
+    1
+    >>> print(plan.queries[0].sql)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import sqlglot
+from sqlglot import exp
+from sqlglot.errors import SqlglotError
+
+from dli.core.models import AggregationType, DimensionType, TimeGrain
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Sequence
+
+    from dli.core.models import (
+        DimensionDefinition,
+        MetricDefinition,
+        MetricSpec,
+        RollupDefinition,
+    )
+
+# Alias of the source relation in generated queries
+SOURCE_ALIAS = "_source"
+
+# Functions re-aggregating a stored metric column from a finer rollup
+_REAGGREGATE = {
+    AggregationType.COUNT: "SUM",
+    AggregationType.COUNT_DISTINCT: "SUM",
+    AggregationType.SUM: "SUM",
+    AggregationType.MIN: "MIN",
+    AggregationType.MAX: "MAX",
+}
+
+
+@dataclass(frozen=True)
+class PlannedMetric:
+    """A metric resolved for planning.
+
+    Attributes:
+        name: Output column name.
+        definition: Metric definition from the spec.
+        filters: Rendered filter conditions, normalized by SQLGlot.
+    """
+
+    name: str
+    definition: MetricDefinition
+    filters: tuple[str, ...] = ()
+
+
+@dataclass
+class PlannedQuery:
+    """One SQL statement of a plan, covering metrics with a shared source.
+
+    Attributes:
+        spec_names: Metric specs whose source relation the query scans.
+        source_sql: Rendered source relation.
+        source_dialect: Dialect the source relation is written in.
+        dimensions: Output dimension column names.
+        metrics: Output metric column names.
+        where: Filters applied to every metric of the query.
+        sql: Compiled SQL in the target dialect.
+        timeout_seconds: Execution timeout for the query.
+        rollup: Rollup table the query reads instead of the source
+            relation, if any.
+    """
+
+    spec_names: list[str]
+    source_sql: str
+    source_dialect: str
+    dimensions: list[str]
+    metrics: list[str]
+    where: list[str]
+    sql: str
+    timeout_seconds: int
+    rollup: str | None = None
+
+
+@dataclass
+class MetricQueryPlan:
+    """Compiled plan for a multi-metric request.
+
+    Attributes:
+        dimensions: Requested dimension names, in request order.
+        metrics: Requested metric column names, in request order.
+        dialect: Target SQL dialect of the compiled queries.
+        queries: One query per group of metrics sharing a source.
+    """
+
+    dimensions: list[str]
+    metrics: list[str]
+    dialect: str
+    queries: list[PlannedQuery] = field(default_factory=list)
+
+    @property
+    def columns(self) -> list[str]:
+        """Columns of the merged frame."""
+        return [*self.dimensions, *self.metrics]
+
+    @property
+    def rollups(self) -> list[str]:
+        """Rollup tables read by the plan."""
+        return [query.rollup for query in self.queries if query.rollup]
+
+    @property
+    def sql(self) -> str:
+        """All compiled statements, separated by semicolons."""
+        return ";\n\n".join(query.sql for query in self.queries)
+
+    def merge(self, results: Sequence[list[dict[str, Any]]]) -> list[dict[str, Any]]:
+        """Merge per-query rows into one frame keyed by dimension values.
+
+        Rows are ordered by the first query that produced each dimension
+        combination. Metrics missing for a combination are None.
+
+        Args:
+            results: Rows of each query, in the order of ``queries``.
+
+        Returns:
+            Merged rows with the columns of ``columns``.
+        """
+        merged: dict[tuple[Any, ...], dict[str, Any]] = {}
+        for query, rows in zip(self.queries, results, strict=True):
+            for row in rows:
+                key = tuple(row.get(name) for name in self.dimensions)
+                target = merged.get(key)
+                if target is None:
+                    target = dict.fromkeys(self.columns)
+                    target.update(zip(self.dimensions, key, strict=True))
+                    merged[key] = target
+                for name in query.metrics:
+                    target[name] = row.get(name)
+        return list(merged.values())
+
+
+def normalize_condition(condition: str, dialect: str) -> str:
+    """Normalize a filter condition so equivalent filters compare equal.
+
+    Args:
+        condition: SQL boolean expression.
+        dialect: Dialect the condition is written in.
+
+    Returns:
+        Condition regenerated by SQLGlot.
+
+    Raises:
+        ValueError: If the condition cannot be parsed.
+    """
+    try:
+        return sqlglot.condition(condition, dialect=dialect).sql(dialect=dialect)
+    except SqlglotError as e:
+        msg = f"Invalid metric filter '{condition}': {e}"
+        raise ValueError(msg) from e
+
+
+def _conjunction(conditions: Sequence[str]) -> str:
+    if len(conditions) == 1:
+        return conditions[0]
+    return " AND ".join(f"({condition})" for condition in conditions)
+
+
+def aggregate_expression(metric: PlannedMetric, conditions: Sequence[str]) -> str:
+    """Build the aggregate for a metric, applying conditions inside it.
+
+    Args:
+        metric: Metric to aggregate.
+        conditions: Filters not covered by the WHERE clause.
+
+    Returns:
+        SQL aggregate expression, e.g. ``SUM(CASE WHEN a > 0 THEN x END)``.
+    """
+    if not conditions:
+        return metric.definition.to_sql()
+
+    predicate = _conjunction(conditions)
+    expression = metric.definition.expression.strip()
+    if expression == "*":
+        expression = "1"
+    conditional = metric.definition.model_copy(
+        update={"expression": f"CASE WHEN {predicate} THEN {expression} END"}
+    )
+    return conditional.to_sql()
+
+
+def compile_query(
+    source_sql: str,
+    dimensions: Sequence[tuple[str, str]],
+    metrics: Sequence[PlannedMetric],
+    *,
+    read: str,
+    write: str,
+) -> tuple[str, list[str]]:
+    """Compile one aggregation query over a source relation.
+
+    Args:
+        source_sql: Rendered source relation (a SELECT statement).
+        dimensions: Output name and SQL expression of each group-by dimension.
+        metrics: Metrics to compute in the query.
+        read: Dialect of the source relation and metric expressions.
+        write: Dialect of the generated SQL.
+
+    Returns:
+        Tuple of (compiled SQL, filters hoisted into the WHERE clause).
+
+    Raises:
+        ValueError: If the generated SQL cannot be parsed.
+    """
+    shared = [
+        condition
+        for condition in metrics[0].filters
+        if all(condition in metric.filters for metric in metrics[1:])
+    ]
+
+    select = [f"{expression} AS {name}" for name, expression in dimensions]
+    select.extend(
+        f"{aggregate_expression(metric, [c for c in metric.filters if c not in shared])}"
+        f" AS {metric.name}"
+        for metric in metrics
+    )
+    source = source_sql.strip().rstrip(";").strip()
+    sql = f"SELECT {', '.join(select)} FROM ({source}) AS {SOURCE_ALIAS}"  # noqa: S608
+    if shared:
+        sql += f" WHERE {_conjunction(shared)}"
+    if dimensions:
+        sql += " GROUP BY " + ", ".join(expression for _, expression in dimensions)
+    return _transpile(sql, read=read, write=write), shared
+
+
+def truncate_time(expression: str, grain: TimeGrain, dialect: str) -> str:
+    """Truncate a time expression to a grain in the given dialect.
+
+    Example:
+        >>> truncate_time("event_ts", TimeGrain.DAY, "trino")
+        "DATE_TRUNC('DAY', event_ts)"
+    """
+    try:
+        node = sqlglot.parse_one(expression, read=dialect)
+    except SqlglotError as e:
+        msg = f"Invalid time dimension expression '{expression}': {e}"
+        raise ValueError(msg) from e
+    return exp.TimestampTrunc(this=node, unit=exp.var(grain.value.upper())).sql(
+        dialect=dialect
+    )
+
+
+def rollup_columns(metric: PlannedMetric) -> dict[str, str]:
+    """Return the rollup columns storing a metric and their aggregates.
+
+    Metric filters are applied inside the aggregates, so a rollup serves
+    metrics with different filters from one table.
+
+    Args:
+        metric: Metric to store.
+
+    Returns:
+        Mapping of rollup column name to aggregate expression.
+    """
+    if metric.definition.aggregation == AggregationType.AVG:
+        total = metric.definition.model_copy(
+            update={"aggregation": AggregationType.SUM}
+        )
+        count = metric.definition.model_copy(
+            update={"aggregation": AggregationType.COUNT}
+        )
+        return {
+            f"{metric.name}__sum": aggregate_expression(
+                PlannedMetric(metric.name, total, metric.filters), metric.filters
+            ),
+            f"{metric.name}__count": aggregate_expression(
+                PlannedMetric(metric.name, count, metric.filters), metric.filters
+            ),
+        }
+    return {metric.name: aggregate_expression(metric, metric.filters)}
+
+
+def _grain_rank(grain: TimeGrain | None) -> int:
+    return -1 if grain is None else list(TimeGrain).index(grain)
+
+
+def _stored_grain(rollup: RollupDefinition, dimension: str) -> TimeGrain | None:
+    return rollup.time_grain if dimension == rollup.time_dimension else None
+
+
+def _is_exact(
+    rollup: RollupDefinition,
+    spec: MetricSpec,
+    dimensions: Sequence[str],
+    time_grain: TimeGrain | None,
+) -> bool:
+    """Whether the rollup holds exactly one row per requested group."""
+    if set(dimensions) != set(rollup.dimensions):
+        return False
+    time_dimensions = {d.name for d in spec.dimensions if d.type == DimensionType.TIME}
+    return all(
+        _stored_grain(rollup, name) == time_grain
+        for name in dimensions
+        if name in time_dimensions
+    )
+
+
+def select_rollup(
+    spec: MetricSpec,
+    metrics: Sequence[PlannedMetric],
+    dimensions: Sequence[str],
+    *,
+    time_grain: TimeGrain | None = None,
+    changed_parameters: Collection[str] = (),
+) -> RollupDefinition | None:
+    """Pick the smallest rollup of a spec that covers a request.
+
+    A rollup covers a request when it stores every metric, groups by every
+    requested dimension, stores its time dimension at a grain that rolls up
+    to the requested one, and maps every parameter that differs from its
+    default to its time range. Distinct counts additionally need a rollup
+    with exactly the requested grouping.
+
+    Rollups with fewer dimensions, then coarser time grains, then fewer
+    stored metrics are smaller; ties keep declaration order.
+
+    Args:
+        spec: Metric spec declaring the rollups.
+        metrics: Requested metrics of the spec.
+        dimensions: Requested dimension names.
+        time_grain: Requested grain for time dimensions.
+        changed_parameters: Spec parameters whose value differs from the
+            default in this request.
+
+    Returns:
+        The covering rollup, or None to scan the source relation.
+    """
+    candidates: list[RollupDefinition] = []
+    for rollup in spec.rollups:
+        stored = set(rollup.metrics) or {metric.name for metric in spec.metrics}
+        if any(metric.definition.name not in stored for metric in metrics):
+            continue
+        if not set(dimensions) <= set(rollup.dimensions):
+            continue
+        range_parameters = {rollup.start_parameter, rollup.end_parameter}
+        if any(name not in range_parameters for name in changed_parameters):
+            continue
+        if (
+            rollup.time_grain is not None
+            and rollup.time_dimension in dimensions
+            and (time_grain is None or not rollup.time_grain.rolls_up_to(time_grain))
+        ):
+            continue
+        if any(
+            metric.definition.aggregation == AggregationType.COUNT_DISTINCT
+            for metric in metrics
+        ) and not _is_exact(rollup, spec, dimensions, time_grain):
+            continue
+        candidates.append(rollup)
+
+    if not candidates:
+        return None
+    return min(
+        candidates,
+        key=lambda rollup: (
+            len(rollup.dimensions),
+            -_grain_rank(rollup.time_grain),
+            len(rollup.metrics or spec.metrics),
+        ),
+    )
+
+
+def compile_rollup_query(
+    table: str,
+    rollup: RollupDefinition,
+    dimensions: Sequence[DimensionDefinition],
+    metrics: Sequence[PlannedMetric],
+    *,
+    time_grain: TimeGrain | None,
+    where: Sequence[str],
+    read: str,
+    write: str,
+) -> str:
+    """Compile a query that re-aggregates metrics from a rollup table.
+
+    Args:
+        table: Rollup table name.
+        rollup: Rollup definition.
+        dimensions: Requested dimensions.
+        metrics: Requested metrics.
+        time_grain: Requested grain for time dimensions.
+        where: Conditions on the rollup columns (e.g., the time range).
+        read: Dialect of the rollup definition.
+        write: Dialect of the generated SQL.
+
+    Returns:
+        Compiled SQL in the target dialect.
+    """
+    group_by: list[str] = []
+    for dimension in dimensions:
+        column = dimension.name
+        if (
+            dimension.type == DimensionType.TIME
+            and time_grain is not None
+            and _stored_grain(rollup, dimension.name) != time_grain
+        ):
+            column = truncate_time(column, time_grain, read)
+        group_by.append(column)
+
+    select = [
+        f"{column} AS {d.name}" for column, d in zip(group_by, dimensions, strict=True)
+    ]
+    for metric in metrics:
+        if metric.definition.aggregation == AggregationType.AVG:
+            select.append(
+                f"CAST(SUM({metric.name}__sum) AS DOUBLE)"
+                f" / NULLIF(SUM({metric.name}__count), 0) AS {metric.name}"
+            )
+        else:
+            function = _REAGGREGATE[metric.definition.aggregation]
+            select.append(f"{function}({metric.name}) AS {metric.name}")
+
+    sql = f"SELECT {', '.join(select)} FROM {table}"  # noqa: S608
+    if where:
+        sql += f" WHERE {_conjunction(where)}"
+    if group_by:
+        sql += " GROUP BY " + ", ".join(group_by)
+    return _transpile(sql, read=read, write=write)
+
+
+def compile_rollup_build(
+    table: str,
+    rollup: RollupDefinition,
+    source_sql: str,
+    dimensions: Sequence[DimensionDefinition],
+    metrics: Sequence[PlannedMetric],
+    *,
+    dialect: str,
+) -> str:
+    """Compile the INSERT statement that loads a rollup from its source.
+
+    The statement is plain string composition so that ``source_sql`` may
+    still contain Jinja placeholders; it is rendered together with the
+    rest of the managed dataset.
+
+    Args:
+        table: Rollup table name.
+        rollup: Rollup definition.
+        source_sql: Source relation (rendered or template).
+        dimensions: Rollup dimensions.
+        metrics: Metrics stored in the rollup.
+        dialect: Dialect of the spec.
+
+    Returns:
+        ``INSERT INTO <table> SELECT ...`` statement.
+    """
+    group_by = [
+        truncate_time(d.expression, rollup.time_grain, dialect)
+        if rollup.time_grain is not None and d.name == rollup.time_dimension
+        else d.expression
+        for d in dimensions
+    ]
+    select = [
+        f"{expression} AS {d.name}"
+        for expression, d in zip(group_by, dimensions, strict=True)
+    ]
+    for metric in metrics:
+        select.extend(
+            f"{aggregate} AS {column}"
+            for column, aggregate in rollup_columns(metric).items()
+        )
+
+    source = source_sql.strip().rstrip(";").strip()
+    sql = (
+        f"INSERT INTO {table}\n"
+        "SELECT\n  " + ",\n  ".join(select) + "\n"
+        f"FROM (\n{source}\n) AS {SOURCE_ALIAS}"
+    )
+    if group_by:
+        sql += "\nGROUP BY\n  " + ",\n  ".join(group_by)
+    return sql
+
+
+def _transpile(sql: str, *, read: str, write: str) -> str:
+    try:
+        return sqlglot.transpile(sql, read=read, write=write, pretty=True)[0]
+    except SqlglotError as e:
+        msg = f"Failed to compile metric query: {e}"
+        raise ValueError(msg) from e
+
+
+__all__ = [
+    "SOURCE_ALIAS",
+    "MetricQueryPlan",
+    "PlannedMetric",
+    "PlannedQuery",
+    "aggregate_expression",
+    "compile_query",
+    "compile_rollup_build",
+    "compile_rollup_query",
+    "normalize_condition",
+    "rollup_columns",
+    "select_rollup",
+    "truncate_time",
+]
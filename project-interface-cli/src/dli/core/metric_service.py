@@ -18,18 +18,44 @@ from pathlib import Path
 import time
 from typing import Any
 
+from sqlglot import exp
+
 from dli.core.config import load_project
-from dli.core.executor import BaseExecutor
+from dli.core.executor import BaseExecutor, DatasetExecutor
+from dli.core.metric_planner import (
+    MetricQueryPlan,
+    PlannedMetric,
+    PlannedQuery,
+    compile_query,
+    compile_rollup_build,
+    compile_rollup_query,
+    normalize_condition,
+    select_rollup,
+    truncate_time,
+)
 from dli.core.models import (
+    DatasetExecutionResult,
+    DatasetSpec,
+    DimensionDefinition,
+    DimensionType,
+    MetricDefinition,
     MetricExecutionResult,
     MetricSpec,
+    RollupDefinition,
+    StatementDefinition,
+    TimeGrain,
     ValidationResult,
 )
 from dli.core.registry import MetricRegistry
 from dli.core.renderer import SQLRenderer
+from dli.core.sql_filters import sql_date_trunc
 from dli.core.validator import SQLValidator
 
 
+class UnknownMetricError(ValueError):
+    """Raised when a metric reference matches no metric definition."""
+
+
 class MetricService:
     """Service for executing metrics (SELECT queries).
 
@@ -176,8 +202,19 @@ class MetricService:
         if not spec:
             return None
 
-        main_sql = spec.get_main_sql()
+        return self._render_template(spec, spec.get_main_sql(), params)
 
+    def _render_template(
+        self,
+        spec: MetricSpec,
+        template: str,
+        params: dict[str, Any],
+    ) -> str:
+        """Render a SQL template with the spec's parameters and refs.
+
+        Raises:
+            ValueError: If a parameter value is missing or invalid
+        """
         # Build refs dictionary from depends_on
         refs = self._build_refs(spec.depends_on)
 
@@ -194,7 +231,7 @@ class MetricService:
 
         # Use render_with_template_context for ref() support
         return self.renderer.render_with_template_context(
-            main_sql,
+            template,
             refs=refs,
             extra_params=validated_params,
         )
@@ -328,6 +365,451 @@ class MetricService:
             execution_time_ms=execution_time_ms,
         )
 
+    def resolve_metric(self, reference: str) -> tuple[MetricSpec, MetricDefinition]:
+        """Resolve a metric reference to its spec and metric definition.
+
+        A reference is either ``<spec name>.<metric name>`` (e.g.
+        ``iceberg.analytics.user_engagement.active_users``) or a bare metric
+        name that is unique across all metric specs.
+
+        Args:
+            reference: Metric reference
+
+        Returns:
+            Tuple of (MetricSpec, MetricDefinition)
+
+        Raises:
+            UnknownMetricError: If the metric is not found
+            ValueError: If the name is ambiguous
+        """
+        spec_name, _, metric_name = reference.rpartition(".")
+        spec = self.registry.get(spec_name) if spec_name else None
+        if spec is not None:
+            for metric in spec.metrics:
+                if metric.name == metric_name:
+                    return spec, metric
+            msg = f"Metric '{metric_name}' not found in '{spec_name}'"
+            raise UnknownMetricError(msg)
+
+        matches = [
+            (candidate, metric)
+            for candidate in self.registry.list_all()
+            for metric in candidate.metrics
+            if metric.name == reference
+        ]
+        if not matches:
+            msg = f"Metric '{reference}' not found"
+            raise UnknownMetricError(msg)
+        if len(matches) > 1:
+            names = ", ".join(f"{s.name}.{m.name}" for s, m in matches)
+            msg = f"Metric '{reference}' is ambiguous: {names}"
+            raise ValueError(msg)
+        return matches[0]
+
+    def plan_query(
+        self,
+        metrics: list[str],
+        dimensions: list[str] | None,
+        params: dict[str, Any],
+        *,
+        dialect: str | None = None,
+        time_grain: TimeGrain | str | None = None,
+        use_rollups: bool = True,
+    ) -> MetricQueryPlan:
+        """Plan a multi-metric query.
+
+        Metrics are grouped by source relation, source dialect and dimension
+        expressions, and each group is compiled into a single SQL statement.
+        Filters shared by all metrics in a group go into the WHERE clause;
+        the others become conditional aggregates.
+
+        A group from a single spec is rewritten onto the smallest declared
+        rollup that covers it (see ``select_rollup``).
+
+        Args:
+            metrics: Metric references (see ``resolve_metric``)
+            dimensions: Dimension names to group by; each must be defined in
+                every spec the metrics come from
+            params: Parameter values for SQL rendering
+            dialect: Target SQL dialect (defaults to the project dialect)
+            time_grain: Grain to truncate time dimensions to
+            use_rollups: Whether to read from rollups when possible
+
+        Returns:
+            MetricQueryPlan with one query per group
+
+        Raises:
+            ValueError: If a metric or dimension cannot be resolved, a
+                parameter is invalid, or the SQL cannot be compiled
+        """
+        if not metrics:
+            msg = "At least one metric is required"
+            raise ValueError(msg)
+        dimension_names = list(dimensions or [])
+        target = dialect or self.default_dialect
+        grain = TimeGrain(time_grain) if time_grain is not None else None
+
+        groups: dict[tuple[Any, ...], dict[str, Any]] = {}
+        sources: dict[str, str] = {}
+        columns: list[str] = []
+        for reference in metrics:
+            spec, definition = self.resolve_metric(reference)
+            if definition.name in columns or definition.name in dimension_names:
+                msg = f"Duplicate output column '{definition.name}' for '{reference}'"
+                raise ValueError(msg)
+            columns.append(definition.name)
+
+            read = spec.execution.dialect
+            if spec.name not in sources:
+                sources[spec.name] = self._render_template(
+                    spec, spec.get_main_sql(), params
+                )
+            definitions = [self._get_dimension(spec, name) for name in dimension_names]
+            expressions = tuple(
+                truncate_time(d.expression, grain, read)
+                if grain is not None and d.type == DimensionType.TIME
+                else d.expression
+                for d in definitions
+            )
+            filters = tuple(
+                normalize_condition(
+                    self._render_template(spec, condition, params), read
+                )
+                for condition in definition.filters
+            )
+
+            key = (" ".join(sources[spec.name].split()), read, expressions)
+            group = groups.setdefault(
+                key,
+                {
+                    "specs": [],
+                    "source": sources[spec.name],
+                    "read": read,
+                    "definitions": definitions,
+                    "expressions": expressions,
+                    "metrics": [],
+                    "timeout": 0,
+                },
+            )
+            if spec not in group["specs"]:
+                group["specs"].append(spec)
+            group["metrics"].append(PlannedMetric(definition.name, definition, filters))
+            group["timeout"] = max(group["timeout"], spec.execution.timeout_seconds)
+
+        plan = MetricQueryPlan(
+            dimensions=dimension_names, metrics=columns, dialect=target
+        )
+        for group in groups.values():
+            specs: list[MetricSpec] = group["specs"]
+            query = PlannedQuery(
+                spec_names=[spec.name for spec in specs],
+                source_sql=group["source"],
+                source_dialect=group["read"],
+                dimensions=dimension_names,
+                metrics=[metric.name for metric in group["metrics"]],
+                where=[],
+                sql="",
+                timeout_seconds=group["timeout"],
+            )
+            rollup = None
+            if use_rollups and len(specs) == 1:
+                rollup = select_rollup(
+                    specs[0],
+                    group["metrics"],
+                    dimension_names,
+                    time_grain=grain,
+                    changed_parameters=self._changed_parameters(specs[0], params),
+                )
+            rollup_where = (
+                self._rollup_range(specs[0], rollup, params, group["read"])
+                if rollup is not None
+                else None
+            )
+            if rollup is not None and rollup_where is not None:
+                query.rollup = rollup.table_name(specs[0].name)
+                query.where = rollup_where
+                query.sql = compile_rollup_query(
+                    query.rollup,
+                    rollup,
+                    group["definitions"],
+                    group["metrics"],
+                    time_grain=grain,
+                    where=query.where,
+                    read=group["read"],
+                    write=target,
+                )
+            else:
+                query.sql, query.where = compile_query(
+                    group["source"],
+                    list(zip(dimension_names, group["expressions"], strict=True)),
+                    group["metrics"],
+                    read=group["read"],
+                    write=target,
+                )
+            plan.queries.append(query)
+        return plan
+
+    def rollup_dataset(self, metric_name: str, rollup_name: str) -> DatasetSpec:
+        """Build the managed dataset that loads a metric rollup.
+
+        The dataset deletes the rows of the time range given by the rollup's
+        range parameters (or all rows, if it has none) and inserts them again
+        from the metric's source relation, so a rollup is refreshed
+        incrementally by running the dataset for each new range. SQL is
+        returned as templates and rendered with the metric's parameters.
+
+        Args:
+            metric_name: Fully qualified metric spec name
+            rollup_name: Rollup name within the spec
+
+        Returns:
+            DatasetSpec for the rollup table
+
+        Raises:
+            ValueError: If the metric or rollup is not found
+        """
+        spec = self.registry.get(metric_name)
+        if spec is None:
+            msg = f"Metric '{metric_name}' not found"
+            raise ValueError(msg)
+        rollup = spec.get_rollup(rollup_name)
+        if rollup is None:
+            msg = f"Rollup '{rollup_name}' not found in '{metric_name}'"
+            raise ValueError(msg)
+
+        table = rollup.table_name(spec.name)
+        stored = set(rollup.metrics) or {metric.name for metric in spec.metrics}
+        metrics = [
+            PlannedMetric(metric.name, metric, tuple(metric.filters))
+            for metric in spec.metrics
+            if metric.name in stored
+        ]
+        if rollup.start_parameter and rollup.end_parameter:
+            # Rows hold grain-truncated buckets; delete every bucket the
+            # range touches, as the INSERT below re-creates all of them
+            grain = rollup.time_grain
+            trunc = f' | date_trunc("{grain.value}")' if grain is not None else ""
+            delete_sql = (
+                f"DELETE FROM {table} WHERE {rollup.time_dimension} BETWEEN "  # noqa: S608
+                f"'{{{{ {rollup.start_parameter}{trunc} }}}}' "
+                f"AND '{{{{ {rollup.end_parameter}{trunc} }}}}'"
+            )
+        else:
+            delete_sql = f"DELETE FROM {table}"  # noqa: S608
+
+        return DatasetSpec(
+            name=table,
+            owner=spec.owner,
+            team=spec.team,
+            description=f"Rollup '{rollup.name}' of metric {spec.name}",
+            domains=list(spec.domains),
+            tags=[*spec.tags, "rollup"],
+            parameters=list(spec.parameters),
+            query_statement=compile_rollup_build(
+                table,
+                rollup,
+                spec.get_main_sql(),
+                [self._get_dimension(spec, name) for name in rollup.dimensions],
+                metrics,
+                dialect=spec.execution.dialect,
+            ),
+            pre_statements=[StatementDefinition(name="delete_range", sql=delete_sql)],
+            execution=spec.execution,
+            depends_on=list(spec.depends_on),
+        )
+
+    def refresh_rollup(
+        self,
+        metric_name: str,
+        rollup_name: str,
+        params: dict[str, Any],
+    ) -> DatasetExecutionResult:
+        """Refresh a metric rollup for one time range.
+
+        Args:
+            metric_name: Fully qualified metric spec name
+            rollup_name: Rollup name within the spec
+            params: Parameter values, including the rollup's range parameters
+
+        Returns:
+            DatasetExecutionResult of the rollup dataset
+        """
+        if not self._executor:
+            return DatasetExecutionResult(
+                dataset_name=rollup_name,
+                success=False,
+                error_message="Executor not configured",
+            )
+        try:
+            dataset = self.rollup_dataset(metric_name, rollup_name)
+            spec = self.registry.get(metric_name)
+            rendered: dict[str, str | list[str]] = {
+                "pre": [
+                    self._render_template(spec, statement.sql or "", params)
+                    for statement in dataset.pre_statements
+                ],
+                "main": self._render_template(spec, dataset.get_main_sql(), params),
+            }
+        except (OSError, ValueError) as e:
+            return DatasetExecutionResult(
+                dataset_name=rollup_name,
+                success=False,
+                error_message=f"SQL rendering failed: {e}",
+            )
+        return DatasetExecutor(self._executor).execute(dataset, rendered)
+
+    @staticmethod
+    def _changed_parameters(spec: MetricSpec, params: dict[str, Any]) -> set[str]:
+        """Spec parameters whose requested value differs from the default."""
+        changed: set[str] = set()
+        for param_def in spec.parameters:
+            if params.get(param_def.name) is None:
+                continue
+            if param_def.default is None or param_def.validate_value(
+                params[param_def.name]
+            ) != param_def.validate_value(param_def.default):
+                changed.add(param_def.name)
+        return changed
+
+    @staticmethod
+    def _rollup_range(
+        spec: MetricSpec,
+        rollup: RollupDefinition,
+        params: dict[str, Any],
+        dialect: str,
+    ) -> list[str] | None:
+        """Time range condition on a rollup for the requested parameters.
+
+        Rollup rows hold grain-truncated buckets, so both bounds are
+        truncated to the rollup's grain: the bucket containing the start
+        is read, as the source query would aggregate into it.
+
+        Returns:
+            Conditions, or None if a bound is not a date or timestamp (the
+            rollup cannot serve the range)
+        """
+        if not (
+            rollup.time_dimension and rollup.start_parameter and rollup.end_parameter
+        ):
+            return []
+        values = {
+            param_def.name: param_def.validate_value(params.get(param_def.name))
+            for param_def in spec.parameters
+            if param_def.name in (rollup.start_parameter, rollup.end_parameter)
+        }
+        start = values.get(rollup.start_parameter, params.get(rollup.start_parameter))
+        end = values.get(rollup.end_parameter, params.get(rollup.end_parameter))
+        if start is None or end is None:
+            return []
+        if rollup.time_grain is not None:
+            try:
+                start = sql_date_trunc(start, rollup.time_grain.value)
+                end = sql_date_trunc(end, rollup.time_grain.value)
+            except ValueError:
+                return None
+        condition = exp.column(rollup.time_dimension).between(
+            exp.Literal.string(str(start)), exp.Literal.string(str(end))
+        )
+        return [condition.sql(dialect=dialect)]
+
+    def query_metrics(
+        self,
+        metrics: list[str],
+        dimensions: list[str] | None,
+        params: dict[str, Any],
+        *,
+        dialect: str | None = None,
+        time_grain: TimeGrain | str | None = None,
+        use_rollups: bool = True,
+        dry_run: bool = False,
+    ) -> MetricExecutionResult:
+        """Execute several metrics with as few queries as possible.
+
+        The request is planned with ``plan_query``; each planned query runs
+        once and the rows are merged on the dimension values into one frame.
+
+        Args:
+            metrics: Metric references (see ``resolve_metric``)
+            dimensions: Dimension names to group by
+            params: Parameter values for SQL rendering
+            dialect: Target SQL dialect (defaults to the project dialect)
+            time_grain: Grain to truncate time dimensions to
+            use_rollups: Whether to read from rollups when possible
+            dry_run: Plan and compile only, without execution
+
+        Returns:
+            MetricExecutionResult with the merged rows; ``rendered_sql``
+            holds every executed statement and ``rollups`` the rollup
+            tables that were read
+        """
+        metric_name = ", ".join(metrics)
+        if not self._executor and not dry_run:
+            return MetricExecutionResult(
+                metric_name=metric_name,
+                success=False,
+                error_message="Executor not configured",
+            )
+
+        try:
+            plan = self.plan_query(
+                metrics,
+                dimensions,
+                params,
+                dialect=dialect,
+                time_grain=time_grain,
+                use_rollups=use_rollups,
+            )
+        except (OSError, ValueError) as e:
+            return MetricExecutionResult(
+                metric_name=metric_name,
+                success=False,
+                error_message=f"Query planning failed: {e}",
+            )
+
+        if dry_run:
+            return MetricExecutionResult(
+                metric_name=metric_name,
+                success=True,
+                error_message="Dry run completed (no execution)",
+                columns=plan.columns,
+                rendered_sql=plan.sql,
+                rollups=plan.rollups,
+            )
+
+        start_time = time.time()
+        results: list[list[dict[str, Any]]] = []
+        for query in plan.queries:
+            exec_result = self._executor.execute_sql(query.sql, query.timeout_seconds)
+            if not exec_result.success:
+                return MetricExecutionResult(
+                    metric_name=metric_name,
+                    success=False,
+                    error_message=exec_result.error_message,
+                    rendered_sql=query.sql,
+                    execution_time_ms=(time.time() - start_time) * 1000,
+                )
+            results.append(exec_result.data)
+
+        rows = plan.merge(results)
+        return MetricExecutionResult(
+            metric_name=metric_name,
+            success=True,
+            rows=rows,
+            row_count=len(rows),
+            columns=plan.columns,
+            rendered_sql=plan.sql,
+            execution_time_ms=(time.time() - start_time) * 1000,
+            rollups=plan.rollups,
+        )
+
+    @staticmethod
+    def _get_dimension(spec: MetricSpec, name: str) -> DimensionDefinition:
+        for dimension in spec.dimensions:
+            if dimension.name == name:
+                return dimension
+        msg = f"Dimension '{name}' not found in '{spec.name}'"
+        raise ValueError(msg)
+
     def get_tables(self, metric_name: str, params: dict[str, Any]) -> list[str]:
         """Extract tables referenced in a metric.
 
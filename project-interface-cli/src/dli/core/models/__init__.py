@@ -38,6 +38,8 @@ from dli.core.models.metric import (
     DimensionType,
     MetricDefinition,
     MetricSpec,
+    RollupDefinition,
+    TimeGrain,
 )
 
 # Result models
@@ -71,6 +73,8 @@ __all__ = [  # noqa: RUF022 - Grouped by module for readability
     "MetricDefinition",
     "DimensionDefinition",
     "MetricSpec",
+    "RollupDefinition",
+    "TimeGrain",
     # Dataset types
     "DatasetSpec",
     # Result types
@@ -5,12 +5,14 @@ This module contains models for the semantic layer following MetricFlow patterns
 - DimensionType: Dimension types (categorical, time)
 - MetricDefinition: dbt-compatible metric definitions
 - DimensionDefinition: Dimensional attributes for slicing/filtering
+- TimeGrain: Time granularity of rollups and time dimensions
+- RollupDefinition: Pre-aggregated materialization of a metric spec
 - MetricSpec: Metric specification (type: Metric, query_type: SELECT only)
 """
 
 from __future__ import annotations
 
-from enum import Enum
+from enum import Enum, StrEnum
 from typing import ClassVar
 
 from pydantic import BaseModel, Field, model_validator
@@ -49,6 +51,39 @@ class DimensionType(str, Enum):
     TIME = "time"
 
 
+class TimeGrain(StrEnum):
+    """Time granularity for rollups and time dimensions."""
+
+    HOUR = "hour"
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+    QUARTER = "quarter"
+    YEAR = "year"
+
+    def rolls_up_to(self, other: TimeGrain) -> bool:
+        """Whether values at this grain can be re-aggregated to ``other``.
+
+        Weeks do not nest in months, quarters or years.
+
+        Example:
+            >>> TimeGrain.DAY.rolls_up_to(TimeGrain.MONTH)
+            True
+            >>> TimeGrain.WEEK.rolls_up_to(TimeGrain.MONTH)
+            False
+        """
+        if self == other:
+            return True
+        if self == TimeGrain.WEEK:
+            return False
+        if other == TimeGrain.WEEK:
+            return self in (TimeGrain.HOUR, TimeGrain.DAY)
+        return _GRAIN_ORDER.index(self) < _GRAIN_ORDER.index(other)
+
+
+_GRAIN_ORDER = list(TimeGrain)
+
+
 class MetricDefinition(BaseModel):
     """Simple metric definition (Phase 1).
 
@@ -141,6 +176,67 @@ class DimensionDefinition(BaseModel):
     description: str = ""
 
 
+class RollupDefinition(BaseModel):
+    """Pre-aggregated materialization of a metric spec.
+
+    A rollup stores the spec's metrics grouped by a subset of its dimensions
+    in a managed table. The metric query planner reads from the smallest
+    rollup that covers a request instead of scanning the source relation.
+
+    Attributes:
+        name: Rollup identifier, unique within the spec
+        dimensions: Dimension names the rollup is grouped by
+        metrics: Metric names stored in the rollup (empty: all metrics)
+        time_dimension: Time dimension the rollup is refreshed by; must be
+            one of ``dimensions``
+        time_grain: Grain the time dimension is truncated to
+        start_parameter: Spec parameter holding the start of the time range
+        end_parameter: Spec parameter holding the end of the time range
+        table: Rollup table name (default: ``<spec name>__<rollup name>``)
+        description: Human-readable description
+
+    Example:
+        >>> rollup = RollupDefinition(
+        ...     name="by_country_day",
+        ...     dimensions=["country", "event_date"],
+        ...     time_dimension="event_date",
+        ...     time_grain=TimeGrain.DAY,
+        ...     start_parameter="start_date",
+        ...     end_parameter="end_date",
+        ... )
+    """
+
+    name: str
+    dimensions: list[str] = Field(default_factory=list)
+    metrics: list[str] = Field(default_factory=list)
+    time_dimension: str | None = None
+    time_grain: TimeGrain | None = None
+    start_parameter: str | None = None
+    end_parameter: str | None = None
+    table: str | None = None
+    description: str = ""
+
+    @model_validator(mode="after")
+    def validate_time_settings(self) -> RollupDefinition:
+        """Validate the time dimension and range parameters."""
+        if self.time_dimension and self.time_dimension not in self.dimensions:
+            msg = f"time_dimension '{self.time_dimension}' must be one of the rollup dimensions"
+            raise ValueError(msg)
+        if (self.time_grain or self.start_parameter or self.end_parameter) and not (
+            self.time_dimension
+        ):
+            msg = "time_grain and range parameters require a time_dimension"
+            raise ValueError(msg)
+        if bool(self.start_parameter) != bool(self.end_parameter):
+            msg = "start_parameter and end_parameter must be set together"
+            raise ValueError(msg)
+        return self
+
+    def table_name(self, spec_name: str) -> str:
+        """Return the rollup table name for a spec."""
+        return self.table or f"{spec_name}__{self.name}"
+
+
 class MetricSpec(SpecBase):
     """Metric specification for read-only analytical queries (type: Metric).
 
@@ -153,6 +249,7 @@ class MetricSpec(SpecBase):
     METRIC-SPECIFIC FIELDS (required for semantic layer):
         metrics: Metric definitions (aggregations, expressions)
         dimensions: Dimension definitions for slicing/filtering
+        rollups: Optional pre-aggregated rollups of the metrics
 
     File naming convention: metric.{catalog}.{schema}.{name}.yaml
 
@@ -192,6 +289,10 @@ class MetricSpec(SpecBase):
         default_factory=list,
         description="Dimension definitions for slicing/filtering"
     )
+    rollups: list[RollupDefinition] = Field(
+        default_factory=list,
+        description="Pre-aggregated rollups used by the metric query planner",
+    )
 
     @model_validator(mode='after')
     def validate_metric_constraints(self) -> MetricSpec:
@@ -202,4 +303,19 @@ class MetricSpec(SpecBase):
         """
         # Note: Allow empty metrics/dimensions for testing purposes
         # In production, you may want to enforce at least one metric
+        dimension_names = {dimension.name for dimension in self.dimensions}
+        metric_names = {metric.name for metric in self.metrics}
+        for rollup in self.rollups:
+            unknown = [d for d in rollup.dimensions if d not in dimension_names]
+            unknown += [m for m in rollup.metrics if m not in metric_names]
+            if unknown:
+                msg = f"Rollup '{rollup.name}' references unknown names: {', '.join(unknown)}"
+                raise ValueError(msg)
         return self
+
+    def get_rollup(self, name: str) -> RollupDefinition | None:
+        """Get a rollup by name."""
+        for rollup in self.rollups:
+            if rollup.name == name:
+                return rollup
+        return None
@@ -13,6 +13,7 @@ from typing import Any
 
 from pydantic import BaseModel, Field
 
+from dli.core.cancellation import InterruptReason
 from dli.core.models.base import _utc_now
 
 
@@ -49,6 +50,10 @@ class ExecutionResult(BaseModel):
         execution_time_ms: Execution time in milliseconds
         error_message: Error message if execution failed
         executed_at: Timestamp of execution
+        cancelled: Whether the query was cancelled (timeout or Ctrl-C)
+        interrupt_reason: Why the query was interrupted (None if it was not)
+        cancel_latency_ms: Time from the cancel request until the engine
+            stopped the query (None if not cancelled or not acknowledged)
     """
 
     dataset_name: str
@@ -62,6 +67,9 @@ class ExecutionResult(BaseModel):
     execution_time_ms: int = 0
     error_message: str | None = None
     executed_at: datetime = Field(default_factory=_utc_now)
+    cancelled: bool = False
+    interrupt_reason: InterruptReason | None = None
+    cancel_latency_ms: int | None = None
 
 
 class DatasetExecutionResult(BaseModel):
@@ -103,6 +111,7 @@ class MetricExecutionResult(BaseModel):
         execution_time_ms: Execution time in milliseconds
         rendered_sql: The SQL that was executed
         executed_at: Timestamp of execution
+        rollups: Rollup tables read instead of the source relation
     """
 
     metric_name: str
@@ -114,3 +123,4 @@ class MetricExecutionResult(BaseModel):
     execution_time_ms: float | None = None
     rendered_sql: str | None = None
     executed_at: datetime = Field(default_factory=_utc_now)
+    rollups: list[str] = Field(default_factory=list)
@@ -1,7 +1,7 @@
 """Query metadata models and operations.
 
 This module provides models for query execution metadata from the
-Basecamp Server catalog.
+Basecamp Server catalog, and incremental watching of query lists.
 """
 
 from dli.core.query.models import (
@@ -13,13 +13,17 @@ from dli.core.query.models import (
     QueryState,
     TableReference,
 )
+from dli.core.query.watch import PollBackoff, QueryWatcher, QueryWatchUpdate
 
 __all__ = [
     "AccountType",
+    "PollBackoff",
     "QueryDetail",
     "QueryInfo",
     "QueryResources",
     "QueryScope",
     "QueryState",
+    "QueryWatchUpdate",
+    "QueryWatcher",
     "TableReference",
 ]
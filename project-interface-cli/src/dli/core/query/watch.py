@@ -0,0 +1,277 @@
+"""Incremental query list watching.
+
+``dli query list --watch`` keeps one client (and its pooled connection)
+open and asks the server only for what changed since the previous poll:
+
+- The ETag of the previous response is sent as If-None-Match, so an
+  unchanged list costs a 304 with no body.
+- The change watermark (``updated_since``) limits a changed list to the
+  rows that were updated, which are merged into the local snapshot.
+- The poll interval doubles while nothing changes (up to a maximum) and
+  drops back to the minimum as soon as something does.
+
+When the server supports server-sent events, the watcher can subscribe to
+them instead and falls back to polling if the stream is unavailable.
+
+Example:
+    >>> watcher = QueryWatcher(client, filters={"scope": "all"}, limit=20)
+    >>> for update in watcher.updates():
+    ...     print(len(update.queries), update.changed_ids)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Literal
+
+from dli.exceptions import ErrorCode, ServerError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from dli.core.client import BasecampClient
+
+logger = logging.getLogger(__name__)
+
+# Default poll interval bounds in seconds
+DEFAULT_MIN_INTERVAL = 2.0
+DEFAULT_MAX_INTERVAL = 30.0
+
+
+@dataclass(frozen=True)
+class PollBackoff:
+    """Adaptive poll interval.
+
+    Attributes:
+        min_interval: Interval after a poll that found changes.
+        max_interval: Upper bound while nothing changes.
+        factor: Growth factor per unchanged poll.
+    """
+
+    min_interval: float = DEFAULT_MIN_INTERVAL
+    max_interval: float = DEFAULT_MAX_INTERVAL
+    factor: float = 2.0
+
+    def __post_init__(self) -> None:
+        """Validate the interval bounds."""
+        if self.min_interval <= 0 or self.max_interval < self.min_interval:
+            msg = (
+                f"Invalid poll interval: min={self.min_interval}, "
+                f"max={self.max_interval}"
+            )
+            raise ValueError(msg)
+
+    def next_interval(self, current: float | None, *, changed: bool) -> float:
+        """Return the interval before the next poll.
+
+        Args:
+            current: Interval used before the last poll (None initially).
+            changed: Whether the last poll returned changes.
+        """
+        if changed or current is None:
+            return self.min_interval
+        return min(current * self.factor, self.max_interval)
+
+
+@dataclass
+class QueryWatchUpdate:
+    """A change to the watched query list.
+
+    Attributes:
+        queries: Current rows, most recently started first.
+        changed_ids: IDs of rows added or updated by this change.
+        removed_ids: IDs of rows dropped by this change.
+        source: Whether the change came from a poll or an event stream.
+        polls: Number of requests made so far.
+        next_interval: Seconds until the next poll (None for events).
+    """
+
+    queries: list[Any]
+    changed_ids: set[str] = field(default_factory=set)
+    removed_ids: set[str] = field(default_factory=set)
+    source: Literal["poll", "events"] = "poll"
+    polls: int = 0
+    next_interval: float | None = None
+
+
+class QueryWatcher:
+    """Keeps a local snapshot of a query list up to date.
+
+    Example:
+        >>> watcher = QueryWatcher(client, filters={"state": "running"})
+        >>> update = watcher.poll()  # full list on the first call
+        >>> watcher.poll() is None  # unchanged since then
+        True
+    """
+
+    def __init__(
+        self,
+        client: BasecampClient,
+        *,
+        filters: dict[str, Any] | None = None,
+        limit: int = 10,
+        backoff: PollBackoff | None = None,
+        use_events: bool = False,
+    ) -> None:
+        """Initialize the watcher.
+
+        Args:
+            client: Client used for every request (keep it pooled).
+            filters: ``query_list`` filters (scope, state, tags, ...).
+            limit: Maximum number of rows to keep.
+            backoff: Poll interval policy.
+            use_events: Subscribe to server-sent events when available.
+        """
+        self.client = client
+        self.filters = filters or {}
+        self.limit = limit
+        self.backoff = backoff or PollBackoff()
+        self.use_events = use_events
+        self.polls = 0
+        self._rows: dict[str, dict[str, Any]] = {}
+        self._etag: str | None = None
+        self._updated_since: str | None = None
+        self._primed = False
+
+    @property
+    def queries(self) -> list[dict[str, Any]]:
+        """Current rows, most recently started first."""
+        return sorted(
+            self._rows.values(),
+            key=lambda q: str(q.get("started_at") or ""),
+            reverse=True,
+        )
+
+    def _apply(
+        self,
+        changed: list[dict[str, Any]],
+        removed: list[str],
+        source: Literal["poll", "events"],
+    ) -> QueryWatchUpdate | None:
+        """Merge changed rows into the snapshot."""
+        changed_ids = {q["query_id"] for q in changed}
+        removed_ids = {query_id for query_id in removed if query_id in self._rows}
+        for query_id in removed_ids:
+            del self._rows[query_id]
+        for query in changed:
+            self._rows[query["query_id"]] = query
+
+        # Keep the newest rows within the limit
+        kept = self.queries[: self.limit]
+        dropped = set(self._rows) - {q["query_id"] for q in kept}
+        for query_id in dropped:
+            del self._rows[query_id]
+        removed_ids |= dropped - changed_ids
+        changed_ids -= dropped
+
+        if not changed_ids and not removed_ids and self._primed:
+            return None
+        self._primed = True
+        return QueryWatchUpdate(
+            queries=kept,
+            changed_ids=changed_ids,
+            removed_ids=removed_ids,
+            source=source,
+            polls=self.polls,
+        )
+
+    def poll(self) -> QueryWatchUpdate | None:
+        """Fetch changes since the previous poll.
+
+        Returns:
+            The update, or None if nothing changed. The first poll always
+            returns the full list.
+
+        Raises:
+            ServerError: If the server rejects the request.
+        """
+        self.polls += 1
+        response = self.client.query_list_changes(
+            **self.filters,
+            limit=self.limit,
+            updated_since=self._updated_since,
+            etag=self._etag,
+        )
+        if not response.success:
+            raise ServerError(
+                message=response.error or "Failed to list queries",
+                code=ErrorCode.SERVER_ERROR,
+                status_code=response.status_code,
+            )
+        if response.status_code == 304 or not isinstance(response.data, dict):  # noqa: PLR2004
+            return None
+
+        data = response.data
+        self._etag = data.get("etag") or self._etag
+        self._updated_since = data.get("updated_since") or self._updated_since
+        return self._apply(data.get("queries") or [], data.get("removed") or [], "poll")
+
+    def _events(self) -> Iterator[QueryWatchUpdate]:
+        """Yield updates from the server-sent event stream."""
+        for event in self.client.stream_query_events(**self.filters):
+            update = self._apply(
+                event.get("queries") or [], event.get("removed") or [], "events"
+            )
+            if update is not None:
+                yield update
+
+    def updates(
+        self,
+        *,
+        stop: threading.Event | None = None,
+        sleep: Callable[[float], Any] = time.sleep,
+    ) -> Iterator[QueryWatchUpdate]:
+        """Yield the full list once, then every change until stopped.
+
+        Errors after the first poll are logged and retried at the maximum
+        interval, so a brief server outage does not end the watch. With
+        ``use_events``, changes are streamed until the event stream fails or
+        closes, after which polling resumes.
+
+        Args:
+            stop: Event that ends the watch when set.
+            sleep: Sleep function (``stop.wait`` is used when given).
+        """
+        wait = stop.wait if stop is not None else sleep
+        interval: float | None = None
+
+        first = self.poll()
+        if first is not None:
+            first.next_interval = self.backoff.min_interval
+            yield first
+
+        if self.use_events:
+            # Poll once the stream is unavailable or closed by the server
+            try:
+                yield from self._events()
+            except Exception as e:
+                logger.info("Query events unavailable, polling instead: %s", e)
+
+        while stop is None or not stop.is_set():
+            interval = self.backoff.next_interval(interval, changed=False)
+            wait(interval)
+            if stop is not None and stop.is_set():
+                return
+            try:
+                update = self.poll()
+            except ServerError as e:
+                logger.warning("Query list poll failed: %s", e)
+                interval = self.backoff.max_interval
+                continue
+            if update is None:
+                continue
+            interval = None
+            update.next_interval = self.backoff.min_interval
+            yield update
+
+
+__all__ = [
+    "DEFAULT_MAX_INTERVAL",
+    "DEFAULT_MIN_INTERVAL",
+    "PollBackoff",
+    "QueryWatchUpdate",
+    "QueryWatcher",
+]
@@ -4,14 +4,205 @@ This module provides registry classes which manage
 specs with caching, filtering, and search functionality:
 - DatasetRegistry: Registry for DatasetSpec (type: Dataset)
 - MetricRegistry: Registry for MetricSpec (type: Metric)
+- SpecIndex: Inverted indexes shared by both registries
+
+Filters and facet listings are served from indexes built when specs are
+loaded (and rebuilt on ``reload``), so their cost grows with the size of
+the result rather than the number of specs in the project.
 """
 
 from __future__ import annotations
 
-from collections.abc import Iterator
+from collections import Counter
+from collections.abc import Iterable, Iterator
 
 from dli.core.discovery import ProjectConfig, SpecDiscovery
-from dli.core.models import DatasetSpec, MetricSpec
+from dli.core.models import DatasetSpec, MetricSpec, SpecBase
+
+# Length of the name n-grams used for substring search
+NGRAM_SIZE = 3
+
+# Facet fields, in the order returned by ``facets()``
+FACET_FIELDS = ("tag", "domain", "owner", "team", "catalog", "schema")
+
+
+def _name_ngrams(text: str) -> set[str]:
+    """Return the n-grams of a lowercased string."""
+    return {text[i : i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1)}
+
+
+def _facet_values(spec: SpecBase) -> dict[str, tuple[str, ...]]:
+    """Return the (de-duplicated, non-empty) facet values of a spec."""
+    return {
+        "tag": tuple(dict.fromkeys(t for t in spec.tags if t)),
+        "domain": tuple(dict.fromkeys(d for d in spec.domains if d)),
+        "owner": (spec.owner,) if spec.owner else (),
+        "team": (spec.team,) if spec.team else (),
+        "catalog": (spec.catalog,) if spec.catalog else (),
+        "schema": (spec.schema_name,) if spec.schema_name else (),
+    }
+
+
+class SpecIndex:
+    """Inverted indexes over spec names for registry search and facets.
+
+    Each facet field (tag, domain, owner, team, catalog, schema) maps a value
+    to the set of spec names having it, and every ``NGRAM_SIZE``-character
+    substring of a lowercased name maps to the names containing it. Searches
+    intersect posting sets, smallest first, instead of scanning every spec;
+    facet counts are computed from the matching names only.
+
+    Results keep the order in which specs were first added.
+
+    Example:
+        >>> index = SpecIndex()
+        >>> index.add(spec)
+        >>> index.search(tag="daily", name_pattern="click")
+        ['iceberg.analytics.daily_clicks']
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty indexes."""
+        self._position: dict[str, int] = {}
+        self._values: dict[str, dict[str, tuple[str, ...]]] = {}
+        self._postings: dict[str, dict[str, set[str]]] = {f: {} for f in FACET_FIELDS}
+        self._ngrams: dict[str, set[str]] = {}
+        self._next_position = 0
+
+    def __len__(self) -> int:
+        """Return the number of indexed specs."""
+        return len(self._values)
+
+    def add(self, spec: SpecBase) -> None:
+        """Index a spec, replacing any spec with the same name."""
+        name = spec.name
+        if name in self._values:
+            self.remove(name)
+        if name not in self._position:
+            self._position[name] = self._next_position
+            self._next_position += 1
+
+        values = _facet_values(spec)
+        self._values[name] = values
+        for field, field_values in values.items():
+            postings = self._postings[field]
+            for value in field_values:
+                postings.setdefault(value, set()).add(name)
+        for gram in _name_ngrams(name.lower()):
+            self._ngrams.setdefault(gram, set()).add(name)
+
+    def remove(self, name: str) -> None:
+        """Remove a spec from the indexes (no-op if absent)."""
+        values = self._values.pop(name, None)
+        if values is None:
+            return
+        for field, field_values in values.items():
+            postings = self._postings[field]
+            for value in field_values:
+                names = postings[value]
+                names.discard(name)
+                if not names:
+                    del postings[value]
+        for gram in _name_ngrams(name.lower()):
+            names = self._ngrams[gram]
+            names.discard(name)
+            if not names:
+                del self._ngrams[gram]
+
+    def clear(self) -> None:
+        """Remove every spec."""
+        self._position.clear()
+        self._values.clear()
+        for postings in self._postings.values():
+            postings.clear()
+        self._ngrams.clear()
+        self._next_position = 0
+
+    def _ordered(self, names: Iterable[str]) -> list[str]:
+        """Return names in the order their specs were first added."""
+        return sorted(names, key=self._position.__getitem__)
+
+    def search(
+        self,
+        *,
+        name_pattern: str | None = None,
+        **filters: str | None,
+    ) -> list[str]:
+        """Return the names matching every given filter.
+
+        Args:
+            name_pattern: Case-insensitive substring of the name.
+            **filters: Exact facet values keyed by facet field (tag, domain,
+                owner, team, catalog, schema). Empty values are ignored.
+
+        Returns:
+            Matching spec names in insertion order.
+        """
+        postings: list[set[str]] = []
+        for field, value in filters.items():
+            if not value:
+                continue
+            posting = self._postings[field].get(value)
+            if not posting:
+                return []
+            postings.append(posting)
+
+        pattern = name_pattern.lower() if name_pattern else ""
+        for gram in _name_ngrams(pattern):
+            posting = self._ngrams.get(gram)
+            if not posting:
+                return []
+            postings.append(posting)
+
+        if not postings:
+            names: Iterable[str] = self._values
+        else:
+            postings.sort(key=len)
+            names = postings[0].intersection(*postings[1:])
+        if pattern:
+            # n-grams only narrow the candidates; confirm the substring
+            names = [n for n in names if pattern in n.lower()]
+        return self._ordered(names)
+
+    def values(self, field: str, *, within: Iterable[str] | None = None) -> list[str]:
+        """Return the distinct values of a facet field.
+
+        Args:
+            field: Facet field name.
+            within: Restrict to these spec names (defaults to all specs).
+
+        Returns:
+            Sorted list of values.
+        """
+        if within is None:
+            return sorted(self._postings[field])
+        return sorted({v for name in within for v in self._values[name][field]})
+
+    def facets(self, names: Iterable[str] | None = None) -> dict[str, dict[str, int]]:
+        """Count specs per facet value.
+
+        Args:
+            names: Spec names to count, e.g. a search result (defaults to all
+                specs, counted from posting sizes).
+
+        Returns:
+            Mapping of facet field to ``{value: spec count}``, values sorted.
+        """
+        if names is None:
+            return {
+                field: {
+                    value: len(self._postings[field][value])
+                    for value in sorted(postings)
+                }
+                for field, postings in self._postings.items()
+            }
+        counts: dict[str, Counter[str]] = {field: Counter() for field in FACET_FIELDS}
+        for name in names:
+            for field, field_values in self._values.get(name, {}).items():
+                counts[field].update(field_values)
+        return {
+            field: dict(sorted(counter.items())) for field, counter in counts.items()
+        }
 
 
 class DatasetRegistry:
@@ -33,12 +224,14 @@ class DatasetRegistry:
         self.config = project_config
         self._discovery = SpecDiscovery(project_config)
         self._cache: dict[str, DatasetSpec] = {}
+        self._index = SpecIndex()
         self._load_all()
 
     def _load_all(self) -> None:
         """Load all dataset specs into the cache."""
         for spec in self._discovery.discover_datasets():
             self._cache[spec.name] = spec
+            self._index.add(spec)
 
     def get(self, name: str) -> DatasetSpec | None:
         """Get a dataset spec by name.
@@ -72,7 +265,7 @@ class DatasetRegistry:
     ) -> list[DatasetSpec]:
         """Search for datasets with optional filters.
 
-        All filters are ANDed together.
+        All filters are ANDed together by intersecting index postings.
 
         Args:
             tag: Filter by tag
@@ -86,31 +279,16 @@ class DatasetRegistry:
         Returns:
             List of matching dataset specs
         """
-        results = self.list_all()
-
-        if tag:
-            results = [s for s in results if tag in s.tags]
-
-        if domain:
-            results = [s for s in results if domain in s.domains]
-
-        if owner:
-            results = [s for s in results if s.owner == owner]
-
-        if team:
-            results = [s for s in results if s.team == team]
-
-        if catalog:
-            results = [s for s in results if s.catalog == catalog]
-
-        if schema:
-            results = [s for s in results if s.schema_name == schema]
-
-        if name_pattern:
-            pattern_lower = name_pattern.lower()
-            results = [s for s in results if pattern_lower in s.name.lower()]
-
-        return results
+        names = self._index.search(
+            tag=tag,
+            domain=domain,
+            owner=owner,
+            team=team,
+            catalog=catalog,
+            schema=schema,
+            name_pattern=name_pattern,
+        )
+        return [self._cache[name] for name in names]
 
     def get_by_catalog(self, catalog: str) -> list[DatasetSpec]:
         """Get all datasets in a catalog.
@@ -174,7 +352,7 @@ class DatasetRegistry:
         Returns:
             Sorted list of catalog names
         """
-        return sorted({s.catalog for s in self.list_all() if s.catalog})
+        return self._index.values("catalog")
 
     def get_schemas(self, catalog: str | None = None) -> list[str]:
         """Get all unique schema names.
@@ -185,10 +363,11 @@ class DatasetRegistry:
         Returns:
             Sorted list of schema names
         """
-        specs = self.list_all()
         if catalog:
-            specs = [s for s in specs if s.catalog == catalog]
-        return sorted({s.schema_name for s in specs if s.schema_name})
+            return self._index.values(
+                "schema", within=self._index.search(catalog=catalog)
+            )
+        return self._index.values("schema")
 
     def get_domains(self) -> list[str]:
         """Get all unique domain names.
@@ -196,10 +375,7 @@ class DatasetRegistry:
         Returns:
             Sorted list of domain names
         """
-        domains: set[str] = set()
-        for spec in self.list_all():
-            domains.update(spec.domains)
-        return sorted(domains)
+        return self._index.values("domain")
 
     def get_tags(self) -> list[str]:
         """Get all unique tag names.
@@ -207,10 +383,7 @@ class DatasetRegistry:
         Returns:
             Sorted list of tag names
         """
-        tags: set[str] = set()
-        for spec in self.list_all():
-            tags.update(spec.tags)
-        return sorted(tags)
+        return self._index.values("tag")
 
     def get_owners(self) -> list[str]:
         """Get all unique owners.
@@ -218,7 +391,7 @@ class DatasetRegistry:
         Returns:
             Sorted list of owner emails
         """
-        return sorted({s.owner for s in self.list_all() if s.owner})
+        return self._index.values("owner")
 
     def get_teams(self) -> list[str]:
         """Get all unique teams.
@@ -226,11 +399,32 @@ class DatasetRegistry:
         Returns:
             Sorted list of team names
         """
-        return sorted({s.team for s in self.list_all() if s.team})
+        return self._index.values("team")
+
+    def facets(
+        self, results: Iterable[DatasetSpec] | None = None
+    ) -> dict[str, dict[str, int]]:
+        """Count datasets per tag, domain, owner, team, catalog and schema.
+
+        Args:
+            results: DatasetSpecs to count, e.g. a ``search()`` result
+                (defaults to all datasets)
+
+        Returns:
+            Mapping of facet name to ``{value: count}``
+
+        Example:
+            >>> results = registry.search(domain="analytics")
+            >>> registry.facets(results)["tag"]
+            {'daily': 3, 'kpi': 1}
+        """
+        names = None if results is None else [spec.name for spec in results]
+        return self._index.facets(names)
 
     def reload(self) -> None:
-        """Reload all dataset specs from disk."""
+        """Reload all dataset specs from disk and rebuild the indexes."""
         self._cache.clear()
+        self._index.clear()
         self._load_all()
 
     def __len__(self) -> int:
@@ -271,12 +465,14 @@ class MetricRegistry:
         self.config = project_config
         self._discovery = SpecDiscovery(project_config)
         self._cache: dict[str, MetricSpec] = {}
+        self._index = SpecIndex()
         self._load_all()
 
     def _load_all(self) -> None:
         """Load all metric specs into the cache."""
         for spec in self._discovery.discover_metrics():
             self._cache[spec.name] = spec
+            self._index.add(spec)
 
     def get(self, name: str) -> MetricSpec | None:
         """Get a metric spec by name.
@@ -310,7 +506,7 @@ class MetricRegistry:
     ) -> list[MetricSpec]:
         """Search for metrics with optional filters.
 
-        All filters are ANDed together.
+        All filters are ANDed together by intersecting index postings.
 
         Args:
             tag: Filter by tag
@@ -324,31 +520,16 @@ class MetricRegistry:
         Returns:
             List of matching metric specs
         """
-        results = self.list_all()
-
-        if tag:
-            results = [s for s in results if tag in s.tags]
-
-        if domain:
-            results = [s for s in results if domain in s.domains]
-
-        if owner:
-            results = [s for s in results if s.owner == owner]
-
-        if team:
-            results = [s for s in results if s.team == team]
-
-        if catalog:
-            results = [s for s in results if s.catalog == catalog]
-
-        if schema:
-            results = [s for s in results if s.schema_name == schema]
-
-        if name_pattern:
-            pattern_lower = name_pattern.lower()
-            results = [s for s in results if pattern_lower in s.name.lower()]
-
-        return results
+        names = self._index.search(
+            tag=tag,
+            domain=domain,
+            owner=owner,
+            team=team,
+            catalog=catalog,
+            schema=schema,
+            name_pattern=name_pattern,
+        )
+        return [self._cache[name] for name in names]
 
     def get_by_catalog(self, catalog: str) -> list[MetricSpec]:
         """Get all metrics in a catalog.
@@ -412,7 +593,7 @@ class MetricRegistry:
         Returns:
             Sorted list of catalog names
         """
-        return sorted({s.catalog for s in self.list_all() if s.catalog})
+        return self._index.values("catalog")
 
     def get_schemas(self, catalog: str | None = None) -> list[str]:
         """Get all unique schema names.
@@ -423,10 +604,11 @@ class MetricRegistry:
         Returns:
             Sorted list of schema names
         """
-        specs = self.list_all()
         if catalog:
-            specs = [s for s in specs if s.catalog == catalog]
-        return sorted({s.schema_name for s in specs if s.schema_name})
+            return self._index.values(
+                "schema", within=self._index.search(catalog=catalog)
+            )
+        return self._index.values("schema")
 
     def get_domains(self) -> list[str]:
         """Get all unique domain names.
@@ -434,10 +616,7 @@ class MetricRegistry:
         Returns:
             Sorted list of domain names
         """
-        domains: set[str] = set()
-        for spec in self.list_all():
-            domains.update(spec.domains)
-        return sorted(domains)
+        return self._index.values("domain")
 
     def get_tags(self) -> list[str]:
         """Get all unique tag names.
@@ -445,10 +624,7 @@ class MetricRegistry:
         Returns:
             Sorted list of tag names
         """
-        tags: set[str] = set()
-        for spec in self.list_all():
-            tags.update(spec.tags)
-        return sorted(tags)
+        return self._index.values("tag")
 
     def get_owners(self) -> list[str]:
         """Get all unique owners.
@@ -456,7 +632,7 @@ class MetricRegistry:
         Returns:
             Sorted list of owner emails
         """
-        return sorted({s.owner for s in self.list_all() if s.owner})
+        return self._index.values("owner")
 
     def get_teams(self) -> list[str]:
         """Get all unique teams.
@@ -464,11 +640,32 @@ class MetricRegistry:
         Returns:
             Sorted list of team names
         """
-        return sorted({s.team for s in self.list_all() if s.team})
+        return self._index.values("team")
+
+    def facets(
+        self, results: Iterable[MetricSpec] | None = None
+    ) -> dict[str, dict[str, int]]:
+        """Count metrics per tag, domain, owner, team, catalog and schema.
+
+        Args:
+            results: MetricSpecs to count, e.g. a ``search()`` result
+                (defaults to all metrics)
+
+        Returns:
+            Mapping of facet name to ``{value: count}``
+
+        Example:
+            >>> results = registry.search(domain="analytics")
+            >>> registry.facets(results)["tag"]
+            {'daily': 3, 'kpi': 1}
+        """
+        names = None if results is None else [spec.name for spec in results]
+        return self._index.facets(names)
 
     def reload(self) -> None:
-        """Reload all metric specs from disk."""
+        """Reload all metric specs from disk and rebuild the indexes."""
         self._cache.clear()
+        self._index.clear()
         self._load_all()
 
     def __len__(self) -> int:
@@ -482,3 +679,12 @@ class MetricRegistry:
     def __iter__(self) -> Iterator[MetricSpec]:
         """Iterate over all metric specs."""
         return iter(self._cache.values())
+
+
+__all__ = [
+    "FACET_FIELDS",
+    "NGRAM_SIZE",
+    "DatasetRegistry",
+    "MetricRegistry",
+    "SpecIndex",
+]
@@ -22,7 +22,9 @@ from typing import Any
 from jinja2 import Environment, FileSystemLoader, StrictUndefined
 
 from dli.core.models import QueryParameter
+from dli.core.spans import traced
 from dli.core.sql_filters import (
+    sql_date_trunc,
     sql_identifier_escape,
     sql_list_escape,
     sql_string_escape,
@@ -71,6 +73,8 @@ class SQLRenderer:
         self.env.filters["sql_list"] = sql_list_escape
         # SQL identifier quoting (shared with SafeJinjaEnvironment)
         self.env.filters["sql_identifier"] = sql_identifier_escape
+        # Date truncation to a time grain (shared with SafeJinjaEnvironment)
+        self.env.filters["date_trunc"] = sql_date_trunc
         # SQL date formatting (SQLRenderer-specific)
         self.env.filters["sql_date"] = self._sql_date_filter
 
@@ -96,6 +100,7 @@ class SQLRenderer:
         except AttributeError:
             return sql_string_escape(str(value))
 
+    @traced("render.template")
     def render(
         self,
         template_str: str,
@@ -132,6 +137,7 @@ class SQLRenderer:
         template = self.env.from_string(template_str)
         return template.render(**validated)
 
+    @traced("render.template")
     def render_string(self, template_str: str, params: dict[str, Any]) -> str:
         """Render a SQL template string directly without validation.
 
@@ -169,6 +175,7 @@ class SQLRenderer:
         template_str = file_path.read_text(encoding="utf-8")
         return self.render(template_str, parameters, params)
 
+    @traced("render.template")
     def render_with_template_context(
         self,
         template_str: str,
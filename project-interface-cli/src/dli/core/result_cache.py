@@ -0,0 +1,400 @@
+"""Local cache of metric query results.
+
+This module provides the ResultCache class used by ``MetricAPI.run`` to
+reuse the rows of a previous execution of the same rendered SQL. This is a
+LOCAL ONLY cache - results are stored on disk under the dli home
+(``~/.dli/cache/results``) and shared by all projects of the user.
+
+Entries are keyed by the SHA-256 of the rendered SQL together with the
+dialect, the engine target (server URL) and the row limit. An entry is
+reused only when:
+- It is younger than the configured TTL
+- None of its upstream tables has a newer ``last_updated`` in the catalog
+  (only checked when the caller passes current table versions)
+
+Rows are stored column by column in a gzip-compressed JSON file per entry,
+which keeps repeated column names out of the file. Values JSON cannot
+represent (datetime, date, time, Decimal, bytes) are stored as tagged
+objects and restored with their type; any other non-JSON value is stored
+as its string form. The index records size and last access time; when the
+total size exceeds ``max_bytes`` the least recently used entries are evicted.
+
+Storage layout::
+
+    ~/.dli/cache/results/
+        index.json          # {"format": 1, "entries": {key: {...}}}
+        <key>.json.gz       # {"columns": [...], "data": [[...], ...]}
+"""
+
+from __future__ import annotations
+
+import base64
+from dataclasses import dataclass
+from datetime import UTC, date, datetime
+from datetime import time as dt_time
+from decimal import Decimal
+import gzip
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import tempfile
+import time
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = "index.json"
+
+# Default upper bound for the total size of cached result files
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Bump when the stored entry layout changes
+_CACHE_FORMAT = 2
+
+# Key marking a JSON object as an encoded typed value
+_TYPE_TAG = "__dli_type__"
+
+
+@dataclass(frozen=True)
+class CachedResult:
+    """A result served from the cache.
+
+    Attributes:
+        rows: Result rows.
+        row_count: Number of rows reported by the original execution.
+        created_at: When the result was computed.
+        age_seconds: Seconds since the result was computed.
+    """
+
+    rows: list[dict[str, Any]]
+    row_count: int
+    created_at: datetime
+    age_seconds: float
+
+
+def compute_result_key(
+    sql: str,
+    *,
+    dialect: str | None,
+    target: str | None,
+    limit: int | None = None,
+) -> str:
+    """Compute the cache key for a rendered query.
+
+    Args:
+        sql: Rendered SQL.
+        dialect: SQL dialect of the query.
+        target: Engine target the query runs against (e.g., server URL).
+        limit: Row limit applied to the execution.
+
+    Returns:
+        Hex digest key.
+    """
+    settings = json.dumps(
+        {"dialect": dialect, "target": target, "limit": limit}, sort_keys=True
+    )
+    digest = hashlib.sha256(sql.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(settings.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def default_result_cache_dir() -> Path:
+    """Return the default cache directory under the dli home."""
+    return Path.home() / ".dli" / "cache" / "results"
+
+
+def _encode_value(value: Any) -> Any:
+    """Encode a value JSON cannot represent natively (``json.dump`` default)."""
+    if isinstance(value, datetime):
+        return {_TYPE_TAG: "datetime", "value": value.isoformat()}
+    if isinstance(value, date):
+        return {_TYPE_TAG: "date", "value": value.isoformat()}
+    if isinstance(value, dt_time):
+        return {_TYPE_TAG: "time", "value": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {_TYPE_TAG: "decimal", "value": str(value)}
+    if isinstance(value, bytes):
+        return {_TYPE_TAG: "bytes", "value": base64.b64encode(value).decode("ascii")}
+    return str(value)
+
+
+def _decode_value(obj: dict[str, Any]) -> Any:
+    """Restore a value encoded by ``_encode_value`` (``json.load`` object_hook)."""
+    kind = obj.get(_TYPE_TAG)
+    if kind is None:
+        return obj
+    value = obj["value"]
+    if kind == "datetime":
+        return datetime.fromisoformat(value)
+    if kind == "date":
+        return date.fromisoformat(value)
+    if kind == "time":
+        return dt_time.fromisoformat(value)
+    if kind == "decimal":
+        return Decimal(value)
+    if kind == "bytes":
+        return base64.b64decode(value)
+    msg = f"Unknown cached value type: {kind}"
+    raise ValueError(msg)
+
+
+def _to_columns(rows: list[dict[str, Any]]) -> dict[str, Any]:
+    columns: dict[str, None] = {}
+    for row in rows:
+        for name in row:
+            columns.setdefault(name, None)
+    names = list(columns)
+    return {
+        "columns": names,
+        "data": [[row.get(name) for row in rows] for name in names],
+    }
+
+
+def _from_columns(payload: dict[str, Any]) -> list[dict[str, Any]]:
+    names: list[str] = payload["columns"]
+    data: list[list[Any]] = payload["data"]
+    return [dict(zip(names, values, strict=True)) for values in zip(*data, strict=True)]
+
+
+def _is_newer(current: str | None, cached: str | None) -> bool:
+    """Whether a table's current last_updated is newer than the cached one."""
+    if current is None or current == cached:
+        return False
+    if cached is None:
+        return True
+    try:
+        return datetime.fromisoformat(current) > datetime.fromisoformat(cached)
+    except ValueError:
+        return True
+
+
+class ResultCache:
+    """On-disk cache of query results with TTL and LRU size eviction.
+
+    Attributes:
+        cache_dir: Directory holding the index and result files.
+        ttl_seconds: Maximum age of a reusable entry.
+        max_bytes: Upper bound for the total size of result files.
+
+    Example:
+        >>> cache = ResultCache(default_result_cache_dir(), ttl_seconds=600)
+        >>> key = compute_result_key(sql, dialect="trino", target=server_url)
+        >>> cached = cache.get(key)
+        >>> if cached is None:
+        ...     rows = execute(sql)
+        ...     cache.put(key, rows)
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        *,
+        ttl_seconds: float,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        """Initialize the cache and load the index.
+
+        Args:
+            cache_dir: Directory holding the index and result files.
+            ttl_seconds: Maximum age of a reusable entry in seconds.
+            max_bytes: Upper bound for the total size of result files.
+        """
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._load()
+
+    @property
+    def index_file(self) -> Path:
+        """Path to the JSON index file."""
+        return self.cache_dir / INDEX_FILENAME
+
+    @property
+    def total_bytes(self) -> int:
+        """Total size of all cached result files."""
+        return sum(entry["size"] for entry in self._entries.values())
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        """Return whether an entry exists for the key (fresh or not)."""
+        return key in self._entries
+
+    def get(
+        self,
+        key: str,
+        *,
+        table_versions: Mapping[str, str | None] | None = None,
+    ) -> CachedResult | None:
+        """Return a cached result if it is still valid.
+
+        Expired entries and entries whose upstream tables have been updated
+        since they were stored are removed.
+
+        Args:
+            key: Key from ``compute_result_key``.
+            table_versions: Current ``last_updated`` per upstream table.
+                If None, freshness is not checked.
+
+        Returns:
+            CachedResult, or None on a miss.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        now = time.time()
+        age = now - entry["created_at"]
+        stale = age > self.ttl_seconds
+        if not stale and table_versions is not None:
+            cached_versions = entry.get("tables", {})
+            stale = any(
+                _is_newer(version, cached_versions.get(table))
+                for table, version in table_versions.items()
+            )
+        if stale:
+            self._remove(key)
+            self._save()
+            return None
+
+        try:
+            with gzip.open(self.cache_dir / entry["file"], "rt", encoding="utf-8") as f:
+                rows = _from_columns(json.load(f, object_hook=_decode_value))
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Dropping unreadable result cache entry %s: %s", key, e)
+            self._remove(key)
+            self._save()
+            return None
+
+        entry["accessed_at"] = now
+        self._save()
+        return CachedResult(
+            rows=rows,
+            row_count=entry.get("row_count", len(rows)),
+            created_at=datetime.fromtimestamp(entry["created_at"], tz=UTC),
+            age_seconds=age,
+        )
+
+    def put(
+        self,
+        key: str,
+        rows: list[dict[str, Any]],
+        *,
+        row_count: int | None = None,
+        table_versions: Mapping[str, str | None] | None = None,
+    ) -> None:
+        """Store a result and evict least recently used entries if needed.
+
+        Failures are logged and ignored; the cache is an optimization only.
+
+        Args:
+            key: Key from ``compute_result_key``.
+            rows: Result rows.
+            row_count: Row count reported by the execution (default: len(rows)).
+            table_versions: ``last_updated`` per upstream table at execution time.
+        """
+        filename = f"{key}.json.gz"
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(
+                dir=self.cache_dir, prefix=".result-", suffix=".tmp"
+            )
+            with (
+                os.fdopen(fd, "wb") as raw,
+                gzip.open(raw, "wt", encoding="utf-8") as f,
+            ):
+                json.dump(
+                    _to_columns(rows), f, default=_encode_value, separators=(",", ":")
+                )
+            tmp_path = Path(tmp_name)
+            size = tmp_path.stat().st_size
+            tmp_path.replace(self.cache_dir / filename)
+        except OSError as e:
+            logger.warning("Failed to write result cache entry %s: %s", key, e)
+            return
+
+        now = time.time()
+        self._entries[key] = {
+            "file": filename,
+            "created_at": now,
+            "accessed_at": now,
+            "size": size,
+            "row_count": len(rows) if row_count is None else row_count,
+            "tables": dict(table_versions or {}),
+        }
+        self._evict(keep=key)
+        self._save()
+
+    def clear(self) -> None:
+        """Remove all entries, their result files and the index."""
+        for key in list(self._entries):
+            self._remove(key)
+        self.index_file.unlink(missing_ok=True)
+
+    def _evict(self, keep: str) -> None:
+        """Drop least recently used entries until the size limit is met."""
+        total = self.total_bytes
+        by_access = sorted(self._entries, key=lambda k: self._entries[k]["accessed_at"])
+        for key in by_access:
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            total -= self._entries[key]["size"]
+            self._remove(key)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            (self.cache_dir / entry["file"]).unlink(missing_ok=True)
+
+    def _save(self) -> None:
+        payload = {"format": _CACHE_FORMAT, "entries": self._entries}
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(
+                dir=self.cache_dir, prefix=".index-", suffix=".tmp"
+            )
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f)
+            Path(tmp_name).replace(self.index_file)
+        except OSError as e:
+            logger.warning(
+                "Failed to write result cache index %s: %s", self.index_file, e
+            )
+
+    def _load(self) -> None:
+        try:
+            with open(self.index_file, encoding="utf-8") as f:
+                payload = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(
+                "Ignoring unreadable result cache %s: %s", self.index_file, e
+            )
+            return
+        if not isinstance(payload, dict) or payload.get("format") != _CACHE_FORMAT:
+            return
+        entries = payload.get("entries")
+        if isinstance(entries, dict):
+            self._entries = entries
+
+
+__all__ = [
+    "DEFAULT_MAX_BYTES",
+    "INDEX_FILENAME",
+    "CachedResult",
+    "ResultCache",
+    "compute_result_key",
+    "default_result_cache_dir",
+]
@@ -0,0 +1,491 @@
+"""Span tracing on top of the command TraceContext.
+
+This module records timed spans (config loading, discovery, rendering,
+SQLGlot parsing, transpile, HTTP calls, execution) for the current CLI
+command and exports them for a flame-style breakdown.
+
+Spans are recorded only when the current TraceContext has a SpanRecorder.
+When it does not (the default), ``span()`` returns a shared no-op object
+and ``@traced`` calls the wrapped function directly, so instrumented hot
+paths pay one context variable lookup.
+
+Profiling is switched on per command by a profile target, taken from
+``dli --profile TARGET`` or the ``DLI_PROFILE`` environment variable:
+- ``*.jsonl``: one JSON object per span
+- any other path: Chrome trace JSON (open in Perfetto or chrome://tracing)
+- ``http(s)://...``: OTLP/HTTP JSON POST (e.g. http://localhost:4318/v1/traces)
+
+Spans are recorded for the thread that runs the command; worker threads
+start without a trace context and are not recorded.
+
+Example:
+    >>> from dli.core.spans import span, traced
+    >>>
+    >>> @traced("discovery.load_spec")
+    ... def load(path): ...
+    >>>
+    >>> with span("http.request", method="GET", path="/health") as s:
+    ...     response = client.get("/health")
+    ...     s.set_attribute("status_code", response.status_code)
+"""
+
+from __future__ import annotations
+
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+import functools
+import json
+import logging
+import os
+from pathlib import Path
+import threading
+import time
+from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar
+
+from dli.core.trace import TraceContext, get_current_trace
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from types import TracebackType
+
+logger = logging.getLogger(__name__)
+
+# Span currently open in this context (parent of the next span)
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+# Offset that turns perf_counter_ns readings into Unix epoch nanoseconds
+_EPOCH_OFFSET_NS = time.time_ns() - time.perf_counter_ns()
+
+
+@dataclass
+class Span:
+    """A timed operation within a command.
+
+    Attributes:
+        name: Operation name (e.g., "discovery.load_spec").
+        span_id: 16-hex-digit span identifier.
+        parent_id: span_id of the enclosing span, or None for a root span.
+        start_ns: Start time in Unix epoch nanoseconds.
+        end_ns: End time in Unix epoch nanoseconds (0 while open).
+        thread_id: Identifier of the thread that recorded the span.
+        attributes: Key-value details (paths, dialects, status codes).
+        error: Exception summary if the operation raised.
+    """
+
+    name: str
+    span_id: str
+    parent_id: str | None
+    start_ns: int
+    end_ns: int = 0
+    thread_id: int = 0
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+
+    @property
+    def duration_ms(self) -> float:
+        """Span duration in milliseconds."""
+        return max(self.end_ns - self.start_ns, 0) / 1_000_000
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Attach a detail to the span."""
+        self.attributes[key] = value
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the span as a JSON-serializable dictionary."""
+        return {
+            "name": self.name,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration_ms": round(self.duration_ms, 3),
+            "thread_id": self.thread_id,
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+
+class SpanRecorder:
+    """Collects finished spans for one command.
+
+    Attributes:
+        spans: Finished spans in completion order.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty recorder."""
+        self.spans: list[Span] = []
+        self._lock = threading.Lock()
+        self._next_id = 0
+
+    def start(self, name: str, attributes: dict[str, Any]) -> Span:
+        """Open a span as a child of the current span."""
+        with self._lock:
+            self._next_id += 1
+            span_id = f"{self._next_id:016x}"
+        parent = _current_span.get()
+        return Span(
+            name=name,
+            span_id=span_id,
+            parent_id=parent.span_id if parent is not None else None,
+            start_ns=_EPOCH_OFFSET_NS + time.perf_counter_ns(),
+            thread_id=threading.get_ident(),
+            attributes=attributes,
+        )
+
+    def finish(self, span: Span) -> None:
+        """Close a span and keep it."""
+        span.end_ns = _EPOCH_OFFSET_NS + time.perf_counter_ns()
+        with self._lock:
+            self.spans.append(span)
+
+
+class _NoopSpan:
+    """Stand-in returned by ``span()`` when recording is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> _NoopSpan:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Ignore the attribute."""
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class _ActiveSpan:
+    """Context manager that records one span."""
+
+    __slots__ = ("_recorder", "_span", "_token")
+
+    def __init__(
+        self, recorder: SpanRecorder, name: str, attributes: dict[str, Any]
+    ) -> None:
+        self._recorder = recorder
+        self._span = recorder.start(name, attributes)
+        self._token = None
+
+    def __enter__(self) -> Span:
+        self._token = _current_span.set(self._span)  # type: ignore[assignment]
+        return self._span
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if exc_type is not None:
+            self._span.error = f"{exc_type.__name__}: {exc}"
+        if self._token is not None:
+            _current_span.reset(self._token)
+        self._recorder.finish(self._span)
+
+
+def span(name: str, **attributes: Any) -> _ActiveSpan | _NoopSpan:
+    """Open a span in the current command, if span recording is enabled.
+
+    Args:
+        name: Operation name.
+        **attributes: Initial span attributes.
+
+    Returns:
+        Context manager yielding the Span (or a no-op when disabled).
+    """
+    trace = get_current_trace()
+    recorder = trace.recorder if trace is not None else None
+    if recorder is None:
+        return _NOOP_SPAN
+    return _ActiveSpan(recorder, name, attributes)
+
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+def traced(name: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Decorator that records a span around each call.
+
+    Args:
+        name: Operation name.
+
+    Returns:
+        Decorator for functions and methods.
+    """
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            trace = get_current_trace()
+            recorder = trace.recorder if trace is not None else None
+            if recorder is None:
+                return func(*args, **kwargs)
+            with _ActiveSpan(recorder, name, {}):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def enable_spans(trace: TraceContext) -> SpanRecorder:
+    """Start recording spans for a trace context.
+
+    Args:
+        trace: Trace context of the command.
+
+    Returns:
+        The recorder attached to the trace.
+    """
+    if trace.recorder is None:
+        trace.recorder = SpanRecorder()
+    return trace.recorder
+
+
+# =============================================================================
+# Exporters
+# =============================================================================
+
+
+def write_jsonl(spans: Iterable[Span], path: Path, trace: TraceContext) -> None:
+    """Write spans as JSON Lines, one object per span.
+
+    Args:
+        spans: Spans to write.
+        path: Output file.
+        trace: Trace context the spans belong to.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        for item in spans:
+            record = {
+                "trace_id": trace.trace_id,
+                "command": trace.command,
+                **item.to_dict(),
+            }
+            f.write(json.dumps(record, default=str) + "\n")
+
+
+def to_chrome_trace(spans: Iterable[Span], trace: TraceContext) -> dict[str, Any]:
+    """Convert spans to the Chrome trace event format (complete events).
+
+    Args:
+        spans: Spans to convert.
+        trace: Trace context the spans belong to.
+
+    Returns:
+        Trace document for Perfetto or chrome://tracing.
+    """
+    pid = os.getpid()
+    events = [
+        {
+            "name": item.name,
+            "cat": item.name.split(".", 1)[0],
+            "ph": "X",
+            "ts": item.start_ns / 1000,
+            "dur": max(item.end_ns - item.start_ns, 0) / 1000,
+            "pid": pid,
+            "tid": item.thread_id,
+            "args": {
+                **item.attributes,
+                **({"error": item.error} if item.error else {}),
+            },
+        }
+        for item in sorted(spans, key=lambda s: s.start_ns)
+    ]
+    return {
+        "traceEvents": events,
+        "displayTimeUnit": "ms",
+        "otherData": {
+            "trace_id": trace.trace_id,
+            "command": trace.command,
+            "cli_version": trace.cli_version,
+        },
+    }
+
+
+def write_chrome_trace(spans: Iterable[Span], path: Path, trace: TraceContext) -> None:
+    """Write spans as a Chrome trace JSON file.
+
+    Args:
+        spans: Spans to write.
+        path: Output file.
+        trace: Trace context the spans belong to.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps(to_chrome_trace(spans, trace), default=str), encoding="utf-8"
+    )
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: dict[str, Any]) -> list[dict[str, Any]]:
+    return [
+        {"key": key, "value": _otlp_value(value)} for key, value in attributes.items()
+    ]
+
+
+def to_otlp(spans: Iterable[Span], trace: TraceContext) -> dict[str, Any]:
+    """Convert spans to an OTLP/JSON ``ExportTraceServiceRequest``.
+
+    Args:
+        spans: Spans to convert.
+        trace: Trace context the spans belong to.
+
+    Returns:
+        OTLP trace export request body.
+    """
+    trace_id = trace.trace_id.replace("-", "")
+    otlp_spans = []
+    for item in spans:
+        entry: dict[str, Any] = {
+            "traceId": trace_id,
+            "spanId": item.span_id,
+            "name": item.name,
+            "kind": 1,  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": str(item.start_ns),
+            "endTimeUnixNano": str(item.end_ns),
+            "attributes": _otlp_attributes(item.attributes),
+            "status": {"code": 2, "message": item.error} if item.error else {"code": 1},
+        }
+        if item.parent_id:
+            entry["parentSpanId"] = item.parent_id
+        otlp_spans.append(entry)
+
+    resource = {
+        "service.name": "dli",
+        "service.version": trace.cli_version,
+        "dli.command": trace.command,
+        "os.type": trace.os_name,
+    }
+    return {
+        "resourceSpans": [
+            {
+                "resource": {"attributes": _otlp_attributes(resource)},
+                "scopeSpans": [{"scope": {"name": "dli"}, "spans": otlp_spans}],
+            }
+        ]
+    }
+
+
+def post_otlp(
+    spans: Iterable[Span], endpoint: str, trace: TraceContext, timeout: float = 5
+) -> None:
+    """Send spans to an OTLP/HTTP collector (JSON encoding).
+
+    Args:
+        spans: Spans to send.
+        endpoint: Collector traces URL (e.g., http://localhost:4318/v1/traces).
+        trace: Trace context the spans belong to.
+        timeout: Request timeout in seconds.
+
+    Raises:
+        httpx.HTTPError: If the collector cannot be reached or rejects the spans.
+    """
+    import httpx  # noqa: PLC0415
+
+    response = httpx.post(endpoint, json=to_otlp(spans, trace), timeout=timeout)
+    response.raise_for_status()
+
+
+def export_spans(trace: TraceContext, target: str) -> str:
+    """Export the recorded spans of a trace to a profile target.
+
+    Args:
+        trace: Trace context with a SpanRecorder.
+        target: ``*.jsonl`` path, other path (Chrome trace) or OTLP http(s) URL.
+
+    Returns:
+        Description of where the spans were written.
+    """
+    spans = list(trace.recorder.spans) if trace.recorder is not None else []
+    if target.startswith(("http://", "https://")):
+        post_otlp(spans, target, trace)
+        return f"OTLP collector {target}"
+    path = Path(target).expanduser()
+    if path.suffix == ".jsonl":
+        write_jsonl(spans, path, trace)
+    else:
+        write_chrome_trace(spans, path, trace)
+    return str(path)
+
+
+def render_breakdown(spans: Iterable[Span], max_depth: int = 4) -> list[str]:
+    """Summarize spans as an indented call tree with total time per path.
+
+    Spans with the same name under the same parent path are merged, so
+    repeated operations (one span per spec file) show as one line with a
+    call count.
+
+    Args:
+        spans: Recorded spans.
+        max_depth: Deepest tree level to include.
+
+    Returns:
+        Text lines, widest spans first within each level.
+    """
+    spans = list(spans)
+    by_id = {item.span_id: item for item in spans}
+    totals: dict[tuple[str, ...], list[float]] = {}
+    for item in spans:
+        path: list[str] = [item.name]
+        parent = by_id.get(item.parent_id) if item.parent_id else None
+        while parent is not None:
+            path.append(parent.name)
+            parent = by_id.get(parent.parent_id) if parent.parent_id else None
+        key = tuple(reversed(path))
+        if len(key) > max_depth:
+            continue
+        entry = totals.setdefault(key, [0.0, 0])
+        entry[0] += item.duration_ms
+        entry[1] += 1
+
+    root_total = sum(ms for key, (ms, _) in totals.items() if len(key) == 1) or 1.0
+    lines: list[str] = []
+
+    def emit(prefix: tuple[str, ...]) -> None:
+        children = [
+            (key, values)
+            for key, values in totals.items()
+            if len(key) == len(prefix) + 1 and key[: len(prefix)] == prefix
+        ]
+        for key, (ms, count) in sorted(children, key=lambda kv: -kv[1][0]):
+            label = "  " * (len(key) - 1) + key[-1]
+            calls = f"  x{int(count)}" if count > 1 else ""
+            lines.append(
+                f"{label:<48} {ms:10.1f}ms {ms / root_total * 100:6.1f}%{calls}"
+            )
+            emit(key)
+
+    emit(())
+    return lines
+
+
+__all__ = [
+    "Span",
+    "SpanRecorder",
+    "enable_spans",
+    "export_spans",
+    "post_otlp",
+    "render_breakdown",
+    "span",
+    "to_chrome_trace",
+    "to_otlp",
+    "traced",
+    "write_chrome_trace",
+    "write_jsonl",
+]
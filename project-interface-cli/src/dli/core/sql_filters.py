@@ -4,6 +4,7 @@ This module provides SQL-safe escaping functions for use in Jinja2 templates:
 - sql_string_escape: Escape strings for SQL with single quotes
 - sql_list_escape: Format lists for SQL IN clauses
 - sql_identifier_escape: Quote SQL identifiers with double quotes
+- sql_date_trunc: Truncate ISO dates and timestamps to a time grain
 
 These filters are used by both SafeJinjaEnvironment (templates.py)
 and SQLRenderer (renderer.py) for consistent SQL escaping.
@@ -11,8 +12,12 @@ and SQLRenderer (renderer.py) for consistent SQL escaping.
 
 from __future__ import annotations
 
+from datetime import date, datetime, timedelta
 from typing import Any
 
+# Time grains understood by sql_date_trunc (same names as TimeGrain values)
+DATE_TRUNC_GRAINS = ("hour", "day", "week", "month", "quarter", "year")
+
 
 def sql_string_escape(value: Any) -> str:
     """Escape a value for safe use in SQL strings.
@@ -87,3 +92,57 @@ def sql_identifier_escape(value: Any) -> str:
         return '""'
     escaped = str(value).replace('"', '""')
     return f'"{escaped}"'
+
+
+def sql_date_trunc(value: Any, grain: str) -> str:
+    """Truncate a date or timestamp to the start of its time grain.
+
+    Mirrors ``DATE_TRUNC``: weeks start on Monday. Dates stay dates (an
+    hour grain leaves them unchanged); timestamps keep their time part.
+
+    Args:
+        value: Date, datetime or ISO 8601 string.
+        grain: One of ``DATE_TRUNC_GRAINS``.
+
+    Returns:
+        Truncated value as an ISO 8601 string.
+
+    Raises:
+        ValueError: If the value is not an ISO date/timestamp or the grain
+            is unknown.
+
+    Example:
+        >>> sql_date_trunc("2024-02-15", "month")
+        '2024-02-01'
+        >>> sql_date_trunc("2024-02-15 10:30:00", "day")
+        '2024-02-15 00:00:00'
+    """
+    if grain not in DATE_TRUNC_GRAINS:
+        msg = f"Unknown time grain '{grain}'. Supported: {', '.join(DATE_TRUNC_GRAINS)}"
+        raise ValueError(msg)
+    if isinstance(value, date):
+        parsed = value
+    else:
+        try:
+            parsed = date.fromisoformat(str(value))
+        except ValueError:
+            parsed = datetime.fromisoformat(str(value))
+
+    if isinstance(parsed, datetime):
+        if grain == "hour":
+            return parsed.replace(minute=0, second=0, microsecond=0).isoformat(sep=" ")
+        day = parsed.date()
+    else:
+        day = parsed
+    if grain == "week":
+        day -= timedelta(days=day.weekday())
+    elif grain == "month":
+        day = day.replace(day=1)
+    elif grain == "quarter":
+        day = day.replace(month=(day.month - 1) // 3 * 3 + 1, day=1)
+    elif grain == "year":
+        day = day.replace(month=1, day=1)
+
+    if isinstance(parsed, datetime):
+        return datetime.combine(day, datetime.min.time()).isoformat(sep=" ")
+    return day.isoformat()
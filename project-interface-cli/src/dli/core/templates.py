@@ -18,6 +18,7 @@ from dli.core.types import TemplateContextDict
 
 # Import SQL filters from dedicated module
 from dli.core.sql_filters import (
+    sql_date_trunc,
     sql_identifier_escape,
     sql_list_escape,
     sql_string_escape,
@@ -380,6 +381,7 @@ class SafeJinjaEnvironment:
         env.filters["sql_string"] = sql_string_escape
         env.filters["sql_list"] = sql_list_escape
         env.filters["sql_identifier"] = sql_identifier_escape
+        env.filters["date_trunc"] = sql_date_trunc
 
     @classmethod
     def is_safe_attribute(cls, name: str) -> bool:
@@ -10,23 +10,46 @@ Example:
     >>> print(trace.short_id)
     550e8400
     >>> TraceContext.clear_current()
+
+Span recording (see dli.core.spans) is enabled per command by a profile
+target from ``dli --profile`` or the DLI_PROFILE environment variable.
 """
 
 from __future__ import annotations
 
 import functools
+import logging
+import os
 import platform
+import sys
 import uuid
 from contextvars import ContextVar
-from dataclasses import dataclass
-from typing import Callable, ParamSpec, TypeVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, ParamSpec, TypeVar
+
+if TYPE_CHECKING:
+    from dli.core.spans import SpanRecorder
+
+__all__ = [
+    "TraceContext",
+    "get_current_trace",
+    "set_profile_target",
+    "take_profile_target",
+    "with_trace",
+]
 
-__all__ = ["TraceContext", "get_current_trace", "with_trace"]
+logger = logging.getLogger(__name__)
+
+# Environment variable naming the profile target for span recording
+PROFILE_ENV_VAR = "DLI_PROFILE"
 
 # Context variable for current trace - single trace per CLI command invocation.
 # Note: Designed for synchronous CLI commands, not for concurrent/async patterns.
 _current_trace: ContextVar[TraceContext | None] = ContextVar("current_trace", default=None)
 
+# Profile target set by `dli --profile`, consumed by the next traced command
+_profile_target: str | None = None
+
 
 def get_current_trace() -> TraceContext | None:
     """Get the current trace context (convenience function).
@@ -43,6 +66,27 @@ def get_current_trace() -> TraceContext | None:
     return _current_trace.get()
 
 
+def set_profile_target(target: str | None) -> None:
+    """Set the profile target for the next command run with @with_trace.
+
+    Args:
+        target: ``*.jsonl`` path, Chrome trace path, or OTLP http(s) URL.
+    """
+    global _profile_target
+    _profile_target = target
+
+
+def take_profile_target() -> str | None:
+    """Return and clear the profile target, falling back to DLI_PROFILE.
+
+    Returns:
+        Profile target, or None if span recording is off.
+    """
+    global _profile_target
+    target, _profile_target = _profile_target, None
+    return target or os.environ.get(PROFILE_ENV_VAR) or None
+
+
 @dataclass
 class TraceContext:
     """Trace context for a CLI command execution.
@@ -53,6 +97,7 @@ class TraceContext:
         cli_version: dli CLI version.
         os_name: Operating system name (lowercase).
         python_version: Python version string.
+        recorder: Span recorder when profiling is enabled, else None.
 
     Example:
         >>> trace = TraceContext.create("run")
@@ -66,6 +111,7 @@ class TraceContext:
     cli_version: str
     os_name: str
     python_version: str
+    recorder: SpanRecorder | None = field(default=None, repr=False, compare=False)
 
     def __repr__(self) -> str:
         """Return concise representation for debugging."""
@@ -150,7 +196,9 @@ def with_trace(command_name: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
     """Decorator to add trace context to CLI commands.
 
     Creates a TraceContext before function execution and clears it after,
-    ensuring proper cleanup even if an exception is raised.
+    ensuring proper cleanup even if an exception is raised. When a profile
+    target is set (``dli --profile`` or DLI_PROFILE), spans are recorded
+    under a root span for the command and exported when it returns.
 
     Args:
         command_name: Name of the command (e.g., "workflow backfill").
@@ -182,12 +230,47 @@ def with_trace(command_name: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
         @functools.wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
             trace = TraceContext.create(command_name)
+            profile_target = take_profile_target()
             trace.set_current()
             try:
-                return func(*args, **kwargs)
+                if profile_target is None:
+                    return func(*args, **kwargs)
+                return _run_profiled(trace, profile_target, func, *args, **kwargs)
             finally:
                 TraceContext.clear_current()
 
         return wrapper
 
     return decorator
+
+
+def _run_profiled[**P, R](
+    trace: TraceContext,
+    target: str,
+    func: Callable[P, R],
+    *args: P.args,
+    **kwargs: P.kwargs,
+) -> R:
+    """Run a command with span recording and export the profile afterwards."""
+    from dli.core.spans import (  # noqa: PLC0415
+        enable_spans,
+        export_spans,
+        render_breakdown,
+        span,
+    )
+
+    recorder = enable_spans(trace)
+    try:
+        with span(f"command {trace.command}"):
+            return func(*args, **kwargs)
+    finally:
+        try:
+            destination = export_spans(trace, target)
+        except Exception as e:
+            logger.warning("Failed to export profile to %s: %s", target, e)
+            destination = f"not exported ({e})"
+        lines = render_breakdown(recorder.spans)
+        sys.stderr.write(
+            f"Profile: {len(recorder.spans)} spans -> {destination}\n"
+            + "".join(f"{line}\n" for line in lines)
+        )
@@ -15,6 +15,7 @@ from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from dli.core.renderer import SQLRenderer
 
+from dli.core.spans import traced
 from dli.core.transpile.client import MockTranspileClient, TranspileRuleClient
 from dli.core.transpile.exceptions import (
     MetricNotFoundError,
@@ -83,6 +84,7 @@ class TranspileEngine:
         self.client: TranspileRuleClient = client or MockTranspileClient()
         self.config = config or TranspileConfig()
 
+    @traced("transpile")
     def transpile(
         self,
         sql: str,
@@ -3,6 +3,7 @@
 This module provides local-only validation capabilities for the DLI CLI:
 - SpecValidator: YAML spec file validation using Pydantic schemas
 - DepValidator: Local dependency checking for depends_on references
+- ValidationCache: Content-hash cache of spec validation results
 - SQL validation: Uses SQLValidator from dli.core.validator
 
 The validation pipeline is LOCAL ONLY - no server interaction.
@@ -15,6 +16,7 @@ Validation stages:
 
 from __future__ import annotations
 
+from dli.core.validation.cache import ValidationCache
 from dli.core.validation.dep_validator import (
     DepValidationResult,
     DepValidator,
@@ -32,5 +34,6 @@ __all__ = [
     "ProjectDepSummary",
     "SpecValidationResult",
     "SpecValidator",
+    "ValidationCache",
     "ValidationSummary",
 ]
@@ -0,0 +1,282 @@
+"""Content-hash cache for spec validation results.
+
+This module provides the ValidationCache class used by
+``SpecValidator.validate_all`` to skip specs that have not changed since
+they were last validated. This is a LOCAL ONLY cache - no server interaction.
+
+Cache entries are keyed by spec file path. An entry is reused only when:
+- The spec file content hash is unchanged
+- The validation settings (dialect, strict, variables) are unchanged
+- The dli version is unchanged
+- Every SQL file the spec referenced has the same content hash
+- Every Jinja template the SQL includes or imports has the same content hash
+
+Referenced files are recorded at validation time (like a compiler depfile),
+so a cache hit costs one spec hash plus one hash per referenced file,
+without parsing YAML.
+
+Storage layout (JSON)::
+
+    {
+        "format": 2,
+        "entries": {
+            "/abs/path/dataset.x.y.z.yaml": {
+                "key": "<sha256 of spec content + settings>",
+                "deps": {"/abs/path/query.sql": "<sha256>"},
+                "result": {...}
+            }
+        }
+    }
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import tempfile
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from dli.core.validation.spec_validator import SpecValidationResult
+
+logger = logging.getLogger(__name__)
+
+# Default cache location relative to the project directory
+DEFAULT_CACHE_DIR = Path(".dli") / "cache"
+CACHE_FILENAME = "validation.json"
+
+# Bump when the stored entry layout changes
+_CACHE_FORMAT = 2
+
+# Hash used for referenced files that do not exist
+_MISSING = "missing"
+
+
+def hash_file(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file, or a marker if it is missing.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex digest, or "missing" if the file cannot be read
+    """
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return _MISSING
+
+
+def compute_spec_key(
+    spec_path: Path,
+    *,
+    dialect: str,
+    strict: bool,
+    variables: Mapping[str, str] | None,
+) -> str | None:
+    """Compute the cache key for a spec file and validation settings.
+
+    Args:
+        spec_path: Path to the spec file
+        dialect: SQL dialect used for validation
+        strict: Whether warnings are treated as errors
+        variables: Variable substitutions for SQL rendering
+
+    Returns:
+        Hex digest key, or None if the spec file cannot be read
+    """
+    from dli import __version__  # noqa: PLC0415
+
+    try:
+        content = spec_path.read_bytes()
+    except OSError:
+        return None
+
+    settings = json.dumps(
+        {
+            "dialect": dialect,
+            "strict": strict,
+            "variables": dict(variables or {}),
+            "version": __version__,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    digest = hashlib.sha256(content)
+    digest.update(b"\0")
+    digest.update(settings.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _result_to_dict(result: SpecValidationResult) -> dict[str, Any]:
+    return {
+        "is_valid": result.is_valid,
+        "spec_path": str(result.spec_path),
+        "spec_name": result.spec_name,
+        "spec_type": result.spec_type,
+        "errors": list(result.errors),
+        "warnings": list(result.warnings),
+    }
+
+
+def _result_from_dict(data: dict[str, Any]) -> SpecValidationResult:
+    from dli.core.validation.spec_validator import (  # noqa: PLC0415
+        SpecValidationResult,
+    )
+
+    return SpecValidationResult(
+        is_valid=data["is_valid"],
+        spec_path=Path(data["spec_path"]),
+        spec_name=data.get("spec_name"),
+        spec_type=data.get("spec_type"),
+        errors=list(data.get("errors", [])),
+        warnings=list(data.get("warnings", [])),
+    )
+
+
+class ValidationCache:
+    """On-disk cache of spec validation results.
+
+    Attributes:
+        cache_dir: Directory holding the cache file
+
+    Example:
+        >>> cache = ValidationCache(project_path / ".dli" / "cache")
+        >>> result = cache.get(spec_path, key)
+        >>> if result is None:
+        ...     result, deps = validator.validate_file_with_deps(spec_path)
+        ...     cache.put(spec_path, key, result, deps)
+        >>> cache.save()
+    """
+
+    def __init__(self, cache_dir: Path) -> None:
+        """Initialize the cache and load existing entries.
+
+        Args:
+            cache_dir: Directory holding the cache file
+        """
+        self.cache_dir = cache_dir
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._dirty = False
+        self._load()
+
+    @property
+    def cache_file(self) -> Path:
+        """Path to the JSON cache file."""
+        return self.cache_dir / CACHE_FILENAME
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
+
+    def get(self, spec_path: Path, key: str) -> SpecValidationResult | None:
+        """Return the cached result if the spec and its SQL files are unchanged.
+
+        Args:
+            spec_path: Path to the spec file
+            key: Key from ``compute_spec_key``
+
+        Returns:
+            Cached SpecValidationResult, or None on a miss
+        """
+        entry = self._entries.get(str(spec_path.resolve()))
+        if entry is None or entry.get("key") != key:
+            return None
+        for dep_path, dep_hash in entry.get("deps", {}).items():
+            if hash_file(Path(dep_path)) != dep_hash:
+                return None
+        return _result_from_dict(entry["result"])
+
+    def put(
+        self,
+        spec_path: Path,
+        key: str,
+        result: SpecValidationResult,
+        deps: Mapping[str, str],
+    ) -> None:
+        """Store a validation result.
+
+        Args:
+            spec_path: Path to the spec file
+            key: Key from ``compute_spec_key``
+            result: Validation result to store
+            deps: Referenced file path -> content hash at validation time
+        """
+        self._entries[str(spec_path.resolve())] = {
+            "key": key,
+            "deps": dict(deps),
+            "result": _result_to_dict(result),
+        }
+        self._dirty = True
+
+    def prune(self, keep: set[Path]) -> None:
+        """Drop entries for spec files that are no longer part of the project.
+
+        Args:
+            keep: Spec paths to keep
+        """
+        keep_keys = {str(p.resolve()) for p in keep}
+        stale = [k for k in self._entries if k not in keep_keys]
+        for k in stale:
+            del self._entries[k]
+        if stale:
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache atomically if it has changed.
+
+        Failures are logged and ignored; the cache is an optimization only.
+        """
+        if not self._dirty:
+            return
+        payload = {"format": _CACHE_FORMAT, "entries": self._entries}
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(
+                dir=self.cache_dir, prefix=".validation-", suffix=".tmp"
+            )
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f)
+            Path(tmp_name).replace(self.cache_file)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(
+                "Failed to write validation cache %s: %s", self.cache_file, e
+            )
+
+    def clear(self) -> None:
+        """Remove all entries and delete the cache file."""
+        self._entries.clear()
+        self._dirty = False
+        self.cache_file.unlink(missing_ok=True)
+
+    def _load(self) -> None:
+        try:
+            with open(self.cache_file, encoding="utf-8") as f:
+                payload = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(
+                "Ignoring unreadable validation cache %s: %s", self.cache_file, e
+            )
+            return
+        if not isinstance(payload, dict) or payload.get("format") != _CACHE_FORMAT:
+            return
+        entries = payload.get("entries")
+        if isinstance(entries, dict):
+            self._entries = entries
+
+
+__all__ = [
+    "CACHE_FILENAME",
+    "DEFAULT_CACHE_DIR",
+    "ValidationCache",
+    "compute_spec_key",
+    "hash_file",
+]
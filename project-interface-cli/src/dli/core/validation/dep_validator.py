@@ -29,6 +29,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from dli.core.config import ProjectConfig
+    from dli.core.graph import ProjectGraph
     from dli.core.models.spec import SpecBase
     from dli.core.registry import DatasetRegistry, MetricRegistry
 
@@ -221,6 +222,22 @@ class DepValidator:
 
         return summary
 
+    def get_project_graph(self, project_config: ProjectConfig) -> ProjectGraph:
+        """Return the shared dependency graph for a project.
+
+        The graph is cached per project and reloads only spec files changed
+        since the last call (see ``ProjectGraph.for_project``).
+
+        Args:
+            project_config: Project configuration
+
+        Returns:
+            Up-to-date ProjectGraph
+        """
+        from dli.core.graph import ProjectGraph  # noqa: PLC0415
+
+        return ProjectGraph.for_project(project_config)
+
     def get_dependency_graph(
         self,
         project_config: ProjectConfig,
@@ -233,55 +250,47 @@ class DepValidator:
         Returns:
             Dictionary mapping spec names to their dependencies
         """
-        from dli.core.discovery import SpecDiscovery  # noqa: PLC0415
-
-        graph: dict[str, list[str]] = {}
-        discovery = SpecDiscovery(project_config)
-
-        for spec in discovery.discover_all():
-            graph[spec.name] = list(spec.depends_on or [])
-
-        return graph
+        return self.get_project_graph(project_config).to_dict()
 
     def find_downstream(
         self,
         resource_name: str,
         project_config: ProjectConfig,
+        depth: int | None = 1,
     ) -> list[str]:
         """Find all specs that depend on a given resource.
 
         Args:
             resource_name: Name of the resource to find dependents for
             project_config: Project configuration
+            depth: Maximum hops to follow (1 for direct dependents only,
+                None for the full transitive closure)
 
         Returns:
-            List of spec names that depend on the resource
+            Sorted list of spec names that depend on the resource
         """
-        graph = self.get_dependency_graph(project_config)
-        downstream: list[str] = []
-
-        for spec_name, dependencies in graph.items():
-            if resource_name in dependencies:
-                downstream.append(spec_name)
-
-        return sorted(downstream)
+        graph = self.get_project_graph(project_config)
+        return sorted(graph.downstream(resource_name, depth=depth))
 
     def find_upstream(
         self,
         resource_name: str,
         project_config: ProjectConfig,
+        depth: int | None = 1,
     ) -> list[str]:
-        """Find all dependencies of a given resource (transitive).
+        """Find the dependencies of a given resource.
 
         Args:
             resource_name: Name of the resource to find dependencies for
             project_config: Project configuration
+            depth: Maximum hops to follow (1 for direct dependencies only,
+                None for the full transitive closure)
 
         Returns:
-            List of spec names that the resource depends on (direct only)
+            Sorted list of names that the resource depends on
         """
-        graph = self.get_dependency_graph(project_config)
-        return sorted(graph.get(resource_name, []))
+        graph = self.get_project_graph(project_config)
+        return sorted(graph.upstream(resource_name, depth=depth))
 
     def detect_cycles(
         self,
@@ -289,42 +298,17 @@ class DepValidator:
     ) -> list[list[str]]:
         """Detect circular dependencies in the project.
 
-        Uses depth-first search to find all cycles in the dependency graph.
+        Uses Tarjan's strongly connected components algorithm (iterative,
+        so deep dependency chains are safe) and reports one cycle per
+        cyclic component.
 
         Args:
             project_config: Project configuration
 
         Returns:
-            List of cycles (each cycle is a list of spec names)
+            List of cycles (each a closed path of spec names, e.g. [a, b, a])
         """
-        graph = self.get_dependency_graph(project_config)
-        cycles: list[list[str]] = []
-        visited: set[str] = set()
-        rec_stack: set[str] = set()
-        path: list[str] = []
-
-        def dfs(node: str) -> None:
-            visited.add(node)
-            rec_stack.add(node)
-            path.append(node)
-
-            for neighbor in graph.get(node, []):
-                if neighbor not in visited:
-                    dfs(neighbor)
-                elif neighbor in rec_stack:
-                    # Found a cycle
-                    cycle_start = path.index(neighbor)
-                    cycle = path[cycle_start:] + [neighbor]
-                    cycles.append(cycle)
-
-            path.pop()
-            rec_stack.remove(node)
-
-        for node in graph:
-            if node not in visited:
-                dfs(node)
-
-        return cycles
+        return self.get_project_graph(project_config).cycles()
 
     def _find_resource(self, name: str) -> bool:
         """Check if a resource exists in local registries.
@@ -12,20 +12,41 @@ Validation stages:
    - Parse with dialect (trino, bigquery, postgres, etc.)
    - Detect syntax errors
    - Generate warnings (SELECT *, missing LIMIT)
+
+Project-wide validation (validate_all) can reuse results for unchanged specs
+from a content-hash cache (see dli.core.validation.cache) and validate the
+remaining specs in parallel across processes. ``dli dataset validate --all``
+and ``dli metric validate --all`` enable both.
 """
 
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
+import logging
+import os
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal
 
 from pydantic import ValidationError
 import yaml
 
+from dli.core.validation.cache import (
+    DEFAULT_CACHE_DIR,
+    ValidationCache,
+    compute_spec_key,
+    hash_file,
+)
+
 if TYPE_CHECKING:
     from dli.core.models.spec import SpecBase
 
+logger = logging.getLogger(__name__)
+
+# Below this many cache misses, process startup costs more than it saves
+_PARALLEL_MIN_SPECS = 8
+
 
 @dataclass
 class SpecValidationResult:
@@ -62,6 +83,7 @@ class ValidationSummary:
         passed: Number of specs that passed validation
         failed: Number of specs that failed validation
         warnings: Number of specs with warnings (but passed)
+        cached: Number of results reused from the validation cache
         results: List of individual validation results
     """
 
@@ -69,6 +91,7 @@ class ValidationSummary:
     passed: int = 0
     failed: int = 0
     warnings: int = 0
+    cached: int = 0
     results: list[SpecValidationResult] = field(default_factory=list)
 
     @property
@@ -151,6 +174,34 @@ class SpecValidator:
         Returns:
             SpecValidationResult with validation status
         """
+        return self._validate_file(path, variables, deps=None)
+
+    def validate_file_with_deps(
+        self,
+        path: Path,
+        *,
+        variables: dict[str, str] | None = None,
+    ) -> tuple[SpecValidationResult, dict[str, str]]:
+        """Validate a single spec file and report the SQL files it read.
+
+        Args:
+            path: Path to the spec file (YAML)
+            variables: Optional variable substitutions for SQL rendering
+
+        Returns:
+            Tuple of (validation result, referenced file path -> content hash)
+        """
+        deps: dict[str, str] = {}
+        result = self._validate_file(path, variables, deps=deps)
+        return result, deps
+
+    def _validate_file(
+        self,
+        path: Path,
+        variables: dict[str, str] | None,
+        deps: dict[str, str] | None,
+    ) -> SpecValidationResult:
+        """Validate a single spec file, recording referenced files into deps."""
         errors: list[str] = []
         warnings: list[str] = []
         spec_name: str | None = None
@@ -221,6 +272,12 @@ class SpecValidator:
         # Update spec_name from validated spec
         spec_name = spec.name
 
+        if deps is not None:
+            if spec.query_file and spec.base_dir:
+                query_path = (spec.base_dir / spec.query_file).resolve()
+                deps[str(query_path)] = hash_file(query_path)
+            deps.update(self._template_deps(spec))
+
         # Stage 4: SQL syntax validation
         sql_errors, sql_warnings = self._validate_sql(spec, path, variables)
         errors.extend(sql_errors)
@@ -246,19 +303,33 @@ class SpecValidator:
         *,
         spec_type: Literal["metric", "dataset", "all"] = "all",
         variables: dict[str, str] | None = None,
+        use_cache: bool = False,
+        cache_dir: Path | None = None,
+        jobs: int | None = 1,
     ) -> ValidationSummary:
         """Validate all specs in a project.
 
+        Spec files are located by path only; each file is parsed once, by
+        ``validate_file``. With ``use_cache``, specs whose content, referenced
+        SQL and template files, variables and dli version are unchanged reuse
+        their previous result. With ``jobs`` other than 1, remaining specs are
+        validated in a process pool.
+
         Args:
             project_path: Path to the project directory containing dli.yaml
             spec_type: Type of specs to validate ("metric", "dataset", or "all")
             variables: Optional variable substitutions for SQL rendering
+            use_cache: Reuse results for unchanged specs and store new ones
+            cache_dir: Cache directory (default: <project>/.dli/cache)
+            jobs: Worker processes for cache misses (default: 1, serial;
+                None uses the CPU count)
 
         Returns:
             ValidationSummary with results for all validated specs
         """
         from dli.core.config import load_project  # noqa: PLC0415
         from dli.core.discovery import SpecDiscovery  # noqa: PLC0415
+        from dli.core.models import SpecType  # noqa: PLC0415
 
         summary = ValidationSummary()
 
@@ -278,25 +349,58 @@ class SpecValidator:
 
         discovery = SpecDiscovery(config)
 
-        # Collect spec paths based on type filter
-        spec_paths: list[tuple[Path, Literal["metric", "dataset"]]] = []
-
+        # Collect spec paths based on type filter (no YAML parsing here)
+        spec_paths: dict[Path, Literal["metric", "dataset"]] = {}
         if spec_type in ("metric", "all"):
-            for spec in discovery.discover_metrics():
-                if spec.spec_path:
-                    spec_paths.append((spec.spec_path, "metric"))
-
+            for path in discovery.discover_spec_paths(SpecType.METRIC):
+                spec_paths.setdefault(path, "metric")
         if spec_type in ("dataset", "all"):
-            for spec in discovery.discover_datasets():
-                if spec.spec_path:
-                    spec_paths.append((spec.spec_path, "dataset"))
-
-        # Validate each spec
-        for path, detected_type in spec_paths:
-            result = self.validate_file(path, variables=variables)
+            for path in discovery.discover_spec_paths(SpecType.DATASET):
+                spec_paths.setdefault(path, "dataset")
+
+        cache = None
+        if use_cache:
+            cache = ValidationCache(cache_dir or project_path / DEFAULT_CACHE_DIR)
+
+        # Reuse cached results, collect misses
+        results: dict[Path, SpecValidationResult] = {}
+        keys: dict[Path, str | None] = {}
+        misses: list[Path] = []
+        for path in spec_paths:
+            if cache is not None:
+                key = compute_spec_key(
+                    path, dialect=self.dialect, strict=self.strict, variables=variables
+                )
+                keys[path] = key
+                cached = cache.get(path, key) if key else None
+                if cached is not None:
+                    results[path] = cached
+                    summary.cached += 1
+                    continue
+            misses.append(path)
+
+        for path, (result, deps) in zip(
+            misses, self._validate_many(misses, variables, jobs), strict=True
+        ):
+            results[path] = result
+            key = keys.get(path)
+            if cache is not None and key:
+                cache.put(path, key, result, deps)
+
+        if cache is not None:
+            if spec_type == "all":
+                cache.prune(set(spec_paths))
+            cache.save()
+
+        # Like SpecDiscovery, skip files whose content declares another type
+        wanted = {"metric", "dataset"} if spec_type == "all" else {spec_type}
+        for path, detected_type in spec_paths.items():
+            result = results[path]
             # Override detected type if we know it from discovery
             if result.spec_type is None:
                 result.spec_type = detected_type
+            if result.spec_type not in wanted:
+                continue
 
             summary.results.append(result)
             summary.total += 1
@@ -310,6 +414,40 @@ class SpecValidator:
 
         return summary
 
+    def _validate_many(
+        self,
+        paths: list[Path],
+        variables: dict[str, str] | None,
+        jobs: int | None,
+    ) -> list[tuple[SpecValidationResult, dict[str, str]]]:
+        """Validate spec files, in a process pool when there are enough of them.
+
+        Args:
+            paths: Spec files to validate
+            variables: Optional variable substitutions for SQL rendering
+            jobs: Worker processes (None uses the CPU count, 1 is serial)
+
+        Returns:
+            (result, deps) tuples in the same order as paths
+        """
+        workers = min(jobs or os.cpu_count() or 1, len(paths))
+        if workers > 1 and len(paths) >= _PARALLEL_MIN_SPECS:
+            tasks = [(self.dialect, self.strict, path, variables) for path in paths]
+            chunksize = max(1, len(tasks) // (workers * 4))
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    return list(
+                        pool.map(_validate_in_worker, tasks, chunksize=chunksize)
+                    )
+            except (OSError, BrokenProcessPool) as e:
+                logger.warning(
+                    "Parallel validation unavailable, running serially: %s", e
+                )
+
+        return [
+            self.validate_file_with_deps(path, variables=variables) for path in paths
+        ]
+
     def validate_by_name(
         self,
         resource_name: str,
@@ -508,6 +646,50 @@ class SpecValidator:
 
         return errors, warnings
 
+    def _template_deps(self, spec: SpecBase) -> dict[str, str]:
+        """Hash the Jinja templates the spec SQL includes or imports.
+
+        Template names are looked up in the spec directory and the working
+        directory (the root of SQLRenderer's loader). Included templates are
+        followed recursively; candidates that do not exist are recorded as
+        missing so that creating them invalidates the cache entry. Names
+        computed at render time cannot be tracked.
+
+        Args:
+            spec: Validated spec object
+
+        Returns:
+            Template file path -> content hash
+        """
+        from jinja2 import Environment, TemplateSyntaxError, meta  # noqa: PLC0415
+
+        try:
+            sources = [spec.get_main_sql()]
+        except (ValueError, OSError):
+            return {}
+
+        search_dirs = [d for d in (spec.base_dir, Path.cwd()) if d is not None]
+        env = Environment(autoescape=False)  # noqa: S701
+        deps: dict[str, str] = {}
+        seen: set[str] = set()
+        while sources:
+            try:
+                names = meta.find_referenced_templates(env.parse(sources.pop()))
+            except TemplateSyntaxError:
+                continue
+            for name in names:
+                if name is None or name in seen:
+                    continue
+                seen.add(name)
+                for directory in search_dirs:
+                    candidate = (directory / name).resolve()
+                    deps[str(candidate)] = hash_file(candidate)
+                    try:
+                        sources.append(candidate.read_text(encoding="utf-8"))
+                    except OSError:
+                        continue
+        return deps
+
     def _render_sql(
         self,
         sql: str,
@@ -528,3 +710,12 @@ class SpecValidator:
 
         renderer = SafeTemplateRenderer()
         return renderer.render(sql, variables)
+
+
+def _validate_in_worker(
+    task: tuple[str, bool, Path, dict[str, str] | None],
+) -> tuple[SpecValidationResult, dict[str, str]]:
+    """Validate one spec file in a worker process (must be picklable)."""
+    dialect, strict, path, variables = task
+    validator = SpecValidator(dialect, strict=strict)
+    return validator.validate_file_with_deps(path, variables=variables)
@@ -11,6 +11,7 @@ from sqlglot import exp
 from sqlglot.errors import ParseError
 
 from dli.core.models import ValidationResult
+from dli.core.spans import traced
 
 
 class SQLValidator:
@@ -28,6 +29,7 @@ class SQLValidator:
         """
         self.dialect = dialect
 
+    @traced("sqlglot.validate")
     def validate(self, sql: str, phase: str = "main") -> ValidationResult:
         """Validate SQL syntax and check for common issues.
 
@@ -99,6 +101,7 @@ class SQLValidator:
         """
         return [self.validate(sql, phase) for sql, phase in sqls]
 
+    @traced("sqlglot.extract_tables")
     def extract_tables(self, sql: str) -> list[str]:
         """Extract table names referenced in the SQL.
 
@@ -158,6 +161,7 @@ class SQLValidator:
 
         return columns
 
+    @traced("sqlglot.format")
     def format_sql(self, sql: str, pretty: bool = True) -> str:
         """Format SQL for readability.
 
@@ -179,6 +183,7 @@ class SQLValidator:
         except ParseError:
             return sql
 
+    @traced("sqlglot.transpile")
     def transpile(
         self, sql: str, target_dialect: str, pretty: bool = True
     ) -> str:
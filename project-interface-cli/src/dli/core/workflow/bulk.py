@@ -0,0 +1,199 @@
+"""Bulk workflow status lookups.
+
+Checking a nightly run of hundreds of datasets one ``workflow_status`` call
+at a time costs hundreds of round-trips. The batch endpoints accept many
+run IDs (or dataset names) per request; this module splits large key lists
+into chunks the server accepts and sends the chunks concurrently:
+
+- Keys are de-duplicated (first occurrence wins) and split into chunks of
+  at most ``batch_size``.
+- A single chunk is sent on the calling thread; several chunks are sent
+  from a small thread pool sharing the caller's (pooled) client. Each task
+  runs in a copy of the caller's context, so requests keep the current
+  trace (X-Trace-Id header and parent span).
+- A chunk rejected with 413 (batch too large) is split in half and retried,
+  so a server with a smaller limit than ``batch_size`` still succeeds.
+- Runs are returned in chunk order. A failed chunk does not fail the whole
+  lookup; its keys are reported in ``failed`` with the error message.
+
+Example:
+    >>> result = fetch_in_chunks(run_ids, client.workflow_status_batch)
+    >>> len(result.runs), result.missing, result.failed
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+import logging
+import re
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from dli.core.client import ServerResponse
+
+logger = logging.getLogger(__name__)
+
+# Keys per request; servers may accept fewer (see the 413 handling above)
+DEFAULT_BATCH_SIZE = 100
+
+# Chunks in flight at once
+DEFAULT_MAX_WORKERS = 4
+
+_RELATIVE_SINCE = re.compile(r"^(\d+)([smhdw])$")
+_SINCE_UNITS = {"s": "seconds", "m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
+
+
+@dataclass
+class BulkFetchResult:
+    """Merged result of a chunked bulk lookup.
+
+    Attributes:
+        runs: Run dicts returned by the server, in chunk order.
+        missing: Requested keys the server does not know.
+        failed: Requested keys whose chunk failed, mapped to the error.
+        requests: Number of requests sent.
+    """
+
+    runs: list[dict[str, Any]] = field(default_factory=list)
+    missing: list[str] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
+    requests: int = 0
+
+    def merge(self, other: BulkFetchResult) -> None:
+        """Append another chunk's result to this one."""
+        self.runs.extend(other.runs)
+        self.missing.extend(other.missing)
+        self.failed.update(other.failed)
+        self.requests += other.requests
+
+
+def chunked(keys: Iterable[str], size: int) -> list[list[str]]:
+    """Split keys into de-duplicated chunks of at most ``size``.
+
+    Args:
+        keys: Run IDs or dataset names.
+        size: Maximum chunk size (at least 1).
+
+    Returns:
+        Chunks in first-occurrence order.
+    """
+    unique = list(dict.fromkeys(keys))
+    size = max(1, size)
+    return [unique[i : i + size] for i in range(0, len(unique), size)]
+
+
+def resolve_since(
+    since: datetime | str | None, *, now: datetime | None = None
+) -> datetime | None:
+    """Resolve a ``--since`` value to a point in time.
+
+    Args:
+        since: Datetime, ISO8601 string, or relative duration such as
+            ``30m``, ``24h`` or ``7d``.
+        now: Reference time for relative durations (defaults to now).
+
+    Returns:
+        The resolved datetime, or None if ``since`` is empty.
+
+    Raises:
+        ValueError: If the string is neither relative nor ISO8601.
+    """
+    if since is None or isinstance(since, datetime):
+        return since
+    value = since.strip()
+    if not value:
+        return None
+    match = _RELATIVE_SINCE.match(value)
+    if match:
+        amount, unit = match.groups()
+        delta = timedelta(**{_SINCE_UNITS[unit]: int(amount)})
+        return (now or datetime.now()) - delta
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        msg = f"Invalid since value: {since!r} (use ISO8601 or e.g. 30m, 24h, 7d)"
+        raise ValueError(msg) from None
+
+
+def _fetch_chunk(
+    chunk: list[str], fetch: Callable[[list[str]], ServerResponse]
+) -> BulkFetchResult:
+    """Send one chunk, halving it while the server rejects its size."""
+    result = BulkFetchResult(requests=1)
+    try:
+        response = fetch(chunk)
+    except Exception as e:
+        logger.warning("Batch request for %d keys failed: %s", len(chunk), e)
+        result.failed = dict.fromkeys(chunk, str(e))
+        return result
+
+    if response.status_code == 413 and len(chunk) > 1:  # noqa: PLR2004
+        middle = len(chunk) // 2
+        logger.debug("Batch of %d rejected as too large, splitting", len(chunk))
+        result.merge(_fetch_chunk(chunk[:middle], fetch))
+        result.merge(_fetch_chunk(chunk[middle:], fetch))
+        return result
+
+    if not response.success:
+        error = response.error or f"Batch request failed ({response.status_code})"
+        result.failed = dict.fromkeys(chunk, error)
+        return result
+
+    data = response.data if isinstance(response.data, dict) else {}
+    result.runs = list(data.get("runs") or [])
+    result.missing = list(data.get("missing") or [])
+    return result
+
+
+def fetch_in_chunks(
+    keys: Iterable[str],
+    fetch: Callable[[list[str]], ServerResponse],
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> BulkFetchResult:
+    """Look up many keys with as few concurrent batch requests as possible.
+
+    Args:
+        keys: Run IDs or dataset names.
+        fetch: Sends one batch and returns the server response, whose data
+            has ``runs`` and ``missing`` lists.
+        batch_size: Maximum keys per request.
+        max_workers: Maximum requests in flight at once.
+
+    Returns:
+        Merged BulkFetchResult.
+    """
+    chunks = chunked(keys, batch_size)
+    result = BulkFetchResult()
+    if len(chunks) <= 1 or max_workers <= 1:
+        for chunk in chunks:
+            result.merge(_fetch_chunk(chunk, fetch))
+        return result
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(chunks)),
+        thread_name_prefix="dli-workflow-bulk",
+    ) as pool:
+        futures = [
+            pool.submit(contextvars.copy_context().run, _fetch_chunk, chunk, fetch)
+            for chunk in chunks
+        ]
+        for future in futures:
+            result.merge(future.result())
+    return result
+
+
+__all__ = [
+    "DEFAULT_BATCH_SIZE",
+    "DEFAULT_MAX_WORKERS",
+    "BulkFetchResult",
+    "chunked",
+    "fetch_in_chunks",
+    "resolve_since",
+]
@@ -78,6 +78,7 @@ class ErrorCode(str, Enum):
     RUN_OUTPUT_FAILED = "DLI-414"
     RUN_TIMEOUT = "DLI-415"
     RUN_PARAMETER_INVALID = "DLI-416"
+    RUN_COST_EXCEEDED = "DLI-417"
 
     # Server Errors (DLI-5xx)
     SERVER_UNREACHABLE = "DLI-501"
@@ -1262,6 +1263,34 @@ class RunParameterInvalidError(DLIError):
         return f"[{self.code.value}] {self.message}"
 
 
+@dataclass
+class RunCostExceededError(DLIError):
+    """Run query rejected by cost admission.
+
+    Raised when the dry-run estimate of a query exceeds the byte or cost
+    budget configured in dli.yaml or by the server policy.
+
+    Attributes:
+        exceeded: Descriptions of the limits the query exceeds.
+        bytes_processed: Estimated bytes the query would process.
+        estimated_cost_usd: Estimated query cost in USD.
+    """
+
+    code: ErrorCode = ErrorCode.RUN_COST_EXCEEDED
+    exceeded: list[str] = field(default_factory=list)
+    bytes_processed: int | None = None
+    estimated_cost_usd: float | None = None
+
+    def __str__(self) -> str:
+        """Return formatted error message."""
+        if self.exceeded:
+            return (
+                f"[{self.code.value}] Query rejected by cost admission: "
+                f"{'; '.join(self.exceeded)}"
+            )
+        return f"[{self.code.value}] {self.message}"
+
+
 # Debug Errors (DLI-95x)
 
 
@@ -1509,6 +1538,7 @@ __all__ = [
     "QueryInvalidFilterError",
     "QueryNotFoundError",
     # Run Errors
+    "RunCostExceededError",
     "RunExecutionError",
     "RunFileNotFoundError",
     "RunLocalDeniedError",
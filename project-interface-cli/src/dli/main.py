@@ -44,26 +44,23 @@ from rich.console import Console
 from rich.panel import Panel
 import typer
 
-# Import command implementations
-from dli.commands import (
-    catalog_app,
-    config_app,
-    dataset_app,
-    debug_app,
-    lineage_app,
-    metric_app,
-    quality_app,
-    query_app,
-    run_app,
-    sql_app,
-    workflow_app,
-)
+# Import command implementations (subcommand groups are loaded lazily)
+from dli.commands import LAZY_SUBCOMMANDS
 from dli.commands import info as info_cmd
 from dli.commands import version as version_cmd
+from dli.commands.lazy import LazyTyperGroup
+
+
+class DliGroup(LazyTyperGroup):
+    """Root command group; subcommand modules are imported on dispatch."""
+
+    lazy_subcommands = LAZY_SUBCOMMANDS
+
 
 # Create the main Typer app
 app = typer.Typer(
     name="dli",
+    cls=DliGroup,
     help="DataOps CLI - Command-line interface for DataOps platform operations.",
     add_completion=False,
     no_args_is_help=True,
@@ -101,30 +98,35 @@ def main(
             is_eager=True,
         ),
     ] = False,
+    profile: Annotated[
+        str | None,
+        typer.Option(
+            "--profile",
+            help=(
+                "Record timing spans and write a profile: *.jsonl, Chrome trace "
+                "(*.json), or OTLP http(s):// URL."
+            ),
+            metavar="TARGET",
+        ),
+    ] = None,
 ) -> None:
     """DataOps CLI - Command-line interface for DataOps platform operations.
 
     Use 'dli COMMAND --help' for more information on a specific command.
     """
-    pass
+    if profile is not None:
+        # Imported only when profiling so plain startup stays light
+        from dli.core.trace import set_profile_target
+
+        set_profile_target(profile)
 
 
 # Register commands
 app.command()(version_cmd)
 app.command()(info_cmd)
 
-# Register subcommand apps
-app.add_typer(catalog_app, name="catalog")
-app.add_typer(config_app, name="config")
-app.add_typer(dataset_app, name="dataset")
-app.add_typer(debug_app, name="debug")
-app.add_typer(lineage_app, name="lineage")
-app.add_typer(metric_app, name="metric")
-app.add_typer(quality_app, name="quality")
-app.add_typer(query_app, name="query")
-app.add_typer(run_app, name="run")
-app.add_typer(sql_app, name="sql")
-app.add_typer(workflow_app, name="workflow")
+# Subcommand apps (catalog, config, dataset, ...) are registered through
+# DliGroup.lazy_subcommands and imported only when dispatched.
 
 
 # Entry point for the CLI
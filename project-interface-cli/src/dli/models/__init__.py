@@ -77,6 +77,7 @@ from dli.models.run import (
 )
 from dli.models.workflow import (
     # Workflow result models
+    WorkflowBulkStatusResult,
     WorkflowHistoryResult,
     WorkflowListResult,
     WorkflowRegisterResult,
@@ -139,6 +140,7 @@ __all__ = [
     # Result models
     "ValidationResult",
     # Workflow result models
+    "WorkflowBulkStatusResult",
     "WorkflowHistoryResult",
     "WorkflowListResult",
     "WorkflowRegisterResult",
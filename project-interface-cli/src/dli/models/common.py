@@ -95,6 +95,9 @@ class ExecutionContext(BaseSettings):
         timeout: Query execution timeout in seconds.
         dry_run: Dry-run mode (no actual execution).
         dialect: Default SQL dialect.
+        result_cache_ttl: Seconds to reuse cached metric results (None disables).
+        result_cache_check_freshness: Invalidate cached results when upstream
+            tables are updated in the catalog.
         parameters: Runtime parameters for Jinja rendering.
         verbose: Enable verbose logging.
 
@@ -160,6 +163,17 @@ class ExecutionContext(BaseSettings):
         description="Default SQL dialect",
     )
 
+    # Local result cache (opt-in)
+    result_cache_ttl: int | None = Field(
+        default=None,
+        ge=0,
+        description="Reuse cached metric results for this many seconds (None disables)",
+    )
+    result_cache_check_freshness: bool = Field(
+        default=False,
+        description="Invalidate cached results when upstream tables are updated",
+    )
+
     # Runtime parameters for Jinja rendering
     parameters: dict[str, Any] = Field(
         default_factory=dict,
@@ -520,6 +534,11 @@ class MetricResult(BaseResult):
         data: Query result rows.
         row_count: Number of rows returned.
         columns: Column names.
+        cache_hit: Whether the rows were served from the local result cache.
+        data_age_seconds: Seconds since the rows were computed (0 for a
+            fresh execution, None if nothing was executed).
+        rollups: Rollup tables the rows were read from instead of the
+            source relation (MetricAPI.query only).
     """
 
     name: str = Field(..., description="Metric name")
@@ -527,6 +546,11 @@ class MetricResult(BaseResult):
     data: list[dict[str, Any]] | None = Field(default=None, description="Result rows")
     row_count: int | None = Field(default=None, description="Number of rows")
     columns: list[str] | None = Field(default=None, description="Column names")
+    cache_hit: bool = Field(default=False, description="Served from result cache")
+    data_age_seconds: float | None = Field(
+        default=None, description="Age of the result data in seconds"
+    )
+    rollups: list[str] = Field(default_factory=list, description="Rollup tables read")
 
 
 class TranspileWarning(BaseModel):
@@ -10,6 +10,7 @@ Models:
     WorkflowListResult: Result of list_workflows query
     WorkflowStatusResult: Detailed status of a workflow run
     WorkflowHistoryResult: Result of history query
+    WorkflowBulkStatusResult: Result of a bulk status lookup
 
 References:
     - Feature Spec: features/WORKFLOW_FEATURE.md Section 4.2
@@ -33,6 +34,7 @@ from dli.core.workflow.models import (
 from dli.models.common import ResultStatus
 
 __all__ = [
+    "WorkflowBulkStatusResult",
     "WorkflowHistoryResult",
     "WorkflowListResult",
     "WorkflowRegisterResult",
@@ -199,3 +201,38 @@ class WorkflowHistoryResult(BaseModel):
         default=None,
         description="Dataset metadata (owner, team, description) if include_dataset_info=True",
     )
+
+
+class WorkflowBulkStatusResult(BaseModel):
+    """Result of a bulk workflow status lookup.
+
+    Returned by WorkflowAPI.get_statuses() and WorkflowAPI.get_latest_statuses().
+    Large lookups are split into several batch requests; a failed batch does
+    not fail the others, its keys are listed in ``failed`` instead.
+
+    Attributes:
+        runs: Run statuses in request order
+        missing: Requested run IDs or dataset names without a matching run
+        failed: Requested keys whose batch request failed, with the error
+        request_count: Number of server requests made
+        status: SUCCESS if every batch succeeded, otherwise FAILURE
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    runs: list[WorkflowStatusResult] = Field(
+        default_factory=list, description="Run statuses"
+    )
+    missing: list[str] = Field(default_factory=list, description="Unknown keys")
+    failed: dict[str, str] = Field(
+        default_factory=dict, description="Keys whose batch failed, with the error"
+    )
+    request_count: int = Field(default=0, description="Server requests made")
+    status: ResultStatus = Field(description="Lookup status")
+
+    def by_dataset(self) -> dict[str, list[WorkflowStatusResult]]:
+        """Group runs by dataset name, preserving their order."""
+        grouped: dict[str, list[WorkflowStatusResult]] = {}
+        for run in self.runs:
+            grouped.setdefault(run.dataset_name, []).append(run)
+        return grouped
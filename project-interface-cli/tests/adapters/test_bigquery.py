@@ -11,6 +11,8 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from dli.core.cancellation import InterruptReason
+
 if TYPE_CHECKING:
     from dli.adapters.bigquery import BigQueryExecutor
 
@@ -201,6 +203,69 @@ class TestBigQueryExecutorExecuteSql:
         assert result.success is False
         assert "Table not found" in result.error_message
 
+    def test_execute_sql_maximum_bytes_billed(
+        self,
+        bigquery_executor: BigQueryExecutor,
+        mock_bigquery_client: MagicMock,
+        mock_bigquery_module: MagicMock,
+    ) -> None:
+        """Should pass the byte cap to BigQuery via QueryJobConfig."""
+        mock_results = MagicMock()
+        mock_results.__iter__ = lambda self: iter([])
+        mock_results.schema = []
+        mock_bigquery_client.query.return_value.result.return_value = mock_results
+
+        with patch("dli.adapters.bigquery._bigquery_module", mock_bigquery_module):
+            result = bigquery_executor.execute_sql(
+                "SELECT 1", maximum_bytes_billed=1000
+            )
+
+        assert result.success is True
+        mock_bigquery_module.QueryJobConfig.assert_called_once_with(
+            maximum_bytes_billed=1000
+        )
+        assert (
+            mock_bigquery_client.query.call_args.kwargs["job_config"]
+            is mock_bigquery_module.QueryJobConfig.return_value
+        )
+
+    def test_execute_sql_timeout_cancels_job(
+        self,
+        bigquery_executor: BigQueryExecutor,
+        mock_bigquery_client: MagicMock,
+    ) -> None:
+        """Should cancel the job and record the cancellation latency."""
+        mock_job = MagicMock()
+        mock_job.result.side_effect = FuturesTimeoutError()
+        mock_job.done.return_value = True
+        mock_bigquery_client.query.return_value = mock_job
+
+        result = bigquery_executor.execute_sql("SELECT * FROM huge", timeout=5)
+
+        mock_job.cancel.assert_called_once()
+        assert result.cancelled is True
+        assert result.interrupt_reason == InterruptReason.TIMEOUT
+        assert result.cancel_latency_ms is not None
+        assert "timed out after 5 seconds" in result.error_message
+
+    def test_execute_sql_keyboard_interrupt_cancels_job(
+        self,
+        bigquery_executor: BigQueryExecutor,
+        mock_bigquery_client: MagicMock,
+    ) -> None:
+        """Should cancel the job when the user presses Ctrl-C."""
+        mock_job = MagicMock()
+        mock_job.result.side_effect = KeyboardInterrupt()
+        mock_job.done.return_value = True
+        mock_bigquery_client.query.return_value = mock_job
+
+        result = bigquery_executor.execute_sql("SELECT * FROM huge")
+
+        mock_job.cancel.assert_called_once()
+        assert result.cancelled is True
+        assert result.interrupt_reason == InterruptReason.USER
+        assert result.error_message == "Query cancelled by user"
+
 
 class TestBigQueryExecutorDryRun:
     """Tests for BigQueryExecutor.dry_run() method."""
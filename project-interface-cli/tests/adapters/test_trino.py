@@ -5,11 +5,15 @@ This module tests the Trino executor with mocked trino client.
 
 from __future__ import annotations
 
+import json
+import threading
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from dli.core.cancellation import InterruptReason, run_cancellable
+
 if TYPE_CHECKING:
     from dli.adapters.trino import TrinoExecutor
 
@@ -352,6 +356,55 @@ class TestTrinoExecutorExecuteSql:
         assert "timed out" in result.error_message.lower()
         assert "10" in result.error_message
 
+    def test_execute_sql_deadline_cancels_query(
+        self,
+        trino_executor: TrinoExecutor,
+        mock_trino_cursor: MagicMock,
+    ) -> None:
+        """Should cancel the running query when the deadline passes."""
+        cancelled = threading.Event()
+        mock_trino_cursor.cancel.side_effect = cancelled.set
+
+        def fetchall() -> list:
+            cancelled.wait(5)
+            raise RuntimeError("Query was canceled")
+
+        mock_trino_cursor.fetchall.side_effect = fetchall
+
+        def short_deadline(call, cancel, timeout):
+            return run_cancellable(call, cancel=cancel, timeout=0.05)
+
+        with patch("dli.adapters.trino.run_cancellable", short_deadline):
+            result = trino_executor.execute_sql("SELECT * FROM huge", timeout=1)
+
+        assert result.success is False
+        assert result.cancelled is True
+        assert result.interrupt_reason == InterruptReason.TIMEOUT
+        assert result.cancel_latency_ms is not None
+        assert result.error_message == "Query timed out after 1 seconds"
+        mock_trino_cursor.cancel.assert_called_once()
+
+
+class TestTrinoExecutorSessionProperties:
+    """Tests for the query_max_run_time session property."""
+
+    def test_query_max_run_time(
+        self, mock_trino_dbapi: MagicMock, mock_trino_auth: MagicMock
+    ) -> None:
+        """Should set query_max_run_time on the connection session."""
+        with (
+            patch("dli.adapters.trino.TRINO_AVAILABLE", True),
+            patch("dli.adapters.trino._trino_dbapi", mock_trino_dbapi),
+            patch("dli.adapters.trino._trino_auth", mock_trino_auth),
+        ):
+            from dli.adapters.trino import TrinoExecutor
+
+            TrinoExecutor(host="localhost", query_max_run_time=600)
+
+        assert mock_trino_dbapi.connect.call_args.kwargs["session_properties"] == {
+            "query_max_run_time": "600s"
+        }
+
 
 class TestTrinoExecutorDryRun:
     """Tests for TrinoExecutor.dry_run() method."""
@@ -392,6 +445,61 @@ class TestTrinoExecutorDryRun:
         assert "Syntax error" in result["error"]
 
 
+class TestTrinoExecutorEstimateCost:
+    """Tests for TrinoExecutor.estimate_cost() method."""
+
+    def test_estimate_sums_input_tables(
+        self,
+        trino_executor: TrinoExecutor,
+        mock_trino_cursor: MagicMock,
+    ) -> None:
+        """Should sum estimated input sizes from the IO plan."""
+        plan = {
+            "inputTableColumnInfos": [
+                {"estimate": {"outputSizeInBytes": 1000.0}},
+                {"estimate": {"outputSizeInBytes": 500.0}},
+                {"estimate": {"outputSizeInBytes": "NaN"}},
+            ]
+        }
+        mock_trino_cursor.fetchall.return_value = [(json.dumps(plan),)]
+
+        result = trino_executor.estimate_cost("SELECT * FROM a JOIN b ON a.id = b.id")
+
+        assert result["valid"] is True
+        assert result["bytes_processed"] == 1500
+        mock_trino_cursor.execute.assert_called_once_with(
+            "EXPLAIN (TYPE IO, FORMAT JSON) SELECT * FROM a JOIN b ON a.id = b.id"
+        )
+
+    def test_estimate_without_statistics(
+        self,
+        trino_executor: TrinoExecutor,
+        mock_trino_cursor: MagicMock,
+    ) -> None:
+        """Should report no size when the connector has no statistics."""
+        plan = {"inputTableColumnInfos": [{"estimate": {"outputSizeInBytes": "NaN"}}]}
+        mock_trino_cursor.fetchall.return_value = [(json.dumps(plan),)]
+
+        result = trino_executor.estimate_cost("SELECT * FROM users")
+
+        assert result["valid"] is True
+        assert result["bytes_processed"] is None
+
+    def test_estimate_falls_back_to_dry_run(
+        self,
+        trino_executor: TrinoExecutor,
+        mock_trino_cursor: MagicMock,
+    ) -> None:
+        """Should fall back to EXPLAIN when the IO plan fails."""
+        mock_trino_cursor.execute.side_effect = [Exception("unsupported"), None]
+        mock_trino_cursor.fetchall.return_value = [("- Output[id]",)]
+
+        result = trino_executor.estimate_cost("SELECT id FROM users")
+
+        assert result["valid"] is True
+        assert "plan" in result
+
+
 class TestTrinoExecutorTestConnection:
     """Tests for TrinoExecutor.test_connection() method."""
 
@@ -376,3 +376,44 @@ class TestCatalogAPIHelperMethods:
         assert len(result.columns) == 2
         assert result.ownership.owner == "data-team"
         assert result.quality.score == 95
+
+
+class TestCatalogAPIIndex:
+    """Tests for CatalogAPI with the offline catalog index."""
+
+    @pytest.fixture
+    def api(self, tmp_path) -> CatalogAPI:
+        """Create CatalogAPI in mock mode with a synced index."""
+        api = CatalogAPI(
+            context=ExecutionContext(
+                execution_mode=ExecutionMode.MOCK, project_path=tmp_path
+            )
+        )
+        stats = api.sync_index()
+        assert stats.success and stats.full
+        return api
+
+    def test_search_uses_index(self, api: CatalogAPI) -> None:
+        """Search is answered from the index, best match first."""
+        result = api.search("users")
+
+        assert result.status == ResultStatus.SUCCESS
+        assert result.tables[0].name == "my-project.analytics.users"
+        assert isinstance(result.tables[0], TableInfo)
+
+    def test_list_tables_uses_index(self, api: CatalogAPI) -> None:
+        """Dataset listing is answered from the index."""
+        result = api.list_tables("my-project.analytics")
+
+        assert result.total_count == 2
+        assert {t.name for t in result.tables} == {
+            "my-project.analytics.orders",
+            "my-project.analytics.users",
+        }
+
+    def test_use_index_false_queries_server(self, api: CatalogAPI) -> None:
+        """Disabling the index falls back to server search."""
+        server_api = CatalogAPI(context=api.context, use_index=False)
+
+        assert server_api._get_index() is None
+        assert server_api.search("users").status == ResultStatus.SUCCESS
@@ -0,0 +1,97 @@
+"""Tests for lazy attribute exports in the dli and dli.api packages.
+
+Covers:
+- ``import dli`` does not import heavy dependencies or the API layer
+- ``from dli import X`` resolves every public name to its defining object
+- Unknown attributes raise AttributeError
+"""
+
+from __future__ import annotations
+
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+import dli
+import dli.api
+
+
+def _loaded_modules(code: str) -> set[str]:
+    """Run code in a fresh interpreter and return the imported module names."""
+    completed = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys\nprint(','.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(completed.stdout.strip().split(","))
+
+
+class TestBareImport:
+    """Tests for the cost of ``import dli``."""
+
+    @pytest.mark.parametrize(
+        "module",
+        ["sqlglot", "jinja2", "pydantic", "httpx", "dli.api", "dli.exceptions"],
+    )
+    def test_bare_import_skips_heavy_modules(self, module: str) -> None:
+        """Bare ``import dli`` does not import heavy modules."""
+        assert module not in _loaded_modules("import dli")
+
+    def test_version_is_eager(self) -> None:
+        """__version__ is available without triggering lazy imports."""
+        loaded = _loaded_modules("import dli\nassert dli.__version__")
+        assert "dli.api" not in loaded
+
+    def test_api_import_loads_only_requested_api(self) -> None:
+        """``from dli.api import DatasetAPI`` does not import unrelated APIs."""
+        loaded = _loaded_modules("from dli.api import DatasetAPI")
+        assert "dli.api.dataset" in loaded
+        assert "dli.api.workflow" not in loaded
+        assert "dli.api.catalog" not in loaded
+
+
+class TestLazyExports:
+    """Tests for name resolution through module ``__getattr__``."""
+
+    @pytest.mark.parametrize("name", sorted(set(dli.__all__) - {"__version__"}))
+    def test_dli_exports_resolve(self, name: str) -> None:
+        """Every name in dli.__all__ resolves to its defining object."""
+        module = importlib.import_module(dli._LAZY_IMPORTS[name])
+        assert getattr(dli, name) is getattr(module, name)
+
+    @pytest.mark.parametrize("name", dli.api.__all__)
+    def test_api_exports_resolve(self, name: str) -> None:
+        """Every name in dli.api.__all__ resolves to its defining class."""
+        module = importlib.import_module(dli.api._LAZY_IMPORTS[name])
+        assert getattr(dli.api, name) is getattr(module, name)
+
+    def test_all_matches_lazy_imports(self) -> None:
+        """__all__ and the lazy import tables list the same names."""
+        assert set(dli.__all__) - {"__version__"} == set(dli._LAZY_IMPORTS)
+        assert set(dli.api.__all__) == set(dli.api._LAZY_IMPORTS)
+
+    def test_from_import(self) -> None:
+        """``from dli import X`` keeps working."""
+        from dli import DatasetAPI, DLIError, ExecutionContext
+        from dli.api.dataset import DatasetAPI as DatasetAPIImpl
+        from dli.exceptions import DLIError as DLIErrorImpl
+        from dli.models.common import ExecutionContext as ExecutionContextImpl
+
+        assert DatasetAPI is DatasetAPIImpl
+        assert DLIError is DLIErrorImpl
+        assert ExecutionContext is ExecutionContextImpl
+
+    def test_dir_lists_lazy_names(self) -> None:
+        """dir() includes names that have not been imported yet."""
+        assert "WorkflowAPI" in dir(dli)
+        assert "WorkflowAPI" in dir(dli.api)
+
+    def test_unknown_attribute_raises(self) -> None:
+        """Unknown attributes raise AttributeError."""
+        with pytest.raises(AttributeError, match="NoSuchAPI"):
+            _ = dli.NoSuchAPI  # type: ignore[attr-defined]
+        with pytest.raises(AttributeError, match="NoSuchAPI"):
+            _ = dli.api.NoSuchAPI  # type: ignore[attr-defined]
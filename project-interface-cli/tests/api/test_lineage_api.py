@@ -661,3 +661,50 @@ class TestLineageDirectionEnum:
         assert LineageDirection("upstream") == LineageDirection.UPSTREAM
         assert LineageDirection("downstream") == LineageDirection.DOWNSTREAM
         assert LineageDirection("both") == LineageDirection.BOTH
+
+
+class TestLineageAPILocal:
+    """Tests for local lineage from project spec SQL."""
+
+    @pytest.fixture
+    def sample_project_path(self, sample_project_path, tmp_path):
+        """Copy of the sample project so the index is written under tmp_path."""
+        import shutil
+
+        project = tmp_path / "project"
+        shutil.copytree(sample_project_path, project)
+        return project
+
+    def test_get_local_lineage(self, sample_project_path) -> None:
+        """Test table-level local lineage on the sample project."""
+        ctx = ExecutionContext(project_path=sample_project_path)
+        api = LineageAPI(context=ctx)
+
+        result = api.get_local_lineage("iceberg.analytics.daily_clicks", "upstream")
+
+        assert [n.name for n in result.nodes] == ["iceberg.raw.user_events"]
+        assert result.total_upstream == 1
+
+    def test_get_local_column_lineage(self, sample_project_path) -> None:
+        """Test column-level local lineage on the sample project."""
+        api = LineageAPI(context=ExecutionContext(project_path=sample_project_path))
+
+        result = api.get_local_lineage(
+            "iceberg.analytics.daily_clicks.click_count", "upstream", column=True
+        )
+
+        assert [n.name for n in result.nodes] == ["iceberg.raw.user_events.item_id"]
+
+    def test_get_local_lineage_unknown_resource(self, sample_project_path) -> None:
+        """Test unknown resources raise LineageNotFoundError."""
+        api = LineageAPI(context=ExecutionContext(project_path=sample_project_path))
+
+        with pytest.raises(LineageNotFoundError):
+            api.get_local_lineage("iceberg.unknown.table")
+
+    def test_get_local_lineage_requires_project_path(self) -> None:
+        """Test ConfigurationError without project_path."""
+        api = LineageAPI(context=ExecutionContext())
+
+        with pytest.raises(ConfigurationError):
+            api.get_local_lineage("iceberg.analytics.daily_clicks")
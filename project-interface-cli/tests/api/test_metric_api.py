@@ -356,3 +356,184 @@ class TestMetricAPIVsDatasetAPI:
         # Both use same context type
         assert dataset_api.context.dialect == metric_api.context.dialect
         assert dataset_api.context.execution_mode == metric_api.context.execution_mode
+
+
+class TestMetricAPIResultCache:
+    """Tests for the opt-in local result cache in MetricAPI.run."""
+
+    METRIC = "iceberg.analytics.user_engagement"
+
+    @pytest.fixture
+    def home(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        home = tmp_path / "home"
+        monkeypatch.setenv("HOME", str(home))
+        return home
+
+    @pytest.fixture
+    def project(self, sample_project_path: Path, tmp_path: Path, home: Path) -> Path:
+        import shutil
+
+        return Path(shutil.copytree(sample_project_path, tmp_path / "project"))
+
+    def _api(self, project: Path, **context: object) -> MetricAPI:
+        return MetricAPI(
+            context=ExecutionContext(
+                project_path=project,
+                parameters={"start_date": "2025-01-01", "end_date": "2025-01-31"},
+                **context,
+            )
+        )
+
+    def test_disabled_by_default(self, project: Path, home: Path) -> None:
+        api = self._api(project)
+
+        first = api.run(self.METRIC)
+        second = api.run(self.METRIC)
+
+        assert first.cache_hit is False
+        assert second.cache_hit is False
+        assert not (home / ".dli" / "cache" / "results").exists()
+
+    def test_cache_is_stored_under_dli_home(self, project: Path, home: Path) -> None:
+        self._api(project, result_cache_ttl=600).run(self.METRIC)
+
+        assert (home / ".dli" / "cache" / "results" / "index.json").exists()
+        assert not (project / ".dli" / "cache" / "results").exists()
+
+    def test_second_run_is_cache_hit(self, project: Path) -> None:
+        first = self._api(project, result_cache_ttl=600).run(self.METRIC)
+        second = self._api(project, result_cache_ttl=600).run(self.METRIC)
+
+        assert first.cache_hit is False
+        assert first.data_age_seconds == 0.0
+        assert second.cache_hit is True
+        assert second.data == first.data
+        assert second.row_count == first.row_count
+        assert second.data_age_seconds is not None
+
+    def test_cache_hit_skips_execution(self, project: Path) -> None:
+        from unittest.mock import patch
+
+        from dli.core.client import BasecampClient
+
+        api = self._api(project, result_cache_ttl=600)
+        api.run(self.METRIC)
+
+        with patch.object(BasecampClient, "execute_rendered_metric") as execute:
+            result = api.run(self.METRIC)
+
+        execute.assert_not_called()
+        assert result.cache_hit is True
+
+    def test_different_limit_is_a_miss(self, project: Path) -> None:
+        api = self._api(project, result_cache_ttl=600)
+        api.run(self.METRIC)
+
+        assert api.run(self.METRIC, limit=1).cache_hit is False
+
+    def test_freshness_invalidation(self, project: Path) -> None:
+        from unittest.mock import patch
+
+        api = self._api(
+            project, result_cache_ttl=600, result_cache_check_freshness=True
+        )
+        with patch.object(
+            MetricAPI, "_table_versions", return_value={"t": "2025-01-01T00:00:00"}
+        ):
+            api.run(self.METRIC)
+            assert api.run(self.METRIC).cache_hit is True
+        with patch.object(
+            MetricAPI, "_table_versions", return_value={"t": "2025-01-02T00:00:00"}
+        ):
+            assert api.run(self.METRIC).cache_hit is False
+
+    def test_table_versions_from_catalog(self) -> None:
+        from dli.core.client import BasecampClient, ServerConfig
+
+        client = BasecampClient(
+            ServerConfig(url="http://localhost:8081"), mock_mode=True
+        )
+
+        versions = MetricAPI._table_versions(
+            client, ["my-project.analytics.users", "missing.table"]
+        )
+
+        assert versions["my-project.analytics.users"] is not None
+        assert versions["missing.table"] is None
+
+
+class TestMetricAPIQuery:
+    """Tests for multi-metric queries through the semantic query planner."""
+
+    SPEC = "iceberg.analytics.user_engagement"
+
+    @pytest.fixture
+    def project(self, sample_project_path: Path, tmp_path: Path) -> Path:
+        import shutil
+
+        import yaml
+
+        project = Path(shutil.copytree(sample_project_path, tmp_path / "project"))
+        path = project / "metrics" / "analytics" / f"metric.{self.SPEC}.yaml"
+        spec = yaml.safe_load(path.read_text())
+        spec["rollups"] = [
+            {
+                "name": "by_country_day",
+                "dimensions": ["user_country", "activity_date"],
+                "time_dimension": "activity_date",
+                "time_grain": "day",
+                "start_parameter": "start_date",
+                "end_parameter": "end_date",
+            }
+        ]
+        path.write_text(yaml.dump(spec))
+        return project
+
+    def _api(self, project: Path) -> MetricAPI:
+        return MetricAPI(
+            context=ExecutionContext(
+                project_path=project,
+                parameters={"start_date": "2025-01-01", "end_date": "2025-01-31"},
+            )
+        )
+
+    def test_result_shows_rollup(self, project: Path) -> None:
+        result = self._api(project).query(
+            [f"{self.SPEC}.total_sessions", f"{self.SPEC}.max_session_duration"],
+            dimensions=["user_country"],
+            show_sql=True,
+        )
+
+        assert result.status == ResultStatus.SUCCESS
+        assert result.rollups == [f"{self.SPEC}__by_country_day"]
+        assert result.columns == [
+            "user_country",
+            "total_sessions",
+            "max_session_duration",
+        ]
+        assert f"FROM {self.SPEC}__by_country_day" in result.sql
+
+    def test_base_relation_without_covering_rollup(self, project: Path) -> None:
+        result = self._api(project).query(
+            [f"{self.SPEC}.total_sessions"],
+            dimensions=["engagement_tier"],
+            dry_run=True,
+        )
+
+        assert result.rollups == []
+
+    def test_unknown_metric(self, project: Path) -> None:
+        from dli.exceptions import MetricNotFoundError
+
+        with pytest.raises(MetricNotFoundError):
+            self._api(project).query([f"{self.SPEC}.missing"])
+
+    def test_unknown_dimension_is_not_metric_not_found(self, project: Path) -> None:
+        from dli.exceptions import ExecutionError, MetricNotFoundError
+
+        with pytest.raises(ExecutionError) as exc_info:
+            self._api(project).query(
+                [f"{self.SPEC}.total_sessions"], dimensions=["missing"]
+            )
+
+        assert not isinstance(exc_info.value, MetricNotFoundError)
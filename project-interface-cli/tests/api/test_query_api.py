@@ -729,3 +729,27 @@ class TestAccountTypeEnum:
         """Test AccountType enum values."""
         assert AccountType.PERSONAL.value == "personal"
         assert AccountType.SYSTEM.value == "system"
+
+
+class TestQueryAPIWatchQueries:
+    """Tests for QueryAPI.watch_queries."""
+
+    def test_first_update_has_query_info(self, mock_api: QueryAPI) -> None:
+        """The first update is the full list as QueryInfo models."""
+        update = next(mock_api.watch_queries(scope=QueryScope.ALL, limit=5))
+
+        assert 0 < len(update.queries) <= 5
+        assert all(isinstance(q, QueryInfo) for q in update.queries)
+        assert update.changed_ids == {q.query_id for q in update.queries}
+
+    def test_stop_event_ends_watch(self, mock_api: QueryAPI) -> None:
+        """Setting the stop event ends the watch after the first update."""
+        import threading
+
+        stop = threading.Event()
+        updates = mock_api.watch_queries(scope=QueryScope.ALL, stop=stop)
+
+        next(updates)
+        stop.set()
+
+        assert list(updates) == []
@@ -711,3 +711,227 @@ class TestRunAPIServerPolicy:
         # Resolve mode without preferences - should use policy default
         mode = api._resolve_execution_mode(prefer_local=False, prefer_server=False)
         assert mode == ExecutionMode.LOCAL
+
+
+# =============================================================================
+# TestRunAPIServerPaging
+# =============================================================================
+
+
+class TestRunAPIServerPaging:
+    """Tests for paged/streamed server result download."""
+
+    @pytest.fixture
+    def paged_api(self, monkeypatch: pytest.MonkeyPatch) -> RunAPI:
+        """RunAPI in server mode backed by a mock client with 1-row pages."""
+        from dli.core.client import BasecampClient, ServerConfig
+
+        monkeypatch.setattr("dli.api.run.RESULT_PAGE_SIZE", 1)
+        client = BasecampClient(
+            ServerConfig(url="http://localhost:8081"), mock_mode=True
+        )
+        ctx = ExecutionContext(execution_mode=ExecutionMode.SERVER)
+        return RunAPI(context=ctx, client=client)
+
+    @pytest.mark.parametrize("stream", [False, True])
+    def test_all_pages_written(
+        self, paged_api: RunAPI, tmp_path: Path, stream: bool
+    ) -> None:
+        sql_file = tmp_path / "query.sql"
+        sql_file.write_text("SELECT 1")
+        output = tmp_path / "out.csv"
+
+        result = paged_api.run(sql_path=sql_file, output_path=output, stream=stream)
+
+        with output.open() as f:
+            rows = list(csv.DictReader(f))
+        assert [row["id"] for row in rows] == ["1", "2"]
+        assert result.row_count == 2
+        assert result.execution_id == "exec-mock-sql-001"
+        assert not (tmp_path / "out.csv.part").exists()
+
+    def test_rows_are_consumed_lazily(self, mock_api: RunAPI, tmp_path: Path) -> None:
+        consumed: list[int] = []
+
+        def rows():
+            for i in range(3):
+                consumed.append(i)
+                yield {"id": i}
+
+        output = tmp_path / "out.json"
+        written = mock_api._write_output(output, OutputFormat.JSON, rows())
+
+        assert written == 3
+        assert consumed == [0, 1, 2]
+        assert len(output.read_text().splitlines()) == 3
+
+    def test_download_failure_leaves_no_output(
+        self, mock_api: RunAPI, tmp_path: Path
+    ) -> None:
+        from dli.exceptions import ServerError
+
+        def rows():
+            yield {"id": 1}
+            raise ServerError(message="page expired")
+
+        output = tmp_path / "out.csv"
+        with pytest.raises(ServerError):
+            mock_api._write_output(output, OutputFormat.CSV, rows())
+
+        assert not output.exists()
+        assert not (tmp_path / "out.csv.part").exists()
+
+
+# =============================================================================
+# TestRunAPICostAdmission
+# =============================================================================
+
+
+class TestRunAPICostAdmission:
+    """Tests for cost admission of local executions."""
+
+    @pytest.fixture
+    def executor(self, monkeypatch: pytest.MonkeyPatch):
+        """Dry-run capable executor returned by ExecutorFactory."""
+        from dli.core.executor import BaseExecutor
+        from dli.core.models import ExecutionResult
+
+        class Executor(BaseExecutor):
+            def __init__(self) -> None:
+                self.executed: list[str] = []
+
+            def execute_sql(self, sql: str, timeout: int = 300) -> ExecutionResult:
+                self.executed.append(sql)
+                return ExecutionResult(
+                    dataset_name="", phase="main", success=True, data=[{"x": 1}]
+                )
+
+            def dry_run(self, sql: str) -> dict:
+                return {
+                    "valid": True,
+                    "bytes_processed": 2_000,
+                    "estimated_cost_usd": 0.5,
+                }
+
+            def test_connection(self) -> bool:
+                return True
+
+        executor = Executor()
+        monkeypatch.setattr(
+            "dli.core.executor.ExecutorFactory.create", lambda mode, context: executor
+        )
+        return executor
+
+    @pytest.fixture
+    def local_api(self, tmp_path: Path, executor):
+        """Factory for RunAPI instances resolved to local mode by policy."""
+        from unittest.mock import Mock
+
+        from dli.core.client import ServerResponse
+
+        def make(policy: dict, project_yaml: str | None = None, **kwargs) -> RunAPI:
+            client = Mock()
+            client.run_get_policy.return_value = ServerResponse(
+                success=True, data={"default_mode": "local", **policy}
+            )
+            if project_yaml is not None:
+                (tmp_path / "dli.yaml").write_text(project_yaml)
+            ctx = ExecutionContext(
+                execution_mode=ExecutionMode.SERVER, project_path=tmp_path
+            )
+            return RunAPI(context=ctx, client=client, **kwargs)
+
+        (tmp_path / "query.sql").write_text("SELECT x FROM big")
+        return make
+
+    def test_policy_budget_rejects(self, local_api, executor, tmp_path: Path) -> None:
+        from dli.exceptions import RunCostExceededError
+
+        api = local_api({"admission": {"query": {"max_bytes": 1_000}}})
+
+        with pytest.raises(RunCostExceededError) as exc_info:
+            api.run(sql_path=tmp_path / "query.sql", output_path=tmp_path / "out.csv")
+
+        assert exc_info.value.code.value == "DLI-417"
+        assert exc_info.value.bytes_processed == 2_000
+        assert executor.executed == []
+        assert not (tmp_path / "out.csv").exists()
+
+    def test_project_budget_confirmed(self, local_api, tmp_path: Path) -> None:
+        asked = []
+        api = local_api(
+            {},
+            "version: '1'\nadmission:\n  on_exceed: confirm\n  query:\n    max_cost_usd: 0.1\n",
+            confirm_cost=lambda decision: asked.append(decision) or True,
+        )
+
+        result = api.run(
+            sql_path=tmp_path / "query.sql", output_path=tmp_path / "out.csv"
+        )
+
+        assert result.row_count == 1
+        assert asked[0].estimated_cost_usd == 0.5
+        assert (tmp_path / ".dli" / "cache" / "dryrun" / "estimates.json").exists()
+
+    def test_no_budget_skips_dry_run(self, local_api, tmp_path: Path) -> None:
+        api = local_api({})
+
+        result = api.run(
+            sql_path=tmp_path / "query.sql", output_path=tmp_path / "out.csv"
+        )
+
+        assert result.row_count == 1
+        assert not (tmp_path / ".dli").exists()
+
+
+class TestRunAPILocalTimeout:
+    """Tests for local query timeouts."""
+
+    def test_cancelled_at_timeout_raises_run_timeout(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from unittest.mock import Mock
+
+        from dli.core.cancellation import InterruptReason
+        from dli.core.client import ServerResponse
+        from dli.core.executor import BaseExecutor
+        from dli.core.models import ExecutionResult
+        from dli.exceptions import RunTimeoutError
+
+        class TimingOutExecutor(BaseExecutor):
+            def execute_sql(self, sql: str, timeout: int = 300) -> ExecutionResult:
+                return ExecutionResult(
+                    dataset_name="",
+                    phase="main",
+                    success=False,
+                    error_message=f"Query timed out after {timeout} seconds",
+                    cancelled=True,
+                    interrupt_reason=InterruptReason.TIMEOUT,
+                    cancel_latency_ms=120,
+                )
+
+            def dry_run(self, sql: str) -> dict:
+                return {"valid": True}
+
+            def test_connection(self) -> bool:
+                return True
+
+        monkeypatch.setattr(
+            "dli.core.executor.ExecutorFactory.create",
+            lambda mode, context: TimingOutExecutor(),
+        )
+        client = Mock()
+        client.run_get_policy.return_value = ServerResponse(
+            success=True, data={"default_mode": "local"}
+        )
+        api = RunAPI(
+            context=ExecutionContext(execution_mode=ExecutionMode.SERVER), client=client
+        )
+        sql_file = tmp_path / "query.sql"
+        sql_file.write_text("SELECT 1")
+
+        with pytest.raises(RunTimeoutError) as exc_info:
+            api.run(sql_path=sql_file, output_path=tmp_path / "out.csv", timeout=5)
+
+        assert exc_info.value.code.value == "DLI-415"
+        assert exc_info.value.timeout_seconds == 5
@@ -6,18 +6,20 @@ Covers:
 - CRUD operations (get, register, unregister)
 - Execution (run, backfill, stop)
 - Query operations (get_status, list_workflows, history)
+- Bulk status lookups (get_statuses, get_latest_statuses)
 - Schedule control (pause, unpause)
 - Result model properties and validation
 """
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from dli import ExecutionContext, WorkflowAPI
+from dli.core.client import ServerResponse
 from dli.core.workflow.models import (
     RunStatus,
     SourceType,
@@ -34,6 +36,7 @@ from dli.exceptions import (
 )
 from dli.models.common import ExecutionMode, ResultStatus
 from dli.models.workflow import (
+    WorkflowBulkStatusResult,
     WorkflowHistoryResult,
     WorkflowListResult,
     WorkflowRegisterResult,
@@ -360,6 +363,96 @@ class TestWorkflowAPIGetStatus:
             result.run_status = RunStatus.FAILED  # type: ignore[misc]
 
 
+class TestWorkflowAPIBulkStatus:
+    """Tests for WorkflowAPI.get_statuses() and get_latest_statuses()."""
+
+    def test_get_statuses_mock_mode(self, mock_api: WorkflowAPI) -> None:
+        """Test bulk run status lookup against mock data."""
+        result = mock_api.get_statuses(
+            [
+                "iceberg.reporting.weekly_summary_20240108_100000",
+                "unknown_run",
+                "iceberg.analytics.daily_clicks_20240115_120000",
+            ]
+        )
+
+        assert isinstance(result, WorkflowBulkStatusResult)
+        assert result.status == ResultStatus.SUCCESS
+        assert [r.run_status for r in result.runs] == [
+            RunStatus.FAILED,
+            RunStatus.RUNNING,
+        ]
+        assert result.runs[0].error_message is not None
+        assert result.missing == ["unknown_run"]
+        assert result.request_count == 1
+
+    def test_get_latest_statuses_all(self, mock_api: WorkflowAPI) -> None:
+        """Test latest run of every workflow within a window."""
+        result = mock_api.get_latest_statuses(since="24h")
+
+        assert list(result.by_dataset()) == [
+            "iceberg.analytics.daily_clicks",
+            "iceberg.warehouse.user_events",
+        ]
+        assert all(len(runs) == 1 for runs in result.by_dataset().values())
+
+    def test_get_latest_statuses_history(self, mock_api: WorkflowAPI) -> None:
+        """Test recent history of several datasets in one call."""
+        result = mock_api.get_latest_statuses(
+            ["iceberg.analytics.daily_clicks", "iceberg.reporting.weekly_summary"],
+            since=datetime.now() - timedelta(days=30),
+            limit_per_dataset=5,
+        )
+
+        grouped = result.by_dataset()
+        assert len(grouped["iceberg.analytics.daily_clicks"]) == 2
+        assert grouped["iceberg.reporting.weekly_summary"][0].is_terminal
+        assert result.missing == []
+
+    def test_chunked_with_partial_failure(
+        self, server_context: ExecutionContext
+    ) -> None:
+        """Test that a failed batch is reported without failing the others."""
+        mock_client = MagicMock()
+
+        def status_batch(run_ids: list[str]) -> ServerResponse:
+            if "run_3" in run_ids:
+                return ServerResponse(success=False, error="timeout", status_code=504)
+            return ServerResponse(
+                success=True,
+                data={
+                    "runs": [
+                        {"run_id": r, "dataset_name": "ds", "status": "COMPLETED"}
+                        for r in run_ids
+                    ],
+                    "missing": [],
+                },
+            )
+
+        mock_client.workflow_status_batch.side_effect = status_batch
+        api = WorkflowAPI(context=server_context, client=mock_client)
+
+        result = api.get_statuses(
+            ["run_1", "run_2", "run_3", "run_4"], batch_size=2, max_workers=2
+        )
+
+        assert [r.run_id for r in result.runs] == ["run_1", "run_2"]
+        assert result.failed == {"run_3": "timeout", "run_4": "timeout"}
+        assert result.status == ResultStatus.FAILURE
+        assert result.request_count == 2
+
+    def test_all_batches_failed_raises(self, server_context: ExecutionContext) -> None:
+        """Test that a lookup where every batch failed raises."""
+        mock_client = MagicMock()
+        mock_client.workflow_status_batch.return_value = ServerResponse(
+            success=False, error="server down", status_code=503
+        )
+        api = WorkflowAPI(context=server_context, client=mock_client)
+
+        with pytest.raises(WorkflowExecutionError, match="server down"):
+            api.get_statuses(["run_1"])
+
+
 class TestWorkflowAPIListWorkflows:
     """Tests for WorkflowAPI.list_workflows() method."""
 
@@ -521,3 +521,96 @@ class TestCatalogSectionDisplay:
         output = get_output(result)
         # May or may not have queries depending on mock data
         assert "quer" in output.lower() or "no" in output.lower() or "users" in output.lower()
+
+
+# =============================================================================
+# Test: Offline catalog index
+# =============================================================================
+
+
+class TestCatalogIndexCommands:
+    """Tests for catalog sync and index-backed list/search."""
+
+    @pytest.fixture
+    def project(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        """Synced project; background refreshes are recorded, not spawned."""
+        from dli.commands import catalog as catalog_cmd
+
+        self.spawned: list[Path] = []
+        monkeypatch.setattr(catalog_cmd, "_spawn_background_sync", self.spawned.append)
+        result = runner.invoke(app, ["catalog", "sync", "--path", str(tmp_path)])
+        assert result.exit_code == 0, get_output(result)
+        assert "Full sync" in get_output(result)
+        return tmp_path
+
+    def test_incremental_sync(self, project: Path) -> None:
+        result = runner.invoke(app, ["catalog", "sync", "--path", str(project)])
+
+        assert result.exit_code == 0
+        assert "Incremental sync" in get_output(result)
+        assert list((project / ".dli" / "cache" / "catalog").glob("catalog-*.sqlite3"))
+
+    def test_search_uses_index(self, project: Path) -> None:
+        result = runner.invoke(
+            app,
+            ["catalog", "search", "email", "--path", str(project), "--format", "json"],
+        )
+
+        assert result.exit_code == 0
+        data = json.loads(get_output(result))
+        assert [t["name"] for t in data] == ["my-project.analytics.users"]
+        assert self.spawned == []
+
+    def test_list_filters_use_index(self, project: Path) -> None:
+        result = runner.invoke(
+            app,
+            [
+                "catalog",
+                "list",
+                "--tag",
+                "PII",
+                "--path",
+                str(project),
+                "--format",
+                "json",
+            ],
+        )
+
+        assert result.exit_code == 0
+        data = json.loads(get_output(result))
+        assert [t["name"] for t in data] == ["my-project.analytics.users"]
+
+    def test_stale_index_refreshes_in_background(self, project: Path) -> None:
+        from dli.core.catalog.index import CatalogIndex
+
+        (path,) = (project / ".dli" / "cache" / "catalog").glob("*.sqlite3")
+        with CatalogIndex(path) as index:
+            index.set_meta("synced_at", "0")
+
+        result = runner.invoke(
+            app, ["catalog", "search", "user", "--path", str(project)]
+        )
+        runner.invoke(app, ["catalog", "search", "user", "--path", str(project)])
+
+        assert result.exit_code == 0
+        assert self.spawned == [project]
+
+    def test_no_index_queries_server(self, project: Path) -> None:
+        result = runner.invoke(
+            app,
+            [
+                "catalog",
+                "search",
+                "us",
+                "--no-index",
+                "--path",
+                str(project),
+                "--format",
+                "json",
+            ],
+        )
+
+        assert result.exit_code == 0
+        # Server-side search matches substrings ("us" in "status")
+        names = [t["name"] for t in json.loads(get_output(result))]
+        assert "my-project.analytics.orders" in names
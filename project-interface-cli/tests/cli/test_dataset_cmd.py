@@ -136,6 +136,31 @@ class TestDatasetValidate:
         # Should validate successfully or show validation result
         assert result.exit_code in [0, 1]
 
+    def test_validate_all_datasets(
+        self, sample_project_path: Path, tmp_path: Path
+    ) -> None:
+        """Test validating every dataset spec, then reusing the cache."""
+        import shutil
+
+        project = shutil.copytree(sample_project_path, tmp_path / "project")
+        args = ["dataset", "validate", "--all", "--jobs", "1", "--path", str(project)]
+
+        first = runner.invoke(app, args)
+        second = runner.invoke(app, args)
+
+        assert first.exit_code in [0, 1]
+        assert (project / ".dli" / "cache" / "validation.json").exists()
+        assert second.exit_code == first.exit_code
+        assert "(0 cached)" not in get_output(second)
+
+    def test_validate_requires_name_or_all(self, sample_project_path: Path) -> None:
+        """Test that validate needs a dataset name or --all."""
+        result = runner.invoke(
+            app, ["dataset", "validate", "--path", str(sample_project_path)]
+        )
+        assert result.exit_code == 1
+        assert "--all" in get_output(result)
+
     def test_validate_nonexistent_dataset(self, sample_project_path: Path) -> None:
         """Test validating a dataset that doesn't exist."""
         result = runner.invoke(
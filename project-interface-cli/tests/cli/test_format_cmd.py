@@ -507,3 +507,67 @@ class TestFormatCommandNotImplemented:
         else:
             # Format command not yet added
             pytest.skip("format command not added to CLI yet")
+
+
+class TestProjectFormatCommand:
+    """Tests for project-wide 'dli format'."""
+
+    @pytest.fixture
+    def sql_project(self, tmp_path: Path) -> Path:
+        """Project with a single unformatted SQL file and no specs."""
+        pytest.importorskip("sqlfluff")
+        (tmp_path / "dli.yaml").write_text(
+            'version: "1"\nproject:\n  name: "fmt"\n'
+            'discovery:\n  datasets_dir: "datasets"\n  metrics_dir: "metrics"\n'
+        )
+        (tmp_path / "datasets").mkdir()
+        (tmp_path / "metrics").mkdir()
+        (tmp_path / "datasets" / "query.sql").write_text("select a,b from t")
+        return tmp_path
+
+    def test_format_help(self) -> None:
+        """Test 'dli format --help' lists engine options."""
+        result = runner.invoke(app, ["format", "--help"])
+
+        assert result.exit_code == 0
+        output = get_output(result)
+        assert "--jobs" in output
+        assert "--no-cache" in output
+        assert "--timings" in output
+
+    def test_check_reports_changes(self, sql_project: Path) -> None:
+        """Test --check exits 1 and leaves files untouched."""
+        result = runner.invoke(
+            app, ["format", "--check", "-d", "trino", "--path", str(sql_project)]
+        )
+
+        assert result.exit_code == 1
+        assert (
+            sql_project / "datasets" / "query.sql"
+        ).read_text() == "select a,b from t"
+
+    def test_format_then_check_uses_cache(self, sql_project: Path) -> None:
+        """Test a formatted project passes --check with the file skipped."""
+        first = runner.invoke(
+            app, ["format", "-d", "trino", "--path", str(sql_project)]
+        )
+        assert first.exit_code == 0
+
+        result = runner.invoke(
+            app,
+            [
+                "format",
+                "--check",
+                "-d",
+                "trino",
+                "-f",
+                "json",
+                "--path",
+                str(sql_project),
+            ],
+        )
+
+        assert result.exit_code == 0
+        data = json.loads(get_output(result))
+        assert data["cached_count"] == 1
+        assert data["files"][0]["cached"] is True
@@ -11,6 +11,7 @@ All lineage operations are SERVER-BASED, so tests use mock mode.
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -558,3 +559,75 @@ class TestLineageNoArgsIsHelp:
         assert result.exit_code in [0, 2]
         output = get_output(result)
         assert "show" in output or "upstream" in output or "Usage" in output
+
+
+class TestLineageLocal:
+    """Tests for local lineage (--local and 'lineage columns')."""
+
+    @pytest.fixture
+    def local_project(self, sample_project_path: Path, tmp_path: Path) -> Path:
+        """Copy of the sample project so the index is written under tmp_path."""
+        import shutil
+
+        project = tmp_path / "project"
+        shutil.copytree(sample_project_path, project)
+        return project
+
+    def test_upstream_local(self, local_project: Path) -> None:
+        """Test 'dli lineage upstream --local' reads spec SQL."""
+        result = runner.invoke(
+            app,
+            [
+                "lineage",
+                "upstream",
+                "iceberg.reporting.daily_summary",
+                "--local",
+                "--format",
+                "json",
+                "--path",
+                str(local_project),
+            ],
+        )
+
+        assert result.exit_code == 0
+        data = json.loads(get_output(result))
+        assert {n["name"] for n in data["nodes"]} == {
+            "iceberg.analytics.daily_clicks",
+            "iceberg.raw.user_events",
+        }
+        assert (local_project / ".dli" / "cache" / "lineage.db").exists()
+
+    def test_show_local_unknown_resource(self, local_project: Path) -> None:
+        """Test unknown resource exits with an error."""
+        result = runner.invoke(
+            app,
+            [
+                "lineage",
+                "show",
+                "iceberg.unknown.table",
+                "--local",
+                "--path",
+                str(local_project),
+            ],
+        )
+
+        assert result.exit_code == 1
+        assert "No local table lineage" in get_output(result)
+
+    def test_columns(self, local_project: Path) -> None:
+        """Test 'dli lineage columns' shows upstream columns."""
+        result = runner.invoke(
+            app,
+            [
+                "lineage",
+                "columns",
+                "iceberg.reporting.daily_summary.total_clicks",
+                "--path",
+                str(local_project),
+            ],
+        )
+
+        assert result.exit_code == 0
+        output = get_output(result)
+        assert "iceberg.analytics.daily_clicks.click_count" in output
+        assert "iceberg.raw.user_events.item_id" in output
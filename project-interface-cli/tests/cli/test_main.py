@@ -6,10 +6,9 @@ allowing direct testing without requiring CLI installation.
 
 from typer.testing import CliRunner
 
-from tests.conftest import strip_ansi
-
 from dli import __version__
 from dli.main import app
+from tests.conftest import strip_ansi
 
 # CliRunner for testing Typer applications
 runner = CliRunner()
@@ -239,3 +238,153 @@ class TestTranspileSubcommand:
         assert result.exit_code == 0
         assert "transpile" in result.stdout.lower()
         assert "--dialect" in result.stdout
+
+
+class TestLazySubcommands:
+    """Tests for lazy subcommand loading (dli.commands.lazy)."""
+
+    def test_registry_help_matches_sub_apps(self):
+        """Registry help text stays in sync with each Typer sub-app."""
+        from dli.commands import LAZY_SUBCOMMANDS
+
+        for name, lazy in LAZY_SUBCOMMANDS.items():
+            sub_app = lazy.load()
+            assert sub_app.info.name == name
+            assert sub_app.info.help == lazy.help
+
+    def test_help_lists_all_subcommands(self):
+        """'dli --help' lists lazy subcommands with their help text."""
+        from dli.commands import LAZY_SUBCOMMANDS
+
+        result = runner.invoke(app, ["--help"])
+        assert result.exit_code == 0
+        output = strip_ansi(result.stdout)
+        for name in LAZY_SUBCOMMANDS:
+            assert name in output
+        assert "Browse and search the data catalog." in output
+
+    def test_unknown_command_fails(self):
+        """Unknown commands still fail with a usage error."""
+        result = runner.invoke(app, ["no-such-command"])
+        assert result.exit_code != 0
+
+    def test_commands_package_exports_apps(self):
+        """'from dli.commands import dataset_app' still works."""
+        import typer
+
+        from dli.commands import dataset_app
+
+        assert isinstance(dataset_app, typer.Typer)
+
+
+class TestStartupImports:
+    """Import-time regression checks for CLI startup.
+
+    These run in a fresh interpreter so modules imported by other tests
+    do not mask eager imports.
+    """
+
+    SUBCOMMAND_MODULES = (
+        "dli.commands.catalog",
+        "dli.commands.config",
+        "dli.commands.dataset",
+        "dli.commands.debug",
+        "dli.commands.format",
+        "dli.commands.lineage",
+        "dli.commands.metric",
+        "dli.commands.quality",
+        "dli.commands.query",
+        "dli.commands.run",
+        "dli.commands.sql",
+        "dli.commands.workflow",
+    )
+
+    # Budgets for cumulative import time (microseconds) as reported by
+    # 'python -X importtime'. Override with DLI_COMMANDS_IMPORT_BUDGET_US /
+    # DLI_MAIN_IMPORT_BUDGET_US on slow CI machines.
+    COMMANDS_IMPORT_BUDGET_US = 50_000
+    MAIN_IMPORT_BUDGET_US = 500_000
+
+    @staticmethod
+    def _run_python(code: str, *args: str) -> str:
+        import subprocess
+        import sys
+
+        completed = subprocess.run(
+            [sys.executable, *args, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return completed.stdout + completed.stderr
+
+    @classmethod
+    def _cumulative_import_us(cls, module: str) -> int:
+        output = cls._run_python("import dli.main", "-X", "importtime")
+        for line in output.splitlines():
+            if not line.startswith("import time:"):
+                continue
+            _, cumulative_us, name = (part.strip() for part in line[12:].split("|"))
+            if name == module:
+                return int(cumulative_us)
+        raise AssertionError(f"{module} not found in importtime output")
+
+    def test_help_does_not_import_subcommands(self):
+        """'dli --help' imports no subcommand module."""
+        code = (
+            "import sys\n"
+            "from typer.testing import CliRunner\n"
+            "from dli.main import app\n"
+            "CliRunner().invoke(app, ['--help'])\n"
+            "print(','.join(m for m in sys.modules if m.startswith('dli.commands.')))\n"
+        )
+        loaded = self._run_python(code).strip().split(",")
+        for module in self.SUBCOMMAND_MODULES:
+            assert module not in loaded
+
+    def test_dispatch_imports_only_target_subcommand(self):
+        """'dli config --help' imports the config module only."""
+        code = (
+            "import sys\n"
+            "from typer.testing import CliRunner\n"
+            "from dli.main import app\n"
+            "CliRunner().invoke(app, ['config', '--help'])\n"
+            "print(','.join(m for m in sys.modules if m.startswith('dli.commands.')))\n"
+        )
+        loaded = self._run_python(code).strip().split(",")
+        assert "dli.commands.config" in loaded
+        assert "dli.commands.dataset" not in loaded
+        assert "dli.commands.workflow" not in loaded
+
+    def test_main_import_skips_heavy_modules(self):
+        """'import dli.main' does not import sqlglot, jinja2 or the API layer."""
+        code = "import sys\nimport dli.main\nprint(','.join(sys.modules))\n"
+        loaded = self._run_python(code).strip().split(",")
+        for module in ("sqlglot", "jinja2", "dli.api", "dli.exceptions", "dli.core"):
+            assert module not in loaded
+
+    def test_commands_import_time_budget(self):
+        """'python -X importtime' keeps dli.commands under budget."""
+        import os
+
+        budget = int(
+            os.environ.get(
+                "DLI_COMMANDS_IMPORT_BUDGET_US", self.COMMANDS_IMPORT_BUDGET_US
+            )
+        )
+        cumulative = self._cumulative_import_us("dli.commands")
+        assert cumulative < budget, (
+            f"dli.commands import took {cumulative}us (budget {budget}us)"
+        )
+
+    def test_main_import_time_budget(self):
+        """'python -X importtime' keeps the whole CLI entry point under budget."""
+        import os
+
+        budget = int(
+            os.environ.get("DLI_MAIN_IMPORT_BUDGET_US", self.MAIN_IMPORT_BUDGET_US)
+        )
+        cumulative = self._cumulative_import_us("dli.main")
+        assert cumulative < budget, (
+            f"dli.main import took {cumulative}us (budget {budget}us)"
+        )
@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
+import pytest
 from typer.testing import CliRunner
 
 from dli.main import app
@@ -361,6 +362,89 @@ class TestQueryList:
         assert result.exit_code == 0
 
 
+# =============================================================================
+# Test: query list --watch
+# =============================================================================
+
+
+class TestQueryListWatch:
+    """Tests for query list watch mode."""
+
+    @pytest.fixture(autouse=True)
+    def interrupt_after_first_update(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Simulate Ctrl+C while waiting for the first poll after the list."""
+        from dli.core.query.watch import QueryWatcher
+
+        original = QueryWatcher.updates
+
+        def interrupt(_interval: float) -> None:
+            raise KeyboardInterrupt
+
+        def updates(self: QueryWatcher, **kwargs: object) -> object:
+            return original(self, sleep=interrupt)
+
+        monkeypatch.setattr(QueryWatcher, "updates", updates)
+
+    def test_watch_table(self, sample_project_path: Path) -> None:
+        result = runner.invoke(
+            app,
+            [
+                "query",
+                "list",
+                "--scope",
+                "all",
+                "--watch",
+                "--path",
+                str(sample_project_path),
+            ],
+        )
+
+        assert result.exit_code == 0
+        output = get_output(result)
+        assert "QUERY_ID" in output
+        assert "Ctrl+C to stop" in output
+
+    def test_watch_json(self, sample_project_path: Path) -> None:
+        result = runner.invoke(
+            app,
+            [
+                "query",
+                "list",
+                "--scope",
+                "all",
+                "--watch",
+                "--format",
+                "json",
+                "--path",
+                str(sample_project_path),
+            ],
+        )
+
+        assert result.exit_code == 0
+        data = json.loads(get_output(result))
+        assert data["queries"]
+        assert data["removed"] == []
+
+    def test_watch_invalid_interval(self, sample_project_path: Path) -> None:
+        result = runner.invoke(
+            app,
+            [
+                "query",
+                "list",
+                "--watch",
+                "--interval",
+                "10",
+                "--max-interval",
+                "5",
+                "--path",
+                str(sample_project_path),
+            ],
+        )
+
+        assert result.exit_code == 1
+        assert "Invalid poll interval" in get_output(result)
+
+
 # =============================================================================
 # Test: query show
 # =============================================================================
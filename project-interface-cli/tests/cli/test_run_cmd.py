@@ -6,7 +6,11 @@ from pathlib import Path
 import pytest
 from typer.testing import CliRunner
 
+from dli.core.admission import AdmissionDecision
+from dli.exceptions import RunCostExceededError
 from dli.main import app
+from dli.models.common import ExecutionMode, ResultStatus
+from dli.models.run import RunResult
 
 runner = CliRunner()
 
@@ -694,6 +698,78 @@ class TestRunErrorHandling:
         assert "=" in output or "format" in output.lower() or "error" in output.lower()
 
 
+# =============================================================================
+# TestRunCostAdmission
+# =============================================================================
+
+
+class CostlyRunAPI:
+    """RunAPI stand-in whose query exceeds the admission budget."""
+
+    def __init__(self, context=None, *, confirm_cost=None) -> None:
+        self.confirm_cost = confirm_cost
+
+    def run(self, *, sql_path: Path, output_path: Path, output_format, **kwargs):
+        decision = AdmissionDecision(
+            sql_hash="abc",
+            admitted=False,
+            bytes_processed=2_000_000_000,
+            exceeded=["bytes 2.0 GB > max_bytes_per_query 1.0 GB"],
+        )
+        if self.confirm_cost is None or not self.confirm_cost(decision):
+            raise RunCostExceededError(
+                message="Query rejected",
+                exceeded=decision.exceeded,
+                bytes_processed=decision.bytes_processed,
+            )
+        output_path.write_text("id\n1\n")
+        return RunResult(
+            status=ResultStatus.SUCCESS,
+            sql_path=sql_path,
+            output_path=output_path,
+            output_format=output_format,
+            row_count=1,
+            duration_seconds=0.1,
+            execution_mode=ExecutionMode.LOCAL,
+            rendered_sql="SELECT 1",
+        )
+
+
+class TestRunCostAdmission:
+    """Tests for queries above the cost admission budget."""
+
+    @pytest.fixture(autouse=True)
+    def costly_api(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("dli.commands.run.RunAPI", CostlyRunAPI)
+
+    def invoke(self, tmp_path: Path, answer: str):
+        sql_file = tmp_path / "query.sql"
+        sql_file.write_text("SELECT 1")
+        return runner.invoke(
+            app,
+            ["run", "--sql", str(sql_file), "-o", str(tmp_path / "out.csv")],
+            input=answer,
+        )
+
+    def test_confirmed_query_runs(self, tmp_path: Path) -> None:
+        """Test a confirmed query above the budget runs."""
+        result = self.invoke(tmp_path, "y\n")
+
+        assert result.exit_code == 0
+        output = get_output(result)
+        assert "exceeds the cost budget" in output
+        assert "2.00 GB" in output
+        assert (tmp_path / "out.csv").exists()
+
+    def test_declined_query_is_reported(self, tmp_path: Path) -> None:
+        """Test a declined query exits with the admission error, not a traceback."""
+        result = self.invoke(tmp_path, "n\n")
+
+        assert result.exit_code == 1
+        assert "DLI-417" in get_output(result)
+        assert not isinstance(result.exception, RunCostExceededError)
+
+
 # =============================================================================
 # TestRunHelp
 # =============================================================================
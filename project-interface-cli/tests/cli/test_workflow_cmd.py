@@ -463,6 +463,111 @@ class TestWorkflowStatus:
         assert "not found" in output.lower() or "error" in output.lower()
 
 
+class TestWorkflowStatusBulk:
+    """Tests for bulk workflow status (several run IDs, --dataset, --all)."""
+
+    def test_status_all_since(self, sample_project_path: Path) -> None:
+        """Test latest run of every workflow in a time window."""
+        result = runner.invoke(
+            app,
+            [
+                "workflow",
+                "status",
+                "--all",
+                "--since",
+                "24h",
+                "--path",
+                str(sample_project_path),
+                "--format",
+                "json",
+            ],
+        )
+        assert result.exit_code == 0
+        data = json.loads(get_output(result))
+        assert [r["dataset_name"] for r in data["runs"]] == [
+            "iceberg.analytics.daily_clicks",
+            "iceberg.warehouse.user_events",
+        ]
+        assert data["request_count"] == 1
+
+    def test_status_multiple_run_ids(self, sample_project_path: Path) -> None:
+        """Test several run IDs are shown in one table."""
+        result = runner.invoke(
+            app,
+            [
+                "workflow",
+                "status",
+                "iceberg.reporting.weekly_summary_20240108_100000",
+                "missing_run",
+                "--path",
+                str(sample_project_path),
+            ],
+        )
+        assert result.exit_code == 0
+        output = get_output(result)
+        assert "Workflow Status (1)" in output
+        assert "missing_run" in output
+        assert "1 failed run(s)" in output
+
+    def test_status_datasets_with_history(self, sample_project_path: Path) -> None:
+        """Test recent runs of selected datasets."""
+        result = runner.invoke(
+            app,
+            [
+                "workflow",
+                "status",
+                "-d",
+                "iceberg.analytics.daily_clicks",
+                "-n",
+                "5",
+                "--path",
+                str(sample_project_path),
+                "--format",
+                "json",
+            ],
+        )
+        assert result.exit_code == 0
+        data = json.loads(get_output(result))
+        assert len(data["runs"]) == 2
+
+    def test_status_invalid_since(self, sample_project_path: Path) -> None:
+        """Test invalid --since value."""
+        result = runner.invoke(
+            app,
+            [
+                "workflow",
+                "status",
+                "--all",
+                "--since",
+                "soon",
+                "--path",
+                str(sample_project_path),
+            ],
+        )
+        assert result.exit_code == 1
+        assert "invalid since" in get_output(result).lower()
+
+    def test_status_requires_target(self, sample_project_path: Path) -> None:
+        """Test that a run ID, --dataset or --all is required."""
+        result = runner.invoke(
+            app, ["workflow", "status", "--path", str(sample_project_path)]
+        )
+        assert result.exit_code == 1
+
+        result = runner.invoke(
+            app,
+            [
+                "workflow",
+                "status",
+                "run_1",
+                "--all",
+                "--path",
+                str(sample_project_path),
+            ],
+        )
+        assert result.exit_code == 1
+
+
 # =============================================================================
 # Test: workflow list
 # =============================================================================
@@ -0,0 +1,233 @@
+"""Tests for dli.core.catalog.index offline catalog index.
+
+Covers:
+- Upsert/delete with FTS search ranking and filters
+- Incremental and full sync from catalog change pages
+- Staleness, refresh claims and background refresh
+- Substring fallback without FTS5
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import time
+from typing import Any
+
+import pytest
+
+from dli.core.catalog import index as index_module
+from dli.core.catalog.index import (
+    CatalogIndex,
+    catalog_index_path,
+    refresh_in_background,
+)
+from dli.core.client import ServerConfig, ServerResponse
+
+
+def table(name: str, **fields: Any) -> dict[str, Any]:
+    return {"name": name, "engine": "bigquery", **fields}
+
+
+USERS = table(
+    "prj.analytics.users",
+    owner="data-team@example.com",
+    team="@data-eng",
+    tags=["pii", "tier::critical"],
+    description="User dimension",
+    columns=[{"name": "user_id", "description": "Unique user identifier"}],
+)
+ORDERS = table(
+    "prj.analytics.orders",
+    owner="commerce@example.com",
+    team="@commerce",
+    tags=["tier::critical"],
+    description="Order facts",
+    columns=[{"name": "user_id", "description": "Customer who placed the order"}],
+)
+EVENTS = table(
+    "prj.raw.events",
+    owner="platform@example.com",
+    tags=["raw"],
+    columns=[{"name": "payload", "description": "Raw JSON"}],
+)
+
+
+class ChangesClient:
+    """Client that serves catalog change pages from a queue."""
+
+    def __init__(self, pages: list[dict[str, Any]]) -> None:
+        self.pages = pages
+        self.calls: list[dict[str, Any]] = []
+        self.config = ServerConfig(url="http://catalog.test")
+
+    def catalog_changes(self, **kwargs: Any) -> ServerResponse:
+        self.calls.append(kwargs)
+        if not self.pages:
+            return ServerResponse(success=False, error="server down", status_code=503)
+        return ServerResponse(success=True, data=self.pages.pop(0))
+
+
+@pytest.fixture
+def index(tmp_path: Path) -> CatalogIndex:
+    catalog_index = CatalogIndex(tmp_path / "catalog.sqlite3")
+    catalog_index.upsert([USERS, ORDERS, EVENTS])
+    yield catalog_index
+    catalog_index.close()
+
+
+def names(tables: list[dict[str, Any]]) -> list[str]:
+    return [t["name"] for t in tables]
+
+
+class TestCatalogIndexSearch:
+    """Tests for search and list queries."""
+
+    def test_name_match_ranks_first(self, index: CatalogIndex) -> None:
+        # "user" matches the users table name and a column of orders
+        assert names(index.search("user")) == [
+            "prj.analytics.users",
+            "prj.analytics.orders",
+        ]
+
+    def test_prefix_and_multiword(self, index: CatalogIndex) -> None:
+        assert names(index.search("ord")) == ["prj.analytics.orders"]
+        assert names(index.search("customer order")) == ["prj.analytics.orders"]
+        assert index.search("missing") == []
+
+    def test_project_filter_and_summary(self, index: CatalogIndex) -> None:
+        results = index.search("raw", project="PRJ")
+
+        assert names(results) == ["prj.raw.events"]
+        assert "columns" not in results[0]
+        assert index.search("raw", project="other") == []
+
+    def test_list_filters(self, index: CatalogIndex) -> None:
+        assert names(index.list(owner="DATA-TEAM@example.com")) == [
+            "prj.analytics.users"
+        ]
+        assert names(index.list(tags=["tier::critical"])) == [
+            "prj.analytics.orders",
+            "prj.analytics.users",
+        ]
+        assert names(index.list(tags=["tier::critical", "PII"])) == [
+            "prj.analytics.users"
+        ]
+        assert names(index.list(project="prj", dataset="raw")) == ["prj.raw.events"]
+        assert names(index.list(limit=1, offset=1)) == ["prj.analytics.users"]
+
+    def test_upsert_replaces_and_delete_removes(self, index: CatalogIndex) -> None:
+        index.upsert([{**USERS, "tags": ["deprecated"]}])
+        index.delete(["prj.raw.events"])
+
+        assert len(index) == 2
+        assert index.list(tags=["pii"]) == []
+        assert names(index.search("deprecated")) == ["prj.analytics.users"]
+        assert index.search("payload") == []
+        assert index.get("prj.analytics.users")["tags"] == ["deprecated"]
+
+    def test_substring_fallback_without_fts(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(
+            index_module, "_FTS_SCHEMA", "CREATE VIRTUAL TABLE x USING nope();"
+        )
+
+        with CatalogIndex(tmp_path / "plain.sqlite3") as plain:
+            plain.upsert([USERS, ORDERS])
+
+            assert not plain.fts_enabled
+            assert names(plain.search("user")) == [
+                "prj.analytics.users",
+                "prj.analytics.orders",
+            ]
+
+
+class TestCatalogIndexSync:
+    """Tests for syncing from catalog change pages."""
+
+    def test_full_then_incremental(self, tmp_path: Path) -> None:
+        client = ChangesClient(
+            [
+                {
+                    "tables": [USERS],
+                    "deleted": [],
+                    "next_cursor": "1",
+                    "sync_token": "t1",
+                },
+                {
+                    "tables": [EVENTS],
+                    "deleted": [],
+                    "next_cursor": None,
+                    "sync_token": "t1",
+                },
+                {"tables": [ORDERS], "deleted": ["prj.raw.events"], "sync_token": "t2"},
+            ]
+        )
+
+        with CatalogIndex(tmp_path / "catalog.sqlite3") as catalog_index:
+            first = catalog_index.sync(client)
+            second = catalog_index.sync(client)
+
+            assert first.full and first.pages == 2 and first.upserted == 2
+            assert not second.full and second.deleted == 1
+            assert client.calls[1]["cursor"] == "1"
+            assert client.calls[2]["since"] == "t1"
+            assert names(catalog_index.list()) == [
+                "prj.analytics.orders",
+                "prj.analytics.users",
+            ]
+            assert catalog_index.get_meta("sync_token") == "t2"
+            assert not catalog_index.is_stale()
+
+    def test_failed_sync_changes_nothing(self, index: CatalogIndex) -> None:
+        client = ChangesClient(
+            [{"tables": [], "deleted": [], "next_cursor": "1", "sync_token": "t1"}]
+        )
+
+        stats = index.sync(client, full=True)
+
+        assert not stats.success
+        assert stats.error == "server down"
+        assert len(index) == 3
+        assert index.get_meta("sync_token") is None
+
+    def test_mock_client_changes(self, tmp_path: Path) -> None:
+        from dli.core.client import BasecampClient
+
+        client = BasecampClient(ServerConfig(url="http://mock"), mock_mode=True)
+
+        with CatalogIndex(tmp_path / "catalog.sqlite3") as catalog_index:
+            stats = catalog_index.sync(client, page_size=2)
+
+            assert stats.pages == 2
+            assert len(catalog_index) == len(client._mock_data["catalog_tables"])
+            assert catalog_index.sync(client).upserted == 0
+
+
+class TestCatalogIndexRefresh:
+    """Tests for staleness and background refresh."""
+
+    def test_index_path_per_server(self, tmp_path: Path) -> None:
+        path = catalog_index_path(tmp_path, "http://a")
+
+        assert path.parent == tmp_path / ".dli" / "cache" / "catalog"
+        assert path != catalog_index_path(tmp_path, "http://b")
+
+    def test_claim_refresh_lease(self, index: CatalogIndex) -> None:
+        assert index.is_stale()
+        assert index.claim_refresh()
+        assert not index.claim_refresh()
+        assert index.claim_refresh(lease_seconds=0)
+
+    def test_refresh_in_background(self, index: CatalogIndex) -> None:
+        index.set_meta("sync_token", "t0")
+        client = ChangesClient([{"tables": [], "deleted": ["prj.raw.events"]}])
+
+        thread = refresh_in_background(index, client)
+        assert thread is not None
+        thread.join(5)
+
+        assert len(index) == 2
+        assert index.synced_at is not None
+        assert index.synced_at <= time.time()
+        assert refresh_in_background(index, client) is None
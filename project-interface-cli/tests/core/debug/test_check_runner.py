@@ -0,0 +1,256 @@
+"""Tests for the concurrent debug check runner.
+
+Covers:
+- Results keep input order regardless of completion order
+- Independent checks run concurrently
+- Declared dependencies run first; dependents skip when they fail
+- Per-check timeouts and the global deadline
+- Exceptions become failed results
+- Per-check latency and total duration in DebugResult
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from dli.api.debug import DebugAPI
+from dli.core.debug.checks import (
+    BaseCheck,
+    DnsResolutionCheck,
+    HttpsConnectivityCheck,
+    ServerHealthCheck,
+    ServerUrlCheck,
+)
+from dli.core.debug.models import CheckCategory, CheckResult, CheckStatus
+from dli.core.debug.runner import CheckRunner
+from dli.models.common import ExecutionContext
+
+
+class SleepCheck(BaseCheck):
+    """Check that sleeps, then returns a fixed status."""
+
+    def __init__(
+        self,
+        label: str,
+        delay: float = 0.0,
+        status: CheckStatus = CheckStatus.PASS,
+        log: list[str] | None = None,
+    ) -> None:
+        self._label = label
+        self._delay = delay
+        self._status = status
+        self._log = log if log is not None else []
+
+    @property
+    def name(self) -> str:
+        return self._label
+
+    @property
+    def category(self) -> CheckCategory:
+        return CheckCategory.NETWORK
+
+    def execute(self, context: ExecutionContext) -> CheckResult:
+        self._log.append(f"start:{self._label}")
+        time.sleep(self._delay)
+        self._log.append(f"end:{self._label}")
+        if self._status == CheckStatus.FAIL:
+            return self._fail("failed", error="boom", remediation="fix it")
+        return self._pass("ok")
+
+
+class ResolveCheck(SleepCheck):
+    """Stand-in for a DNS check."""
+
+
+class ConnectCheck(SleepCheck):
+    """Stand-in for an HTTPS check that needs DNS first."""
+
+    depends_on = (ResolveCheck,)
+
+
+class QuickTimeoutCheck(SleepCheck):
+    """Check with its own short timeout."""
+
+    timeout = 0.1
+
+
+class ErrorCheck(SleepCheck):
+    """Check whose execute raises."""
+
+    def execute(self, context: ExecutionContext) -> CheckResult:
+        raise RuntimeError("unexpected")
+
+
+@pytest.fixture
+def context() -> ExecutionContext:
+    return ExecutionContext(timeout=30)
+
+
+class TestCheckRunner:
+    """Tests for CheckRunner."""
+
+    def test_results_keep_input_order(self, context: ExecutionContext) -> None:
+        checks = [SleepCheck("slow", 0.2), SleepCheck("fast", 0.0)]
+
+        results = CheckRunner(context).run(checks)
+
+        assert [r.name for r in results] == ["slow", "fast"]
+
+    def test_independent_checks_run_concurrently(
+        self, context: ExecutionContext
+    ) -> None:
+        checks = [SleepCheck(f"c{i}", 0.3) for i in range(4)]
+
+        start = time.perf_counter()
+        results = CheckRunner(context).run(checks)
+        elapsed = time.perf_counter() - start
+
+        assert all(r.status == CheckStatus.PASS for r in results)
+        assert elapsed < 0.9
+
+    def test_max_workers_limits_concurrency(self, context: ExecutionContext) -> None:
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        class CountingCheck(SleepCheck):
+            def execute(self, context: ExecutionContext) -> CheckResult:
+                nonlocal active, peak
+                with lock:
+                    active += 1
+                    peak = max(peak, active)
+                time.sleep(0.05)
+                with lock:
+                    active -= 1
+                return self._pass("ok")
+
+        CheckRunner(context, max_workers=2).run(
+            [CountingCheck(f"c{i}") for i in range(6)]
+        )
+
+        assert peak <= 2
+
+    def test_dependency_runs_first(self, context: ExecutionContext) -> None:
+        log: list[str] = []
+        checks = [ResolveCheck("dns", 0.1, log=log), ConnectCheck("https", log=log)]
+
+        results = CheckRunner(context).run(checks)
+
+        assert log.index("end:dns") < log.index("start:https")
+        assert [r.status for r in results] == [CheckStatus.PASS, CheckStatus.PASS]
+
+    def test_dependent_skipped_when_dependency_fails(
+        self, context: ExecutionContext
+    ) -> None:
+        log: list[str] = []
+        checks = [
+            ResolveCheck("dns", status=CheckStatus.FAIL, log=log),
+            ConnectCheck("https", log=log),
+        ]
+
+        results = CheckRunner(context).run(checks)
+
+        assert results[1].status == CheckStatus.SKIP
+        assert "dns failed" in results[1].message
+        assert "start:https" not in log
+
+    def test_per_check_timeout(self, context: ExecutionContext) -> None:
+        checks = [QuickTimeoutCheck("hang", 2.0), SleepCheck("ok")]
+
+        start = time.perf_counter()
+        results = CheckRunner(context).run(checks)
+
+        assert time.perf_counter() - start < 1.0
+        assert results[0].status == CheckStatus.FAIL
+        assert "Timed out" in results[0].message
+        assert results[0].remediation is not None
+        assert results[1].status == CheckStatus.PASS
+
+    def test_global_deadline(self, context: ExecutionContext) -> None:
+        checks = [SleepCheck("a", 2.0), SleepCheck("b", 2.0)]
+
+        start = time.perf_counter()
+        results = CheckRunner(context, deadline=0.2).run(checks)
+
+        assert time.perf_counter() - start < 1.0
+        assert all(r.status == CheckStatus.FAIL for r in results)
+        assert all("global deadline" in (r.error or "") for r in results)
+
+    def test_exception_becomes_failure(self, context: ExecutionContext) -> None:
+        results = CheckRunner(context).run([ErrorCheck("broken")])
+
+        assert results[0].status == CheckStatus.FAIL
+        assert results[0].name == "broken"
+        assert results[0].error == "unexpected"
+
+    def test_duration_is_measured(self, context: ExecutionContext) -> None:
+        results = CheckRunner(context).run([SleepCheck("slow", 0.1)])
+
+        assert results[0].duration_ms >= 90
+
+
+class TestDeclaredDependencies:
+    """Tests for dependencies declared by the built-in checks."""
+
+    def test_https_depends_on_dns(self) -> None:
+        assert DnsResolutionCheck in HttpsConnectivityCheck.depends_on
+
+    def test_https_waits_only_for_dns_of_its_host(self) -> None:
+        https = HttpsConnectivityCheck("https://b.example.com/health")
+
+        assert https.waits_for(DnsResolutionCheck("b.example.com"))
+        assert not https.waits_for(DnsResolutionCheck("a.example.com"))
+
+    def test_dns_failure_skips_only_same_host_https(
+        self, context: ExecutionContext, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def fake_dns(check: DnsResolutionCheck, context: ExecutionContext):
+            if check.hostname == "a.example.com":
+                return check._fail("Failed to resolve", error="NXDOMAIN")
+            return check._pass("resolved")
+
+        monkeypatch.setattr(DnsResolutionCheck, "execute", fake_dns)
+        monkeypatch.setattr(
+            HttpsConnectivityCheck,
+            "execute",
+            lambda check, context: check._pass("connected"),
+        )
+        checks = [
+            DnsResolutionCheck("a.example.com"),
+            DnsResolutionCheck("b.example.com"),
+            HttpsConnectivityCheck("https://a.example.com"),
+            HttpsConnectivityCheck("https://b.example.com"),
+        ]
+
+        results = CheckRunner(context).run(checks)
+
+        assert [r.status for r in results] == [
+            CheckStatus.FAIL,
+            CheckStatus.PASS,
+            CheckStatus.SKIP,
+            CheckStatus.PASS,
+        ]
+
+    def test_server_health_depends_on_server_url(self) -> None:
+        assert ServerUrlCheck in ServerHealthCheck.depends_on
+
+    def test_network_checks_have_timeouts(self) -> None:
+        for check_class in (
+            DnsResolutionCheck,
+            HttpsConnectivityCheck,
+            ServerHealthCheck,
+        ):
+            assert check_class.timeout is not None
+
+
+class TestDebugAPIDuration:
+    """Tests for run-level latency reporting."""
+
+    def test_result_reports_total_duration(self, context: ExecutionContext) -> None:
+        result = DebugAPI(context=context).check_system()
+
+        assert result.duration_ms >= 0
+        assert result.slowest_check is not None
@@ -0,0 +1,244 @@
+"""Tests for the project-wide format engine.
+
+Test coverage:
+- compute_config_hash: Sensitivity to dialect, lint flag and .sqlfluff content
+- FormatCache: round-trip, content and configuration invalidation
+- ProjectFormatter: unchanged-file skipping, check mode, timings,
+  parallel execution and serial fallback
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from dli.core.format import FormatConfig
+from dli.core.format.engine import (
+    FileFormatOutcome,
+    FormatCache,
+    ProjectFormatSummary,
+    ProjectFormatter,
+    compute_config_hash,
+)
+from dli.models.format import FileFormatStatus
+
+pytest.importorskip("sqlfluff")
+
+UNFORMATTED_SQL = "select a,b from t where x=1"
+
+
+def _write_project(root: Path, sql_count: int = 2) -> Path:
+    """Create a minimal project with dataset SQL files."""
+    root.mkdir(parents=True, exist_ok=True)
+    (root / "dli.yaml").write_text(
+        """
+version: "1"
+project:
+  name: "format-engine-test"
+discovery:
+  datasets_dir: "datasets"
+  metrics_dir: "metrics"
+"""
+    )
+    datasets = root / "datasets"
+    datasets.mkdir()
+    (root / "metrics").mkdir()
+    for i in range(sql_count):
+        (datasets / f"ds_{i}.sql").write_text(f"select id_{i},name from t_{i}")
+    return root
+
+
+def _sql_files(root: Path) -> list[tuple[Path, str]]:
+    return [(p, "sql") for p in sorted((root / "datasets").glob("*.sql"))]
+
+
+class TestComputeConfigHash:
+    """Tests for compute_config_hash."""
+
+    def test_stable_for_same_settings(self) -> None:
+        config = FormatConfig()
+        assert compute_config_hash(config, "trino", lint=False) == compute_config_hash(
+            config, "trino", lint=False
+        )
+
+    def test_changes_with_dialect_and_lint(self) -> None:
+        config = FormatConfig()
+        base = compute_config_hash(config, "trino", lint=False)
+        assert compute_config_hash(config, "bigquery", lint=False) != base
+        assert compute_config_hash(config, "trino", lint=True) != base
+
+    def test_changes_with_sqlfluff_file_content(self, tmp_path: Path) -> None:
+        sqlfluff = tmp_path / ".sqlfluff"
+        sqlfluff.write_text("[sqlfluff]\nmax_line_length = 100\n")
+        config = FormatConfig(sqlfluff_path=sqlfluff)
+        before = compute_config_hash(config, "trino", lint=False)
+
+        sqlfluff.write_text("[sqlfluff]\nmax_line_length = 80\n")
+        assert compute_config_hash(config, "trino", lint=False) != before
+
+
+class TestFormatCache:
+    """Tests for FormatCache."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        file_path = tmp_path / "a.sql"
+        cache = FormatCache(tmp_path / "cache", "cfg")
+        cache.mark_clean(file_path, "h1", [{"rule": "LT01"}])
+        cache.save()
+
+        reloaded = FormatCache(tmp_path / "cache", "cfg")
+        assert reloaded.lookup(file_path, "h1") == [{"rule": "LT01"}]
+        assert reloaded.lookup(file_path, "h2") is None
+
+    def test_config_change_invalidates_all(self, tmp_path: Path) -> None:
+        file_path = tmp_path / "a.sql"
+        cache = FormatCache(tmp_path / "cache", "cfg-1")
+        cache.mark_clean(file_path, "h1")
+        cache.save()
+
+        reloaded = FormatCache(tmp_path / "cache", "cfg-2")
+        assert len(reloaded) == 0
+        assert reloaded.lookup(file_path, "h1") is None
+
+    def test_corrupt_file_ignored(self, tmp_path: Path) -> None:
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        (cache_dir / "format.json").write_text("{not json")
+
+        assert len(FormatCache(cache_dir, "cfg")) == 0
+
+
+class TestProjectFormatSummary:
+    """Tests for ProjectFormatSummary."""
+
+    def test_counts_and_slowest(self) -> None:
+        summary = ProjectFormatSummary(
+            files=[
+                FileFormatOutcome(Path("a.sql"), "sql", FileFormatStatus.CHANGED, 5.0),
+                FileFormatOutcome(
+                    Path("b.sql"), "sql", FileFormatStatus.UNCHANGED, 50.0
+                ),
+                FileFormatOutcome(
+                    Path("c.sql"), "sql", FileFormatStatus.UNCHANGED, 0.1, cached=True
+                ),
+                FileFormatOutcome(Path("d.yaml"), "yaml", FileFormatStatus.ERROR, 1.0),
+            ]
+        )
+
+        assert summary.changed_count == 1
+        assert summary.error_count == 1
+        assert summary.cached_count == 1
+        assert summary.has_changes
+        assert [f.path.name for f in summary.slowest(2)] == ["b.sql", "a.sql"]
+
+
+class TestProjectFormatter:
+    """Tests for ProjectFormatter."""
+
+    def test_discover_files_lists_sql(self, tmp_path: Path) -> None:
+        root = _write_project(tmp_path / "project")
+
+        files = ProjectFormatter(root, dialect="trino").discover_files()
+
+        assert {(p.name, kind) for p, kind in files} == {
+            ("ds_0.sql", "sql"),
+            ("ds_1.sql", "sql"),
+        }
+
+    def test_second_run_skips_formatted_files(self, tmp_path: Path) -> None:
+        root = _write_project(tmp_path / "project")
+        formatter = ProjectFormatter(root, dialect="trino", jobs=1)
+
+        first = formatter.format_files(_sql_files(root))
+        assert first.changed_count == 2
+        assert first.cached_count == 0
+        assert all(f.duration_ms > 0 for f in first.files)
+
+        second = formatter.format_files(_sql_files(root))
+        assert second.cached_count == 2
+        assert second.changed_count == 0
+        assert (root / ".dli" / "cache" / "format.json").exists()
+
+    def test_check_mode_does_not_cache_changed_files(self, tmp_path: Path) -> None:
+        root = _write_project(tmp_path / "project", sql_count=1)
+        formatter = ProjectFormatter(root, dialect="trino", jobs=1)
+
+        first = formatter.format_files(_sql_files(root), check_only=True)
+        second = formatter.format_files(_sql_files(root), check_only=True)
+
+        assert first.changed_count == 1
+        assert second.changed_count == 1
+        assert second.cached_count == 0
+        assert (
+            root / "datasets" / "ds_0.sql"
+        ).read_text() == "select id_0,name from t_0"
+
+    def test_content_change_invalidates_entry(self, tmp_path: Path) -> None:
+        root = _write_project(tmp_path / "project")
+        formatter = ProjectFormatter(root, dialect="trino", jobs=1)
+        formatter.format_files(_sql_files(root))
+
+        (root / "datasets" / "ds_0.sql").write_text(UNFORMATTED_SQL)
+        summary = formatter.format_files(_sql_files(root))
+
+        by_name = {f.path.name: f for f in summary.files}
+        assert not by_name["ds_0.sql"].cached
+        assert by_name["ds_0.sql"].status == FileFormatStatus.CHANGED
+        assert by_name["ds_1.sql"].cached
+
+    def test_dialect_change_invalidates_cache(self, tmp_path: Path) -> None:
+        root = _write_project(tmp_path / "project")
+        ProjectFormatter(root, dialect="trino", jobs=1).format_files(_sql_files(root))
+
+        summary = ProjectFormatter(root, dialect="bigquery", jobs=1).format_files(
+            _sql_files(root)
+        )
+
+        assert summary.cached_count == 0
+
+    def test_no_cache_option(self, tmp_path: Path) -> None:
+        root = _write_project(tmp_path / "project")
+        formatter = ProjectFormatter(root, dialect="trino", jobs=1, use_cache=False)
+        formatter.format_files(_sql_files(root))
+
+        summary = formatter.format_files(_sql_files(root))
+
+        assert summary.cached_count == 0
+        assert not (root / ".dli" / "cache" / "format.json").exists()
+
+    def test_parallel_matches_serial(self, tmp_path: Path) -> None:
+        serial_root = _write_project(tmp_path / "serial", sql_count=4)
+        parallel_root = _write_project(tmp_path / "parallel", sql_count=4)
+
+        serial = ProjectFormatter(serial_root, dialect="trino", jobs=1).format_files(
+            _sql_files(serial_root)
+        )
+        parallel = ProjectFormatter(
+            parallel_root, dialect="trino", jobs=2
+        ).format_files(_sql_files(parallel_root))
+
+        assert [f.status for f in parallel.files] == [f.status for f in serial.files]
+        for s_file, p_file in zip(serial.files, parallel.files, strict=True):
+            assert s_file.path.read_text() == p_file.path.read_text()
+
+    def test_pool_failure_falls_back_to_serial(self, tmp_path: Path) -> None:
+        root = _write_project(tmp_path / "project", sql_count=4)
+        formatter = ProjectFormatter(root, dialect="trino", jobs=2)
+
+        with patch(
+            "dli.core.format.engine.ProcessPoolExecutor",
+            side_effect=OSError("no semaphores"),
+        ):
+            summary = formatter.format_files(_sql_files(root))
+
+        assert summary.changed_count == 4
+        assert summary.error_count == 0
+
+    def test_invalid_dialect_fails_fast(self, tmp_path: Path) -> None:
+        from dli.exceptions import FormatDialectError
+
+        root = _write_project(tmp_path / "project")
+        with pytest.raises(FormatDialectError):
+            ProjectFormatter(root, dialect="not-a-dialect")
@@ -0,0 +1,126 @@
+"""Tests for SQL lineage extraction (dli.core.lineage.extractor).
+
+Test coverage:
+- Table-level sources for SELECT, INSERT, CREATE AS and MERGE
+- Column-level edges through aliases, CTEs, derived tables and UNION
+- INSERT column lists, SELECT * and parse errors
+"""
+
+from __future__ import annotations
+
+from dli.core.lineage.extractor import ColumnEdge, extract_sql_lineage
+
+
+def _extract(sql: str, target: str = "cat.db.target"):
+    return extract_sql_lineage(sql, dialect="trino", default_target=target)
+
+
+def _column_pairs(sql: str, target: str = "cat.db.target") -> set[tuple[str, str]]:
+    return {(e.source, e.target) for e in _extract(sql, target).columns}
+
+
+class TestTableLineage:
+    """Tests for table-level extraction."""
+
+    def test_select_uses_default_target(self) -> None:
+        lineage = _extract("SELECT a FROM cat.raw.events", target="cat.m.metric")
+
+        assert lineage.target == "cat.m.metric"
+        assert lineage.tables == ["cat.raw.events"]
+
+    def test_insert_target_and_join_sources(self) -> None:
+        lineage = _extract(
+            "INSERT INTO cat.db.out SELECT u.id FROM cat.raw.users u "
+            "JOIN cat.raw.orders o ON u.id = o.user_id"
+        )
+
+        assert lineage.target == "cat.db.out"
+        assert lineage.tables == ["cat.raw.users", "cat.raw.orders"]
+
+    def test_cte_names_are_not_tables(self) -> None:
+        lineage = _extract(
+            "WITH recent AS (SELECT id FROM cat.raw.events) SELECT id FROM recent"
+        )
+
+        assert lineage.tables == ["cat.raw.events"]
+
+    def test_create_table_as(self) -> None:
+        lineage = _extract("CREATE TABLE cat.db.snap AS SELECT k FROM cat.raw.src")
+
+        assert lineage.target == "cat.db.snap"
+        assert lineage.columns == [ColumnEdge("cat.raw.src.k", "cat.db.snap.k")]
+
+    def test_merge_sources(self) -> None:
+        lineage = _extract(
+            "MERGE INTO cat.db.dim t USING cat.raw.src s ON t.id = s.id "
+            "WHEN MATCHED THEN UPDATE SET v = s.v"
+        )
+
+        assert lineage.target == "cat.db.dim"
+        assert lineage.tables == ["cat.raw.src"]
+
+    def test_parse_error_is_reported(self) -> None:
+        lineage = _extract("SELECT (a FROM")
+
+        assert lineage.errors
+        assert lineage.tables == []
+
+
+class TestColumnLineage:
+    """Tests for column-level extraction."""
+
+    def test_expression_and_alias(self) -> None:
+        pairs = _column_pairs("SELECT id, amount * 2 AS doubled FROM cat.raw.s")
+
+        assert pairs == {
+            ("cat.raw.s.id", "cat.db.target.id"),
+            ("cat.raw.s.amount", "cat.db.target.doubled"),
+        }
+
+    def test_resolves_through_cte(self) -> None:
+        pairs = _column_pairs(
+            "WITH c AS (SELECT u.id AS uid, o.amt FROM cat.raw.users u "
+            "JOIN cat.raw.orders o ON u.id = o.uid) "
+            "SELECT uid, SUM(amt) AS total FROM c GROUP BY uid"
+        )
+
+        assert pairs == {
+            ("cat.raw.users.id", "cat.db.target.uid"),
+            ("cat.raw.orders.amt", "cat.db.target.total"),
+        }
+
+    def test_insert_column_list_renames_outputs(self) -> None:
+        pairs = _column_pairs("INSERT INTO cat.db.out (x) SELECT id FROM cat.raw.s")
+
+        assert pairs == {("cat.raw.s.id", "cat.db.out.x")}
+
+    def test_union_merges_by_position(self) -> None:
+        pairs = _column_pairs(
+            "SELECT id FROM cat.raw.a UNION ALL SELECT other_id FROM cat.raw.b"
+        )
+
+        assert pairs == {
+            ("cat.raw.a.id", "cat.db.target.id"),
+            ("cat.raw.b.other_id", "cat.db.target.id"),
+        }
+
+    def test_star_over_derived_table_expands(self) -> None:
+        pairs = _column_pairs("SELECT * FROM (SELECT id, name FROM cat.raw.u) d")
+
+        assert pairs == {
+            ("cat.raw.u.id", "cat.db.target.id"),
+            ("cat.raw.u.name", "cat.db.target.name"),
+        }
+
+    def test_scalar_subquery_in_projection(self) -> None:
+        pairs = _column_pairs(
+            "SELECT a.id, (SELECT MAX(z) FROM cat.raw.zz) AS m FROM cat.raw.a a"
+        )
+
+        assert ("cat.raw.zz.z", "cat.db.target.m") in pairs
+        assert ("cat.raw.a.id", "cat.db.target.id") in pairs
+
+    def test_where_columns_are_not_edges(self) -> None:
+        pairs = _column_pairs("SELECT id FROM cat.raw.s WHERE status = 'x'")
+
+        assert pairs == {("cat.raw.s.id", "cat.db.target.id")}
@@ -0,0 +1,260 @@
+"""Tests for the local lineage index (dli.core.lineage.local).
+
+Test coverage:
+- AdjacencyGraph: CSR construction, depth-limited traversal, serialization
+- LocalLineageIndex.build: incremental rebuilds, SQL file changes, removals
+- LocalLineageIndex queries: table- and column-level LineageResult
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from dli.core.lineage import LineageDirection
+from dli.core.lineage.local import AdjacencyGraph, LocalLineageIndex
+
+
+def _write_project(root: Path) -> Path:
+    """Create raw.events -> analytics.daily -> reporting.summary (+ a metric)."""
+    root.mkdir(parents=True, exist_ok=True)
+    (root / "dli.yaml").write_text(
+        """
+version: "1"
+project:
+  name: "lineage-test"
+discovery:
+  datasets_dir: "datasets"
+  metrics_dir: "metrics"
+"""
+    )
+    datasets = root / "datasets"
+    metrics = root / "metrics"
+    datasets.mkdir()
+    metrics.mkdir()
+
+    (datasets / "daily.sql").write_text(
+        "INSERT INTO iceberg.analytics.daily\n"
+        "SELECT user_id, COUNT(*) AS events FROM iceberg.raw.events\n"
+        "WHERE dt = '{{ execution_date }}' AND region = '{{ region }}'\n"
+        "GROUP BY user_id"
+    )
+    (datasets / "dataset.iceberg.analytics.daily.yaml").write_text(
+        """
+name: iceberg.analytics.daily
+owner: owner@example.com
+team: "@data"
+type: Dataset
+query_type: DML
+query_file: daily.sql
+tags: [daily]
+"""
+    )
+    (datasets / "dataset.iceberg.reporting.summary.yaml").write_text(
+        """
+name: iceberg.reporting.summary
+owner: owner@example.com
+team: "@data"
+type: Dataset
+query_type: DML
+query_statement: |
+  INSERT INTO iceberg.reporting.summary
+  SELECT SUM(events) AS total_events FROM iceberg.analytics.daily
+"""
+    )
+    (metrics / "metric.iceberg.metrics.active.yaml").write_text(
+        """
+name: iceberg.metrics.active
+owner: analyst@example.com
+team: "@analytics"
+type: Metric
+query_type: SELECT
+query_statement: SELECT COUNT(DISTINCT user_id) AS active FROM iceberg.analytics.daily
+"""
+    )
+    return root
+
+
+class TestAdjacencyGraph:
+    """Tests for the CSR adjacency graph."""
+
+    def test_traverse_both_directions(self) -> None:
+        graph = AdjacencyGraph.from_edges(
+            [("a", "b"), ("b", "c"), ("a", "c"), ("c", "d")]
+        )
+
+        down, _ = graph.traverse("a", reverse=False)
+        up, up_edges = graph.traverse("d", reverse=True)
+
+        assert {graph.names[n]: d for n, d in down.items()} == {"b": 1, "c": 1, "d": 2}
+        assert {graph.names[n]: d for n, d in up.items()} == {"c": 1, "a": 2, "b": 2}
+        # Edges are reported in forward orientation
+        assert (graph.names.index("c"), graph.names.index("d")) in up_edges
+
+    def test_depth_limit(self) -> None:
+        graph = AdjacencyGraph.from_edges([("a", "b"), ("b", "c"), ("c", "d")])
+
+        reached, _ = graph.traverse("a", reverse=False, depth=2)
+
+        assert {graph.names[n] for n in reached} == {"b", "c"}
+
+    def test_cycle_terminates(self) -> None:
+        graph = AdjacencyGraph.from_edges([("a", "b"), ("b", "a")])
+
+        reached, _ = graph.traverse("a", reverse=False)
+
+        assert {graph.names[n] for n in reached} == {"b"}
+
+    def test_row_round_trip(self) -> None:
+        graph = AdjacencyGraph.from_edges([("a", "b"), ("a", "c"), ("a", "b")])
+
+        restored = AdjacencyGraph.from_row(graph.to_row())
+
+        assert restored.names == graph.names
+        assert restored.edge_count == 2
+        reached, _ = restored.traverse("a", reverse=False)
+        assert {restored.names[n] for n in reached} == {"b", "c"}
+
+    def test_unknown_node(self) -> None:
+        graph = AdjacencyGraph.from_edges([("a", "b")])
+
+        assert "z" not in graph
+        assert graph.traverse("z", reverse=False) == ({}, [])
+
+
+class TestLocalLineageIndexBuild:
+    """Tests for building the local index."""
+
+    def test_initial_build_parses_all_specs(self, tmp_path: Path) -> None:
+        root = _write_project(tmp_path / "project")
+
+        stats = LocalLineageIndex(root).build()
+
+        assert stats.specs == 3
+        assert stats.parsed == 3
+        assert stats.reused == 0
+        assert stats.table_edges == 3
+        assert stats.errors == {}
+        assert (root / ".dli" / "cache" / "lineage.db").exists()
+
+    def test_rebuild_reuses_unchanged_specs(self, tmp_path: Path) -> None:
+        root = _write_project(tmp_path / "project")
+        LocalLineageIndex(root).build()
+
+        stats = LocalLineageIndex(root).build()
+
+        assert stats.parsed == 0
+        assert stats.reused == 3
+
+    def test_sql_file_change_reparses_spec(self, tmp_path: Path) -> None:
+        root = _write_project(tmp_path / "project")
+        index = LocalLineageIndex(root)
+        index.build()
+
+        (root / "datasets" / "daily.sql").write_text(
+            "INSERT INTO iceberg.analytics.daily "
+            "SELECT user_id, 1 AS events FROM iceberg.raw.clicks"
+        )
+        stats = index.build()
+
+        assert stats.parsed == 1
+        upstream = index.get_lineage("iceberg.analytics.daily", "upstream")
+        assert [n.name for n in upstream.nodes] == ["iceberg.raw.clicks"]
+
+    def test_removed_spec_is_dropped(self, tmp_path: Path) -> None:
+        root = _write_project(tmp_path / "project")
+        index = LocalLineageIndex(root)
+        index.build()
+
+        (root / "metrics" / "metric.iceberg.metrics.active.yaml").unlink()
+        stats = index.build()
+
+        assert stats.removed == 1
+        downstream = index.get_lineage("iceberg.analytics.daily", "downstream")
+        assert [n.name for n in downstream.nodes] == ["iceberg.reporting.summary"]
+
+    def test_dialect_change_reparses_everything(self, tmp_path: Path) -> None:
+        root = _write_project(tmp_path / "project")
+        LocalLineageIndex(root, dialect="trino").build()
+
+        stats = LocalLineageIndex(root, dialect="bigquery").build()
+
+        assert stats.parsed == 3
+
+    def test_invalid_spec_is_reported(self, tmp_path: Path) -> None:
+        root = _write_project(tmp_path / "project")
+        (root / "datasets" / "dataset.iceberg.bad.spec.yaml").write_text(
+            "name: [oops\n"
+        )
+
+        stats = LocalLineageIndex(root).build()
+
+        assert len(stats.errors) == 1
+        assert stats.parsed == 4
+
+
+class TestLocalLineageIndexQuery:
+    """Tests for querying the local index."""
+
+    def test_table_lineage_both_directions(self, tmp_path: Path) -> None:
+        root = _write_project(tmp_path / "project")
+        index = LocalLineageIndex(root)
+        index.build()
+
+        result = index.get_lineage("iceberg.analytics.daily")
+
+        assert result.direction == LineageDirection.BOTH
+        assert result.root.type == "Dataset"
+        assert result.root.tags == ["daily"]
+        depths = {n.name: n.depth for n in result.nodes}
+        assert depths == {
+            "iceberg.raw.events": -1,
+            "iceberg.reporting.summary": 1,
+            "iceberg.metrics.active": 1,
+        }
+        types = {n.name: n.type for n in result.nodes}
+        assert types["iceberg.raw.events"] == "External"
+        assert types["iceberg.metrics.active"] == "Metric"
+        assert result.total_upstream == 1
+        assert result.total_downstream == 2
+
+    def test_depth_limited_downstream(self, tmp_path: Path) -> None:
+        root = _write_project(tmp_path / "project")
+        index = LocalLineageIndex(root)
+        index.build()
+
+        result = index.get_lineage("iceberg.raw.events", "downstream", depth=1)
+
+        assert [n.name for n in result.nodes] == ["iceberg.analytics.daily"]
+        assert result.max_depth == 1
+
+    def test_column_lineage(self, tmp_path: Path) -> None:
+        root = _write_project(tmp_path / "project")
+        index = LocalLineageIndex(root)
+        index.build()
+
+        result = index.get_column_lineage(
+            "iceberg.reporting.summary.total_events", "upstream"
+        )
+
+        assert {n.name: n.depth for n in result.nodes} == {
+            "iceberg.analytics.daily.events": -1,
+        }
+        assert all(n.type == "Column" for n in result.nodes)
+        assert all(e.edge_type == "column" for e in result.edges)
+
+    def test_contains(self, tmp_path: Path) -> None:
+        root = _write_project(tmp_path / "project")
+        index = LocalLineageIndex(root)
+        index.build()
+
+        assert index.contains("iceberg.raw.events")
+        assert index.contains("iceberg.analytics.daily.user_id", column=True)
+        assert not index.contains("iceberg.unknown.table")
+
+    def test_query_without_build_is_empty(self, tmp_path: Path) -> None:
+        root = _write_project(tmp_path / "project")
+
+        result = LocalLineageIndex(root).get_lineage("iceberg.analytics.daily")
+
+        assert result.nodes == []
+        assert result.root.type == "External"
@@ -0,0 +1,193 @@
+"""Tests for dli.core.query.watch incremental query list watching."""
+
+from __future__ import annotations
+
+from itertools import islice
+from typing import Any
+
+import pytest
+
+from dli.core.client import BasecampClient, ServerConfig, ServerResponse
+from dli.core.query.watch import PollBackoff, QueryWatcher
+from dli.exceptions import ServerError
+
+
+def query(query_id: str, started_at: str, state: str = "running") -> dict[str, Any]:
+    return {"query_id": query_id, "started_at": started_at, "state": state}
+
+
+def changes(
+    *queries: dict[str, Any], removed: list[str] | None = None
+) -> ServerResponse:
+    return ServerResponse(
+        success=True,
+        data={
+            "queries": list(queries),
+            "removed": removed or [],
+            "updated_since": max((q["started_at"] for q in queries), default=None),
+            "etag": f'"{len(queries)}"',
+        },
+    )
+
+
+NOT_MODIFIED = ServerResponse(success=True, status_code=304)
+
+
+class ScriptedClient:
+    """Client that returns scripted query_list_changes responses."""
+
+    def __init__(
+        self,
+        responses: list[ServerResponse],
+        events: list[dict[str, Any]] | None = None,
+    ) -> None:
+        self.responses = responses
+        self.events = events
+        self.calls: list[dict[str, Any]] = []
+
+    def query_list_changes(self, **kwargs: Any) -> ServerResponse:
+        self.calls.append(kwargs)
+        return self.responses.pop(0)
+
+    def stream_query_events(self, **kwargs: Any) -> Any:
+        if self.events is None:
+            raise ServerError(message="Query events are not available", status_code=501)
+        yield from self.events
+        raise ServerError(message="stream closed", status_code=503)
+
+
+class TestPollBackoff:
+    """Tests for the adaptive poll interval."""
+
+    def test_grows_while_unchanged(self) -> None:
+        backoff = PollBackoff(min_interval=1, max_interval=5)
+
+        assert backoff.next_interval(None, changed=False) == 1
+        assert backoff.next_interval(1, changed=False) == 2
+        assert backoff.next_interval(4, changed=False) == 5
+        assert backoff.next_interval(5, changed=True) == 1
+
+    def test_invalid_bounds(self) -> None:
+        with pytest.raises(ValueError, match="Invalid poll interval"):
+            PollBackoff(min_interval=10, max_interval=1)
+
+
+class TestQueryWatcherPoll:
+    """Tests for QueryWatcher.poll."""
+
+    def test_conditional_requests(self) -> None:
+        client = ScriptedClient(
+            [changes(query("q1", "t1"), query("q2", "t2")), NOT_MODIFIED]
+        )
+        watcher = QueryWatcher(client, filters={"scope": "all"})
+
+        first = watcher.poll()
+
+        assert first is not None
+        assert [q["query_id"] for q in first.queries] == ["q2", "q1"]
+        assert watcher.poll() is None
+        assert client.calls[0]["etag"] is None
+        assert client.calls[1] == {
+            "scope": "all",
+            "limit": 10,
+            "updated_since": "t2",
+            "etag": '"2"',
+        }
+
+    def test_merges_changed_and_removed_rows(self) -> None:
+        client = ScriptedClient(
+            [
+                changes(query("q1", "t1"), query("q2", "t2")),
+                changes(query("q1", "t1", state="success"), removed=["q2"]),
+            ]
+        )
+        watcher = QueryWatcher(client)
+        watcher.poll()
+
+        update = watcher.poll()
+
+        assert update is not None
+        assert update.changed_ids == {"q1"}
+        assert update.removed_ids == {"q2"}
+        assert update.queries == [query("q1", "t1", state="success")]
+
+    def test_keeps_newest_rows_within_limit(self) -> None:
+        client = ScriptedClient(
+            [changes(query("q1", "t1"), query("q2", "t2")), changes(query("q3", "t3"))]
+        )
+        watcher = QueryWatcher(client, limit=2)
+        watcher.poll()
+
+        update = watcher.poll()
+
+        assert [q["query_id"] for q in update.queries] == ["q3", "q2"]
+        assert update.removed_ids == {"q1"}
+
+    def test_failure_raises(self) -> None:
+        client = ScriptedClient(
+            [ServerResponse(success=False, error="boom", status_code=500)]
+        )
+
+        with pytest.raises(ServerError, match="boom"):
+            QueryWatcher(client).poll()
+
+
+class TestQueryWatcherUpdates:
+    """Tests for QueryWatcher.updates."""
+
+    def test_backs_off_until_change(self) -> None:
+        client = ScriptedClient(
+            [
+                changes(query("q1", "t1")),
+                NOT_MODIFIED,
+                ServerResponse(success=False, error="unavailable", status_code=503),
+                NOT_MODIFIED,
+                changes(query("q2", "t2")),
+            ]
+        )
+        sleeps: list[float] = []
+        watcher = QueryWatcher(
+            client, backoff=PollBackoff(min_interval=1, max_interval=8)
+        )
+
+        updates = list(islice(watcher.updates(sleep=sleeps.append), 2))
+
+        assert [u.changed_ids for u in updates] == [{"q1"}, {"q2"}]
+        # Unchanged polls double the interval, errors jump to the maximum
+        assert sleeps == [1, 2, 8, 8]
+        assert updates[1].polls == 5
+
+    def test_events_with_polling_fallback(self) -> None:
+        client = ScriptedClient(
+            [changes(query("q1", "t1")), changes(query("q3", "t3"))],
+            events=[{"queries": [query("q2", "t2")]}, {"queries": [], "removed": []}],
+        )
+        watcher = QueryWatcher(client, use_events=True)
+
+        updates = list(islice(watcher.updates(sleep=lambda _: None), 3))
+
+        assert [u.source for u in updates] == ["poll", "events", "poll"]
+        assert updates[1].changed_ids == {"q2"}
+        assert [q["query_id"] for q in updates[2].queries] == ["q3", "q2", "q1"]
+
+
+class TestMockQueryListChanges:
+    """Tests for BasecampClient.query_list_changes in mock mode."""
+
+    def test_etag_and_watermark(self) -> None:
+        client = BasecampClient(ServerConfig(url="http://mock"), mock_mode=True)
+
+        first = client.query_list_changes(scope="all")
+        assert first.data["queries"]
+        etag = first.data["etag"]
+        watermark = first.data["updated_since"]
+
+        assert client.query_list_changes(scope="all", etag=etag).status_code == 304
+        unchanged = client.query_list_changes(scope="all", updated_since=watermark)
+        assert unchanged.data["queries"] == []
+
+    def test_events_unavailable_in_mock_mode(self) -> None:
+        client = BasecampClient(ServerConfig(url="http://mock"), mock_mode=True)
+
+        with pytest.raises(ServerError):
+            next(client.stream_query_events(scope="all"))
@@ -0,0 +1,246 @@
+"""Tests for dli.core.admission cost-based admission control.
+
+Covers:
+- CostBudget parsing and merging
+- DryRunCache memory/disk persistence and TTL
+- AdmissionExecutor query/command limits, confirmation and byte caps
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from dli.core.admission import (
+    AdmissionDecision,
+    AdmissionExecutor,
+    CostBudget,
+    DryRunCache,
+    OnExceed,
+    budget_from_config,
+    sql_hash,
+)
+from dli.core.executor import BaseExecutor
+from dli.core.models import ExecutionResult
+
+GB = 1_000_000_000
+
+
+class EstimatingExecutor(BaseExecutor):
+    """Executor with fixed dry-run estimates that records executions."""
+
+    supports_maximum_bytes_billed = True
+
+    def __init__(self, estimates: dict[str, dict[str, Any]]) -> None:
+        self.estimates = estimates
+        self.dry_runs: list[str] = []
+        self.executed: list[tuple[str, int | None]] = []
+
+    def execute_sql(
+        self,
+        sql: str,
+        timeout: int = 300,
+        *,
+        maximum_bytes_billed: int | None = None,
+    ) -> ExecutionResult:
+        self.executed.append((sql, maximum_bytes_billed))
+        return ExecutionResult(
+            dataset_name="", phase="main", success=True, rendered_sql=sql
+        )
+
+    def dry_run(self, sql: str) -> dict[str, Any]:
+        self.dry_runs.append(sql)
+        return self.estimates.get(sql, {"valid": False, "error": "unknown table"})
+
+    def test_connection(self) -> bool:
+        return True
+
+
+def estimate(size: int) -> dict[str, Any]:
+    return {
+        "valid": True,
+        "bytes_processed": size,
+        "estimated_cost_usd": size / 1e12 * 5,
+    }
+
+
+@pytest.fixture
+def executor() -> EstimatingExecutor:
+    return EstimatingExecutor(
+        {
+            "SELECT small": estimate(1 * GB),
+            "SELECT medium": estimate(40 * GB),
+            "SELECT huge": estimate(5000 * GB),
+        }
+    )
+
+
+class TestCostBudget:
+    """Tests for CostBudget parsing and merging."""
+
+    def test_from_dict(self) -> None:
+        budget = CostBudget.from_dict(
+            {
+                "on_exceed": "confirm",
+                "query": {"max_bytes": 100 * GB, "max_cost_usd": 1},
+                "command": {"max_cost_usd": "10.5"},
+            }
+        )
+
+        assert budget.max_bytes_per_query == 100 * GB
+        assert budget.max_cost_per_query_usd == 1.0
+        assert budget.max_bytes_per_command is None
+        assert budget.max_cost_per_command_usd == 10.5
+        assert budget.on_exceed == OnExceed.CONFIRM
+
+    def test_empty_is_unlimited(self) -> None:
+        assert CostBudget.from_dict(None).is_unlimited
+        assert not CostBudget(max_bytes_per_query=1).is_unlimited
+
+    def test_invalid_value(self) -> None:
+        with pytest.raises(ValueError, match="Invalid admission config"):
+            CostBudget.from_dict({"on_exceed": "ignore"})
+
+    def test_merge_keeps_stricter_limits(self) -> None:
+        project = CostBudget(
+            max_bytes_per_query=100,
+            max_cost_per_command_usd=5.0,
+            on_exceed=OnExceed.CONFIRM,
+        )
+        server = CostBudget(max_bytes_per_query=50, max_bytes_per_command=500)
+
+        merged = project.merge(server)
+
+        assert merged.max_bytes_per_query == 50
+        assert merged.max_bytes_per_command == 500
+        assert merged.max_cost_per_command_usd == 5.0
+        assert merged.on_exceed == OnExceed.REJECT
+
+    def test_budget_from_config_uses_policy(self) -> None:
+        budget = budget_from_config(
+            {"query": {"max_bytes": 100}},
+            {"allow_local": True, "admission": {"query": {"max_bytes": 10}}},
+        )
+        assert budget.max_bytes_per_query == 10
+
+        server_only = budget_from_config(
+            {}, {"admission": {"on_exceed": "confirm", "query": {"max_bytes": 10}}}
+        )
+        assert server_only.on_exceed == OnExceed.CONFIRM
+
+
+class TestDryRunCache:
+    """Tests for the dry-run estimate cache."""
+
+    def test_persists_across_instances(self, tmp_path: Path) -> None:
+        key = sql_hash("SELECT 1", "bigquery")
+        DryRunCache(tmp_path).put(key, estimate(10))
+
+        assert DryRunCache(tmp_path).get(key) == estimate(10)
+
+    def test_expired_entry(self, tmp_path: Path) -> None:
+        cache = DryRunCache(tmp_path, ttl_seconds=-1)
+        cache.put("key", estimate(10))
+
+        assert cache.get("key") is None
+
+    def test_hash_depends_on_engine(self) -> None:
+        assert sql_hash("SELECT 1", "trino") != sql_hash("SELECT 1", "bigquery")
+        assert sql_hash("SELECT 1 ", "trino") == sql_hash("SELECT 1", "trino")
+
+    def test_corrupt_file_is_ignored(self, tmp_path: Path) -> None:
+        (tmp_path / "estimates.json").write_text("{not json")
+
+        assert len(DryRunCache(tmp_path)) == 0
+
+
+class TestAdmissionExecutor:
+    """Tests for AdmissionExecutor."""
+
+    def test_within_budget_runs_with_byte_cap(
+        self, executor: EstimatingExecutor
+    ) -> None:
+        admission = AdmissionExecutor(executor, CostBudget(max_bytes_per_query=10 * GB))
+
+        result = admission.execute_sql("SELECT small")
+
+        assert result.success
+        assert executor.executed == [("SELECT small", 10 * GB)]
+        assert admission.spent_bytes == 1 * GB
+
+    def test_query_limit_rejects(self, executor: EstimatingExecutor) -> None:
+        admission = AdmissionExecutor(executor, CostBudget(max_bytes_per_query=10 * GB))
+
+        result = admission.execute_sql("SELECT medium")
+
+        assert not result.success
+        assert "exceeds the query limit" in result.error_message
+        assert executor.executed == []
+
+    def test_cost_limit_rejects(self, executor: EstimatingExecutor) -> None:
+        admission = AdmissionExecutor(executor, CostBudget(max_cost_per_query_usd=1.0))
+
+        assert admission.execute_sql("SELECT medium").success
+        assert not admission.execute_sql("SELECT huge").success
+        assert (
+            "$25.00 exceeds the query limit of $1.00" in admission.decisions[-1].reason
+        )
+
+    def test_command_limit_accumulates(self, executor: EstimatingExecutor) -> None:
+        admission = AdmissionExecutor(
+            executor, CostBudget(max_bytes_per_command=50 * GB)
+        )
+
+        assert admission.execute_sql("SELECT medium").success
+        assert executor.executed[-1] == ("SELECT medium", 50 * GB)
+        assert admission.execute_sql("SELECT small").success
+        assert executor.executed[-1] == ("SELECT small", 10 * GB)
+        assert not admission.execute_sql("SELECT medium").success
+        assert "exceeds the command limit" in admission.decisions[-1].reason
+
+    def test_confirmation(self, executor: EstimatingExecutor) -> None:
+        asked: list[AdmissionDecision] = []
+
+        def confirm(decision: AdmissionDecision) -> bool:
+            asked.append(decision)
+            return True
+
+        budget = CostBudget(max_bytes_per_query=10 * GB, on_exceed=OnExceed.CONFIRM)
+        admission = AdmissionExecutor(executor, budget, confirm=confirm)
+
+        assert admission.execute_sql("SELECT medium").success
+        assert asked[0].bytes_processed == 40 * GB
+        assert admission.decisions[-1].confirmed
+        # A confirmed query runs without a cap
+        assert executor.executed == [("SELECT medium", None)]
+
+    def test_confirm_without_callback_rejects(
+        self, executor: EstimatingExecutor
+    ) -> None:
+        budget = CostBudget(max_bytes_per_query=10 * GB, on_exceed=OnExceed.CONFIRM)
+        admission = AdmissionExecutor(executor, budget)
+
+        assert not admission.execute_sql("SELECT medium").success
+
+    def test_failed_estimate_is_admitted(self, executor: EstimatingExecutor) -> None:
+        admission = AdmissionExecutor(executor, CostBudget(max_bytes_per_query=1))
+
+        assert admission.execute_sql("SELECT missing").success
+        assert "unknown table" in admission.decisions[-1].reason
+        assert executor.executed == [("SELECT missing", None)]
+
+    def test_repeated_statement_uses_cache(
+        self, executor: EstimatingExecutor, tmp_path: Path
+    ) -> None:
+        budget = CostBudget(max_bytes_per_query=10 * GB)
+        AdmissionExecutor(executor, budget, cache=DryRunCache(tmp_path)).execute_sql(
+            "SELECT small"
+        )
+        second = AdmissionExecutor(executor, budget, cache=DryRunCache(tmp_path))
+
+        second.execute_sql("SELECT small")
+
+        assert executor.dry_runs == ["SELECT small"]
+        assert second.decisions[0].cached
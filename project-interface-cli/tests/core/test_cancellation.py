@@ -0,0 +1,86 @@
+"""Tests for dli.core.cancellation deadline enforcement."""
+
+from __future__ import annotations
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from dli.core.cancellation import (
+    InterruptReason,
+    QueryInterruptedError,
+    request_cancel,
+    run_cancellable,
+)
+
+
+class BlockingQuery:
+    """Query that blocks until cancelled."""
+
+    def __init__(self) -> None:
+        self.cancelled = threading.Event()
+
+    def run(self) -> str:
+        if self.cancelled.wait(5):
+            raise RuntimeError("Query was cancelled")
+        return "finished"
+
+    def cancel(self) -> None:
+        self.cancelled.set()
+
+
+class TestRunCancellable:
+    """Tests for run_cancellable."""
+
+    def test_returns_value(self) -> None:
+        assert run_cancellable(lambda: 42, cancel=lambda: None, timeout=1) == 42
+
+    def test_propagates_error(self) -> None:
+        def fail() -> None:
+            raise ValueError("syntax error")
+
+        with pytest.raises(ValueError, match="syntax error"):
+            run_cancellable(fail, cancel=lambda: None, timeout=1)
+
+    def test_timeout_cancels(self) -> None:
+        query = BlockingQuery()
+
+        with pytest.raises(QueryInterruptedError) as exc_info:
+            run_cancellable(query.run, cancel=query.cancel, timeout=0.05)
+
+        assert query.cancelled.is_set()
+        assert exc_info.value.reason == InterruptReason.TIMEOUT
+        assert exc_info.value.cancel_latency_ms is not None
+
+    def test_keyboard_interrupt_cancels(self) -> None:
+        query = BlockingQuery()
+        original_wait = threading.Event.wait
+
+        def wait(event: threading.Event, timeout: float | None = None) -> bool:
+            # Simulate Ctrl-C arriving while the main thread waits for the query
+            if threading.current_thread() is threading.main_thread() and timeout:
+                raise KeyboardInterrupt
+            return original_wait(event, timeout)
+
+        with (
+            patch.object(threading.Event, "wait", wait),
+            pytest.raises(QueryInterruptedError) as exc_info,
+        ):
+            run_cancellable(query.run, cancel=query.cancel, timeout=10)
+
+        assert query.cancelled.is_set()
+        assert exc_info.value.reason == InterruptReason.USER
+
+
+class TestRequestCancel:
+    """Tests for request_cancel."""
+
+    def test_unacknowledged_cancel(self) -> None:
+        assert request_cancel(lambda: None, lambda: False, grace=0.01) is None
+
+    def test_cancel_failure_is_ignored(self) -> None:
+        def cancel() -> None:
+            raise RuntimeError("already finished")
+
+        assert request_cancel(cancel, lambda: True) is not None
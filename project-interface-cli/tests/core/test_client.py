@@ -192,6 +192,79 @@ class TestCreateClient:
         assert client.config.timeout == 60
         assert client.config.api_key == "key123"
 
+    def test_real_clients_are_shared_per_server(self) -> None:
+        """Real-mode clients are shared per (url, api_key, timeout)."""
+        first = create_client(url="http://shared.server", mock_mode=False)
+
+        assert create_client(url="http://shared.server", mock_mode=False) is first
+        other_timeout = create_client(
+            url="http://shared.server", timeout=60, mock_mode=False
+        )
+        assert other_timeout is not first
+        assert create_client(url="http://other.server", mock_mode=False) is not first
+
+    def test_mock_clients_are_not_shared(self) -> None:
+        """Mock-mode clients keep their own mock state."""
+        assert create_client(mock_mode=True) is not create_client(mock_mode=True)
+
+
+class TestClientRegistry:
+    """Tests for the process-wide client registry."""
+
+    def test_close_all_forgets_clients(self) -> None:
+        from unittest.mock import patch
+
+        from dli.core.client.registry import ClientRegistry
+
+        registry = ClientRegistry()
+        client = registry.get(ServerConfig(url="http://registry.server"))
+
+        with patch.object(client, "close") as close:
+            registry.close_all()
+
+        close.assert_called_once()
+        assert len(registry) == 0
+        assert registry.get(ServerConfig(url="http://registry.server")) is not client
+
+    def test_after_fork_registry_is_empty(self) -> None:
+        from dli.core.client.registry import ClientRegistry
+
+        registry = ClientRegistry()
+        registry.get(ServerConfig(url="http://registry.server"))
+
+        registry._reset_after_fork()
+
+        assert len(registry) == 0
+
+
+class TestBasecampClientLazyMockData:
+    """Tests for lazy mock fixture construction."""
+
+    def test_real_mode_does_not_build_mock_data(self) -> None:
+        from unittest.mock import patch
+
+        with patch(
+            "dli.core.client.baseclient.MockDataFactory.create_all_mock_data"
+        ) as create:
+            BasecampClient(ServerConfig(url="http://localhost:8081"), mock_mode=False)
+
+        create.assert_not_called()
+
+    def test_mock_data_built_once_on_first_use(self) -> None:
+        from unittest.mock import patch
+
+        client = BasecampClient(
+            ServerConfig(url="http://localhost:8081"), mock_mode=True
+        )
+        with patch(
+            "dli.core.client.baseclient.MockDataFactory.create_all_mock_data",
+            return_value={"metrics": []},
+        ) as create:
+            client.list_metrics()
+            client.list_metrics()
+
+        create.assert_called_once()
+
 
 class TestBasecampClientNonMock:
     """Tests for BasecampClient in non-mock mode (real API calls)."""
@@ -867,4 +940,130 @@ class TestBasecampClientExecutionAPIs:
         )
         assert response.success is False
         assert response.status_code == 501
-        assert response.error == "Real API not implemented yet"
\ No newline at end of file
+        assert response.error == "Real API not implemented yet"
+
+
+class TestBasecampClientResultPaging:
+    """Tests for paged and streamed execution result retrieval."""
+
+    @pytest.fixture
+    def mock_client(self) -> BasecampClient:
+        """Create a mock client."""
+        return BasecampClient(ServerConfig(url="http://localhost:8081"), mock_mode=True)
+
+    @pytest.fixture
+    def real_client(self) -> BasecampClient:
+        """Create a non-mock client."""
+        return BasecampClient(
+            ServerConfig(url="http://localhost:8081"), mock_mode=False
+        )
+
+    def test_unpaged_response_has_all_rows(self, mock_client: BasecampClient) -> None:
+        response = mock_client.execute_rendered_sql(sql="SELECT 1")
+
+        assert len(response.data["rows"]) == 2
+        assert "next_page_token" not in response.data
+
+    def test_first_page_and_token(self, mock_client: BasecampClient) -> None:
+        response = mock_client.execute_rendered_sql(sql="SELECT 1", page_size=1)
+
+        assert len(response.data["rows"]) == 1
+        assert response.data["row_count"] == 2
+        assert response.data["next_page_token"] == "1"
+
+    def test_single_page_has_no_token(self, mock_client: BasecampClient) -> None:
+        response = mock_client.execute_rendered_metric(
+            rendered_sql="SELECT 1", page_size=10
+        )
+
+        assert len(response.data["rows"]) == 2
+        assert response.data["next_page_token"] is None
+
+    def test_fetch_result_page(self, mock_client: BasecampClient) -> None:
+        first = mock_client.execute_rendered_dataset(
+            rendered_sql="SELECT 1", page_size=1
+        )
+
+        page = mock_client.fetch_result_page(
+            first.data["execution_id"], first.data["next_page_token"], page_size=1
+        )
+
+        assert page.success is True
+        assert page.data["rows"] == [{"id": 2, "name": "mock_dataset_2", "value": 200}]
+        assert page.data["next_page_token"] is None
+
+    def test_fetch_unknown_result(self, mock_client: BasecampClient) -> None:
+        response = mock_client.fetch_result_page("missing", "0")
+
+        assert response.success is False
+        assert response.status_code == 404
+
+    @pytest.mark.parametrize("stream", [False, True])
+    def test_iter_result_rows_follows_pages(
+        self, mock_client: BasecampClient, stream: bool
+    ) -> None:
+        response = mock_client.execute_rendered_sql(sql="SELECT 1", page_size=1)
+
+        rows = list(
+            mock_client.iter_result_rows(response.data, page_size=1, stream=stream)
+        )
+
+        assert [row["id"] for row in rows] == [1, 2]
+
+    def test_iter_result_rows_raises_on_page_error(
+        self, mock_client: BasecampClient
+    ) -> None:
+        from dli.exceptions import ServerError
+
+        data = {"execution_id": "missing", "rows": [{"id": 1}], "next_page_token": "1"}
+        rows = mock_client.iter_result_rows(data)
+
+        assert next(rows) == {"id": 1}
+        with pytest.raises(ServerError):
+            next(rows)
+
+    def test_fetch_result_page_http(self, real_client: BasecampClient) -> None:
+        from unittest.mock import MagicMock
+
+        real_client._http = MagicMock()
+        real_client._http.get.return_value = MagicMock(
+            status_code=200, json=lambda: {"rows": [{"id": 3}], "next_page_token": None}
+        )
+
+        response = real_client.fetch_result_page("exec-1", "abc", page_size=50)
+
+        assert response.data["rows"] == [{"id": 3}]
+        real_client._http.get.assert_called_once_with(
+            "/api/v1/execution/results/exec-1",
+            params={"page_token": "abc", "page_size": 50},
+        )
+
+    def test_stream_result_rows_decodes_ndjson(
+        self, real_client: BasecampClient
+    ) -> None:
+        from unittest.mock import MagicMock
+
+        response = MagicMock(status_code=200)
+        response.iter_lines.return_value = iter(['{"id": 1}', "", '{"id": 2}'])
+        real_client._http = MagicMock()
+        real_client._http.stream.return_value.__enter__.return_value = response
+
+        rows = list(real_client.stream_result_rows("exec-1", page_token="tok"))
+
+        assert rows == [{"id": 1}, {"id": 2}]
+        args, kwargs = real_client._http.stream.call_args
+        assert args == ("GET", "/api/v1/execution/results/exec-1/stream")
+        assert kwargs["params"] == {"page_token": "tok"}
+        assert kwargs["headers"]["Accept"] == "application/x-ndjson"
+
+    def test_stream_result_rows_http_error(self, real_client: BasecampClient) -> None:
+        from unittest.mock import MagicMock
+
+        from dli.exceptions import ServerError
+
+        response = MagicMock(status_code=410, text="expired")
+        real_client._http = MagicMock()
+        real_client._http.stream.return_value.__enter__.return_value = response
+
+        with pytest.raises(ServerError, match="expired"):
+            list(real_client.stream_result_rows("exec-1"))
@@ -385,3 +385,14 @@ class TestSpecDiscovery:
         # All should be .sql files
         for sql_file in sql_files:
             assert sql_file.suffix == ".sql"
+
+    def test_load_spec_file(self, sample_project_path):
+        """Test loading single spec files found by discover_spec_paths."""
+        config = load_project(sample_project_path)
+        discovery = SpecDiscovery(config)
+
+        for spec_type in (SpecType.METRIC, SpecType.DATASET):
+            for spec_path in discovery.discover_spec_paths(spec_type):
+                spec = discovery.load_spec_file(spec_path)
+                assert spec.type == spec_type
+                assert spec.spec_path == spec_path
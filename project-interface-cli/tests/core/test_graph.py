@@ -0,0 +1,278 @@
+"""Tests for the project dependency graph.
+
+Test coverage:
+- Forward/reverse adjacency and incremental node updates
+- Transitive closure with depth limits
+- Tarjan SCC and cycle reporting (including deep chains)
+- Topological layering
+- for_project: shared instance, incremental refresh from spec files
+"""
+
+from __future__ import annotations
+
+from itertools import pairwise
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from dli.core.config import load_project
+from dli.core.discovery import SpecDiscovery
+from dli.core.graph import ProjectGraph
+
+
+@pytest.fixture(autouse=True)
+def _clear_graph_cache() -> None:
+    ProjectGraph.clear_cache()
+
+
+def _write_dataset(root: Path, name: str, depends_on: list[str]) -> Path:
+    spec_path = root / "datasets" / f"dataset.{name}.yaml"
+    deps = "".join(f"  - {dep}\n" for dep in depends_on)
+    spec_path.write_text(
+        f"""name: {name}
+owner: test@example.com
+team: "@test"
+type: Dataset
+query_type: DML
+query_statement: "INSERT INTO {name} SELECT 1"
+depends_on:
+{deps if deps else "  []"}
+"""
+    )
+    return spec_path
+
+
+def _write_project(root: Path) -> Path:
+    root.mkdir(parents=True, exist_ok=True)
+    (root / "dli.yaml").write_text(
+        """
+version: "1"
+project:
+  name: "graph-test"
+discovery:
+  datasets_dir: "datasets"
+  metrics_dir: "metrics"
+"""
+    )
+    (root / "datasets").mkdir()
+    (root / "metrics").mkdir()
+    return root
+
+
+class TestProjectGraphAdjacency:
+    """Tests for adjacency and incremental node updates."""
+
+    def test_forward_and_reverse_edges(self) -> None:
+        graph = ProjectGraph.from_mapping({"a": [], "b": ["a"], "c": ["a", "b"]})
+
+        assert graph.dependencies("c") == ["a", "b"]
+        assert sorted(graph.dependents("a")) == ["b", "c"]
+        assert graph.to_dict() == {"a": [], "b": ["a"], "c": ["a", "b"]}
+
+    def test_external_dependency_is_not_a_spec(self) -> None:
+        graph = ProjectGraph.from_mapping({"a": ["raw.events"]})
+
+        assert "raw.events" in graph
+        assert not graph.is_spec("raw.events")
+        assert graph.dependents("raw.events") == ["a"]
+        assert len(graph) == 1
+
+    def test_set_node_replaces_edges(self) -> None:
+        graph = ProjectGraph.from_mapping({"a": [], "b": ["a"]})
+
+        graph.set_node("b", ["c"])
+
+        assert graph.dependents("a") == []
+        assert graph.dependents("c") == ["b"]
+
+    def test_remove_node_keeps_incoming_edges(self) -> None:
+        graph = ProjectGraph.from_mapping({"a": ["x"], "b": ["a"]})
+
+        graph.remove_node("a")
+
+        assert not graph.is_spec("a")
+        assert graph.dependents("x") == []
+        assert graph.dependents("a") == ["b"]
+
+
+class TestProjectGraphTraversal:
+    """Tests for transitive closure queries."""
+
+    @pytest.fixture
+    def chain(self) -> ProjectGraph:
+        # d -> c -> b -> a, e -> a
+        return ProjectGraph.from_mapping(
+            {"a": [], "b": ["a"], "c": ["b"], "d": ["c"], "e": ["a"]}
+        )
+
+    def test_upstream_unlimited(self, chain: ProjectGraph) -> None:
+        assert chain.upstream("d") == {"c": 1, "b": 2, "a": 3}
+
+    def test_upstream_depth_limit(self, chain: ProjectGraph) -> None:
+        assert chain.upstream("d", depth=2) == {"c": 1, "b": 2}
+
+    def test_downstream_depth_limit(self, chain: ProjectGraph) -> None:
+        assert chain.downstream("a", depth=1) == {"b": 1, "e": 1}
+        assert chain.downstream("a") == {"b": 1, "e": 1, "c": 2, "d": 3}
+
+    def test_unknown_node(self, chain: ProjectGraph) -> None:
+        assert chain.upstream("missing") == {}
+
+    def test_closure_terminates_on_cycles(self) -> None:
+        graph = ProjectGraph.from_mapping({"a": ["b"], "b": ["a"]})
+
+        assert graph.upstream("a") == {"b": 1}
+
+
+class TestProjectGraphCycles:
+    """Tests for SCC-based cycle detection."""
+
+    def test_dag_has_no_cycles(self) -> None:
+        graph = ProjectGraph.from_mapping({"a": [], "b": ["a"], "c": ["a", "b"]})
+
+        assert graph.cycles() == []
+        assert all(len(c) == 1 for c in graph.strongly_connected_components())
+
+    def test_self_reference(self) -> None:
+        graph = ProjectGraph.from_mapping({"a": ["a"]})
+
+        assert graph.cycles() == [["a", "a"]]
+
+    def test_cycle_is_closed_path(self) -> None:
+        graph = ProjectGraph.from_mapping(
+            {"a": ["c"], "b": ["a"], "c": ["b"], "d": ["a"]}
+        )
+
+        (cycle,) = graph.cycles()
+        assert cycle[0] == cycle[-1]
+        assert set(cycle) == {"a", "b", "c"}
+        for node, dep in pairwise(cycle):
+            assert dep in graph.dependencies(node)
+
+    def test_separate_components(self) -> None:
+        graph = ProjectGraph.from_mapping(
+            {"a": ["b"], "b": ["a"], "c": ["d"], "d": ["c"]}
+        )
+
+        assert sorted(sorted(set(c)) for c in graph.cycles()) == [
+            ["a", "b"],
+            ["c", "d"],
+        ]
+
+    def test_deep_chain_does_not_recurse(self) -> None:
+        size = 20_000
+        mapping = {f"n{i}": [f"n{i + 1}"] for i in range(size)}
+        mapping[f"n{size}"] = ["n0"]
+        graph = ProjectGraph.from_mapping(mapping)
+
+        (cycle,) = graph.cycles()
+        assert len(cycle) == size + 2
+
+
+class TestProjectGraphLayers:
+    """Tests for topological layering."""
+
+    def test_layers_order_dependencies_first(self) -> None:
+        graph = ProjectGraph.from_mapping(
+            {"a": [], "b": ["a"], "c": ["a"], "d": ["b", "c"], "e": ["raw.x"]}
+        )
+
+        assert graph.topological_layers() == [["a", "e"], ["b", "c"], ["d"]]
+
+    def test_cycle_members_share_a_layer(self) -> None:
+        graph = ProjectGraph.from_mapping(
+            {"a": [], "b": ["a", "c"], "c": ["b"], "d": ["c"]}
+        )
+
+        assert graph.topological_layers() == [["a"], ["b", "c"], ["d"]]
+
+    def test_deep_chain_layers(self) -> None:
+        size = 5_000
+        graph = ProjectGraph.from_mapping(
+            {f"n{i}": [f"n{i - 1}"] if i else [] for i in range(size)}
+        )
+
+        layers = graph.topological_layers()
+        assert len(layers) == size
+        assert layers[0] == ["n0"]
+
+
+class TestProjectGraphForProject:
+    """Tests for the shared, incrementally refreshed project graph."""
+
+    def test_builds_from_spec_files(self, tmp_path: Path) -> None:
+        root = _write_project(tmp_path / "project")
+        _write_dataset(root, "cat.db.a", [])
+        _write_dataset(root, "cat.db.b", ["cat.db.a"])
+
+        graph = ProjectGraph.for_project(load_project(root))
+
+        assert graph.to_dict() == {"cat.db.a": [], "cat.db.b": ["cat.db.a"]}
+
+    def test_returns_shared_instance(self, tmp_path: Path) -> None:
+        root = _write_project(tmp_path / "project")
+        _write_dataset(root, "cat.db.a", [])
+
+        first = ProjectGraph.for_project(load_project(root))
+        second = ProjectGraph.for_project(load_project(root))
+
+        assert first is second
+
+    def test_refresh_reloads_only_changed_files(self, tmp_path: Path) -> None:
+        root = _write_project(tmp_path / "project")
+        _write_dataset(root, "cat.db.a", [])
+        _write_dataset(root, "cat.db.b", ["cat.db.a"])
+        config = load_project(root)
+        ProjectGraph.for_project(config)
+
+        spec_c = _write_dataset(root, "cat.db.c", ["cat.db.b"])
+        with patch.object(
+            SpecDiscovery,
+            "load_spec_file",
+            autospec=True,
+            side_effect=SpecDiscovery.load_spec_file,
+        ) as load:
+            graph = ProjectGraph.for_project(config)
+
+        assert [call.args[1] for call in load.call_args_list] == [spec_c]
+        assert graph.downstream("cat.db.a") == {"cat.db.b": 1, "cat.db.c": 2}
+
+    def test_refresh_without_changes_loads_nothing(self, tmp_path: Path) -> None:
+        root = _write_project(tmp_path / "project")
+        _write_dataset(root, "cat.db.a", [])
+        config = load_project(root)
+        graph = ProjectGraph.for_project(config)
+
+        with patch("dli.core.discovery.SpecDiscovery.load_spec_file") as load:
+            assert graph.refresh() is False
+        load.assert_not_called()
+
+    def test_modified_and_removed_files(self, tmp_path: Path) -> None:
+        root = _write_project(tmp_path / "project")
+        _write_dataset(root, "cat.db.a", [])
+        spec_b = _write_dataset(root, "cat.db.b", ["cat.db.a"])
+        config = load_project(root)
+        graph = ProjectGraph.for_project(config)
+
+        _write_dataset(root, "cat.db.b", ["cat.db.a", "raw.extra_source"])
+        graph.refresh()
+        assert graph.dependencies("cat.db.b") == ["cat.db.a", "raw.extra_source"]
+
+        spec_b.unlink()
+        graph.refresh()
+        assert not graph.is_spec("cat.db.b")
+        assert graph.dependents("cat.db.a") == []
+
+    def test_invalid_spec_is_skipped(self, tmp_path: Path) -> None:
+        root = _write_project(tmp_path / "project")
+        _write_dataset(root, "cat.db.a", [])
+        (root / "datasets" / "dataset.cat.db.bad.yaml").write_text("name: [unclosed")
+
+        graph = ProjectGraph.for_project(load_project(root))
+
+        assert graph.nodes == ["cat.db.a"]
+
+    def test_refresh_requires_project(self) -> None:
+        with pytest.raises(ValueError, match="requires a graph created for a project"):
+            ProjectGraph.from_mapping({}).refresh()
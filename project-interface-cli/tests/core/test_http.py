@@ -249,6 +249,35 @@ class TestTracedHttpClientDelete:
             assert response == mock_response
 
 
+class TestTracedHttpClientStream:
+    """Tests for streamed requests."""
+
+    def test_traced_http_client_stream_with_trace(
+        self,
+        http_client: TracedHttpClient,
+        mock_response: MagicMock,
+        with_trace_context: TraceContext,
+    ) -> None:
+        """Streamed request should include trace headers and yield the response."""
+        with patch("httpx.Client") as mock_client_cls:
+            mock_client_instance = MagicMock()
+            mock_client_instance.stream.return_value.__enter__.return_value = (
+                mock_response
+            )
+            mock_client_cls.return_value.__enter__.return_value = mock_client_instance
+
+            with http_client.stream("GET", "/api/v1/results/1/stream") as response:
+                assert response == mock_response
+
+            args = mock_client_instance.stream.call_args
+            assert args.args == ("GET", "/api/v1/results/1/stream")
+            assert (
+                args.kwargs["headers"]["X-Trace-Id"]
+                == "550e8400-e29b-41d4-a716-446655440000"
+            )
+            mock_client_instance.stream.return_value.__exit__.assert_called_once()
+
+
 class TestTracedHttpClientMergesHeaders:
     """Tests for custom header merging."""
 
@@ -341,6 +370,48 @@ class TestTracedHttpClientClientCreation:
             assert call_kwargs.kwargs.get("follow_redirects") is True
 
 
+class TestTracedHttpClientPooled:
+    """Tests for connection reuse with pooled=True."""
+
+    def test_pooled_client_reuses_httpx_client(self, mock_response: MagicMock) -> None:
+        TraceContext.clear_current()
+        client = TracedHttpClient("https://api.example.com", pooled=True)
+
+        with patch("httpx.Client") as mock_client_cls:
+            mock_client_cls.return_value.is_closed = False
+            mock_client_cls.return_value.get.return_value = mock_response
+            mock_client_cls.return_value.post.return_value = mock_response
+
+            client.get("/a")
+            client.post("/b")
+            client.close()
+
+            mock_client_cls.assert_called_once_with(
+                base_url="https://api.example.com", timeout=30
+            )
+            mock_client_cls.return_value.close.assert_called_once()
+
+    def test_pooled_client_reconnects_after_fork(
+        self, mock_response: MagicMock
+    ) -> None:
+        TraceContext.clear_current()
+        client = TracedHttpClient("https://api.example.com", pooled=True)
+
+        with patch("httpx.Client") as mock_client_cls:
+            mock_client_cls.return_value.is_closed = False
+            mock_client_cls.return_value.get.return_value = mock_response
+
+            client.get("/a")
+            with patch("dli.core.http.os.getpid", return_value=client._pid + 1):
+                client.get("/b")
+
+            assert mock_client_cls.call_count == 2
+            mock_client_cls.return_value.close.assert_not_called()
+
+    def test_close_is_noop_when_unpooled(self, http_client: TracedHttpClient) -> None:
+        http_client.close()
+
+
 class TestTracedHttpClientIntegration:
     """Integration-style tests (still mocked but testing full flow)."""
 
@@ -1,12 +1,14 @@
 """Tests for the DLI Core Engine metric service module."""
 
 from pathlib import Path
+from typing import ClassVar
 
 import pytest
 import yaml
 
 from dli.core.executor import MockExecutor
-from dli.core.metric_service import MetricService
+from dli.core.metric_service import MetricService, UnknownMetricError
+from dli.core.models import TimeGrain
 
 
 @pytest.fixture
@@ -390,3 +392,423 @@ class TestMetricExecutionResult:
         assert result.row_count == 0
         assert len(result.rows) == 0
         assert result.error_message is not None
+
+
+@pytest.fixture
+def sales_project(temp_project):
+    """Add two sales metric specs with shared dimensions to the project."""
+    base = {
+        "owner": "owner@example.com",
+        "team": "@sales",
+        "type": "Metric",
+        "query_type": "SELECT",
+        "parameters": [{"name": "date", "type": "date", "required": True}],
+        "dimensions": [
+            {"name": "region", "type": "categorical", "expression": "region"},
+            {"name": "order_date", "type": "time", "expression": "dt"},
+        ],
+    }
+    orders = {
+        **base,
+        "name": "iceberg.sales.orders",
+        "query_statement": "SELECT * FROM orders WHERE dt >= '{{ date }}'",
+        "metrics": [
+            {"name": "order_count", "aggregation": "count", "expression": "*"},
+            {
+                "name": "revenue",
+                "aggregation": "sum",
+                "expression": "amount",
+                "filters": ["status = 'paid'"],
+            },
+            {
+                "name": "paid_customers",
+                "aggregation": "count_distinct",
+                "expression": "customer_id",
+                "filters": ["status = 'paid'"],
+            },
+            {
+                "name": "refunds",
+                "aggregation": "sum",
+                "expression": "amount",
+                "filters": ["status='refunded'"],
+            },
+        ],
+    }
+    items = {
+        **base,
+        "name": "iceberg.sales.order_items",
+        "query_statement": "SELECT * FROM order_items WHERE dt >= '{{ date }}'",
+        "metrics": [{"name": "units", "aggregation": "sum", "expression": "quantity"}],
+    }
+    metrics_dir = temp_project / "metrics"
+    for spec in (orders, items):
+        (metrics_dir / f"metric.{spec['name']}.yaml").write_text(yaml.dump(spec))
+    return temp_project
+
+
+class ScriptedExecutor(MockExecutor):
+    """Mock executor returning one prepared result per executed query."""
+
+    def __init__(self, results):
+        super().__init__()
+        self.results = list(results)
+        self.executed = []
+
+    def execute_sql(self, sql, timeout=300):
+        self.executed.append(sql)
+        self.mock_data = self.results.pop(0)
+        return super().execute_sql(sql, timeout)
+
+
+class TestMetricQueryPlanner:
+    """Tests for multi-metric query planning on MetricService."""
+
+    PARAMS: ClassVar[dict[str, str]] = {"date": "2025-01-01"}
+
+    def test_resolve_qualified_and_bare_names(self, sales_project):
+        service = MetricService(project_path=sales_project)
+
+        spec, metric = service.resolve_metric("iceberg.sales.orders.revenue")
+        assert (spec.name, metric.name) == ("iceberg.sales.orders", "revenue")
+        assert service.resolve_metric("units")[0].name == "iceberg.sales.order_items"
+
+    def test_resolve_unknown_metric(self, sales_project):
+        service = MetricService(project_path=sales_project)
+
+        with pytest.raises(UnknownMetricError, match="not found"):
+            service.resolve_metric("iceberg.sales.orders.margin")
+        with pytest.raises(UnknownMetricError, match="not found"):
+            service.resolve_metric("margin")
+
+    def test_metrics_on_same_source_share_one_query(self, sales_project):
+        service = MetricService(project_path=sales_project)
+
+        plan = service.plan_query(
+            ["order_count", "revenue", "refunds", "paid_customers"],
+            ["region"],
+            self.PARAMS,
+        )
+
+        assert len(plan.queries) == 1
+        sql = " ".join(plan.queries[0].sql.split())
+        assert sql.count("FROM orders") == 1
+        assert "SUM(CASE WHEN status = 'paid' THEN amount END) AS revenue" in sql
+        assert "SUM(CASE WHEN status = 'refunded' THEN amount END) AS refunds" in sql
+        assert "COUNT(DISTINCT CASE WHEN status = 'paid' THEN customer_id END)" in sql
+        assert "COUNT(*) AS order_count" in sql
+        assert "GROUP BY" in sql
+        assert plan.queries[0].where == []
+        assert plan.columns == [
+            "region",
+            "order_count",
+            "revenue",
+            "refunds",
+            "paid_customers",
+        ]
+
+    def test_shared_filters_are_hoisted(self, sales_project):
+        service = MetricService(project_path=sales_project)
+
+        plan = service.plan_query(
+            ["revenue", "paid_customers"], ["region"], self.PARAMS
+        )
+
+        query = plan.queries[0]
+        assert query.where == ["status = 'paid'"]
+        assert "CASE" not in query.sql
+        assert "SUM(amount) AS revenue" in query.sql
+
+    def test_different_sources_get_separate_queries(self, sales_project):
+        service = MetricService(project_path=sales_project)
+
+        plan = service.plan_query(["revenue", "units"], ["region"], self.PARAMS)
+
+        assert [q.spec_names for q in plan.queries] == [
+            ["iceberg.sales.orders"],
+            ["iceberg.sales.order_items"],
+        ]
+
+    def test_target_dialect(self, sales_project):
+        service = MetricService(project_path=sales_project)
+
+        plan = service.plan_query(
+            ["revenue"], ["region"], self.PARAMS, dialect="bigquery"
+        )
+
+        assert plan.dialect == "bigquery"
+        assert "`" not in plan.queries[0].sql
+        assert plan.queries[0].sql.startswith("SELECT")
+
+    def test_filter_templates_are_rendered(self, fixture_service):
+        plan = fixture_service.plan_query(
+            ["iceberg.analytics.user_engagement.active_users"],
+            ["user_country"],
+            {"start_date": "2025-01-01", "end_date": "2025-01-31", "min_sessions": 3},
+        )
+
+        assert plan.queries[0].where == ["session_count >= 3"]
+
+    def test_unknown_dimension(self, sales_project):
+        service = MetricService(project_path=sales_project)
+
+        with pytest.raises(ValueError, match="Dimension 'country' not found"):
+            service.plan_query(["revenue"], ["country"], self.PARAMS)
+
+    def test_query_metrics_merges_rows(self, sales_project):
+        executor = ScriptedExecutor(
+            [
+                [
+                    {"region": "eu", "revenue": 10, "refunds": 1},
+                    {"region": "us", "revenue": 20, "refunds": 2},
+                ],
+                [{"region": "us", "units": 7}, {"region": "apac", "units": 3}],
+            ]
+        )
+        service = MetricService(project_path=sales_project, executor=executor)
+
+        result = service.query_metrics(
+            ["revenue", "units", "refunds"], ["region"], self.PARAMS
+        )
+
+        assert result.success is True
+        assert len(executor.executed) == 2
+        assert result.columns == ["region", "revenue", "units", "refunds"]
+        assert result.rows == [
+            {"region": "eu", "revenue": 10, "units": None, "refunds": 1},
+            {"region": "us", "revenue": 20, "units": 7, "refunds": 2},
+            {"region": "apac", "revenue": None, "units": 3, "refunds": None},
+        ]
+
+    def test_query_metrics_dry_run(self, sales_project):
+        service = MetricService(project_path=sales_project)
+
+        result = service.query_metrics(
+            ["revenue", "units"], ["region"], self.PARAMS, dry_run=True
+        )
+
+        assert result.success is True
+        assert result.rendered_sql.count("SELECT") == 4
+
+    def test_query_metrics_planning_error(self, sales_project, mock_executor):
+        service = MetricService(project_path=sales_project, executor=mock_executor)
+
+        result = service.query_metrics(["revenue"], ["region"], {})
+
+        assert result.success is False
+        assert "Query planning failed" in result.error_message
+
+
+@pytest.fixture
+def rollup_project(sales_project):
+    """Declare rollups on the orders metric spec."""
+    path = sales_project / "metrics" / "metric.iceberg.sales.orders.yaml"
+    spec = yaml.safe_load(path.read_text())
+    spec["parameters"] = [
+        {"name": "start_date", "type": "date", "required": True},
+        {"name": "end_date", "type": "date", "required": True},
+        {"name": "channel", "type": "string", "required": False, "default": "web"},
+    ]
+    spec["query_statement"] = (
+        "SELECT * FROM orders WHERE dt BETWEEN '{{ start_date }}' AND '{{ end_date }}' "
+        "AND channel = '{{ channel }}'"
+    )
+    spec["rollups"] = [
+        {
+            "name": "by_region_date_day",
+            "dimensions": ["region", "order_date"],
+            "time_dimension": "order_date",
+            "time_grain": "day",
+            "start_parameter": "start_date",
+            "end_parameter": "end_date",
+        },
+        {
+            "name": "by_region_day",
+            "dimensions": ["region", "order_date"],
+            "metrics": ["order_count", "revenue"],
+            "time_dimension": "order_date",
+            "time_grain": "day",
+            "start_parameter": "start_date",
+            "end_parameter": "end_date",
+            "table": "iceberg.rollups.orders_region_day",
+        },
+        {"name": "by_region_all_time", "dimensions": ["region"]},
+    ]
+    path.write_text(yaml.dump(spec))
+    return sales_project
+
+
+class TestMetricRollups:
+    """Tests for rollup selection, rewriting and refresh."""
+
+    PARAMS: ClassVar[dict[str, str]] = {
+        "start_date": "2025-01-01",
+        "end_date": "2025-01-31",
+    }
+
+    def test_smallest_covering_rollup_is_used(self, rollup_project):
+        service = MetricService(project_path=rollup_project)
+
+        plan = service.plan_query(
+            ["revenue"], ["region"], {**self.PARAMS, "date": "2025-01-01"}
+        )
+
+        query = plan.queries[0]
+        assert query.rollup == "iceberg.rollups.orders_region_day"
+        assert plan.rollups == ["iceberg.rollups.orders_region_day"]
+        sql = " ".join(query.sql.split())
+        assert "SUM(revenue) AS revenue FROM iceberg.rollups.orders_region_day" in sql
+        assert "order_date BETWEEN '2025-01-01' AND '2025-01-31'" in sql
+        assert "FROM orders" not in sql
+
+    def test_rollup_without_metric_is_skipped(self, rollup_project):
+        service = MetricService(project_path=rollup_project)
+
+        plan = service.plan_query(["refunds", "order_count"], ["region"], self.PARAMS)
+
+        assert plan.rollups == ["iceberg.sales.orders__by_region_date_day"]
+
+    def test_average_is_recombined_from_sum_and_count(self, rollup_project):
+        path = rollup_project / "metrics" / "metric.iceberg.sales.orders.yaml"
+        spec = yaml.safe_load(path.read_text())
+        spec["metrics"].append(
+            {"name": "avg_amount", "aggregation": "avg", "expression": "amount"}
+        )
+        path.write_text(yaml.dump(spec))
+        service = MetricService(project_path=rollup_project)
+
+        plan = service.plan_query(["avg_amount"], ["region"], self.PARAMS)
+
+        sql = " ".join(plan.queries[0].sql.split())
+        assert (
+            "SUM(avg_amount__sum) AS DOUBLE) / NULLIF(SUM(avg_amount__count), 0)" in sql
+        )
+
+    def test_coarser_time_grain_is_truncated(self, rollup_project):
+        service = MetricService(project_path=rollup_project)
+
+        plan = service.plan_query(
+            ["revenue"], ["order_date"], self.PARAMS, time_grain=TimeGrain.MONTH
+        )
+
+        assert plan.rollups == ["iceberg.rollups.orders_region_day"]
+        assert "DATE_TRUNC('MONTH', order_date)" in plan.queries[0].sql
+
+    def test_raw_time_dimension_falls_back_to_base(self, rollup_project):
+        service = MetricService(project_path=rollup_project)
+
+        plan = service.plan_query(["revenue"], ["order_date"], self.PARAMS)
+
+        assert plan.rollups == []
+        assert "FROM orders" in plan.queries[0].sql
+
+    def test_distinct_count_needs_exact_grouping(self, rollup_project):
+        service = MetricService(project_path=rollup_project)
+
+        coarse = service.plan_query(["paid_customers"], ["region"], self.PARAMS)
+        exact = service.plan_query(
+            ["paid_customers"], ["region", "order_date"], self.PARAMS, time_grain="day"
+        )
+
+        assert coarse.rollups == []
+        assert exact.rollups == ["iceberg.sales.orders__by_region_date_day"]
+
+    def test_unmapped_parameter_change_falls_back_to_base(self, rollup_project):
+        service = MetricService(project_path=rollup_project)
+
+        default = service.plan_query(
+            ["revenue"], ["region"], {**self.PARAMS, "channel": "web"}
+        )
+        changed = service.plan_query(
+            ["revenue"], ["region"], {**self.PARAMS, "channel": "app"}
+        )
+
+        assert default.rollups != []
+        assert changed.rollups == []
+
+    def test_rollups_can_be_disabled(self, rollup_project):
+        service = MetricService(project_path=rollup_project)
+
+        plan = service.plan_query(
+            ["revenue"], ["region"], self.PARAMS, use_rollups=False
+        )
+
+        assert plan.rollups == []
+
+    def test_query_metrics_reports_rollups(self, rollup_project):
+        service = MetricService(project_path=rollup_project)
+
+        result = service.query_metrics(
+            ["revenue"], ["region"], self.PARAMS, dry_run=True
+        )
+
+        assert result.rollups == ["iceberg.rollups.orders_region_day"]
+
+    def test_rollup_dataset(self, rollup_project):
+        service = MetricService(project_path=rollup_project)
+
+        dataset = service.rollup_dataset("iceberg.sales.orders", "by_region_day")
+
+        assert dataset.name == "iceberg.rollups.orders_region_day"
+        assert "rollup" in dataset.tags
+        assert dataset.pre_statements[0].sql == (
+            "DELETE FROM iceberg.rollups.orders_region_day WHERE order_date BETWEEN "
+            "'{{ start_date | date_trunc(\"day\") }}' AND '{{ end_date | date_trunc(\"day\") }}'"
+        )
+        main = dataset.get_main_sql()
+        assert main.startswith("INSERT INTO iceberg.rollups.orders_region_day")
+        assert "DATE_TRUNC('DAY', dt) AS order_date" in main
+        assert "SUM(CASE WHEN status = 'paid' THEN amount END) AS revenue" in main
+        assert "refunds" not in main
+
+    def test_unaligned_range_reads_and_replaces_whole_buckets(self, rollup_project):
+        path = rollup_project / "metrics" / "metric.iceberg.sales.orders.yaml"
+        spec = yaml.safe_load(path.read_text())
+        spec["rollups"] = [
+            {
+                "name": "by_region_month",
+                "dimensions": ["region", "order_date"],
+                "time_dimension": "order_date",
+                "time_grain": "month",
+                "start_parameter": "start_date",
+                "end_parameter": "end_date",
+            }
+        ]
+        path.write_text(yaml.dump(spec))
+        executor = ScriptedExecutor([[], []])
+        service = MetricService(project_path=rollup_project, executor=executor)
+        params = {"start_date": "2024-01-15", "end_date": "2024-03-10"}
+
+        plan = service.plan_query(["revenue"], ["region"], params)
+        result = service.refresh_rollup(
+            "iceberg.sales.orders", "by_region_month", params
+        )
+
+        assert plan.rollups == ["iceberg.sales.orders__by_region_month"]
+        assert plan.queries[0].where == [
+            "order_date BETWEEN '2024-01-01' AND '2024-03-01'"
+        ]
+        assert result.success is True
+        assert executor.executed[0].endswith(
+            "order_date BETWEEN '2024-01-01' AND '2024-03-01'"
+        )
+        assert "BETWEEN '2024-01-15' AND '2024-03-10'" in executor.executed[1]
+
+    def test_rollup_dataset_unknown_rollup(self, rollup_project):
+        service = MetricService(project_path=rollup_project)
+
+        with pytest.raises(ValueError, match="Rollup 'missing' not found"):
+            service.rollup_dataset("iceberg.sales.orders", "missing")
+
+    def test_refresh_rollup(self, rollup_project):
+        executor = ScriptedExecutor([[], []])
+        service = MetricService(project_path=rollup_project, executor=executor)
+
+        result = service.refresh_rollup(
+            "iceberg.sales.orders", "by_region_day", self.PARAMS
+        )
+
+        assert result.success is True
+        assert result.dataset_name == "iceberg.rollups.orders_region_day"
+        assert "'2025-01-01' AND '2025-01-31'" in executor.executed[0]
+        assert executor.executed[1].startswith("INSERT INTO")
+        assert "channel = 'web'" in executor.executed[1]
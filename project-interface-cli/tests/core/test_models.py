@@ -19,10 +19,12 @@ from dli.core.models import (
     ParameterType,
     QueryParameter,
     QueryType,
+    RollupDefinition,
     Spec,
     SpecBase,
     SpecType,
     StatementDefinition,
+    TimeGrain,
     ValidationResult,
 )
 
@@ -582,6 +584,60 @@ class TestDimensionDefinition:
         assert dim.type == DimensionType.CATEGORICAL
 
 
+class TestTimeGrain:
+    """Tests for TimeGrain roll-up compatibility."""
+
+    def test_finer_grain_rolls_up(self):
+        assert TimeGrain.DAY.rolls_up_to(TimeGrain.MONTH)
+        assert TimeGrain.HOUR.rolls_up_to(TimeGrain.WEEK)
+        assert TimeGrain.MONTH.rolls_up_to(TimeGrain.MONTH)
+
+    def test_coarser_or_misaligned_grain_does_not_roll_up(self):
+        assert not TimeGrain.MONTH.rolls_up_to(TimeGrain.DAY)
+        assert not TimeGrain.WEEK.rolls_up_to(TimeGrain.MONTH)
+        assert not TimeGrain.MONTH.rolls_up_to(TimeGrain.WEEK)
+
+
+class TestRollupDefinition:
+    """Tests for RollupDefinition model."""
+
+    def test_default_table_name(self):
+        rollup = RollupDefinition(name="by_country", dimensions=["country"])
+
+        assert (
+            rollup.table_name("iceberg.sales.orders")
+            == "iceberg.sales.orders__by_country"
+        )
+        assert RollupDefinition(name="r", table="t.s.r").table_name("a.b.c") == "t.s.r"
+
+    def test_time_dimension_must_be_a_dimension(self):
+        with pytest.raises(ValueError, match="time_dimension"):
+            RollupDefinition(name="r", dimensions=["country"], time_dimension="dt")
+
+    def test_time_grain_requires_time_dimension(self):
+        with pytest.raises(ValueError, match="require a time_dimension"):
+            RollupDefinition(name="r", dimensions=["dt"], time_grain=TimeGrain.DAY)
+
+    def test_range_parameters_come_in_pairs(self):
+        with pytest.raises(ValueError, match="set together"):
+            RollupDefinition(
+                name="r",
+                dimensions=["dt"],
+                time_dimension="dt",
+                start_parameter="start",
+            )
+
+    def test_spec_rejects_unknown_names(self):
+        with pytest.raises(ValueError, match="unknown names: country"):
+            MetricSpec(
+                name="test.test.test",
+                owner="owner@example.com",
+                team="@team",
+                query_statement="SELECT 1",
+                rollups=[RollupDefinition(name="r", dimensions=["country"])],
+            )
+
+
 class TestMetricSpec:
     """Tests for MetricSpec model (type: Metric, query_type: SELECT)."""
 
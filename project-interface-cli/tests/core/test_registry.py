@@ -6,7 +6,8 @@ import pytest
 import yaml
 
 from dli.core.discovery import load_project
-from dli.core.registry import DatasetRegistry
+from dli.core.models import DatasetSpec
+from dli.core.registry import DatasetRegistry, SpecIndex
 
 
 @pytest.fixture
@@ -352,3 +353,92 @@ class TestDatasetRegistry:
         assert len(registry) == 2
         assert "iceberg.analytics.daily_clicks" in registry
         assert "iceberg.reporting.daily_summary" in registry
+
+    def test_search_name_pattern(self, temp_project):
+        """Test case-insensitive substring search on names."""
+        config = load_project(temp_project)
+        registry = DatasetRegistry(config)
+
+        assert {s.name for s in registry.search(name_pattern="SUMMARY")} == {
+            "iceberg.reporting.user_summary",
+            "iceberg.analytics.weekly_summary",
+        }
+        # Shorter than an n-gram and n-grams present in a different order
+        assert len(registry.search(name_pattern="y_")) == 2
+        assert registry.search(name_pattern="clicks_daily") == []
+        assert registry.search(name_pattern="summary", tag="weekly")[0].name == (
+            "iceberg.analytics.weekly_summary"
+        )
+
+    def test_facets(self, temp_project):
+        """Test facet counts for all datasets and for a search result."""
+        config = load_project(temp_project)
+        registry = DatasetRegistry(config)
+
+        facets = registry.facets()
+        assert facets["tag"] == {
+            "daily": 1,
+            "kpi": 2,
+            "report": 1,
+            "user": 1,
+            "weekly": 1,
+        }
+        assert facets["schema"] == {"analytics": 2, "reporting": 1}
+
+        scoped = registry.facets(registry.search(domain="feed"))
+        assert scoped["team"] == {"@analytics": 2}
+        assert scoped["domain"] == {"engagement": 1, "feed": 2}
+
+    def test_reload_rebuilds_indexes(self, temp_project):
+        """Test that removed and changed specs leave the indexes on reload."""
+        config = load_project(temp_project)
+        registry = DatasetRegistry(config)
+
+        (
+            temp_project / "datasets" / "dataset.iceberg.reporting.user_summary.yaml"
+        ).unlink()
+        registry.reload()
+
+        assert registry.search(tag="report") == []
+        assert registry.get_teams() == ["@analytics"]
+        assert "reporting" not in registry.get_schemas()
+
+
+def make_spec(name: str, **fields) -> DatasetSpec:
+    return DatasetSpec(
+        name=name,
+        owner=fields.pop("owner", "owner@example.com"),
+        team=fields.pop("team", "@team"),
+        query_type="DML",
+        query_statement="INSERT INTO t SELECT 1",
+        **fields,
+    )
+
+
+class TestSpecIndex:
+    """Tests for the SpecIndex inverted indexes."""
+
+    def test_replace_keeps_position(self):
+        """Test re-adding a spec updates postings but keeps its order."""
+        index = SpecIndex()
+        index.add(make_spec("a.b.first", tags=["x"]))
+        index.add(make_spec("a.b.second", tags=["x"]))
+        index.add(make_spec("a.b.first", tags=["y"]))
+
+        assert index.search(tag="x") == ["a.b.second"]
+        assert index.search(tag="y") == ["a.b.first"]
+        assert index.search() == ["a.b.first", "a.b.second"]
+
+    def test_remove_drops_empty_postings(self):
+        """Test removing the last spec with a value removes the value."""
+        index = SpecIndex()
+        index.add(make_spec("a.b.first", tags=["x", "x"], owner="solo@example.com"))
+        index.add(make_spec("a.c.second", tags=["x"]))
+
+        assert index.facets()["tag"] == {"x": 2}
+        index.remove("a.b.first")
+
+        assert index.values("owner") == ["owner@example.com"]
+        assert index.values("schema") == ["c"]
+        assert index.search(name_pattern="first") == []
+        assert len(index) == 1
@@ -0,0 +1,186 @@
+"""Tests for the local metric result cache.
+
+Covers:
+- Key derivation from SQL, dialect, target and limit
+- Columnar round trip, typed values and persistence across instances
+- Default location under the dli home
+- TTL expiry and catalog freshness invalidation
+- Size-based LRU eviction
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime, time
+from decimal import Decimal
+import gzip
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from dli.core.result_cache import (
+    ResultCache,
+    compute_result_key,
+    default_result_cache_dir,
+)
+
+ROWS = [
+    {"date": "2025-01-01", "users": 10, "note": None},
+    {"date": "2025-01-02", "users": 12, "note": "late"},
+]
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path) -> Path:
+    return tmp_path / "results"
+
+
+class TestComputeResultKey:
+    """Tests for compute_result_key."""
+
+    def test_same_inputs_same_key(self) -> None:
+        a = compute_result_key("SELECT 1", dialect="trino", target="http://a")
+        b = compute_result_key("SELECT 1", dialect="trino", target="http://a")
+        assert a == b
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"dialect": "bigquery", "target": "http://a"},
+            {"dialect": "trino", "target": "http://b"},
+            {"dialect": "trino", "target": "http://a", "limit": 10},
+        ],
+    )
+    def test_settings_change_key(self, kwargs: dict) -> None:
+        base = compute_result_key("SELECT 1", dialect="trino", target="http://a")
+        assert compute_result_key("SELECT 1", **kwargs) != base
+
+
+class TestResultCache:
+    """Tests for ResultCache storage, expiry and eviction."""
+
+    def test_round_trip(self, cache_dir: Path) -> None:
+        cache = ResultCache(cache_dir, ttl_seconds=60)
+        cache.put("k", ROWS)
+
+        cached = cache.get("k")
+
+        assert cached is not None
+        assert cached.rows == ROWS
+        assert cached.row_count == 2
+        assert cached.age_seconds >= 0
+
+    def test_typed_values_round_trip(self, cache_dir: Path) -> None:
+        rows = [
+            {
+                "ts": datetime(2025, 1, 1, 12, 30, tzinfo=UTC),
+                "day": date(2025, 1, 1),
+                "at": time(8, 15),
+                "amount": Decimal("12.50"),
+                "raw": b"\x00\xff",
+            }
+        ]
+        ResultCache(cache_dir, ttl_seconds=60).put("k", rows)
+
+        cached = ResultCache(cache_dir, ttl_seconds=60).get("k")
+
+        assert cached is not None
+        assert cached.rows == rows
+        assert type(cached.rows[0]["ts"]) is datetime
+        assert type(cached.rows[0]["day"]) is date
+
+    def test_default_dir_is_under_dli_home(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("HOME", str(tmp_path))
+
+        assert default_result_cache_dir() == tmp_path / ".dli" / "cache" / "results"
+
+    def test_file_is_columnar(self, cache_dir: Path) -> None:
+        ResultCache(cache_dir, ttl_seconds=60).put("k", ROWS)
+
+        with gzip.open(cache_dir / "k.json.gz", "rt", encoding="utf-8") as f:
+            payload = json.load(f)
+
+        assert payload["columns"] == ["date", "users", "note"]
+        assert payload["data"][1] == [10, 12]
+
+    def test_persists_across_instances(self, cache_dir: Path) -> None:
+        ResultCache(cache_dir, ttl_seconds=60).put("k", ROWS, row_count=5)
+
+        cached = ResultCache(cache_dir, ttl_seconds=60).get("k")
+
+        assert cached is not None
+        assert cached.row_count == 5
+
+    def test_miss(self, cache_dir: Path) -> None:
+        assert ResultCache(cache_dir, ttl_seconds=60).get("missing") is None
+
+    def test_ttl_expiry_removes_entry(self, cache_dir: Path) -> None:
+        cache = ResultCache(cache_dir, ttl_seconds=60)
+        with patch("dli.core.result_cache.time.time", return_value=1_000.0):
+            cache.put("k", ROWS)
+
+        with patch("dli.core.result_cache.time.time", return_value=1_061.0):
+            assert cache.get("k") is None
+
+        assert "k" not in cache
+        assert not (cache_dir / "k.json.gz").exists()
+
+    def test_table_update_invalidates(self, cache_dir: Path) -> None:
+        cache = ResultCache(cache_dir, ttl_seconds=3600)
+        cache.put("k", ROWS, table_versions={"db.events": "2025-01-01T00:00:00+00:00"})
+
+        assert cache.get("k", table_versions={"db.events": "2025-01-01T00:00:00+00:00"})
+        assert (
+            cache.get("k", table_versions={"db.events": "2025-01-02T00:00:00+00:00"})
+            is None
+        )
+
+    def test_unknown_table_version_does_not_invalidate(self, cache_dir: Path) -> None:
+        cache = ResultCache(cache_dir, ttl_seconds=3600)
+        cache.put("k", ROWS, table_versions={"db.events": "2025-01-01T00:00:00+00:00"})
+
+        assert cache.get("k", table_versions={"db.events": None}) is not None
+
+    def test_lru_eviction_by_size(self, cache_dir: Path) -> None:
+        cache = ResultCache(cache_dir, ttl_seconds=3600)
+        with patch("dli.core.result_cache.time.time", return_value=1_000.0):
+            cache.put("a", ROWS)
+        with patch("dli.core.result_cache.time.time", return_value=1_001.0):
+            cache.put("b", ROWS)
+        with patch("dli.core.result_cache.time.time", return_value=1_002.0):
+            cache.get("a")  # "b" is now least recently used
+        cache.max_bytes = cache.total_bytes + 1
+
+        with patch("dli.core.result_cache.time.time", return_value=1_003.0):
+            cache.put("c", ROWS)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert not (cache_dir / "b.json.gz").exists()
+
+    def test_entry_larger_than_limit_is_kept(self, cache_dir: Path) -> None:
+        cache = ResultCache(cache_dir, ttl_seconds=60, max_bytes=1)
+        cache.put("k", ROWS)
+
+        assert cache.get("k") is not None
+
+    def test_corrupt_entry_is_dropped(self, cache_dir: Path) -> None:
+        cache = ResultCache(cache_dir, ttl_seconds=60)
+        cache.put("k", ROWS)
+        (cache_dir / "k.json.gz").write_bytes(b"not gzip")
+
+        assert cache.get("k") is None
+        assert "k" not in cache
+
+    def test_clear(self, cache_dir: Path) -> None:
+        cache = ResultCache(cache_dir, ttl_seconds=60)
+        cache.put("k", ROWS)
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert list(cache_dir.iterdir()) == []
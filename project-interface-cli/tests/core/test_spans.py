@@ -0,0 +1,282 @@
+"""Tests for dli.core.spans span tracing.
+
+Covers:
+- No-op behaviour when span recording is disabled
+- Span nesting, attributes and error capture
+- JSONL, Chrome trace and OTLP exporters
+- with_trace profiling via set_profile_target / DLI_PROFILE
+- Instrumented library entry points
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from dli.core.spans import (
+    Span,
+    enable_spans,
+    export_spans,
+    render_breakdown,
+    span,
+    to_chrome_trace,
+    to_otlp,
+    traced,
+)
+from dli.core.trace import (
+    TraceContext,
+    set_profile_target,
+    take_profile_target,
+    with_trace,
+)
+
+
+@pytest.fixture
+def trace() -> TraceContext:
+    """Current trace context with span recording enabled."""
+    context = TraceContext.create("dataset run")
+    enable_spans(context)
+    context.set_current()
+    yield context
+    TraceContext.clear_current()
+
+
+@pytest.fixture(autouse=True)
+def _no_profile_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("DLI_PROFILE", raising=False)
+    set_profile_target(None)
+
+
+class TestDisabled:
+    """Tests for the disabled fast path."""
+
+    def test_span_is_noop_without_trace(self) -> None:
+        with span("anything", key="value") as current:
+            current.set_attribute("more", 1)
+
+    def test_span_is_noop_without_recorder(self) -> None:
+        context = TraceContext.create("list")
+        context.set_current()
+        try:
+            with span("anything"):
+                pass
+            assert context.recorder is None
+        finally:
+            TraceContext.clear_current()
+
+    def test_traced_calls_function(self) -> None:
+        @traced("op")
+        def double(x: int) -> int:
+            return x * 2
+
+        assert double(21) == 42
+
+
+class TestRecording:
+    """Tests for span recording."""
+
+    def test_nested_spans_have_parents(self, trace: TraceContext) -> None:
+        with span("outer"), span("inner", path="/a") as inner:
+            inner.set_attribute("rows", 3)
+
+        spans = {s.name: s for s in trace.recorder.spans}
+        assert spans["inner"].parent_id == spans["outer"].span_id
+        assert spans["outer"].parent_id is None
+        assert spans["inner"].attributes == {"path": "/a", "rows": 3}
+        assert spans["outer"].end_ns >= spans["inner"].end_ns
+
+    def test_traced_records_span(self, trace: TraceContext) -> None:
+        @traced("work")
+        def work() -> str:
+            return "done"
+
+        assert work() == "done"
+        assert [s.name for s in trace.recorder.spans] == ["work"]
+
+    def test_error_is_recorded(self, trace: TraceContext) -> None:
+        with pytest.raises(ValueError, match="bad input"), span("failing"):
+            raise ValueError("bad input")
+
+        assert trace.recorder.spans[0].error == "ValueError: bad input"
+
+
+class TestExporters:
+    """Tests for span exporters."""
+
+    @pytest.fixture
+    def spans(self, trace: TraceContext) -> list[Span]:
+        with span("command dataset run"):
+            with span("discovery.load_spec", path="a.yaml"):
+                pass
+            with span("http.request", method="POST") as current:
+                current.set_attribute("status_code", 200)
+        return trace.recorder.spans
+
+    def test_jsonl(
+        self, trace: TraceContext, spans: list[Span], tmp_path: Path
+    ) -> None:
+        path = tmp_path / "profile.jsonl"
+
+        export_spans(trace, str(path))
+
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        assert len(records) == 3
+        assert {r["trace_id"] for r in records} == {trace.trace_id}
+        assert {r["name"] for r in records} >= {"discovery.load_spec", "http.request"}
+
+    def test_chrome_trace(
+        self, trace: TraceContext, spans: list[Span], tmp_path: Path
+    ) -> None:
+        path = tmp_path / "profile.json"
+
+        export_spans(trace, str(path))
+
+        document = json.loads(path.read_text())
+        events = document["traceEvents"]
+        assert events[0]["name"] == "command dataset run"
+        assert all(e["ph"] == "X" and e["dur"] >= 0 for e in events)
+        assert document["otherData"]["trace_id"] == trace.trace_id
+
+    def test_chrome_trace_events_sorted(
+        self, trace: TraceContext, spans: list[Span]
+    ) -> None:
+        events = to_chrome_trace(spans, trace)["traceEvents"]
+        assert [e["ts"] for e in events] == sorted(e["ts"] for e in events)
+
+    def test_otlp(self, trace: TraceContext, spans: list[Span]) -> None:
+        body = to_otlp(spans, trace)
+
+        otlp_spans = body["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        by_name = {s["name"]: s for s in otlp_spans}
+        assert len(by_name["http.request"]["traceId"]) == 32
+        assert (
+            by_name["http.request"]["parentSpanId"]
+            == by_name["command dataset run"]["spanId"]
+        )
+        assert {"key": "status_code", "value": {"intValue": "200"}} in by_name[
+            "http.request"
+        ]["attributes"]
+
+    def test_otlp_post(self, trace: TraceContext, spans: list[Span]) -> None:
+        with patch("httpx.post") as post:
+            destination = export_spans(trace, "http://localhost:4318/v1/traces")
+
+        assert "localhost:4318" in destination
+        assert post.call_args.args[0] == "http://localhost:4318/v1/traces"
+        assert "resourceSpans" in post.call_args.kwargs["json"]
+
+    def test_breakdown_merges_repeated_spans(self, trace: TraceContext) -> None:
+        with span("command validate"):
+            for _ in range(3):
+                with span("discovery.load_spec"):
+                    pass
+
+        lines = render_breakdown(trace.recorder.spans)
+
+        assert lines[0].startswith("command validate")
+        assert lines[1].startswith("  discovery.load_spec")
+        assert lines[1].endswith("x3")
+
+
+class TestProfiledCommand:
+    """Tests for with_trace profiling."""
+
+    def test_profile_target_is_consumed(self) -> None:
+        set_profile_target("out.json")
+
+        assert take_profile_target() == "out.json"
+        assert take_profile_target() is None
+
+    def test_env_var_fallback(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("DLI_PROFILE", "env.jsonl")
+
+        assert take_profile_target() == "env.jsonl"
+
+    def test_with_trace_writes_profile(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        path = tmp_path / "profile.jsonl"
+        set_profile_target(str(path))
+
+        @with_trace("dataset run")
+        def command() -> str:
+            with span("render.template"):
+                return "ok"
+
+        assert command() == "ok"
+
+        names = [json.loads(line)["name"] for line in path.read_text().splitlines()]
+        assert set(names) == {"command dataset run", "render.template"}
+        assert "Profile: 2 spans" in capsys.readouterr().err
+
+    def test_with_trace_without_profile_records_nothing(self) -> None:
+        captured: list[TraceContext | None] = []
+
+        @with_trace("dataset list")
+        def command() -> None:
+            captured.append(TraceContext.get_current())
+
+        command()
+
+        assert captured[0] is not None
+        assert captured[0].recorder is None
+
+    def test_export_failure_does_not_break_command(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        set_profile_target("http://127.0.0.1:9/v1/traces")
+
+        @with_trace("dataset run")
+        def command() -> int:
+            return 1
+
+        with patch("httpx.post", side_effect=OSError("refused")):
+            assert command() == 1
+        assert "not exported" in capsys.readouterr().err
+
+
+class TestInstrumentation:
+    """Tests for spans emitted by instrumented library code."""
+
+    def test_sql_validator(self, trace: TraceContext) -> None:
+        from dli.core.validator import SQLValidator
+
+        SQLValidator("trino").validate("SELECT 1")
+
+        assert "sqlglot.validate" in [s.name for s in trace.recorder.spans]
+
+    def test_renderer(self, trace: TraceContext) -> None:
+        from dli.core.renderer import SQLRenderer
+
+        SQLRenderer().render_string("SELECT {{ x }}", {"x": 1})
+
+        assert "render.template" in [s.name for s in trace.recorder.spans]
+
+    def test_discovery(self, trace: TraceContext, sample_project_path: Path) -> None:
+        from dli.core.config import load_project
+        from dli.core.discovery import SpecDiscovery
+
+        list(SpecDiscovery(load_project(sample_project_path)).discover_all())
+
+        names = [s.name for s in trace.recorder.spans]
+        assert "config.load_project" in names
+        assert "discovery.load_spec" in names
+
+    def test_http_client(self, trace: TraceContext) -> None:
+        from dli.core.http import TracedHttpClient
+
+        with patch("httpx.Client") as client_class:
+            client = MagicMock()
+            client.get.return_value = MagicMock(status_code=204)
+            client_class.return_value.__enter__.return_value = client
+            TracedHttpClient("https://example.com").get("/health")
+
+        (http_span,) = [s for s in trace.recorder.spans if s.name == "http.request"]
+        assert http_span.attributes == {
+            "method": "GET",
+            "path": "/health",
+            "status_code": 204,
+        }
@@ -14,6 +14,7 @@ import pytest
 from jinja2.exceptions import SecurityError, UndefinedError
 
 from dli.core.renderer import SQLRenderer
+from dli.core.sql_filters import sql_date_trunc
 from dli.core.templates import (
     SafeJinjaEnvironment,
     SafeTemplateRenderer,
@@ -420,6 +421,31 @@ class TestSharedSQLFilters:
         """Test sql_identifier_escape returns empty quotes for None."""
         assert sql_identifier_escape(None) == '""'
 
+    def test_sql_date_trunc_grains(self):
+        """Test sql_date_trunc truncates dates and timestamps like DATE_TRUNC."""
+        assert sql_date_trunc("2024-02-15", "week") == "2024-02-12"
+        assert sql_date_trunc("2024-05-15", "quarter") == "2024-04-01"
+        assert sql_date_trunc(date(2024, 5, 15), "year") == "2024-01-01"
+        assert sql_date_trunc("2024-02-15", "hour") == "2024-02-15"
+        assert sql_date_trunc("2024-02-15 10:30:00", "hour") == "2024-02-15 10:00:00"
+        assert sql_date_trunc("2024-02-15T10:30:00", "month") == "2024-02-01 00:00:00"
+
+    def test_sql_date_trunc_invalid(self):
+        """Test sql_date_trunc rejects unknown grains and non-dates."""
+        with pytest.raises(ValueError, match="Unknown time grain"):
+            sql_date_trunc("2024-02-15", "decade")
+        with pytest.raises(ValueError):
+            sql_date_trunc("last week", "day")
+
+    def test_date_trunc_filter_registered(self):
+        """Test both renderers expose the date_trunc filter."""
+        template = "{{ d | date_trunc('month') }}"
+        env = SafeJinjaEnvironment.create_environment()
+        assert env.from_string(template).render(d="2024-02-15") == "2024-02-01"
+        assert (
+            SQLRenderer().render_string(template, {"d": "2024-02-15"}) == "2024-02-01"
+        )
+
 
 class TestSandboxSecurity:
     """Security tests for SafeJinjaEnvironment sandbox."""
@@ -17,16 +17,28 @@ Test coverage:
 
 from __future__ import annotations
 
+from contextlib import contextmanager
 from pathlib import Path
 from typing import TYPE_CHECKING
 from unittest.mock import Mock, patch
 
 import pytest
 
+from dli.core.graph import ProjectGraph
 from dli.core.validation import DepValidationResult, DepValidator, ProjectDepSummary
 
 if TYPE_CHECKING:
-    pass
+    from collections.abc import Iterator
+
+
+@contextmanager
+def _patch_project_specs(specs: list[Mock]) -> Iterator[None]:
+    """Serve the project graph from in-memory specs instead of spec files."""
+    with patch(
+        "dli.core.graph.ProjectGraph.for_project",
+        return_value=ProjectGraph.from_specs(specs),
+    ):
+        yield
 
 
 # =============================================================================
@@ -449,11 +461,7 @@ class TestDepValidatorDependencyGraph:
 
         validator = DepValidator()
 
-        with patch("dli.core.discovery.SpecDiscovery") as mock_discovery_class:
-            mock_discovery = Mock()
-            mock_discovery.discover_all.return_value = [mock_spec1, mock_spec2, mock_spec3]
-            mock_discovery_class.return_value = mock_discovery
-
+        with _patch_project_specs([mock_spec1, mock_spec2, mock_spec3]):
             graph = validator.get_dependency_graph(mock_config)
 
             assert "spec1" in graph
@@ -473,11 +481,7 @@ class TestDepValidatorDependencyGraph:
 
         validator = DepValidator()
 
-        with patch("dli.core.discovery.SpecDiscovery") as mock_discovery_class:
-            mock_discovery = Mock()
-            mock_discovery.discover_all.return_value = [mock_spec]
-            mock_discovery_class.return_value = mock_discovery
-
+        with _patch_project_specs([mock_spec]):
             graph = validator.get_dependency_graph(mock_config)
 
             assert graph["spec1"] == []
@@ -504,11 +508,7 @@ class TestDepValidatorFindDownstream:
 
         validator = DepValidator()
 
-        with patch("dli.core.discovery.SpecDiscovery") as mock_discovery_class:
-            mock_discovery = Mock()
-            mock_discovery.discover_all.return_value = [mock_spec1, mock_spec2, mock_spec3]
-            mock_discovery_class.return_value = mock_discovery
-
+        with _patch_project_specs([mock_spec1, mock_spec2, mock_spec3]):
             downstream = validator.find_downstream("spec1", mock_config)
 
             assert len(downstream) == 2
@@ -526,11 +526,7 @@ class TestDepValidatorFindDownstream:
 
         validator = DepValidator()
 
-        with patch("dli.core.discovery.SpecDiscovery") as mock_discovery_class:
-            mock_discovery = Mock()
-            mock_discovery.discover_all.return_value = [mock_spec1]
-            mock_discovery_class.return_value = mock_discovery
-
+        with _patch_project_specs([mock_spec1]):
             downstream = validator.find_downstream("spec1", mock_config)
 
             assert downstream == []
@@ -549,11 +545,7 @@ class TestDepValidatorFindUpstream:
 
         validator = DepValidator()
 
-        with patch("dli.core.discovery.SpecDiscovery") as mock_discovery_class:
-            mock_discovery = Mock()
-            mock_discovery.discover_all.return_value = [mock_spec]
-            mock_discovery_class.return_value = mock_discovery
-
+        with _patch_project_specs([mock_spec]):
             upstream = validator.find_upstream("spec3", mock_config)
 
             assert len(upstream) == 2
@@ -571,11 +563,7 @@ class TestDepValidatorFindUpstream:
 
         validator = DepValidator()
 
-        with patch("dli.core.discovery.SpecDiscovery") as mock_discovery_class:
-            mock_discovery = Mock()
-            mock_discovery.discover_all.return_value = [mock_spec]
-            mock_discovery_class.return_value = mock_discovery
-
+        with _patch_project_specs([mock_spec]):
             upstream = validator.find_upstream("spec1", mock_config)
 
             assert upstream == []
@@ -590,11 +578,7 @@ class TestDepValidatorFindUpstream:
 
         validator = DepValidator()
 
-        with patch("dli.core.discovery.SpecDiscovery") as mock_discovery_class:
-            mock_discovery = Mock()
-            mock_discovery.discover_all.return_value = [mock_spec]
-            mock_discovery_class.return_value = mock_discovery
-
+        with _patch_project_specs([mock_spec]):
             upstream = validator.find_upstream("nonexistent", mock_config)
 
             assert upstream == []
@@ -621,11 +605,7 @@ class TestDepValidatorDetectCycles:
 
         validator = DepValidator()
 
-        with patch("dli.core.discovery.SpecDiscovery") as mock_discovery_class:
-            mock_discovery = Mock()
-            mock_discovery.discover_all.return_value = [mock_spec1, mock_spec2, mock_spec3]
-            mock_discovery_class.return_value = mock_discovery
-
+        with _patch_project_specs([mock_spec1, mock_spec2, mock_spec3]):
             cycles = validator.detect_cycles(mock_config)
 
             assert cycles == []
@@ -640,11 +620,7 @@ class TestDepValidatorDetectCycles:
 
         validator = DepValidator()
 
-        with patch("dli.core.discovery.SpecDiscovery") as mock_discovery_class:
-            mock_discovery = Mock()
-            mock_discovery.discover_all.return_value = [mock_spec]
-            mock_discovery_class.return_value = mock_discovery
-
+        with _patch_project_specs([mock_spec]):
             cycles = validator.detect_cycles(mock_config)
 
             assert len(cycles) == 1
@@ -664,11 +640,7 @@ class TestDepValidatorDetectCycles:
 
         validator = DepValidator()
 
-        with patch("dli.core.discovery.SpecDiscovery") as mock_discovery_class:
-            mock_discovery = Mock()
-            mock_discovery.discover_all.return_value = [mock_spec1, mock_spec2]
-            mock_discovery_class.return_value = mock_discovery
-
+        with _patch_project_specs([mock_spec1, mock_spec2]):
             cycles = validator.detect_cycles(mock_config)
 
             assert len(cycles) >= 1
@@ -692,11 +664,7 @@ class TestDepValidatorDetectCycles:
 
         validator = DepValidator()
 
-        with patch("dli.core.discovery.SpecDiscovery") as mock_discovery_class:
-            mock_discovery = Mock()
-            mock_discovery.discover_all.return_value = [mock_spec1, mock_spec2, mock_spec3]
-            mock_discovery_class.return_value = mock_discovery
-
+        with _patch_project_specs([mock_spec1, mock_spec2, mock_spec3]):
             cycles = validator.detect_cycles(mock_config)
 
             assert len(cycles) >= 1
@@ -707,11 +675,7 @@ class TestDepValidatorDetectCycles:
 
         validator = DepValidator()
 
-        with patch("dli.core.discovery.SpecDiscovery") as mock_discovery_class:
-            mock_discovery = Mock()
-            mock_discovery.discover_all.return_value = []
-            mock_discovery_class.return_value = mock_discovery
-
+        with _patch_project_specs([]):
             cycles = validator.detect_cycles(mock_config)
 
             assert cycles == []
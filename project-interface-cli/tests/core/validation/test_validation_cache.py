@@ -0,0 +1,315 @@
+"""Tests for the spec validation cache and parallel project validation.
+
+Test coverage:
+- compute_spec_key: Sensitivity to content, settings and variables
+- ValidationCache: get/put/save round-trip, dependency invalidation, pruning
+- SpecValidator.validate_all: use_cache hits and misses, parallel validation
+- Included Jinja templates as cache dependencies
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+from dli.core.validation import SpecValidationResult, SpecValidator
+from dli.core.validation.cache import ValidationCache, compute_spec_key, hash_file
+
+
+def _write_project(root: Path, dataset_count: int = 2) -> Path:
+    """Create a minimal project with file-based dataset SQL and one metric."""
+    root.mkdir(parents=True, exist_ok=True)
+    (root / "dli.yaml").write_text(
+        """
+version: "1"
+project:
+  name: "cache-test"
+discovery:
+  datasets_dir: "datasets"
+  metrics_dir: "metrics"
+"""
+    )
+    datasets = root / "datasets"
+    metrics = root / "metrics"
+    datasets.mkdir()
+    metrics.mkdir()
+
+    for i in range(dataset_count):
+        (datasets / f"ds_{i}.sql").write_text(
+            f"INSERT INTO iceberg.analytics.ds_{i} SELECT id FROM iceberg.raw.events"
+        )
+        (datasets / f"dataset.iceberg.analytics.ds_{i}.yaml").write_text(
+            f"""
+name: iceberg.analytics.ds_{i}
+owner: owner@example.com
+team: "@data"
+type: Dataset
+query_type: DML
+query_file: ds_{i}.sql
+"""
+        )
+
+    (metrics / "metric.iceberg.analytics.users.yaml").write_text(
+        """
+name: iceberg.analytics.users
+owner: owner@example.com
+team: "@data"
+type: Metric
+query_type: SELECT
+query_statement: SELECT COUNT(*) AS users FROM iceberg.core.users
+"""
+    )
+    return root
+
+
+class TestComputeSpecKey:
+    """Tests for compute_spec_key."""
+
+    def test_key_is_stable(self, tmp_path: Path) -> None:
+        spec = tmp_path / "spec.yaml"
+        spec.write_text("name: a")
+        key1 = compute_spec_key(spec, dialect="trino", strict=False, variables=None)
+        key2 = compute_spec_key(spec, dialect="trino", strict=False, variables={})
+        assert key1 is not None
+        assert key1 == key2
+
+    def test_key_changes_with_content_and_settings(self, tmp_path: Path) -> None:
+        spec = tmp_path / "spec.yaml"
+        spec.write_text("name: a")
+        base = compute_spec_key(spec, dialect="trino", strict=False, variables=None)
+
+        assert base != compute_spec_key(
+            spec, dialect="bigquery", strict=False, variables=None
+        )
+        assert base != compute_spec_key(
+            spec, dialect="trino", strict=True, variables=None
+        )
+        assert base != compute_spec_key(
+            spec, dialect="trino", strict=False, variables={"dt": "2024-01-01"}
+        )
+
+        spec.write_text("name: b")
+        assert base != compute_spec_key(
+            spec, dialect="trino", strict=False, variables=None
+        )
+
+    def test_key_changes_with_version(self, tmp_path: Path) -> None:
+        spec = tmp_path / "spec.yaml"
+        spec.write_text("name: a")
+        base = compute_spec_key(spec, dialect="trino", strict=False, variables=None)
+        with patch("dli.__version__", "999.0.0"):
+            assert base != compute_spec_key(
+                spec, dialect="trino", strict=False, variables=None
+            )
+
+    def test_missing_spec_has_no_key(self, tmp_path: Path) -> None:
+        assert (
+            compute_spec_key(
+                tmp_path / "missing.yaml", dialect="trino", strict=False, variables=None
+            )
+            is None
+        )
+
+
+class TestValidationCache:
+    """Tests for ValidationCache storage."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        spec = tmp_path / "spec.yaml"
+        spec.write_text("name: a")
+        result = SpecValidationResult(
+            is_valid=False,
+            spec_path=spec,
+            spec_name="a",
+            spec_type="metric",
+            errors=["boom"],
+            warnings=["careful"],
+        )
+
+        cache = ValidationCache(tmp_path / "cache")
+        cache.put(spec, "k1", result, {})
+        cache.save()
+
+        reloaded = ValidationCache(tmp_path / "cache")
+        cached = reloaded.get(spec, "k1")
+        assert cached == result
+        assert reloaded.get(spec, "other-key") is None
+
+    def test_dependency_change_invalidates(self, tmp_path: Path) -> None:
+        spec = tmp_path / "spec.yaml"
+        sql = tmp_path / "query.sql"
+        spec.write_text("name: a")
+        sql.write_text("SELECT 1")
+        result = SpecValidationResult(is_valid=True, spec_path=spec)
+
+        cache = ValidationCache(tmp_path / "cache")
+        cache.put(spec, "k1", result, {str(sql): hash_file(sql)})
+        assert cache.get(spec, "k1") is not None
+
+        sql.write_text("SELECT 2")
+        assert cache.get(spec, "k1") is None
+
+    def test_prune_removes_stale_entries(self, tmp_path: Path) -> None:
+        keep = tmp_path / "keep.yaml"
+        drop = tmp_path / "drop.yaml"
+        cache = ValidationCache(tmp_path / "cache")
+        for path in (keep, drop):
+            cache.put(
+                path, "k", SpecValidationResult(is_valid=True, spec_path=path), {}
+            )
+
+        cache.prune({keep})
+
+        assert len(cache) == 1
+        assert cache.get(keep, "k") is not None
+
+    def test_corrupt_cache_file_is_ignored(self, tmp_path: Path) -> None:
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        (cache_dir / "validation.json").write_text("{not json")
+
+        cache = ValidationCache(cache_dir)
+        assert len(cache) == 0
+
+
+class TestValidateAllCached:
+    """Tests for SpecValidator.validate_all with use_cache."""
+
+    def test_second_run_is_served_from_cache(self, tmp_path: Path) -> None:
+        project = _write_project(tmp_path)
+        validator = SpecValidator()
+
+        first = validator.validate_all(project, use_cache=True)
+        assert first.total == 3
+        assert first.cached == 0
+        assert (project / ".dli" / "cache" / "validation.json").exists()
+
+        with patch.object(SpecValidator, "validate_file_with_deps") as mock_validate:
+            second = validator.validate_all(project, use_cache=True)
+            mock_validate.assert_not_called()
+
+        assert second.cached == 3
+        assert second.total == first.total
+        assert second.passed == first.passed
+        assert [r.spec_name for r in second.results] == [
+            r.spec_name for r in first.results
+        ]
+
+    def test_changed_sql_file_is_revalidated(self, tmp_path: Path) -> None:
+        project = _write_project(tmp_path)
+        validator = SpecValidator()
+        validator.validate_all(project, use_cache=True)
+
+        (project / "datasets" / "ds_0.sql").write_text("INSERT INTO (((")
+
+        summary = validator.validate_all(project, use_cache=True)
+        assert summary.cached == 2
+        assert summary.failed == 1
+
+    def test_changed_variables_miss_cache(self, tmp_path: Path) -> None:
+        project = _write_project(tmp_path)
+        validator = SpecValidator()
+        validator.validate_all(project, use_cache=True)
+
+        summary = validator.validate_all(
+            project, use_cache=True, variables={"execution_date": "2024-01-01"}
+        )
+        assert summary.cached == 0
+
+    def test_changed_included_template_is_revalidated(self, tmp_path: Path) -> None:
+        project = _write_project(tmp_path)
+        macros = project / "datasets" / "macros"
+        macros.mkdir()
+        (macros / "source.sql").write_text("iceberg.raw.events")
+        (project / "datasets" / "ds_0.sql").write_text(
+            "INSERT INTO iceberg.analytics.ds_0 SELECT id FROM "
+            "{% include 'macros/source.sql' %}"
+        )
+        validator = SpecValidator()
+
+        first = validator.validate_all(project, use_cache=True)
+        (macros / "source.sql").write_text("iceberg.raw.clicks")
+        second = validator.validate_all(project, use_cache=True)
+
+        assert first.cached == 0
+        assert second.cached == 2
+
+    def test_template_deps_follow_nested_includes(self, tmp_path: Path) -> None:
+        project = _write_project(tmp_path)
+        datasets = project / "datasets"
+        (datasets / "outer.sql").write_text("{% import 'inner.sql' as inner %}")
+        (datasets / "inner.sql").write_text("SELECT 1")
+        (datasets / "ds_0.sql").write_text("{% include 'outer.sql' %}")
+
+        _, deps = SpecValidator().validate_file_with_deps(
+            datasets / "dataset.iceberg.analytics.ds_0.yaml"
+        )
+
+        assert str((datasets / "outer.sql").resolve()) in deps
+        assert str((datasets / "inner.sql").resolve()) in deps
+
+    def test_cache_disabled_by_default(self, tmp_path: Path) -> None:
+        project = _write_project(tmp_path)
+        SpecValidator().validate_all(project)
+        assert not (project / ".dli").exists()
+
+    def test_custom_cache_dir(self, tmp_path: Path) -> None:
+        project = _write_project(tmp_path / "project_root")
+        cache_dir = tmp_path / "custom-cache"
+        SpecValidator().validate_all(project, use_cache=True, cache_dir=cache_dir)
+        assert (cache_dir / "validation.json").exists()
+
+    def test_invalid_spec_is_reported(self, tmp_path: Path) -> None:
+        """Specs that fail to load are reported instead of being skipped."""
+        project = _write_project(tmp_path)
+        (project / "datasets" / "dataset.iceberg.analytics.broken.yaml").write_text(
+            "name: iceberg.analytics.broken\n"
+        )
+
+        summary = SpecValidator().validate_all(project)
+        assert summary.failed >= 1
+        assert any(
+            r.spec_path.name == "dataset.iceberg.analytics.broken.yaml"
+            for r in summary.failed_results
+        )
+
+
+class TestValidateAllParallel:
+    """Tests for process-parallel validation of cache misses."""
+
+    def test_parallel_matches_serial(self, tmp_path: Path) -> None:
+        project = _write_project(tmp_path, dataset_count=10)
+        validator = SpecValidator()
+
+        serial = validator.validate_all(project, jobs=1)
+        parallel = validator.validate_all(project, jobs=2)
+
+        assert parallel.total == serial.total == 11
+        assert [r.spec_path for r in parallel.results] == [
+            r.spec_path for r in serial.results
+        ]
+        assert [r.is_valid for r in parallel.results] == [
+            r.is_valid for r in serial.results
+        ]
+
+    def test_serial_by_default(self, tmp_path: Path) -> None:
+        project = _write_project(tmp_path, dataset_count=10)
+
+        with patch(
+            "dli.core.validation.spec_validator.ProcessPoolExecutor"
+        ) as mock_pool:
+            summary = SpecValidator().validate_all(project)
+
+        mock_pool.assert_not_called()
+        assert summary.total == 11
+
+    def test_falls_back_to_serial_when_pool_fails(self, tmp_path: Path) -> None:
+        project = _write_project(tmp_path, dataset_count=10)
+
+        with patch(
+            "dli.core.validation.spec_validator.ProcessPoolExecutor",
+            side_effect=OSError("no semaphores"),
+        ):
+            summary = SpecValidator().validate_all(project, jobs=4)
+
+        assert summary.total == 11
@@ -0,0 +1,176 @@
+"""Tests for dli.core.workflow.bulk chunked status lookups."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import threading
+from typing import Any
+
+import pytest
+
+from dli.core.client import BasecampClient, ServerConfig, ServerResponse
+from dli.core.http import TracedHttpClient
+from dli.core.trace import TraceContext
+from dli.core.workflow.bulk import chunked, fetch_in_chunks, resolve_since
+
+
+class BatchServer:
+    """Fake batch endpoint that knows run IDs starting with "run"."""
+
+    def __init__(
+        self, max_batch: int | None = None, fail: set[str] | None = None
+    ) -> None:
+        self.max_batch = max_batch
+        self.fail = fail or set()
+        self.batches: list[list[str]] = []
+        self.threads: set[str] = set()
+
+    def __call__(self, keys: list[str]) -> ServerResponse:
+        self.batches.append(keys)
+        self.threads.add(threading.current_thread().name)
+        if self.max_batch is not None and len(keys) > self.max_batch:
+            return ServerResponse(success=False, error="too large", status_code=413)
+        if self.fail & set(keys):
+            return ServerResponse(success=False, error="unavailable", status_code=503)
+        runs: list[dict[str, Any]] = [
+            {"run_id": k} for k in keys if k.startswith("run")
+        ]
+        return ServerResponse(
+            success=True,
+            data={
+                "runs": runs,
+                "missing": [k for k in keys if not k.startswith("run")],
+            },
+        )
+
+
+def run_ids(result: Any) -> list[str]:
+    return [run["run_id"] for run in result.runs]
+
+
+class TestChunking:
+    """Tests for chunked and resolve_since."""
+
+    def test_chunks_deduplicate(self) -> None:
+        assert chunked(["a", "b", "a", "c", "d"], 2) == [["a", "b"], ["c", "d"]]
+        assert chunked([], 10) == []
+
+    def test_resolve_since(self) -> None:
+        now = datetime(2025, 1, 2, 12, 0)
+
+        assert resolve_since("24h", now=now) == datetime(2025, 1, 1, 12, 0)
+        assert resolve_since("30m", now=now) == now - timedelta(minutes=30)
+        assert resolve_since("2025-01-01T08:00:00") == datetime(2025, 1, 1, 8, 0)
+        assert resolve_since(None) is None
+        with pytest.raises(ValueError, match="Invalid since value"):
+            resolve_since("yesterday")
+
+
+class TestFetchInChunks:
+    """Tests for fetch_in_chunks."""
+
+    def test_parallel_chunks_keep_order(self) -> None:
+        server = BatchServer()
+        keys = [f"run{i:02d}" for i in range(10)] + ["unknown"]
+
+        result = fetch_in_chunks(keys, server, batch_size=3, max_workers=4)
+
+        assert run_ids(result) == keys[:10]
+        assert result.missing == ["unknown"]
+        assert result.requests == 4
+        assert all(name.startswith("dli-workflow-bulk") for name in server.threads)
+
+    def test_parallel_chunks_keep_trace(self) -> None:
+        http = TracedHttpClient("http://localhost")
+        trace = TraceContext.create("workflow status")
+        seen: list[str | None] = []
+
+        def fetch(keys: list[str]) -> ServerResponse:
+            seen.append(http._get_headers().get("X-Trace-Id"))
+            return ServerResponse(success=True, data={"runs": [], "missing": keys})
+
+        trace.set_current()
+        try:
+            fetch_in_chunks(["a", "b", "c"], fetch, batch_size=1, max_workers=3)
+        finally:
+            TraceContext.clear_current()
+
+        assert seen == [trace.trace_id] * 3
+
+    def test_single_chunk_on_calling_thread(self) -> None:
+        server = BatchServer()
+
+        result = fetch_in_chunks(["run1", "run2"], server)
+
+        assert result.requests == 1
+        assert server.threads == {threading.current_thread().name}
+
+    def test_splits_rejected_batches(self) -> None:
+        server = BatchServer(max_batch=2)
+
+        result = fetch_in_chunks(["run1", "run2", "run3", "run4", "run5"], server)
+
+        assert run_ids(result) == ["run1", "run2", "run3", "run4", "run5"]
+        assert [len(b) for b in server.batches] == [5, 2, 3, 1, 2]
+        assert result.requests == 5
+        assert not result.failed
+
+    def test_failed_chunk_is_reported(self) -> None:
+        server = BatchServer(fail={"run3"})
+
+        result = fetch_in_chunks(
+            ["run1", "run2", "run3", "run4"], server, batch_size=2, max_workers=2
+        )
+
+        assert run_ids(result) == ["run1", "run2"]
+        assert result.failed == {"run3": "unavailable", "run4": "unavailable"}
+
+    def test_exception_is_reported(self) -> None:
+        def broken(keys: list[str]) -> ServerResponse:
+            raise RuntimeError("connection reset")
+
+        result = fetch_in_chunks(["run1"], broken)
+
+        assert result.failed == {"run1": "connection reset"}
+
+
+class TestMockBatchEndpoints:
+    """Tests for the BasecampClient batch methods in mock mode."""
+
+    @pytest.fixture
+    def client(self) -> BasecampClient:
+        return BasecampClient(ServerConfig(url="http://mock"), mock_mode=True)
+
+    def test_status_batch(self, client: BasecampClient) -> None:
+        response = client.workflow_status_batch(
+            ["iceberg.warehouse.user_events_20240115_040000", "missing_run"]
+        )
+
+        assert response.success
+        assert [r["dataset_name"] for r in response.data["runs"]] == [
+            "iceberg.warehouse.user_events"
+        ]
+        assert response.data["missing"] == ["missing_run"]
+
+    def test_latest_runs(self, client: BasecampClient) -> None:
+        latest = client.workflow_latest_runs(since="24h").data
+        history = client.workflow_latest_runs(
+            ["iceberg.analytics.daily_clicks", "iceberg.reporting.weekly_summary"],
+            since="1d",
+            limit_per_dataset=5,
+        ).data
+
+        # The weekly summary ran a week ago, outside the window
+        assert [r["dataset_name"] for r in latest["runs"]] == [
+            "iceberg.analytics.daily_clicks",
+            "iceberg.warehouse.user_events",
+        ]
+        assert latest["runs"][0]["status"] == "RUNNING"
+        assert len(history["runs"]) == 2
+        assert history["missing"] == ["iceberg.reporting.weekly_summary"]
+
+    def test_latest_runs_invalid_since(self, client: BasecampClient) -> None:
+        response = client.workflow_latest_runs(since="soon")
+
+        assert not response.success
+        assert response.status_code == 400